@@ -1,4 +1,76 @@
+import argparse
+import asyncio
+
+from src.config.settings import EXTRACT_CONFIG, LOAD_CONFIG, PARTITION_CONFIG, PIPELINE_CONFIG
 from src.main.main_pipeline import MainPipeline
 
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Pipeline de análise de vendas e estoque.")
+    parser.add_argument(
+        "--refresh-cache",
+        action="store_true",
+        help="Ignora o cache colunar das fontes e relê todos os arquivos CSV.",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Carrega apenas os dados posteriores à última carga, mesclando-os às tabelas existentes.",
+    )
+    parser.add_argument(
+        "--partition-by",
+        choices=["ID_FILIAL", "month"],
+        default=PARTITION_CONFIG["key"] or None,
+        help="Transforma vendas e estoque em partições por filial ou por mês, em processos paralelos.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Executa todas as etapas, mesmo que as fontes e o código não tenham mudado desde a última carga.",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=EXTRACT_CONFIG["chunk_size"],
+        help="Extrai, transforma e carrega os dados em blocos com essa quantidade de linhas (streaming).",
+    )
+    parser.add_argument(
+        "--start-date",
+        default=EXTRACT_CONFIG["start_date"],
+        help="Primeira data (AAAA-MM-DD) das vendas e do estoque; as partições anteriores não são lidas.",
+    )
+    parser.add_argument(
+        "--end-date",
+        default=EXTRACT_CONFIG["end_date"],
+        help="Última data (AAAA-MM-DD) das vendas e do estoque; as partições posteriores não são lidas.",
+    )
+    parser.add_argument(
+        "--pipelined",
+        action="store_true",
+        help="No streaming, lê, transforma e carrega os blocos ao mesmo tempo, em threads ligadas por filas.",
+    )
+    parser.add_argument(
+        "--async",
+        dest="async_mode",
+        action="store_true",
+        help="Executa o pipeline assíncrono (asyncpg), sobrepondo a carga de cada bloco à produção do próximo.",
+    )
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
-    MainPipeline().run_pipeline()
+    args = parse_args()
+    pipeline = MainPipeline(
+        refresh_cache=args.refresh_cache,
+        incremental=args.incremental or LOAD_CONFIG["incremental"],
+        partition_by=args.partition_by or "",
+        no_cache=args.no_cache,
+        chunk_size=args.chunk_size,
+        pipelined=args.pipelined or PIPELINE_CONFIG["enabled"],
+        start_date=args.start_date,
+        end_date=args.end_date,
+    )
+    if args.async_mode or LOAD_CONFIG["async"]:
+        asyncio.run(pipeline.run_pipeline_async())
+    else:
+        pipeline.run_pipeline()
@@ -11,3 +11,79 @@ DATABASE_CONFIG = {
     "host": os.getenv("DB_HOST"),
     "port": os.getenv("DB_PORT"),
 }
+
+POOL_CONFIG = {
+    "min_size": int(os.getenv("DB_POOL_MIN_SIZE", "1")),
+    "max_size": int(os.getenv("DB_POOL_MAX_SIZE", "8")),
+    "checkout_timeout": float(os.getenv("DB_POOL_CHECKOUT_TIMEOUT", "30")),
+    "health_check": os.getenv("DB_POOL_HEALTH_CHECK", "true").lower() == "true",
+    "reconnect_attempts": int(os.getenv("DB_POOL_RECONNECT_ATTEMPTS", "3")),
+}
+
+QUERY_CONFIG = {
+    "itersize": int(os.getenv("QUERY_ITERSIZE", "10000")),
+}
+
+LOAD_CONFIG = {
+    "method": os.getenv("LOAD_METHOD", "copy"),
+    "copy_chunk_size": int(os.getenv("LOAD_COPY_CHUNK_SIZE", "100000")),
+    "incremental": os.getenv("LOAD_INCREMENTAL", "false").lower() == "true",
+    "max_workers": int(os.getenv("LOAD_MAX_WORKERS", "1")),
+    "atomic": os.getenv("LOAD_ATOMIC", "false").lower() == "true",
+    "async": os.getenv("LOAD_ASYNC", "false").lower() == "true",
+}
+
+EXTRACT_CONFIG = {
+    "chunk_size": int(os.getenv("EXTRACT_CHUNK_SIZE", "0")),
+    "cache_enabled": os.getenv("EXTRACT_CACHE_ENABLED", "true").lower() == "true",
+    "cache_dir": os.getenv("EXTRACT_CACHE_DIR", ".cache/extract"),
+    "cache_max_bytes": int(os.getenv("EXTRACT_CACHE_MAX_BYTES", str(5 * 1024**3))),
+    "max_workers": int(os.getenv("EXTRACT_MAX_WORKERS", str(min(os.cpu_count() or 1, 4)))),
+    "start_date": os.getenv("EXTRACT_START_DATE", ""),
+    "end_date": os.getenv("EXTRACT_END_DATE", ""),
+}
+
+TRANSFORM_CONFIG = {
+    "engine": os.getenv("TRANSFORM_ENGINE", "vectorized"),
+    "velocity_granularity": os.getenv("TRANSFORM_VELOCITY_GRANULARITY", "row"),
+    "backend": os.getenv("TRANSFORM_BACKEND", "pandas"),
+    "memory_limit": os.getenv("TRANSFORM_MEMORY_LIMIT", "4GB"),
+    "temp_dir": os.getenv("TRANSFORM_TEMP_DIR", ".cache/transform"),
+}
+
+PARTITION_CONFIG = {
+    "key": os.getenv("PARTITION_KEY", ""),
+    "max_workers": int(os.getenv("PARTITION_MAX_WORKERS", str(os.cpu_count() or 1))),
+}
+
+PIPELINE_CONFIG = {
+    "enabled": os.getenv("PIPELINE_ENABLED", "false").lower() == "true",
+    "queue_size": int(os.getenv("PIPELINE_QUEUE_SIZE", "2")),
+}
+
+ANALYSIS_CONFIG = {
+    "max_workers": int(os.getenv("ANALYSIS_MAX_WORKERS", "5")),
+    "query_timeout": float(os.getenv("ANALYSIS_QUERY_TIMEOUT", "60")),
+    "top_n": int(os.getenv("ANALYSIS_TOP_N", "10")),
+    "group_top_n": int(os.getenv("ANALYSIS_GROUP_TOP_N", "30")),
+    "group_pages": int(os.getenv("ANALYSIS_GROUP_PAGES", "1")),
+}
+
+STAGE_CACHE_CONFIG = {
+    "enabled": os.getenv("STAGE_CACHE_ENABLED", "true").lower() == "true",
+    "cache_dir": os.getenv("STAGE_CACHE_DIR", ".cache/stages"),
+    "max_bytes": int(os.getenv("STAGE_CACHE_MAX_BYTES", str(10 * 1024**3))),
+}
+
+REPORTS_CONFIG = {
+    "max_workers": int(os.getenv("REPORTS_MAX_WORKERS", str(min(os.cpu_count() or 1, 5)))),
+    "cache_enabled": os.getenv("REPORTS_CACHE_ENABLED", "true").lower() == "true",
+}
+
+METRICS_CONFIG = {
+    "enabled": os.getenv("METRICS_ENABLED", "false").lower() == "true",
+    "path": os.getenv("METRICS_PATH", ".metrics/pipeline_metrics.jsonl"),
+    "tracemalloc": os.getenv("METRICS_TRACEMALLOC", "false").lower() == "true",
+    "profile": os.getenv("METRICS_PROFILE", "false").lower() == "true",
+    "profile_dir": os.getenv("METRICS_PROFILE_DIR", ".metrics/profiles"),
+}
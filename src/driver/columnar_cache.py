@@ -0,0 +1,211 @@
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Iterator, Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from src.config.settings import EXTRACT_CONFIG
+
+
+class ColumnarCache:
+    """
+    Cache colunar (Parquet) para os arquivos de origem já convertidos em DataFrames.
+
+    Na primeira leitura, o DataFrame de cada arquivo é gravado em Parquet; as leituras seguintes do mesmo
+    conteúdo são servidas a partir de leituras Arrow com memória mapeada, sem repetir a análise do CSV.
+
+    A chave de cada entrada combina o hash SHA-256 do conteúdo do arquivo com uma variante de leitura (por
+    exemplo, o esquema utilizado), de forma que mudanças no arquivo ou no esquema geram uma nova entrada.
+    Para evitar recalcular o hash a cada execução, o tamanho e o `mtime` de cada arquivo já processado são
+    guardados em um manifesto; o hash só é recalculado quando um deles muda.
+
+    As entradas são removidas por ordem de uso menos recente (LRU) sempre que o tamanho total do cache
+    ultrapassa `max_bytes`.
+
+    Atributos:
+        cache_dir (Path): O diretório onde os arquivos Parquet e o manifesto são armazenados.
+        max_bytes (int): O tamanho máximo, em bytes, ocupado pelas entradas do cache.
+        refresh (bool): Se `True`, ignora as entradas existentes e as regrava a partir dos arquivos de origem.
+    """
+
+    MANIFEST_NAME = "manifest.json"
+    HASH_BLOCK_SIZE = 1024 * 1024
+
+    def __init__(
+        self,
+        cache_dir: str = EXTRACT_CONFIG["cache_dir"],
+        max_bytes: int = EXTRACT_CONFIG["cache_max_bytes"],
+        refresh: bool = False,
+    ) -> None:
+        """
+        Inicializa o cache colunar, criando o diretório se necessário.
+
+        Args:
+            cache_dir (str): O diretório do cache. O padrão vem de `EXTRACT_CACHE_DIR`.
+            max_bytes (int): O tamanho máximo do cache em bytes. O padrão vem de `EXTRACT_CACHE_MAX_BYTES`.
+            refresh (bool): Se `True`, força a releitura de todas as fontes nesta execução.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.refresh = refresh
+        self.__lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        """Copia o estado do cache sem o lock, para que ele possa ser enviado a outros processos."""
+        state = self.__dict__.copy()
+        del state["_ColumnarCache__lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restaura o estado do cache com um novo lock."""
+        self.__dict__.update(state)
+        self.__lock = threading.Lock()
+
+    def key(self, file_path: Path, variant: str = "") -> str:
+        """
+        Calcula a chave do cache para um arquivo de origem.
+
+        Args:
+            file_path (Path): O caminho do arquivo de origem.
+            variant (str): Uma descrição da forma de leitura do arquivo (por exemplo, o esquema).
+
+        Returns:
+            str: A chave da entrada no cache.
+        """
+        content_hash = self.__content_hash(file_path)
+        return hashlib.sha256(f"{content_hash}:{variant}".encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[pd.DataFrame]:
+        """
+        Recupera um DataFrame do cache.
+
+        Args:
+            key (str): A chave calculada por `key`.
+
+        Returns:
+            Optional[pd.DataFrame]: O DataFrame armazenado ou `None` se não houver entrada válida.
+        """
+        entry = self.__entry_path(key)
+        if self.refresh or not entry.exists():
+            return None
+        entry.touch()
+        return pq.read_table(entry, memory_map=True).to_pandas()
+
+    def iter_chunks(self, key: str, chunk_size: int) -> Optional[Iterator[pd.DataFrame]]:
+        """
+        Recupera uma entrada do cache em blocos de tamanho fixo.
+
+        Args:
+            key (str): A chave calculada por `key`.
+            chunk_size (int): A quantidade de linhas de cada bloco.
+
+        Returns:
+            Optional[Iterator[pd.DataFrame]]: Um gerador de blocos ou `None` se não houver entrada válida.
+        """
+        entry = self.__entry_path(key)
+        if self.refresh or not entry.exists():
+            return None
+        entry.touch()
+        return self.__read_batches(entry, chunk_size)
+
+    def put(self, key: str, df: pd.DataFrame) -> None:
+        """
+        Armazena um DataFrame no cache e aplica a política de remoção.
+
+        A gravação é feita em um arquivo temporário e movida atomicamente para o destino.
+
+        Args:
+            key (str): A chave calculada por `key`.
+            df (pd.DataFrame): O DataFrame a ser armazenado.
+        """
+        entry = self.__entry_path(key)
+        temporary = entry.with_name(f"{entry.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        df.to_parquet(temporary, engine="pyarrow", index=False)
+        os.replace(temporary, entry)
+        self.evict()
+
+    def evict(self) -> None:
+        """
+        Remove as entradas usadas há mais tempo até que o cache caiba em `max_bytes`.
+        """
+        with self.__lock:
+            entries = sorted(self.cache_dir.glob("*.parquet"), key=lambda path: path.stat().st_mtime)
+            total = sum(path.stat().st_size for path in entries)
+            for path in entries:
+                if total <= self.max_bytes:
+                    break
+                total -= path.stat().st_size
+                path.unlink(missing_ok=True)
+
+    def __entry_path(self, key: str) -> Path:
+        """Retorna o caminho do arquivo Parquet de uma entrada."""
+        return self.cache_dir / f"{key}.parquet"
+
+    def __content_hash(self, file_path: Path) -> str:
+        """
+        Retorna o hash SHA-256 do conteúdo de um arquivo, reaproveitando o valor do manifesto quando o
+        tamanho e o `mtime` do arquivo não mudaram.
+
+        Args:
+            file_path (Path): O caminho do arquivo.
+
+        Returns:
+            str: O hash do conteúdo do arquivo.
+        """
+        stat = file_path.stat()
+        manifest_key = str(file_path.resolve())
+        with self.__lock:
+            manifest = self.__read_manifest()
+        known = manifest.get(manifest_key)
+        if known and known["size"] == stat.st_size and known["mtime_ns"] == stat.st_mtime_ns:
+            return known["sha256"]
+
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as file:
+            for block in iter(lambda: file.read(self.HASH_BLOCK_SIZE), b""):
+                digest.update(block)
+        content_hash = digest.hexdigest()
+
+        with self.__lock:
+            manifest = self.__read_manifest()
+            manifest[manifest_key] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": content_hash}
+            self.__write_manifest(manifest)
+        return content_hash
+
+    def __read_manifest(self) -> dict:
+        """Lê o manifesto de hashes dos arquivos de origem."""
+        manifest_path = self.cache_dir / self.MANIFEST_NAME
+        if not manifest_path.exists():
+            return {}
+        with open(manifest_path, "r") as file:
+            return json.load(file)
+
+    def __write_manifest(self, manifest: dict) -> None:
+        """Grava o manifesto de hashes dos arquivos de origem de forma atômica."""
+        manifest_path = self.cache_dir / self.MANIFEST_NAME
+        temporary = manifest_path.with_name(f"{self.MANIFEST_NAME}.{os.getpid()}.tmp")
+        with open(temporary, "w") as file:
+            json.dump(manifest, file)
+        os.replace(temporary, manifest_path)
+
+    @staticmethod
+    def __read_batches(entry: Path, chunk_size: int) -> Iterator[pd.DataFrame]:
+        """
+        Lê um arquivo Parquet do cache em lotes.
+
+        Args:
+            entry (Path): O caminho do arquivo Parquet.
+            chunk_size (int): A quantidade de linhas de cada lote.
+
+        Yields:
+            pd.DataFrame: O próximo lote como DataFrame.
+        """
+        parquet_file = pq.ParquetFile(entry, memory_map=True)
+        for batch in parquet_file.iter_batches(batch_size=chunk_size):
+            yield pa.Table.from_batches([batch]).to_pandas()
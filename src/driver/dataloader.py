@@ -1,64 +1,327 @@
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Iterator, List, Optional
 
 import pandas as pd
 
+from src.config.settings import EXTRACT_CONFIG
+from src.driver.columnar_cache import ColumnarCache
 from src.driver.interface.dataloader_interface import DataLoaderInterface
+from src.driver.schemas import SOURCE_SCHEMAS, SourceSchema, get_schema
+from src.driver.source_discovery import DateRange, SourceDiscovery
+from src.errors.schema_error import SchemaError
 
 
 class DataLoader(DataLoaderInterface):
-    """Implementação da DataLoaderInterface para manipulação de arquivos CSV."""
+    """Implementação da DataLoaderInterface para manipulação de arquivos CSV.
 
-    def __init__(self, base_path: str = "data"):
+    Cada fonte pode ser entregue em um único arquivo ou em vários arquivos particionados por data, compactados
+    ou não (ver `SourceDiscovery`). Com um intervalo de datas, as partições fora dele não são lidas, e as linhas
+    das fontes com coluna de data são filtradas pelo intervalo.
+    """
+
+    FILE_NAMES = {key: schema.file_name for key, schema in SOURCE_SCHEMAS.items()}
+
+    def __init__(
+        self,
+        base_path: str = "data",
+        cache: Optional[ColumnarCache] = None,
+        max_workers: int = EXTRACT_CONFIG["max_workers"],
+        date_range: Optional[DateRange] = None,
+    ):
         """Inicializa o carregador de dados com um caminho base para os arquivos CSV.
 
         Args:
             base_path (str): O diretório onde os arquivos CSV estão localizados. O padrão é "data".
+            cache (Optional[ColumnarCache]): Um cache colunar opcional. Quando informado, cada arquivo
+                                             é lido do CSV apenas uma vez por conteúdo e esquema.
+            max_workers (int): A quantidade de arquivos lidos ao mesmo tempo por `extract_all`. Com `1`, os
+                               arquivos são lidos um após o outro. O padrão vem de `EXTRACT_MAX_WORKERS`.
+            date_range (Optional[DateRange]): O intervalo de datas extraído das fontes com coluna de data.
+                                              Sem ele, as fontes são extraídas por inteiro.
 
         Raises:
             FileNotFoundError: Se o diretório especificado não existir.
         """
         self.base_path = Path(base_path)
+        self.cache = cache
+        self.max_workers = max_workers
+        self.date_range = date_range or DateRange()
+        self.__discovery = SourceDiscovery(self.base_path, self.date_range)
         if not self.base_path.exists():
             raise FileNotFoundError(f"Diretório não encontrado: {self.base_path}")
 
-    def load_csv(self, file_name: str) -> pd.DataFrame:
-        """Carrega um arquivo CSV em um DataFrame do pandas.
+    def load_csv(self, file_name: str, schema: Optional[SourceSchema] = None) -> pd.DataFrame:
+        """Carrega um arquivo CSV, compactado ou não, em um DataFrame do pandas.
+
+        Arquivos registrados em `SOURCE_SCHEMAS` são lidos com os tipos explícitos do seu esquema; os demais
+        têm os tipos inferidos pelo pandas. Com um cache configurado, o DataFrame é servido do Parquet
+        correspondente quando o arquivo não mudou desde a última leitura.
 
         Args:
-            file_name (str): O nome do arquivo CSV a ser carregado.
+            file_name (str): O nome do arquivo CSV a ser carregado, relativo ao diretório base.
+            schema (Optional[SourceSchema]): O esquema do arquivo. O padrão é o esquema registrado para o
+                                             nome do arquivo, se houver.
 
         Returns:
             pd.DataFrame: Os dados carregados como um DataFrame.
 
+        Raises:
+            FileNotFoundError: Se o arquivo especificado não existir.
+            SchemaError: Se o arquivo não corresponder ao seu esquema.
+        """
+        file_path = self.__resolve(file_name)
+        schema = schema or get_schema(file_path.name)
+        if self.cache is None:
+            return self.__read_csv(file_path, schema)
+
+        key = self.cache.key(file_path, variant=repr(schema))
+        df = self.cache.get(key)
+        if df is None:
+            df = self.__read_csv(file_path, schema)
+            self.cache.put(key, df)
+        return df
+
+    def load_csv_chunks(
+        self, file_name: str, chunk_size: int, schema: Optional[SourceSchema] = None
+    ) -> Iterator[pd.DataFrame]:
+        """Carrega um arquivo CSV, compactado ou não, em blocos de tamanho fixo, sem manter o arquivo inteiro em
+        memória.
+
+        A existência do arquivo é verificada imediatamente; a leitura só acontece à medida que os blocos
+        são consumidos. Com um cache configurado, os blocos são lidos do Parquet quando o arquivo já foi
+        armazenado por uma leitura completa com `load_csv`.
+
+        Args:
+            file_name (str): O nome do arquivo CSV a ser carregado, relativo ao diretório base.
+            chunk_size (int): A quantidade de linhas de cada bloco.
+            schema (Optional[SourceSchema]): O esquema do arquivo. O padrão é o esquema registrado para o
+                                             nome do arquivo, se houver.
+
+        Returns:
+            Iterator[pd.DataFrame]: Um gerador que produz os blocos do arquivo como DataFrames.
+
+        Raises:
+            FileNotFoundError: Se o arquivo especificado não existir.
+            ValueError: Se o tamanho do bloco não for positivo.
+            SchemaError: Se o cabeçalho do arquivo não corresponder ao seu esquema. Valores incompatíveis
+                         com os tipos do esquema são detectados ao consumir o bloco que os contém.
+        """
+        if chunk_size <= 0:
+            raise ValueError("O tamanho do bloco deve ser maior que zero.")
+        file_path = self.__resolve(file_name)
+        schema = schema or get_schema(file_path.name)
+        if self.cache is not None:
+            cached_chunks = self.cache.iter_chunks(self.cache.key(file_path, variant=repr(schema)), chunk_size)
+            if cached_chunks is not None:
+                return cached_chunks
+        self.__validate_header(file_path, schema)
+        return self.__read_chunks(file_path, chunk_size, schema)
+
+    def extract_all(self, since: Optional[Dict[str, pd.Timestamp]] = None) -> Dict[str, pd.DataFrame]:
+        """Carrega as fontes predefinidas em DataFrames do pandas.
+
+        As fontes a serem carregadas são predefinidas e incluem:
+            - estoque_hering.csv (ou o diretório estoque/)
+            - lojas_hering.csv (ou o diretório lojas/)
+            - produtos_hering.csv (ou o diretório produtos/)
+            - vendas_hering.csv (ou o diretório vendas/)
+
+        Com `max_workers` maior que 1, os arquivos são lidos ao mesmo tempo em um pool de threads (os leitores
+        de CSV do pandas e do pyarrow liberam o GIL durante a análise), e o tempo total passa a ser limitado
+        pelo maior arquivo em vez da soma de todos. Os arquivos de uma mesma fonte são juntados em um único
+        DataFrame.
+
+        Args:
+            since (Optional[Dict[str, pd.Timestamp]]): A primeira data de interesse de cada fonte, como as marcas
+                d'água da carga incremental. As partições que terminam antes dela não são lidas (ver
+                `SourceDiscovery.find`); as linhas anteriores das partições lidas são mantidas.
+
+        Returns:
+            Dict[str, pd.DataFrame]: Um dicionário onde as chaves são os nomes dos conjuntos de dados
+            e os valores são os DataFrames correspondentes.
+
+        Raises:
+            FileNotFoundError: Se algum dos arquivos não existir.
+            SchemaError: Se algum dos arquivos não corresponder ao seu esquema.
+        """
+        files = [(key, file_path) for key, paths in self.source_paths(since).items() for file_path in paths]
+        if self.max_workers <= 1:
+            frames = [self.__load_source_file(key, file_path) for key, file_path in files]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_workers, len(files)), thread_name_prefix="extract"
+            ) as executor:
+                futures = [executor.submit(self.__load_source_file, key, file_path) for key, file_path in files]
+            frames = [future.result() for future in futures]
+
+        data: Dict[str, List[pd.DataFrame]] = {}
+        for (key, _), df in zip(files, frames):
+            data.setdefault(key, []).append(df)
+        return {key: SOURCE_SCHEMAS[key].concat(source_frames) for key, source_frames in data.items()}
+
+    def extract_all_chunks(self, chunk_size: int) -> Dict[str, Iterator[pd.DataFrame]]:
+        """Prepara a leitura em blocos das fontes predefinidas.
+
+        Os blocos de uma fonte entregue em vários arquivos são produzidos arquivo a arquivo, na ordem dos
+        arquivos.
+
+        Args:
+            chunk_size (int): A quantidade de linhas de cada bloco.
+
+        Returns:
+            Dict[str, Iterator[pd.DataFrame]]: Um dicionário onde as chaves são os nomes dos conjuntos de dados
+            e os valores são geradores de blocos de cada fonte.
+        """
+        return {key: self.__source_chunks(key, paths, chunk_size) for key, paths in self.source_paths().items()}
+
+    def source_paths(self, since: Optional[Dict[str, pd.Timestamp]] = None) -> Dict[str, List[Path]]:
+        """Localiza os arquivos das fontes predefinidas, sem as partições fora do intervalo de datas.
+
+        Args:
+            since (Optional[Dict[str, pd.Timestamp]]): A primeira data de interesse de cada fonte. As partições
+                que terminam antes dela também são descartadas.
+
+        Returns:
+            Dict[str, List[Path]]: Um dicionário onde as chaves são os nomes dos conjuntos de dados
+            e os valores são os caminhos dos arquivos de cada um.
+
+        Raises:
+            FileNotFoundError: Se alguma das fontes não tiver arquivos.
+        """
+        since = since or {}
+        return {key: self.__discovery.find(schema, since.get(key)) for key, schema in SOURCE_SCHEMAS.items()}
+
+    def load_source(self, key: str, paths: List[Path]) -> pd.DataFrame:
+        """Carrega alguns arquivos de uma fonte predefinida em um único DataFrame.
+
+        Usado pela transformação particionada, em que cada processo lê apenas os arquivos da sua partição. As
+        linhas fora do intervalo de datas são descartadas, como em `extract_all`.
+
+        Args:
+            key (str): O nome da fonte.
+            paths (List[Path]): Os arquivos da fonte a serem lidos, entre os retornados por `source_paths`.
+
+        Returns:
+            pd.DataFrame: Os dados dos arquivos juntados em um DataFrame.
+
+        Raises:
+            FileNotFoundError: Se algum dos arquivos não existir.
+            SchemaError: Se algum dos arquivos não corresponder ao esquema da fonte.
+        """
+        return SOURCE_SCHEMAS[key].concat([self.__load_source_file(key, file_path) for file_path in paths])
+
+    def __load_source_file(self, key: str, file_path: Path) -> pd.DataFrame:
+        """Carrega um arquivo de uma fonte predefinida, mantendo as linhas dentro do intervalo de datas."""
+        schema = SOURCE_SCHEMAS[key]
+        df = self.load_csv(str(file_path.relative_to(self.base_path)), schema)
+        return self.date_range.filter(df, schema.watermark_column)
+
+    def __source_chunks(self, key: str, paths: List[Path], chunk_size: int) -> Iterator[pd.DataFrame]:
+        """Prepara os blocos de todos os arquivos de uma fonte, verificando os seus cabeçalhos imediatamente.
+
+        Args:
+            key (str): O nome da fonte.
+            paths (List[Path]): Os arquivos da fonte.
+            chunk_size (int): A quantidade de linhas de cada bloco.
+
+        Returns:
+            Iterator[pd.DataFrame]: Os blocos dos arquivos, um arquivo após o outro, dentro do intervalo de datas.
+        """
+        schema = SOURCE_SCHEMAS[key]
+        chunks = chain.from_iterable(
+            [
+                self.load_csv_chunks(str(file_path.relative_to(self.base_path)), chunk_size, schema)
+                for file_path in paths
+            ]
+        )
+        if schema.watermark_column is None or not self.date_range.bounded:
+            return chunks
+        return self.__filter_chunks(chunks, schema.watermark_column)
+
+    def __filter_chunks(self, chunks: Iterator[pd.DataFrame], column: str) -> Iterator[pd.DataFrame]:
+        """Mantém as linhas dos blocos dentro do intervalo de datas, descartando os blocos que ficarem vazios."""
+        for chunk in chunks:
+            chunk = self.date_range.filter(chunk, column)
+            if not chunk.empty:
+                yield chunk
+
+    def __resolve(self, file_name: str) -> Path:
+        """Monta o caminho completo de um arquivo e verifica se ele existe.
+
+        Args:
+            file_name (str): O nome do arquivo CSV.
+
+        Returns:
+            Path: O caminho do arquivo.
+
         Raises:
             FileNotFoundError: Se o arquivo especificado não existir.
         """
         file_path = self.base_path / file_name
         if not file_path.exists():
             raise FileNotFoundError(f"Arquivo não encontrado: {file_path}")
-        return pd.read_csv(file_path)
+        return file_path
 
-    def extract_all(self) -> Dict[str, pd.DataFrame]:
-        """Carrega múltiplos arquivos CSV predefinidos em DataFrames do pandas.
+    def __read_csv(self, file_path: Path, schema: Optional[SourceSchema]) -> pd.DataFrame:
+        """Lê um arquivo CSV por inteiro, aplicando o seu esquema quando registrado.
 
-        Os arquivos a serem carregados são predefinidos e incluem:
-            - estoque_hering.csv
-            - lojas_hering.csv
-            - produtos_hering.csv
-            - vendas_hering.csv
+        Args:
+            file_path (Path): O caminho do arquivo CSV.
+            schema (Optional[SourceSchema]): O esquema do arquivo, se registrado.
 
         Returns:
-            Dict[str, pd.DataFrame]: Um dicionário onde as chaves são os nomes dos conjuntos de dados
-            e os valores são os DataFrames correspondentes.
+            pd.DataFrame: Os dados carregados como um DataFrame.
+
+        Raises:
+            SchemaError: Se o arquivo não corresponder ao seu esquema.
+        """
+        self.__validate_header(file_path, schema)
+        if schema is None:
+            return pd.read_csv(file_path)
+        try:
+            df = pd.read_csv(file_path, **schema.read_options())
+        except (TypeError, ValueError) as error:
+            raise SchemaError(f"O arquivo {file_path} não corresponde ao esquema: {error}") from error
+        return schema.apply(df)
+
+    @staticmethod
+    def __validate_header(file_path: Path, schema: Optional[SourceSchema]) -> None:
+        """Valida o cabeçalho de um arquivo com o seu esquema.
+
+        Args:
+            file_path (Path): O caminho do arquivo CSV.
+            schema (Optional[SourceSchema]): O esquema do arquivo. Sem ele, o cabeçalho não é validado.
+
+        Raises:
+            SchemaError: Se o cabeçalho não contiver todas as colunas do esquema.
+        """
+        if schema is not None:
+            schema.validate_header(list(pd.read_csv(file_path, nrows=0).columns))
+
+    @staticmethod
+    def __read_chunks(file_path: Path, chunk_size: int, schema: Optional[SourceSchema]) -> Iterator[pd.DataFrame]:
+        """Lê um arquivo CSV bloco a bloco.
+
+        Args:
+            file_path (Path): O caminho do arquivo CSV.
+            chunk_size (int): A quantidade de linhas de cada bloco.
+            schema (Optional[SourceSchema]): O esquema do arquivo, se registrado.
+
+        Yields:
+            pd.DataFrame: O próximo bloco do arquivo.
+
+        Raises:
+            SchemaError: Se um bloco contiver valores incompatíveis com o esquema.
         """
-        file_names = {
-            "stock": "estoque_hering.csv",
-            "store": "lojas_hering.csv",
-            "products": "produtos_hering.csv",
-            "sales": "vendas_hering.csv",
-        }
-        data = {}
-        for key, file_name in file_names.items():
-            data[key] = self.load_csv(file_name)
-        return data
+        if schema is None:
+            with pd.read_csv(file_path, chunksize=chunk_size) as reader:
+                yield from reader
+            return
+        try:
+            with pd.read_csv(file_path, chunksize=chunk_size, **schema.read_options()) as reader:
+                for chunk in reader:
+                    yield schema.apply(chunk)
+        except (TypeError, ValueError) as error:
+            raise SchemaError(f"O arquivo {file_path} não corresponde ao esquema: {error}") from error
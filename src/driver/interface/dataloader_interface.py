@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Dict
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
 
 import pandas as pd
 
@@ -20,10 +21,49 @@ class DataLoaderInterface(ABC):
         pass
 
     @abstractmethod
-    def extract_all(self) -> Dict[str, pd.DataFrame]:
+    def load_csv_chunks(self, file_name: str, chunk_size: int) -> Iterator[pd.DataFrame]:
+        """Carrega um arquivo CSV em blocos de tamanho fixo.
+
+        Args:
+            file_name (str): O nome do arquivo CSV.
+            chunk_size (int): A quantidade de linhas de cada bloco.
+
+        Returns:
+            Iterator[pd.DataFrame]: Um gerador que produz os blocos do arquivo como DataFrames.
+        """
+        pass
+
+    @abstractmethod
+    def extract_all(self, since: Optional[Dict[str, pd.Timestamp]] = None) -> Dict[str, pd.DataFrame]:
         """Carrega múltiplos arquivos CSV predefinidos em DataFrames do pandas.
 
+        Args:
+            since (Optional[Dict[str, pd.Timestamp]]): A primeira data de interesse de cada fonte. Os arquivos
+                que contêm apenas datas anteriores a ela podem deixar de ser lidos.
+
         Returns:
             dict: Um dicionário onde as chaves são os nomes dos conjuntos de dados e os valores são os DataFrames.
         """
         pass
+
+    @abstractmethod
+    def extract_all_chunks(self, chunk_size: int) -> Dict[str, Iterator[pd.DataFrame]]:
+        """Prepara a leitura em blocos dos arquivos CSV predefinidos.
+
+        Args:
+            chunk_size (int): A quantidade de linhas de cada bloco.
+
+        Returns:
+            dict: Um dicionário onde as chaves são os nomes dos conjuntos de dados e os valores são geradores de blocos.
+        """
+        pass
+
+    @abstractmethod
+    def source_paths(self) -> Dict[str, List[Path]]:
+        """Retorna os caminhos dos arquivos de origem predefinidos, para leitura direta por outros motores.
+
+        Returns:
+            dict: Um dicionário onde as chaves são os nomes dos conjuntos de dados e os valores são as listas
+            com os caminhos dos arquivos de cada um.
+        """
+        pass
@@ -0,0 +1,219 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.errors.schema_error import SchemaError
+
+
+@dataclass(frozen=True)
+class SourceSchema:
+    """
+    Esquema de leitura de um arquivo de origem.
+
+    Os tipos seguem as tabelas definidas em `src/queries/create`: colunas `INT` usam inteiros de 32 bits
+    (anuláveis, `Int32`, quando o arquivo pode trazer valores ausentes que a limpeza preenche depois),
+    colunas `DECIMAL` usam `float64`, chaves de baixa cardinalidade usam `category` e colunas `DATE`
+    são convertidas para `datetime64`.
+
+    Attributes:
+        file_name (str): O nome do arquivo CSV da fonte, quando ela é entregue em um único arquivo.
+        directory (Optional[str]): O diretório da fonte quando ela é entregue em vários arquivos, particionados
+                                   por data (por exemplo, `vendas/2024-06/*.csv.zst`).
+        dtypes (Dict[str, str]): Os tipos de cada coluna lida diretamente pelo leitor de CSV.
+        date_columns (List[str]): As colunas convertidas para datas após a leitura.
+        watermark_column (Optional[str]): A coluna de data usada como marca d'água nas cargas incrementais e no
+                                          filtro por intervalo de datas. Fontes sem essa coluna são sempre
+                                          carregadas por inteiro.
+    """
+
+    file_name: str
+    dtypes: Dict[str, str]
+    date_columns: List[str] = field(default_factory=list)
+    watermark_column: Optional[str] = None
+    directory: Optional[str] = None
+
+    @property
+    def columns(self) -> List[str]:
+        """Retorna todas as colunas esperadas no arquivo."""
+        return [*self.date_columns, *self.dtypes]
+
+    def read_options(self) -> dict:
+        """
+        Monta os argumentos de `pd.read_csv` para este esquema.
+
+        Returns:
+            dict: Os argumentos `usecols` e `dtype`. Colunas de data são lidas como texto e convertidas
+            em `apply`.
+        """
+        return {
+            "usecols": self.columns,
+            "dtype": {**self.dtypes, **{column: "string" for column in self.date_columns}},
+        }
+
+    def validate_header(self, header: List[str]) -> None:
+        """
+        Verifica se o cabeçalho do arquivo contém todas as colunas do esquema.
+
+        Colunas extras são permitidas e descartadas na leitura.
+
+        Args:
+            header (List[str]): As colunas encontradas no arquivo.
+
+        Raises:
+            SchemaError: Se alguma coluna do esquema estiver ausente.
+        """
+        missing = [column for column in self.columns if column not in header]
+        if missing:
+            raise SchemaError(f"O arquivo {self.file_name} não contém as colunas esperadas: {', '.join(missing)}")
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Converte as colunas de data de um DataFrame lido com `read_options`.
+
+        Args:
+            df (pd.DataFrame): O DataFrame (ou bloco) lido do arquivo.
+
+        Returns:
+            pd.DataFrame: O DataFrame com as colunas de data convertidas.
+
+        Raises:
+            SchemaError: Se alguma data não estiver no formato ISO 8601.
+        """
+        for column in self.date_columns:
+            try:
+                df[column] = pd.to_datetime(df[column], format="ISO8601")
+            except (TypeError, ValueError) as error:
+                raise SchemaError(f"A coluna {column} do arquivo {self.file_name} contém datas inválidas: {error}")
+        return df
+
+    def row_hashes(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Calcula um hash de cada linha pelas colunas do esquema, usado nas cargas incrementais para reconhecer as
+        linhas já carregadas na data da marca d'água.
+
+        Os valores são convertidos em texto antes do hash (as datas como `AAAA-MM-DD`), de modo que o resultado
+        não depende de a coluna ser categórica ou de o inteiro ser anulável, e pode ser gravado no banco de dados
+        e comparado em outra execução.
+
+        Args:
+            df (pd.DataFrame): As linhas, com as colunas do esquema (colunas ausentes são ignoradas).
+
+        Returns:
+            np.ndarray: O hash de 64 bits (`int64`) de cada linha, na ordem do DataFrame.
+        """
+        text = pd.DataFrame(
+            {
+                column: df[column].dt.strftime("%Y-%m-%d") if column in self.date_columns else df[column].astype(str)
+                for column in self.columns
+                if column in df
+            }
+        )
+        return pd.util.hash_pandas_object(text, index=False).to_numpy().view("int64")
+
+    def concat(self, frames: List[pd.DataFrame]) -> pd.DataFrame:
+        """
+        Junta os DataFrames lidos de vários arquivos da fonte em um único DataFrame.
+
+        O `pd.concat` converte para `object` as colunas categóricas com categorias diferentes em cada arquivo;
+        essas colunas voltam a ser categóricas após a junção.
+
+        Args:
+            frames (List[pd.DataFrame]): Os DataFrames de cada arquivo, lidos com este esquema.
+
+        Returns:
+            pd.DataFrame: Os DataFrames juntos, com os tipos do esquema.
+        """
+        if len(frames) == 1:
+            return frames[0]
+        df = pd.concat(frames, ignore_index=True)
+        for column, dtype in self.dtypes.items():
+            if dtype == "category" and not isinstance(df[column].dtype, pd.CategoricalDtype):
+                df[column] = df[column].astype("category")
+        return df
+
+
+SOURCE_SCHEMAS: Dict[str, SourceSchema] = {
+    "stock": SourceSchema(
+        file_name="estoque_hering.csv",
+        directory="estoque",
+        date_columns=["DATA_FOTO"],
+        watermark_column="DATA_FOTO",
+        dtypes={
+            "ID_FILIAL": "int32",
+            "PRODUTO": "category",
+            "COR_PRODUTO": "category",
+            "TAMANHO": "category",
+            "TOTAL": "int32",
+            "TRANSITO": "int32",
+        },
+    ),
+    "store": SourceSchema(
+        file_name="lojas_hering.csv",
+        directory="lojas",
+        dtypes={
+            "ID_FILIAL": "int32",
+            "LOJA": "object",
+            "PONTO_VENDA_COD": "Int32",
+            "PONTO_VENDA": "object",
+            "PUBLICO_LOJA": "category",
+            "CANAL": "category",
+            "CIDADE": "category",
+            "LOJA_M2": "Int32",
+            "PAIS": "category",
+            "UF": "category",
+            "CLIMA": "category",
+            "STATUS": "category",
+        },
+    ),
+    "products": SourceSchema(
+        file_name="produtos_hering.csv",
+        directory="produtos",
+        dtypes={
+            "ARTIGO_COR": "object",
+            "ARTIGO": "object",
+            "DESC_PRODUTO": "object",
+            "COR": "category",
+            "COR_DESCRICAO": "object",
+            "NEGOCIO": "category",
+            "PARTE": "category",
+            "GRUPO": "category",
+            "GENERO": "category",
+            "COD_COTA": "Int32",
+            "COLECAO": "category",
+            "PIRAMIDE": "category",
+        },
+    ),
+    "sales": SourceSchema(
+        file_name="vendas_hering.csv",
+        directory="vendas",
+        date_columns=["DATA_VENDA"],
+        watermark_column="DATA_VENDA",
+        dtypes={
+            "ID_FILIAL": "int32",
+            "PRODUTO": "category",
+            "COR_PRODUTO": "category",
+            "TAMANHO": "category",
+            "VENDA_PECAS": "Int32",
+            "VENDA_LIQUIDA": "float64",
+            "VENDA_BRUTA": "float64",
+        },
+    ),
+}
+
+
+def get_schema(file_name: str) -> Optional[SourceSchema]:
+    """
+    Busca o esquema registrado para um arquivo.
+
+    Args:
+        file_name (str): O nome do arquivo CSV.
+
+    Returns:
+        Optional[SourceSchema]: O esquema do arquivo ou `None` se ele não estiver registrado.
+    """
+    for schema in SOURCE_SCHEMAS.values():
+        if schema.file_name == file_name:
+            return schema
+    return None
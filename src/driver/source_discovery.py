@@ -0,0 +1,234 @@
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import pandas as pd
+
+from src.driver.schemas import SourceSchema
+
+COMPRESSION_SUFFIXES = (".gz", ".zst", ".bz2", ".xz")
+"""Extensões de compressão aceitas nos arquivos de origem; o pandas descompacta os arquivos pela extensão."""
+
+PARTITION_DATE = re.compile(r"(\d{4})-(\d{2})(?:-(\d{2}))?")
+"""Data de uma partição no caminho de um arquivo: `AAAA-MM` (mês) ou `AAAA-MM-DD` (dia)."""
+
+
+@dataclass(frozen=True)
+class DateRange:
+    """
+    Intervalo de datas, com os dois limites inclusivos, das linhas extraídas das fontes com coluna de data.
+
+    Attributes:
+        start (Optional[pd.Timestamp]): A primeira data do intervalo ou `None`, sem limite inicial.
+        end (Optional[pd.Timestamp]): A última data do intervalo ou `None`, sem limite final.
+    """
+
+    start: Optional[pd.Timestamp] = None
+    end: Optional[pd.Timestamp] = None
+
+    @classmethod
+    def parse(cls, start: str = "", end: str = "") -> "DateRange":
+        """
+        Cria um intervalo a partir de datas no formato ISO 8601 (`AAAA-MM-DD`).
+
+        Args:
+            start (str): A primeira data do intervalo. Vazia, o intervalo não tem limite inicial.
+            end (str): A última data do intervalo. Vazia, o intervalo não tem limite final.
+
+        Returns:
+            DateRange: O intervalo de datas.
+
+        Raises:
+            ValueError: Se alguma data for inválida ou se o fim for anterior ao início.
+        """
+        try:
+            date_range = cls(
+                start=pd.Timestamp(start).normalize() if start else None,
+                end=pd.Timestamp(end).normalize() if end else None,
+            )
+        except ValueError as error:
+            raise ValueError(f"Intervalo de datas inválido ({start!r} a {end!r}): {error}") from error
+        if date_range.start is not None and date_range.end is not None and date_range.end < date_range.start:
+            raise ValueError(f"A data final ({end}) é anterior à data inicial ({start}).")
+        return date_range
+
+    def __str__(self) -> str:
+        if self.start is None and self.end is None:
+            return "sem limites"
+        if self.end is None:
+            return f"a partir de {self.start.date().isoformat()}"
+        if self.start is None:
+            return f"até {self.end.date().isoformat()}"
+        return f"de {self.start.date().isoformat()} a {self.end.date().isoformat()}"
+
+    @property
+    def bounded(self) -> bool:
+        """Indica se o intervalo tem algum limite."""
+        return self.start is not None or self.end is not None
+
+    def overlaps(self, first: pd.Timestamp, last: pd.Timestamp) -> bool:
+        """
+        Verifica se um período, com os dois limites inclusivos, tem alguma data dentro do intervalo.
+
+        Args:
+            first (pd.Timestamp): A primeira data do período.
+            last (pd.Timestamp): A última data do período.
+
+        Returns:
+            bool: `True` se o período e o intervalo se sobrepõem.
+        """
+        return (self.start is None or last >= self.start) and (self.end is None or first <= self.end)
+
+    def filter(self, df: pd.DataFrame, column: Optional[str]) -> pd.DataFrame:
+        """
+        Mantém apenas as linhas de um DataFrame com a data dentro do intervalo.
+
+        Args:
+            df (pd.DataFrame): O DataFrame (ou bloco) de uma fonte.
+            column (Optional[str]): A coluna de data da fonte. Sem ela, o DataFrame é retornado inteiro.
+
+        Returns:
+            pd.DataFrame: As linhas dentro do intervalo.
+        """
+        if not self.bounded or column is None:
+            return df
+        mask = pd.Series(True, index=df.index)
+        if self.start is not None:
+            mask &= df[column] >= self.start
+        if self.end is not None:
+            mask &= df[column] < self.end + pd.Timedelta(days=1)
+        return df if mask.all() else df[mask].reset_index(drop=True)
+
+
+class SourceDiscovery:
+    """
+    Localiza os arquivos de cada fonte de dados em um diretório base.
+
+    Para cada fonte, são procurados, nesta ordem:
+
+    1. Os arquivos do diretório particionado da fonte (`SourceSchema.directory`), em qualquer nível, com a
+       extensão `.csv`, compactados ou não (por exemplo, `vendas/2024-06/parte-1.csv.zst`).
+    2. O arquivo único da fonte (`SourceSchema.file_name`), sem compressão ou com uma das extensões de
+       `COMPRESSION_SUFFIXES` (por exemplo, `vendas_hering.csv.gz`).
+
+    Nas fontes com coluna de data (`SourceSchema.watermark_column`), os arquivos do diretório particionado são
+    podados pelo intervalo de datas: a data mais interna no caminho do arquivo (`2024-06`, `data=2024-06-09`,
+    `vendas_2024-06.csv.gz`) define o período da partição, e as partições fora do intervalo são descartadas sem
+    serem abertas. Da mesma forma, na carga incremental, as partições que terminam antes da marca d'água da
+    fonte são descartadas. Arquivos sem data no caminho são sempre lidos.
+
+    Atributos:
+        base_path (Path): O diretório onde as fontes estão localizadas.
+        date_range (DateRange): O intervalo de datas usado na poda das partições.
+    """
+
+    def __init__(self, base_path: Path, date_range: Optional[DateRange] = None) -> None:
+        """
+        Inicializa a busca das fontes.
+
+        Args:
+            base_path (Path): O diretório onde as fontes estão localizadas.
+            date_range (Optional[DateRange]): O intervalo de datas das partições lidas. Sem ele, todas são lidas.
+        """
+        self.base_path = Path(base_path)
+        self.date_range = date_range or DateRange()
+
+    def find(self, schema: SourceSchema, since: Optional[pd.Timestamp] = None) -> List[Path]:
+        """
+        Localiza os arquivos de uma fonte, em ordem, descartando as partições fora do intervalo de datas.
+
+        Com `since`, as partições que terminam antes dessa data também são descartadas. Se nenhuma partição
+        chegar até ela, apenas a última é mantida, para que a fonte continue sendo lida com as suas colunas;
+        as suas linhas, todas anteriores a `since`, são descartadas depois da leitura.
+
+        Args:
+            schema (SourceSchema): O esquema da fonte.
+            since (Optional[pd.Timestamp]): A primeira data de interesse, como a marca d'água da carga
+                incremental. Sem ela, as partições são podadas apenas pelo intervalo de datas.
+
+        Returns:
+            List[Path]: Os caminhos dos arquivos da fonte.
+
+        Raises:
+            FileNotFoundError: Se a fonte não tiver nenhum arquivo ou nenhuma partição dentro do intervalo.
+        """
+        directory = self.base_path / schema.directory if schema.directory else None
+        files = self.__partition_files(directory) if directory is not None and directory.is_dir() else []
+        if not files:
+            single_file = self.__single_file(schema.file_name)
+            if single_file is None:
+                raise FileNotFoundError(f"Arquivo não encontrado: {self.base_path / schema.file_name}")
+            return [single_file]
+        if schema.watermark_column is None or (not self.date_range.bounded and since is None):
+            return files
+
+        selected = [path for path in files if self.__in_range(path.relative_to(directory), self.date_range)]
+        if not selected:
+            raise FileNotFoundError(f"Nenhuma partição de {directory} no intervalo {self.date_range}.")
+        if since is None:
+            return selected
+        recent = [path for path in selected if self.__in_range(path.relative_to(directory), DateRange(start=since))]
+        return recent or selected[-1:]
+
+    @staticmethod
+    def is_source_file(path: Path) -> bool:
+        """
+        Verifica se um arquivo é um CSV, compactado ou não.
+
+        Args:
+            path (Path): O caminho do arquivo.
+
+        Returns:
+            bool: `True` para arquivos `.csv` e `.csv` seguidos de uma extensão de `COMPRESSION_SUFFIXES`.
+        """
+        name = path.name.lower()
+        return name.endswith(".csv") or any(name.endswith(f".csv{suffix}") for suffix in COMPRESSION_SUFFIXES)
+
+    @staticmethod
+    def partition_period(relative_path: Path) -> Optional[Tuple[pd.Timestamp, pd.Timestamp]]:
+        """
+        Extrai o período de uma partição a partir da data mais interna no caminho do arquivo.
+
+        Args:
+            relative_path (Path): O caminho do arquivo relativo ao diretório da fonte.
+
+        Returns:
+            Optional[Tuple[pd.Timestamp, pd.Timestamp]]: A primeira e a última data da partição (um mês para
+            `AAAA-MM` e um dia para `AAAA-MM-DD`) ou `None` se o caminho não tiver data.
+        """
+        for part in reversed(relative_path.parts):
+            matches = list(PARTITION_DATE.finditer(part))
+            if not matches:
+                continue
+            year, month, day = matches[-1].groups()
+            try:
+                if day is None:
+                    first = pd.Timestamp(year=int(year), month=int(month), day=1)
+                    return first, first + pd.offsets.MonthEnd(0)
+                first = pd.Timestamp(year=int(year), month=int(month), day=int(day))
+            except ValueError:
+                continue
+            return first, first
+        return None
+
+    def __partition_files(self, directory: Path) -> List[Path]:
+        """Lista, em ordem, os arquivos CSV (compactados ou não) do diretório particionado de uma fonte."""
+        return sorted(
+            path
+            for path in directory.rglob("*")
+            if path.is_file() and not path.name.startswith(".") and self.is_source_file(path)
+        )
+
+    def __single_file(self, file_name: str) -> Optional[Path]:
+        """Retorna o arquivo único de uma fonte, sem compressão ou compactado, ou `None` se ele não existir."""
+        for suffix in ("", *COMPRESSION_SUFFIXES):
+            file_path = self.base_path / f"{file_name}{suffix}"
+            if file_path.exists():
+                return file_path
+        return None
+
+    def __in_range(self, relative_path: Path, date_range: DateRange) -> bool:
+        """Verifica se a partição de um arquivo tem alguma data dentro de um intervalo."""
+        period = self.partition_period(relative_path)
+        return period is None or date_range.overlaps(*period)
@@ -0,0 +1,184 @@
+import glob
+import hashlib
+from dataclasses import fields
+from pathlib import Path
+from typing import Dict, List, Optional, Type, TypeVar
+
+import pandas as pd
+
+from src.config.settings import STAGE_CACHE_CONFIG
+from src.driver.columnar_cache import ColumnarCache
+
+Contract = TypeVar("Contract")
+
+
+class StageCache(ColumnarCache):
+    """
+    Cache dos resultados das etapas do pipeline, endereçado pelo conteúdo das suas entradas.
+
+    A chave de cada etapa combina as chaves das entradas com a versão do código da etapa (o hash dos arquivos
+    listados em `STAGE_SOURCES`) e com a configuração informada:
+
+    - extração: o hash do conteúdo de cada arquivo de origem;
+    - transformação: a chave da extração e a configuração da transformação;
+    - carga: a chave da transformação.
+
+    Os contratos de extração e de transformação são gravados com um arquivo Parquet por DataFrame, reaproveitando
+    o armazenamento e a remoção por uso menos recente (LRU) de `ColumnarCache`; um contrato com algum arquivo
+    removido deixa de ser encontrado. A carga não gera dados: a chave da última carga concluída é registrada no
+    próprio banco de dados (ver `LoadData.mark_loaded`), e não neste cache, para que um banco recriado ou com as
+    tabelas esvaziadas seja carregado de novo.
+
+    Atributos:
+        cache_dir (Path): O diretório do cache.
+        max_bytes (int): O tamanho máximo, em bytes, ocupado pelos contratos.
+        refresh (bool): Se `True`, nenhuma etapa é reaproveitada, mas os resultados desta execução são gravados.
+    """
+
+    STAGE_SOURCES = {
+        "extract": (
+            "src/driver/dataloader.py",
+            "src/driver/schemas.py",
+            "src/driver/source_discovery.py",
+            "src/stages/extract/**/*.py",
+            "src/stages/contracts/extract_contract.py",
+        ),
+        "transform": (
+            "src/stages/transform/**/*.py",
+            "src/queries/transform/*.sql",
+            "src/stages/contracts/transform_contract.py",
+        ),
+        "load": (
+            "src/stages/load/**/*.py",
+            "src/infra/database_repository.py",
+            "src/infra/async_database_repository.py",
+            "src/queries/create/*.sql",
+            "src/queries/keys/*.sql",
+            "src/queries/indexes/*.sql",
+            "src/queries/partitions/*.sql",
+            "src/queries/loads/*.sql",
+            "src/queries/views/*.sql",
+        ),
+    }
+
+    def __init__(
+        self,
+        cache_dir: str = STAGE_CACHE_CONFIG["cache_dir"],
+        max_bytes: int = STAGE_CACHE_CONFIG["max_bytes"],
+        refresh: bool = False,
+    ) -> None:
+        """
+        Inicializa o cache das etapas, criando o diretório se necessário.
+
+        Args:
+            cache_dir (str): O diretório do cache. O padrão vem de `STAGE_CACHE_DIR`.
+            max_bytes (int): O tamanho máximo do cache em bytes. O padrão vem de `STAGE_CACHE_MAX_BYTES`.
+            refresh (bool): Se `True`, executa todas as etapas nesta execução (`--no-cache`).
+        """
+        super().__init__(cache_dir=cache_dir, max_bytes=max_bytes, refresh=refresh)
+
+    def files_key(self, paths: Dict[str, List[Path]]) -> str:
+        """
+        Calcula a chave do conteúdo de um conjunto de arquivos de origem.
+
+        Args:
+            paths (Dict[str, List[Path]]): Os caminhos dos arquivos de cada fonte.
+
+        Returns:
+            str: A chave do conjunto de arquivos.
+        """
+        return self.__digest(
+            *(f"{source}={self.key(Path(path))}" for source in sorted(paths) for path in paths[source])
+        )
+
+    def stage_key(self, stage: str, *inputs: object) -> str:
+        """
+        Calcula a chave do resultado de uma etapa.
+
+        Args:
+            stage (str): `"extract"`, `"transform"` ou `"load"`.
+            *inputs (object): As chaves das entradas da etapa e a configuração que altera o seu resultado.
+
+        Returns:
+            str: A chave do resultado da etapa.
+        """
+        return self.__digest(stage, self.code_version(stage), *map(repr, inputs))
+
+    def code_version(self, stage: str) -> str:
+        """
+        Calcula a versão do código de uma etapa a partir do conteúdo dos seus arquivos.
+
+        Args:
+            stage (str): O nome da etapa em `STAGE_SOURCES`.
+
+        Returns:
+            str: O hash dos arquivos da etapa.
+        """
+        digest = hashlib.sha256()
+        for pattern in self.STAGE_SOURCES[stage]:
+            for file_name in sorted(glob.glob(pattern, recursive=True)):
+                digest.update(file_name.encode())
+                with open(file_name, "rb") as file:
+                    digest.update(file.read())
+        return digest.hexdigest()
+
+    def get_contract(self, key: str, contract_type: Type[Contract]) -> Optional[Contract]:
+        """
+        Recupera um contrato do cache.
+
+        Args:
+            key (str): A chave calculada por `stage_key`.
+            contract_type (Type[Contract]): A classe do contrato.
+
+        Returns:
+            Optional[Contract]: O contrato ou `None` se algum dos seus DataFrames não estiver no cache.
+        """
+        frames = {}
+        for item in fields(contract_type):
+            frames[item.name] = self.get(f"{key}-{item.name}")
+            if frames[item.name] is None:
+                return None
+        return contract_type(**frames)
+
+    def put_contract(self, key: str, contract: object) -> None:
+        """
+        Armazena cada DataFrame de um contrato no cache.
+
+        Args:
+            key (str): A chave calculada por `stage_key`.
+            contract (object): O contrato de extração ou de transformação.
+        """
+        for item in fields(contract):
+            self.put(f"{key}-{item.name}", self._to_parquet_frame(getattr(contract, item.name)))
+
+    @staticmethod
+    def _to_parquet_frame(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Prepara um DataFrame para o Parquet: as colunas de texto que misturam textos e números, como as
+        preenchidas com `0` pela limpeza da transformação, passam a ter apenas textos, como ficam no banco.
+
+        Args:
+            df (pd.DataFrame): O DataFrame de um contrato.
+
+        Returns:
+            pd.DataFrame: O próprio DataFrame, se não houver colunas mistas, ou uma cópia com os valores
+                          dessas colunas convertidos em texto.
+        """
+        mixed = []
+        for column in df.columns:
+            values = df[column].cat.categories if isinstance(df[column].dtype, pd.CategoricalDtype) else df[column]
+            if values.dtype == object and values.map(type, na_action="ignore").nunique() > 1:
+                mixed.append(column)
+        if not mixed:
+            return df
+
+        df = df.copy()
+        for column in mixed:
+            text = df[column].astype(object).map(str, na_action="ignore")
+            df[column] = text.astype("category") if isinstance(df[column].dtype, pd.CategoricalDtype) else text
+        return df
+
+    @staticmethod
+    def __digest(*parts: str) -> str:
+        """Calcula o hash SHA-256 de uma sequência de textos."""
+        return hashlib.sha256("\n".join(parts).encode()).hexdigest()
@@ -1,5 +1,13 @@
+import hashlib
+import json
 import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Callable, Dict, List, Optional, Tuple
 
+import pandas as pd
+
+from src.config.settings import REPORTS_CONFIG
 from src.stages.contracts.analyze_contract import AnalyzeContract
 
 from .interfaces.visualization_interface import ReportsVisualizerInterface
@@ -8,34 +16,187 @@ from .sales_by_region_visualizer import SalesByRegionVisualizer
 from .sales_velocity_visualizer import SalesVelocityVisualizer
 
 
+def _render(plot: Callable[[pd.DataFrame], None], data: pd.DataFrame) -> None:
+    """Gera um gráfico no processo worker."""
+    plot(data)
+
+
 class ReportsVisualizer(ReportsVisualizerInterface):
     """
     Classe responsável por visualizar e salvar gráficos relacionados a dados de relatórios.
+
+    Os gráficos são desenhados com a API orientada a objetos do matplotlib (`Figure` com o backend Agg), sem o
+    estado global do `pyplot`, e por isso podem ser gerados em paralelo em um pool de processos. Cada gráfico só
+    é gerado novamente quando o hash do conteúdo do seu DataFrame (e, nos gráficos paginados, do tamanho da
+    página) muda em relação à última geração ou quando algum dos arquivos gerados por ela, uma página em
+    cada arquivo nos gráficos paginados, não existe mais. O hash e os arquivos de cada gráfico são
+    registrados no arquivo `CACHE_FILE_NAME` do diretório de saída.
+
+    Atributos:
+        output_directory (str): O diretório onde os gráficos são salvos.
+        max_workers (int): A quantidade de processos usados para gerar os gráficos. Com `1`, os gráficos são
+                           gerados no próprio processo.
+        cache_enabled (bool): Se `True`, os gráficos cujos dados não mudaram não são gerados novamente.
     """
 
-    def __init__(self, output_directory: str = "graphs"):
+    CACHE_FILE_NAME = ".reports_cache.json"
+    PAGINATED_CHARTS = ("sales_by_product", "sales_by_branch")
+
+    def __init__(
+        self,
+        output_directory: str = "graphs",
+        max_workers: int = REPORTS_CONFIG["max_workers"],
+        cache_enabled: bool = REPORTS_CONFIG["cache_enabled"],
+    ):
         """
         Inicializa o visualizador e configura o diretório de saída para salvar os gráficos.
 
         Args:
             output_directory (str): O diretório onde os gráficos serão salvos. Padrão é "graphs".
+            max_workers (int): A quantidade de processos. O padrão vem de `REPORTS_MAX_WORKERS`.
+            cache_enabled (bool): Se `True`, reaproveita os gráficos cujos dados não mudaram. O padrão vem de
+                                  `REPORTS_CACHE_ENABLED`.
+
+        Raises:
+            ValueError: Se `max_workers` não for positivo.
         """
+        if max_workers <= 0:
+            raise ValueError("A quantidade de workers dos relatórios deve ser maior que zero.")
         self.output_directory = output_directory
+        self.max_workers = max_workers
+        self.cache_enabled = cache_enabled
         os.makedirs(self.output_directory, exist_ok=True)
 
         self.sales_by_region_visualizer = SalesByRegionVisualizer(self.output_directory)
         self.sales_velocity_visualizer = SalesVelocityVisualizer(self.output_directory)
         self.sales_by_group_visualizer = SalesByGroupVisualizer(self.output_directory)
+        self.__charts = {
+            "top_10_sales_by_region": (
+                SalesByRegionVisualizer.TOP_FILE_NAME,
+                self.sales_by_region_visualizer.plot_top_10_sales_by_region,
+            ),
+            "top_10_least_sales_by_region": (
+                SalesByRegionVisualizer.LEAST_FILE_NAME,
+                self.sales_by_region_visualizer.plot_top_10_least_sales_by_region,
+            ),
+            "sales_velocity": (SalesVelocityVisualizer.FILE_NAME, self.sales_velocity_visualizer.plot_sales_velocity),
+            "sales_by_product": (
+                SalesByGroupVisualizer.PRODUCT_FILE_NAME,
+                self.sales_by_group_visualizer.plot_sales_by_product,
+            ),
+            "sales_by_branch": (
+                SalesByGroupVisualizer.BRANCH_FILE_NAME,
+                self.sales_by_group_visualizer.plot_sales_by_branch,
+            ),
+        }
 
     def generate_reports(self, analyze_contract: AnalyzeContract) -> None:
         """
         Gera relatórios visuais (gráficos) relacionados aos dados fornecidos.
 
+        Os gráficos cujos dados não mudaram desde a última geração e cujos arquivos ainda existem são mantidos.
+        Os demais são gerados em paralelo e, ao final, os hashes e os arquivos dos que foram gerados com sucesso
+        são registrados. Os gráficos de `PAGINATED_CHARTS` são paginados com o `group_page_size` do contrato, e
+        cada página é um arquivo.
+
         Args:
             analyze_contract (AnalyzeContract): Contrato contendo os dados para gerar os relatórios.
+
+        Raises:
+            Exception: O primeiro erro ocorrido na geração de um gráfico, após a conclusão dos demais.
+        """
+        entries = self.__read_entries()
+        pending: List[Tuple[str, Callable[[pd.DataFrame], None], pd.DataFrame, Dict[str, object]]] = []
+        for field, (file_name, plot) in self.__charts.items():
+            data = getattr(analyze_contract, field)
+            options = {"page_size": analyze_contract.group_page_size} if field in self.PAGINATED_CHARTS else {}
+            entry = {
+                "hash": self._content_hash(data, options),
+                "files": self.__chart_files(field, file_name, data, **options),
+            }
+            if entries.get(file_name) == entry and self.__files_exist(entry["files"]):
+                print(f"Gráfico {file_name} inalterado; geração ignorada.")
+                continue
+            pending.append((file_name, partial(plot, **options), data, entry))
+
+        errors = self.__render(pending)
+        for file_name, _, _, entry in pending:
+            if file_name not in errors:
+                entries[file_name] = entry
+        self.__write_entries(entries)
+        if errors:
+            raise next(iter(errors.values()))
+
+    @staticmethod
+    def _content_hash(data: pd.DataFrame, options: Optional[Dict[str, object]] = None) -> str:
         """
-        self.sales_by_region_visualizer.plot_top_10_sales_by_region(analyze_contract.top_10_sales_by_region)
-        self.sales_by_region_visualizer.plot_top_10_least_sales_by_region(analyze_contract.top_10_least_sales_by_region)
-        self.sales_velocity_visualizer.plot_sales_velocity(analyze_contract.sales_velocity)
-        self.sales_by_group_visualizer.plot_sales_by_product(analyze_contract.sales_by_product)
-        self.sales_by_group_visualizer.plot_sales_by_branch(analyze_contract.sales_by_branch)
+        Calcula o hash do conteúdo de um DataFrame: colunas, tipos e valores, sem o índice, e as opções do gráfico.
+
+        Args:
+            data (pd.DataFrame): Os dados de um gráfico.
+            options (Optional[Dict[str, object]]): Os argumentos passados ao gráfico além dos dados. Sem opções,
+                                                   o hash é o mesmo de antes delas existirem.
+
+        Returns:
+            str: O hash SHA-256 em hexadecimal.
+        """
+        digest = hashlib.sha256(repr([(column, str(dtype)) for column, dtype in data.dtypes.items()]).encode())
+        digest.update(pd.util.hash_pandas_object(data, index=False).to_numpy().tobytes())
+        if options:
+            digest.update(repr(sorted(options.items())).encode())
+        return digest.hexdigest()
+
+    def __chart_files(
+        self, field: str, file_name: str, data: pd.DataFrame, page_size: Optional[int] = None
+    ) -> List[str]:
+        """Lista os arquivos gerados por um gráfico: um por página nos gráficos paginados e um nos demais."""
+        if field not in self.PAGINATED_CHARTS:
+            return [file_name]
+        return self.sales_by_group_visualizer.page_file_names(data, file_name, page_size)
+
+    def __files_exist(self, file_names: List[str]) -> bool:
+        """Verifica se todos os arquivos de um gráfico existem no diretório de saída."""
+        return all(os.path.exists(os.path.join(self.output_directory, file_name)) for file_name in file_names)
+
+    def __render(
+        self, pending: List[Tuple[str, Callable[[pd.DataFrame], None], pd.DataFrame, Dict[str, object]]]
+    ) -> Dict[str, Exception]:
+        """Gera os gráficos pendentes, em paralelo quando houver mais de um worker, e retorna os erros por arquivo."""
+        errors = {}
+        if self.max_workers == 1 or len(pending) <= 1:
+            for file_name, plot, data, _ in pending:
+                try:
+                    plot(data)
+                except Exception as exception:
+                    errors[file_name] = exception
+            return errors
+
+        with ProcessPoolExecutor(max_workers=min(self.max_workers, len(pending))) as executor:
+            futures = {file_name: executor.submit(_render, plot, data) for file_name, plot, data, _ in pending}
+            for file_name, future in futures.items():
+                try:
+                    future.result()
+                except Exception as exception:
+                    errors[file_name] = exception
+        return errors
+
+    def __read_entries(self) -> Dict[str, Dict[str, object]]:
+        """
+        Lê o hash e os arquivos da última geração de cada gráfico, ou nenhum se o cache estiver desabilitado ou
+        ilegível. Os registros do formato anterior, só com o hash, não correspondem a nenhum gráfico e fazem
+        com que ele seja gerado novamente.
+        """
+        if not self.cache_enabled:
+            return {}
+        try:
+            with open(os.path.join(self.output_directory, self.CACHE_FILE_NAME)) as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def __write_entries(self, entries: Dict[str, Dict[str, object]]) -> None:
+        """Registra o hash e os arquivos dos gráficos gerados, se o cache estiver habilitado."""
+        if not self.cache_enabled:
+            return
+        with open(os.path.join(self.output_directory, self.CACHE_FILE_NAME), "w") as file:
+            json.dump(entries, file, indent=2, sort_keys=True)
@@ -1,53 +1,133 @@
+import glob
 import os
+from typing import List, Optional, Tuple
 
-import matplotlib.pyplot as plt
+import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 from pandas import DataFrame
 
+from src.config.settings import ANALYSIS_CONFIG
+
 
 class SalesByGroupVisualizer:
-    def __init__(self, output_directory: str):
+    PRODUCT_FILE_NAME = "vendas_por_produto.png"
+    BRANCH_FILE_NAME = "vendas_por_filial.png"
+    OTHERS_LABEL = "OUTROS"
+
+    def __init__(self, output_directory: str, page_size: int = ANALYSIS_CONFIG["group_top_n"]):
+        """
+        Inicializa o visualizador de vendas por produto e por filial.
+
+        Args:
+            output_directory (str): O diretório onde os gráficos serão salvos.
+            page_size (int): A quantidade de barras por gráfico, quando não informada ao desenhar. O padrão vem de
+                             `ANALYSIS_GROUP_TOP_N`.
+        """
         self.output_directory = output_directory
+        self.page_size = page_size
 
-    def plot_sales_by_product(self, sales_df: DataFrame) -> None:
+    def plot_sales_by_product(self, sales_df: DataFrame, page_size: Optional[int] = None) -> None:
         """
         Visualiza e salva o gráfico de vendas por produto.
 
         Args:
-            sales_df (DataFrame): Dados de vendas.
+            sales_df (DataFrame): Dados de vendas, do produto com mais vendas para o com menos, com os demais
+                                  produtos somados na linha `OUTROS`.
+            page_size (Optional[int]): A quantidade de barras por gráfico; por padrão, `page_size` do visualizador.
         """
-
-        plt.figure(figsize=(12, 8))
-        plt.bar(
-            sales_df["produto"],
-            sales_df["venda_pecas"],
-            color="orange",
+        self.__plot_pages(
+            sales_df, "produto", "Produto", "Vendas por Produto", "orange", self.PRODUCT_FILE_NAME, (12, 8), page_size
         )
-        plt.title("Vendas por Produto")
-        plt.xlabel("Produto")
-        plt.ylabel("Vendas (Peças)")
-        plt.xticks(rotation=45, ha="right", fontsize=10)
-        plt.tight_layout(pad=3.0)
-        plt.savefig(os.path.join(self.output_directory, "vendas_por_produto.png"))
-        plt.close()
 
-    def plot_sales_by_branch(self, sales_df: DataFrame) -> None:
+    def plot_sales_by_branch(self, sales_df: DataFrame, page_size: Optional[int] = None) -> None:
         """
         Visualiza e salva o gráfico de vendas por filial.
 
         Args:
-            sales_df (DataFrame): Dados de vendas.
+            sales_df (DataFrame): Dados de vendas, da filial com mais vendas para a com menos, com as demais
+                                  filiais somadas na linha `OUTROS`.
+            page_size (Optional[int]): A quantidade de barras por gráfico; por padrão, `page_size` do visualizador.
         """
-
-        plt.figure(figsize=(10, 6))
-        plt.bar(
-            sales_df["id_filial"],
-            sales_df["venda_pecas"],
-            color="purple",
+        self.__plot_pages(
+            sales_df, "id_filial", "Filial", "Vendas por Filial", "purple", self.BRANCH_FILE_NAME, (10, 6), page_size
         )
-        plt.title("Vendas por Filial")
-        plt.xlabel("Filial")
-        plt.ylabel("Vendas (Peças)")
-        plt.xticks(rotation=45, ha="right", fontsize=10)
-        plt.tight_layout(pad=3.0)
-        plt.savefig(os.path.join(self.output_directory, "vendas_por_filial.png"))
-        plt.close()
+
+    def paginate(self, sales_df: DataFrame, page_size: Optional[int] = None) -> List[DataFrame]:
+        """
+        Divide os dados em páginas de `page_size` barras. A linha `OUTROS`, que vem por último, fica na última
+        página, mesmo que ela já esteja completa.
+
+        Args:
+            sales_df (DataFrame): Dados de vendas já ordenados.
+            page_size (Optional[int]): A quantidade de barras por página; por padrão, `page_size` do visualizador.
+
+        Returns:
+            List[DataFrame]: As páginas; ao menos uma, mesmo que os dados estejam vazios.
+        """
+        page_size = page_size or self.page_size
+        pages = [sales_df.iloc[start : start + page_size] for start in range(0, len(sales_df), page_size)]
+        if len(pages) > 1 and len(pages[-1]) == 1:
+            pages[-2:] = [pd.concat(pages[-2:])]
+        return pages or [sales_df]
+
+    def page_file_names(self, sales_df: DataFrame, file_name: str, page_size: Optional[int] = None) -> List[str]:
+        """
+        Lista os arquivos gerados para os dados de um gráfico paginado: `file_name` para a primeira página e o
+        sufixo `_pagina_<n>` para as demais.
+
+        Args:
+            sales_df (DataFrame): Dados de vendas já ordenados.
+            file_name (str): O nome do arquivo do gráfico (`PRODUCT_FILE_NAME` ou `BRANCH_FILE_NAME`).
+            page_size (Optional[int]): A quantidade de barras por página; por padrão, `page_size` do visualizador.
+
+        Returns:
+            List[str]: Os nomes dos arquivos de cada página, em ordem.
+        """
+        return self.__page_file_names(file_name, len(self.paginate(sales_df, page_size)))
+
+    @staticmethod
+    def __page_file_names(file_name: str, pages: int) -> List[str]:
+        """Lista os nomes dos arquivos de um gráfico com a quantidade de páginas informada."""
+        base, extension = os.path.splitext(file_name)
+        return [file_name] + [f"{base}_pagina_{number}{extension}" for number in range(2, pages + 1)]
+
+    def __plot_pages(
+        self,
+        sales_df: DataFrame,
+        column: str,
+        xlabel: str,
+        title: str,
+        color: str,
+        file_name: str,
+        figsize: Tuple[int, int],
+        page_size: Optional[int],
+    ) -> None:
+        """
+        Salva um gráfico por página. A primeira página usa `file_name`; as demais, o sufixo `_pagina_<n>`.
+        Páginas de execuções anteriores que não existem mais são removidas.
+        """
+        pages = self.paginate(sales_df, page_size)
+        base, extension = os.path.splitext(file_name)
+        for stale_page in glob.glob(os.path.join(self.output_directory, f"{base}_pagina_*{extension}")):
+            os.remove(stale_page)
+
+        for number, (page, page_file_name) in enumerate(
+            zip(pages, self.__page_file_names(file_name, len(pages))), start=1
+        ):
+            labels = page[column].astype(str)
+            figure = Figure(figsize=figsize)
+            FigureCanvasAgg(figure)
+            axes = figure.add_subplot()
+            axes.bar(
+                labels,
+                page["venda_pecas"],
+                color=["gray" if label == self.OTHERS_LABEL else color for label in labels],
+            )
+            axes.set_title(title if len(pages) == 1 else f"{title} (página {number} de {len(pages)})")
+            axes.set_xlabel(xlabel)
+            axes.set_ylabel("Vendas (Peças)")
+            for label in axes.get_xticklabels():
+                label.set(rotation=45, ha="right", fontsize=10)
+            figure.tight_layout(pad=3.0)
+            figure.savefig(os.path.join(self.output_directory, page_file_name))
@@ -1,53 +1,59 @@
 import os
 
-import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 from pandas import DataFrame
 
 
 class SalesByRegionVisualizer:
+    TOP_FILE_NAME = "top_10_regioes_com_mais_vendas.png"
+    LEAST_FILE_NAME = "top_10_regioes_com_menos_vendas.png"
+
     def __init__(self, output_directory: str):
         self.output_directory = output_directory
 
     def plot_top_10_sales_by_region(self, sales_by_region: DataFrame) -> None:
         """
-        Visualiza e salva o gráfico de vendas por região, mostrando as 10 regiões com mais vendas.
+        Visualiza e salva o gráfico de vendas por região, mostrando as regiões com mais vendas.
 
         Args:
-            sales_by_region (DataFrame): Dados agregados de vendas agrupados por região.
+            sales_by_region (DataFrame): As regiões com mais vendas, já ordenadas e limitadas pela consulta.
         """
-
-        plt.figure(figsize=(10, 6))
-        plt.bar(
-            sales_by_region["cidade"][:10],
-            sales_by_region["venda_pecas"][:10],
+        figure = Figure(figsize=(10, 6))
+        FigureCanvasAgg(figure)
+        axes = figure.add_subplot()
+        axes.bar(
+            sales_by_region["cidade"],
+            sales_by_region["venda_pecas"],
             color="skyblue",
         )
-        plt.title("Top 10 Regiões com Mais Vendas")
-        plt.xlabel("Cidade")
-        plt.ylabel("Vendas (Peças)")
-        plt.xticks(rotation=45, ha="right")
-        plt.tight_layout()
-        plt.savefig(os.path.join(self.output_directory, "top_10_regioes_com_mais_vendas.png"))
-        plt.close()
+        axes.set_title(f"Top {len(sales_by_region)} Regiões com Mais Vendas")
+        axes.set_xlabel("Cidade")
+        axes.set_ylabel("Vendas (Peças)")
+        for label in axes.get_xticklabels():
+            label.set(rotation=45, ha="right")
+        figure.tight_layout()
+        figure.savefig(os.path.join(self.output_directory, self.TOP_FILE_NAME))
 
     def plot_top_10_least_sales_by_region(self, sales_by_region: DataFrame) -> None:
         """
-        Visualiza e salva o gráfico de vendas por região, mostrando as 10 regiões com menos vendas.
+        Visualiza e salva o gráfico de vendas por região, mostrando as regiões com menos vendas.
 
         Args:
-            sales_by_region (DataFrame): Dados agregados de vendas agrupados por região.
+            sales_by_region (DataFrame): As regiões com menos vendas, já ordenadas e limitadas pela consulta.
         """
-
-        plt.figure(figsize=(10, 6))
-        plt.bar(
-            sales_by_region["cidade"][:10],
-            sales_by_region["venda_pecas"][:10],
+        figure = Figure(figsize=(10, 6))
+        FigureCanvasAgg(figure)
+        axes = figure.add_subplot()
+        axes.bar(
+            sales_by_region["cidade"],
+            sales_by_region["venda_pecas"],
             color="salmon",
         )
-        plt.title("Top 10 Regiões com Menos Vendas")
-        plt.xlabel("Cidade")
-        plt.ylabel("Vendas (Peças)")
-        plt.xticks(rotation=45, ha="right")
-        plt.tight_layout()
-        plt.savefig(os.path.join(self.output_directory, "top_10_regioes_com_menos_vendas.png"))
-        plt.close()
+        axes.set_title(f"Top {len(sales_by_region)} Regiões com Menos Vendas")
+        axes.set_xlabel("Cidade")
+        axes.set_ylabel("Vendas (Peças)")
+        for label in axes.get_xticklabels():
+            label.set(rotation=45, ha="right")
+        figure.tight_layout()
+        figure.savefig(os.path.join(self.output_directory, self.LEAST_FILE_NAME))
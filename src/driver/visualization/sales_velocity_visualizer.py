@@ -1,30 +1,35 @@
 import os
 
-import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 from pandas import DataFrame
 
 
 class SalesVelocityVisualizer:
+    FILE_NAME = "top_10_produtos_maior_velocidade_venda.png"
+
     def __init__(self, output_directory: str):
         self.output_directory = output_directory
 
     def plot_sales_velocity(self, sales_velocity: DataFrame) -> None:
         """
-        Visualiza e salva os 10 principais produtos por velocidade de venda.
+        Visualiza e salva os principais produtos por velocidade de venda.
 
         Args:
-            sales_velocity (DataFrame): Dados de velocidade de vendas.
+            sales_velocity (DataFrame): Os produtos com maior velocidade de venda, já limitados pela consulta.
         """
-        plt.figure(figsize=(10, 6))
-        plt.bar(
-            sales_velocity["produto"][:10],
-            sales_velocity["avg_velocidade_venda"][:10],
+        figure = Figure(figsize=(10, 6))
+        FigureCanvasAgg(figure)
+        axes = figure.add_subplot()
+        axes.bar(
+            sales_velocity["produto"],
+            sales_velocity["avg_velocidade_venda"],
             color="lightgreen",
         )
-        plt.title("Top 10 Produtos com Maior Velocidade de Venda")
-        plt.xlabel("Produto")
-        plt.ylabel("Velocidade de Venda")
-        plt.xticks(rotation=45, ha="right")
-        plt.tight_layout()
-        plt.savefig(os.path.join(self.output_directory, "top_10_produtos_maior_velocidade_venda.png"))
-        plt.close()
+        axes.set_title(f"Top {len(sales_velocity)} Produtos com Maior Velocidade de Venda")
+        axes.set_xlabel("Produto")
+        axes.set_ylabel("Velocidade de Venda")
+        for label in axes.get_xticklabels():
+            label.set(rotation=45, ha="right")
+        figure.tight_layout()
+        figure.savefig(os.path.join(self.output_directory, self.FILE_NAME))
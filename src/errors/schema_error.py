@@ -0,0 +1,23 @@
+class SchemaError(Exception):
+    """
+    Exceção personalizada levantada quando um arquivo de origem não corresponde ao esquema esperado.
+
+    Esta exceção é usada para indicar colunas ausentes ou valores que não podem ser convertidos
+    para os tipos declarados no registro de esquemas das fontes.
+
+    Atributos:
+        message (str): A mensagem de erro associada à exceção.
+        error_type (str): Uma string indicando o tipo de erro, neste caso, 'Erro de Esquema'.
+    """
+
+    def __init__(self, message: str) -> None:
+        """
+        Inicializa a exceção SchemaError com uma mensagem de erro específica.
+
+        Args:
+            message (str): Uma mensagem de erro descritiva fornecendo mais detalhes
+                           sobre a causa da exceção.
+        """
+        super().__init__(message)
+        self.message = message
+        self.error_type = "Erro de Esquema"
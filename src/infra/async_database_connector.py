@@ -0,0 +1,96 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from src.config.settings import DATABASE_CONFIG, POOL_CONFIG
+
+try:
+    import asyncpg
+except ImportError:  # pragma: no cover - dependência opcional
+    asyncpg = None
+
+
+class AsyncDatabaseConnection:
+    """
+    Uma classe para gerenciar as conexões assíncronas com um banco de dados PostgreSQL usando asyncpg.
+
+    É a contrapartida de `DatabaseConnection` para o pipeline assíncrono: as conexões são mantidas em um pool do
+    asyncpg (`asyncpg.Pool`), com os mesmos tamanhos mínimo e máximo de `POOL_CONFIG`, e cada operação retira uma
+    conexão com `get_connection()` e a devolve ao final. O pool descarta as conexões encerradas pelo servidor e
+    reverte as transações abertas ao receber uma conexão de volta.
+
+    O pool pertence ao loop de eventos em que foi criado: `connect` deve ser chamado dentro do loop que executa
+    o pipeline, antes das operações concorrentes, e `close` ao final.
+
+    Atributos:
+        pool (asyncpg.Pool, opcional): O pool de conexões com o banco de dados PostgreSQL.
+    """
+
+    pool = None
+
+    @classmethod
+    async def connect(cls, config: dict = DATABASE_CONFIG):
+        """
+        Cria o pool de conexões com o banco de dados PostgreSQL. Se o pool já existir, ele é reaproveitado.
+
+        Args:
+            config (dict): Os parâmetros de conexão. O padrão é `DATABASE_CONFIG`.
+
+        Returns:
+            asyncpg.Pool: O pool de conexões com o banco de dados PostgreSQL.
+
+        Raise:
+            ImportError: Se o pacote `asyncpg` não estiver instalado.
+            Exception: Se ocorrer um erro ao conectar-se ao banco de dados.
+        """
+        if asyncpg is None:
+            raise ImportError("O pipeline assíncrono requer o pacote asyncpg (poetry install --extras asyncpg).")
+        if cls.pool is not None and not cls.pool.is_closing():
+            return cls.pool
+        try:
+            cls.pool = await asyncpg.create_pool(
+                min_size=POOL_CONFIG["min_size"],
+                max_size=POOL_CONFIG["max_size"],
+                database=config.get("dbname"),
+                user=config.get("user"),
+                password=config.get("password"),
+                host=config.get("host"),
+                port=int(config["port"]) if config.get("port") else None,
+            )
+        except (OSError, asyncpg.PostgresError) as error:
+            raise Exception(f"Erro ao conectar-se ao banco de dados: {error}")
+        return cls.pool
+
+    @classmethod
+    @asynccontextmanager
+    async def get_connection(cls) -> AsyncIterator:
+        """
+        Retira uma conexão do pool e a devolve ao final do bloco `async with`.
+
+        Quando todas as conexões estão em uso, aguarda até `POOL_CONFIG["checkout_timeout"]` segundos por uma
+        conexão livre.
+
+        Yields:
+            asyncpg.Connection: Uma conexão com o banco de dados.
+
+        Raise:
+            Exception: Se não houver conexão livre no tempo limite.
+        """
+        pool = await cls.connect()
+        try:
+            connection = await pool.acquire(timeout=POOL_CONFIG["checkout_timeout"])
+        except asyncio.TimeoutError:
+            raise Exception("Erro ao obter conexão: todas as conexões do pool estão em uso.")
+        try:
+            yield connection
+        finally:
+            await pool.release(connection)
+
+    @classmethod
+    async def close(cls) -> None:
+        """
+        Fecha todas as conexões do pool. Uma chamada posterior a `connect` ou `get_connection` cria um novo pool.
+        """
+        if cls.pool is not None and not cls.pool.is_closing():
+            await cls.pool.close()
+        cls.pool = None
@@ -0,0 +1,430 @@
+import re
+import time
+from contextlib import asynccontextmanager, nullcontext
+from decimal import Decimal
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from src.config.settings import LOAD_CONFIG, QUERY_CONFIG
+
+from .async_database_connector import AsyncDatabaseConnection
+from .database_repository import DatabaseRepository
+from .instrumentation import instrumented
+from .interface.database_repository import DatabaseRepositoryInterface
+
+
+def _to_decimal(value) -> Decimal:
+    """Converte um valor em `Decimal` pela sua representação em texto, como no CSV do `COPY` síncrono."""
+    return Decimal(str(value))
+
+
+class AsyncDatabaseRepository(DatabaseRepositoryInterface):
+    """
+    Implementa a interface `DatabaseRepositoryInterface` sobre o asyncpg, para o pipeline assíncrono.
+
+    Os métodos têm a mesma semântica dos de `DatabaseRepository`, mas são corrotinas (`find_chunks` é um gerador
+    assíncrono e `transaction` um gerenciador de contexto assíncrono), e cada operação retira uma conexão do pool
+    de `AsyncDatabaseConnection`. As consultas e os comandos aceitam os mesmos parâmetros no formato `%(nome)s`,
+    convertidos para os parâmetros posicionais (`$1`, `$2`, ...) do PostgreSQL.
+
+    Com o método `"copy"`, `insert_data` transmite os dados com o `COPY` binário do asyncpg
+    (`copy_records_to_table`): os valores são convertidos para os tipos Python das colunas de destino, consultadas
+    uma única vez por tabela, em vez de serializados em CSV. `find` executa cada consulta como um comando
+    preparado.
+
+    Atributos:
+        load_method (str): O método de carga em massa utilizado por `insert_data`. `"copy"` usa o `COPY` binário e
+                           `"values"` utiliza `executemany`.
+        copy_chunk_size (int): A quantidade de linhas convertidas e enviadas por vez.
+    """
+
+    LOAD_METHODS = DatabaseRepository.LOAD_METHODS
+    PARAMETER = re.compile(r"%\((\w+)\)s")
+    CONVERTERS: Dict[str, Callable] = {
+        "smallint": int,
+        "integer": int,
+        "bigint": int,
+        "numeric": _to_decimal,
+        "real": float,
+        "double precision": float,
+        "date": lambda value: pd.Timestamp(value).date(),
+        "timestamp without time zone": lambda value: pd.Timestamp(value).to_pydatetime(),
+        "character varying": str,
+        "character": str,
+        "text": str,
+    }
+    """Conversão dos valores de cada tipo de coluna do PostgreSQL (`information_schema.columns.data_type`)."""
+
+    def __init__(
+        self,
+        load_method: str = LOAD_CONFIG["method"],
+        copy_chunk_size: int = LOAD_CONFIG["copy_chunk_size"],
+    ) -> None:
+        """
+        Inicializa o repositório com o método de carga em massa desejado.
+
+        Args:
+            load_method (str): `"copy"` (padrão) ou `"values"`.
+            copy_chunk_size (int): A quantidade de linhas por bloco enviado ao banco.
+
+        Raises:
+            ValueError: Se o método de carga não for suportado ou o tamanho do bloco não for positivo.
+        """
+        if load_method not in self.LOAD_METHODS:
+            raise ValueError(f"Método de carga inválido: {load_method}. Use um de {self.LOAD_METHODS}.")
+        if copy_chunk_size <= 0:
+            raise ValueError("O tamanho do bloco do COPY deve ser maior que zero.")
+        self.load_method = load_method
+        self.copy_chunk_size = copy_chunk_size
+        self.__column_types: Dict[str, Dict[str, str]] = {}
+
+    async def create(self, query: str) -> None:
+        """
+        Cria uma tabela no banco de dados, se ela ainda não existir.
+
+        Args:
+            query (str): A consulta SQL para criar a tabela. Pode conter mais de um comando.
+
+        Raise:
+            Exception: Se ocorrer um erro durante a execução da consulta, uma mensagem de erro é registrada.
+        """
+        async with AsyncDatabaseConnection.get_connection() as connection:
+            try:
+                await connection.execute(query)
+                print("Tabela criada com sucesso!")
+            except Exception as e:
+                print(f"Erro ao criar a tabela: {e}")
+
+    @instrumented(
+        "insert_data",
+        rows_in=lambda arguments: len(arguments["dataframe"]),
+        labels=lambda arguments: {"table": arguments["table_name"]},
+    )
+    async def insert_data(self, dataframe, table_name, transaction=None) -> None:
+        """
+        Insere dados de um DataFrame na tabela especificada no banco de dados.
+
+        Com o método `"copy"`, o DataFrame é enviado em blocos de `copy_chunk_size` linhas com o `COPY` binário.
+        Se o `COPY` falhar, a carga é desfeita até um savepoint e refeita com `executemany`. Ao final, a vazão da
+        carga (linhas por segundo) é exibida.
+
+        Args:
+            dataframe (pd.DataFrame): O DataFrame pandas contendo os dados a serem inseridos.
+            table_name (str): O nome da tabela onde os dados devem ser inseridos.
+            transaction (asyncpg.Connection, opcional): Uma transação aberta por `transaction()`.
+
+        Raise:
+            Exception: Se ocorrer um erro durante a inserção de dados; sem transação, a carga é revertida.
+        """
+
+        async def write(connection, method: str) -> None:
+            await self.__write(connection, dataframe, table_name, table_name, method)
+
+        await self.__run_load(table_name, len(dataframe), transaction, write)
+
+    async def upsert_data(
+        self,
+        dataframe: pd.DataFrame,
+        table_name: str,
+        conflict_columns: Sequence[str],
+        additive_columns: Sequence[str] = (),
+        transaction=None,
+    ) -> None:
+        """
+        Insere ou atualiza dados de um DataFrame na tabela especificada, usando `INSERT ... ON CONFLICT`.
+
+        Os dados são carregados em uma tabela temporária e mesclados na tabela de destino com o mesmo comando de
+        `DatabaseRepository.upsert_data`.
+
+        Args:
+            dataframe (pd.DataFrame): O DataFrame com os dados a serem mesclados. Não deve conter chaves repetidas.
+            table_name (str): O nome da tabela de destino.
+            conflict_columns (Sequence[str]): As colunas da chave natural, cobertas por um índice único.
+            additive_columns (Sequence[str]): As colunas somadas ao valor existente em caso de conflito.
+            transaction (asyncpg.Connection, opcional): Uma transação aberta por `transaction()`.
+
+        Raise:
+            Exception: Se ocorrer um erro durante a mesclagem dos dados.
+        """
+        staging_table = f"{table_name}_staging"
+        query = DatabaseRepository._upsert_query(
+            list(dataframe.columns), table_name, staging_table, conflict_columns, additive_columns
+        )
+
+        async def write(connection, method: str) -> None:
+            await connection.execute(
+                f"CREATE TEMP TABLE IF NOT EXISTS {staging_table} (LIKE {table_name} INCLUDING DEFAULTS) ON COMMIT DROP"
+            )
+            await connection.execute(f"TRUNCATE {staging_table}")
+            await self.__write(connection, dataframe, staging_table, table_name, method)
+            await connection.execute(query)
+
+        await self.__run_load(table_name, len(dataframe), transaction, write)
+
+    async def execute(self, query: str, params: Optional[dict] = None, transaction=None) -> None:
+        """
+        Executa um comando SQL que não retorna registros.
+
+        Args:
+            query (str): O comando SQL, opcionalmente com parâmetros no formato `%(nome)s`. Sem parâmetros, pode
+                         conter mais de um comando.
+            params (Optional[dict]): Os valores dos parâmetros do comando.
+            transaction (asyncpg.Connection, opcional): Uma transação aberta por `transaction()`.
+
+        Raises:
+            Exception: Se ocorrer um erro durante a execução do comando.
+        """
+        async with self.__connection(transaction) as connection:
+            try:
+                sql, args = self._to_positional(query, params)
+                await connection.execute(sql, *args)
+            except Exception as e:
+                raise Exception(f"Erro ao executar o comando SQL: {e}") from e
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator:
+        """
+        Abre uma transação que agrupa várias operações do repositório.
+
+        Uma conexão do pool fica reservada para a transação até o fim do bloco `async with`, quando é confirmada,
+        ou revertida se uma exceção for levantada.
+
+        Yields:
+            asyncpg.Connection: A conexão da transação, a ser repassada às operações do repositório.
+        """
+        async with AsyncDatabaseConnection.get_connection() as connection:
+            async with connection.transaction():
+                yield connection
+
+    @instrumented("find", rows_out=len, labels=lambda arguments: {"query": " ".join(arguments["query"].split())[:120]})
+    async def find(self, query: str, params: Optional[dict] = None, timeout: Optional[float] = None) -> pd.DataFrame:
+        """
+        Executa uma consulta SQL como um comando preparado e retorna os registros como um DataFrame pandas.
+
+        Args:
+            query (str): A consulta SQL a ser executada.
+            params (Optional[dict]): Os valores dos parâmetros da consulta, no formato `%(nome)s`. Parâmetros que
+                                     não aparecem na consulta são ignorados.
+            timeout (Optional[float]): O tempo máximo de execução da consulta, em segundos.
+
+        Returns:
+            pd.DataFrame: Um DataFrame contendo os registros retornados pela consulta.
+
+        Raises:
+            Exception: Se ocorrer algum erro durante a execução da consulta.
+        """
+        async with AsyncDatabaseConnection.get_connection() as connection:
+            try:
+                sql, args = self._to_positional(query, params)
+                statement = await connection.prepare(sql, timeout=timeout)
+                records = await statement.fetch(*args, timeout=timeout)
+                columns = [attribute.name for attribute in statement.get_attributes()]
+                return DatabaseRepository._records_to_frame([tuple(record) for record in records], columns)
+            except Exception as e:
+                raise Exception(f"Erro ao executar a consulta SQL: {e}") from e
+
+    async def find_chunks(
+        self,
+        query: str,
+        chunk_size: int = QUERY_CONFIG["itersize"],
+        params: Optional[dict] = None,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[pd.DataFrame]:
+        """
+        Executa uma consulta SQL e retorna os registros resultantes em blocos de DataFrames.
+
+        A consulta é preparada e lida por um cursor do lado do servidor, `chunk_size` linhas por vez, dentro de
+        uma transação. A conexão permanece reservada até que o gerador seja esgotado ou fechado.
+
+        Args:
+            query (str): A consulta SQL a ser executada.
+            chunk_size (int): A quantidade de linhas de cada bloco.
+            params (Optional[dict]): Os valores dos parâmetros da consulta, no formato `%(nome)s`.
+            timeout (Optional[float]): O tempo máximo de cada leitura, em segundos.
+
+        Yields:
+            pd.DataFrame: O próximo bloco de registros.
+
+        Raises:
+            ValueError: Se `chunk_size` não for positivo.
+            Exception: Se ocorrer algum erro durante a execução da consulta.
+        """
+        if chunk_size <= 0:
+            raise ValueError("O tamanho do bloco deve ser maior que zero.")
+        async with AsyncDatabaseConnection.get_connection() as connection:
+            try:
+                async with connection.transaction():
+                    sql, args = self._to_positional(query, params)
+                    statement = await connection.prepare(sql, timeout=timeout)
+                    columns = [attribute.name for attribute in statement.get_attributes()]
+                    cursor = await statement.cursor(*args, timeout=timeout)
+                    while True:
+                        records = await cursor.fetch(chunk_size, timeout=timeout)
+                        if not records:
+                            break
+                        yield DatabaseRepository._records_to_frame([tuple(record) for record in records], columns)
+            except Exception as e:
+                raise Exception(f"Erro ao executar a consulta SQL: {e}") from e
+
+    @classmethod
+    def _to_positional(cls, query: str, params: Optional[dict]) -> Tuple[str, list]:
+        """
+        Converte os parâmetros `%(nome)s` de uma consulta nos parâmetros posicionais do asyncpg.
+
+        Cada nome recebe uma posição, na ordem da sua primeira ocorrência, e `%%` volta a ser `%`, como no
+        psycopg2. Sem parâmetros, a consulta é mantida como está.
+
+        Args:
+            query (str): A consulta com parâmetros no formato `%(nome)s`.
+            params (Optional[dict]): Os valores dos parâmetros.
+
+        Returns:
+            Tuple[str, list]: A consulta com parâmetros `$n` e os valores na ordem das posições.
+        """
+        if params is None:
+            return query, []
+        names: List[str] = []
+
+        def position(match: re.Match) -> str:
+            if match.group(1) not in names:
+                names.append(match.group(1))
+            return f"${names.index(match.group(1)) + 1}"
+
+        sql = cls.PARAMETER.sub(position, query).replace("%%", "%")
+        return sql, [params[name] for name in names]
+
+    @classmethod
+    def _to_records(cls, dataframe: pd.DataFrame, column_types: Dict[str, str]) -> List[tuple]:
+        """
+        Converte um bloco do DataFrame em tuplas com os tipos Python exigidos pelo `COPY` binário.
+
+        Cada valor é convertido pelo tipo da sua coluna de destino (ver `CONVERTERS`): textos preenchidos com
+        `0` pela limpeza passam a ser `"0"`, códigos que viraram `float` voltam a ser `int` e valores decimais
+        passam a ser `Decimal`. Valores ausentes viram `None`. Colunas inteiras sem valores ausentes são
+        convertidas de uma só vez.
+
+        Args:
+            dataframe (pd.DataFrame): O bloco a ser convertido.
+            column_types (Dict[str, str]): O tipo de cada coluna de destino, pelo nome em minúsculas.
+
+        Returns:
+            List[tuple]: As linhas do bloco.
+        """
+        columns = []
+        for column in dataframe.columns:
+            series = dataframe[column]
+            convert = cls.CONVERTERS.get(column_types.get(column.lower()))
+            if convert is int and pd.api.types.is_integer_dtype(series.dtype) and not series.hasnans:
+                columns.append(series.astype("int64").tolist())
+                continue
+            columns.append(
+                [
+                    None if pd.isna(value) else convert(value) if convert is not None else value
+                    for value in series.astype(object)
+                ]
+            )
+        return list(zip(*columns))
+
+    async def __run_load(
+        self, table_name: str, row_count: int, transaction, write: Callable[..., Awaitable[None]]
+    ) -> None:
+        """
+        Executa uma carga em massa, com fallback do `COPY` para `executemany`, e exibe a sua vazão.
+
+        Args:
+            table_name (str): O nome da tabela de destino, usado nas mensagens.
+            row_count (int): A quantidade de linhas carregadas.
+            transaction (asyncpg.Connection, opcional): Uma transação aberta por `transaction()`.
+            write (Callable[..., Awaitable[None]]): A função que grava os dados, recebendo a conexão e o método.
+
+        Raise:
+            Exception: Se a carga falhar com todos os métodos disponíveis.
+        """
+        async with self.__connection(transaction) as connection:
+            start = time.perf_counter()
+            try:
+                if transaction is None:
+                    async with connection.transaction():
+                        method = await self.__write_with_fallback(connection, table_name, write)
+                else:
+                    method = await self.__write_with_fallback(connection, table_name, write)
+            except Exception as e:
+                print(f"Erro ao carregar dados na tabela {table_name}: {e}")
+                raise Exception("Erro ao carregar dados na tabela") from e
+            elapsed = time.perf_counter() - start
+            rows_per_second = row_count / elapsed if elapsed > 0 else float(row_count)
+            print(
+                f"Dados carregados com sucesso na tabela {table_name}: {row_count} linhas em {elapsed:.2f}s "
+                f"({rows_per_second:,.0f} linhas/s via {method})."
+            )
+
+    async def __write_with_fallback(self, connection, table_name: str, write: Callable[..., Awaitable[None]]) -> str:
+        """
+        Grava os dados com o método configurado; se o `COPY` falhar, desfaz o savepoint e refaz com `executemany`.
+
+        Returns:
+            str: O método com que os dados foram gravados.
+        """
+        if self.load_method == "copy":
+            try:
+                async with connection.transaction():
+                    await write(connection, "copy")
+                return "copy"
+            except Exception as e:
+                print(f"Falha no COPY para a tabela {table_name}, utilizando executemany: {e}")
+        await write(connection, "values")
+        return "values"
+
+    async def __write(
+        self, connection, dataframe: pd.DataFrame, target_table: str, type_table: str, method: str
+    ) -> None:
+        """
+        Grava o DataFrame na tabela, em blocos de `copy_chunk_size` linhas, com o método de carga informado.
+
+        Args:
+            connection (asyncpg.Connection): A conexão da transação corrente.
+            dataframe (pd.DataFrame): Os dados a serem carregados.
+            target_table (str): A tabela que recebe os dados.
+            type_table (str): A tabela cujas colunas definem os tipos (a própria tabela ou a de origem da
+                              tabela temporária).
+            method (str): `"copy"` ou `"values"`.
+        """
+        column_types = await self.__get_column_types(connection, type_table)
+        columns = [column.lower() for column in dataframe.columns]
+        insert = f"INSERT INTO {target_table} ({', '.join(columns)}) VALUES " + (
+            f"({', '.join(f'${position}' for position in range(1, len(columns) + 1))})"
+        )
+        for start in range(0, len(dataframe), self.copy_chunk_size):
+            chunk = dataframe.iloc[start : start + self.copy_chunk_size]
+            records = self._to_records(DatabaseRepository._to_copy_frame(chunk), column_types)
+            if method == "copy":
+                await connection.copy_records_to_table(target_table, records=records, columns=columns)
+            else:
+                await connection.executemany(insert, records)
+
+    async def __get_column_types(self, connection, table_name: str) -> Dict[str, str]:
+        """Consulta, uma única vez por tabela, o tipo de cada coluna no `information_schema`."""
+        if table_name not in self.__column_types:
+            rows = await connection.fetch(
+                "SELECT column_name, data_type FROM information_schema.columns WHERE table_name = $1",
+                table_name.lower(),
+            )
+            self.__column_types[table_name] = {row["column_name"]: row["data_type"] for row in rows}
+        return self.__column_types[table_name]
+
+    @staticmethod
+    def __connection(transaction):
+        """
+        Retorna o gerenciador de contexto assíncrono da conexão de uma operação: a conexão da transação
+        informada ou, sem transação, uma conexão retirada do pool.
+
+        Args:
+            transaction (asyncpg.Connection, opcional): Uma transação aberta por `transaction()`.
+
+        Returns:
+            AbstractAsyncContextManager: O gerenciador de contexto que fornece a conexão.
+        """
+        if transaction is not None:
+            return nullcontext(transaction)
+        return AsyncDatabaseConnection.get_connection()
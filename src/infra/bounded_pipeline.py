@@ -0,0 +1,166 @@
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+from src.config.settings import PIPELINE_CONFIG
+
+Item = TypeVar("Item")
+
+_END = object()
+"""Marca o fim dos itens de uma etapa na sua fila."""
+
+
+@dataclass
+class StageStats:
+    """
+    Estatísticas de uma etapa do `BoundedPipeline`, usadas para identificar o gargalo.
+
+    Attributes:
+        name (str): O nome da etapa.
+        items (int): A quantidade de itens entregues ao consumidor.
+        producer_wait_seconds (float): O tempo em que a etapa ficou bloqueada com a fila cheia (consumidor lento).
+        consumer_wait_seconds (float): O tempo em que o consumidor ficou bloqueado com a fila vazia (etapa lenta).
+    """
+
+    name: str
+    items: int = 0
+    producer_wait_seconds: float = 0.0
+    consumer_wait_seconds: float = 0.0
+
+
+class BoundedPipeline:
+    """
+    Executa as etapas de um pipeline em threads ligadas por filas limitadas (produtor/consumidor).
+
+    Cada chamada a `stage` consome um iterável em uma thread própria e retorna um iterador sobre os itens
+    produzidos, que pode ser passado à etapa seguinte, inclusive a outra chamada a `stage`. Assim, enquanto o
+    consumidor processa um item, a etapa anterior já produz o próximo, e o tempo total se aproxima do tempo da
+    etapa mais lenta em vez da soma de todas.
+
+    - Contrapressão: cada fila guarda no máximo `queue_size` itens; uma etapa mais rápida que o seu consumidor
+      fica bloqueada até que haja espaço, o que limita a memória a `queue_size` itens por etapa.
+    - Erros: uma exceção levantada por uma etapa é entregue ao seu consumidor na ordem dos itens e levantada
+      novamente por ele, atravessando as etapas seguintes até a thread principal.
+    - Cancelamento: ao sair do bloco `with` (ou em `close`), todas as etapas são interrompidas, inclusive quando
+      o consumidor falhou ou parou de consumir; cada etapa termina o item em andamento, fecha o seu iterável e a
+      sua thread é aguardada.
+
+    Atributos:
+        queue_size (int): A quantidade máxima de itens em cada fila.
+        stats (Dict[str, StageStats]): As estatísticas de cada etapa.
+    """
+
+    def __init__(self, queue_size: int = PIPELINE_CONFIG["queue_size"], poll_interval: float = 0.1) -> None:
+        """
+        Inicializa o pipeline, sem etapas.
+
+        Args:
+            queue_size (int): A quantidade máxima de itens em cada fila. O padrão vem de `PIPELINE_QUEUE_SIZE`.
+            poll_interval (float): O intervalo, em segundos, com que as esperas nas filas verificam o cancelamento.
+
+        Raises:
+            ValueError: Se `queue_size` não for positivo.
+        """
+        if queue_size <= 0:
+            raise ValueError("O tamanho das filas do pipeline deve ser maior que zero.")
+        self.queue_size = queue_size
+        self.stats: Dict[str, StageStats] = {}
+        self.__poll_interval = poll_interval
+        self.__stop = threading.Event()
+        self.__threads: List[threading.Thread] = []
+
+    def __enter__(self) -> "BoundedPipeline":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def stage(self, iterable: Iterable[Item], name: str) -> Iterator[Item]:
+        """
+        Inicia uma etapa que consome `iterable` em uma thread e entrega os itens por uma fila limitada.
+
+        Args:
+            iterable (Iterable[Item]): Os itens da etapa, como um gerador de blocos.
+            name (str): O nome da etapa, usado na thread e nas estatísticas.
+
+        Returns:
+            Iterator[Item]: Os itens da etapa, na ordem em que foram produzidos.
+
+        Raises:
+            ValueError: Se já existir uma etapa com o mesmo nome.
+        """
+        if name in self.stats:
+            raise ValueError(f"A etapa {name} já existe no pipeline.")
+        items: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        stats = self.stats[name] = StageStats(name=name)
+        thread = threading.Thread(
+            target=self.__produce, args=(iterable, items, stats), name=f"pipeline-{name}", daemon=True
+        )
+        self.__threads.append(thread)
+        thread.start()
+        return self.__consume(items, stats)
+
+    def close(self) -> None:
+        """
+        Interrompe as etapas ainda em execução, aguarda as suas threads e exibe as estatísticas de cada etapa.
+        """
+        self.__stop.set()
+        for thread in self.__threads:
+            thread.join()
+        for stats in self.stats.values():
+            print(
+                f"Etapa {stats.name}: {stats.items} itens, {stats.producer_wait_seconds:.2f}s aguardando o consumidor "
+                f"e {stats.consumer_wait_seconds:.2f}s aguardada pelo consumidor."
+            )
+
+    def __produce(self, iterable: Iterable, items: queue.Queue, stats: StageStats) -> None:
+        """Consome o iterável da etapa, colocando cada item e, ao final, o fim ou o erro na fila."""
+        iterator = iter(iterable)
+        try:
+            for item in iterator:
+                if not self.__put(items, (item, None), stats):
+                    return
+            self.__put(items, (_END, None), stats)
+        except BaseException as exception:
+            self.__put(items, (_END, exception), stats)
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+
+    def __put(self, items: queue.Queue, entry: Tuple[object, Optional[BaseException]], stats: StageStats) -> bool:
+        """Coloca um item na fila, aguardando espaço; retorna `False` se o pipeline for interrompido antes."""
+        start = time.perf_counter()
+        try:
+            while not self.__stop.is_set():
+                try:
+                    items.put(entry, timeout=self.__poll_interval)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        finally:
+            stats.producer_wait_seconds += time.perf_counter() - start
+
+    def __consume(self, items: queue.Queue, stats: StageStats) -> Iterator:
+        """Entrega os itens da fila até o fim da etapa, levantando o erro da etapa, se houver."""
+        while True:
+            start = time.perf_counter()
+            entry = None
+            while entry is None and not self.__stop.is_set():
+                try:
+                    entry = items.get(timeout=self.__poll_interval)
+                except queue.Empty:
+                    continue
+            stats.consumer_wait_seconds += time.perf_counter() - start
+            if entry is None:
+                raise Exception(f"O pipeline foi interrompido antes do fim da etapa {stats.name}.")
+            item, error = entry
+            if item is _END:
+                if error is not None:
+                    raise error
+                return
+            stats.items += 1
+            yield item
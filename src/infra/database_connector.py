@@ -1,26 +1,35 @@
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
 import psycopg2
+from psycopg2.pool import ThreadedConnectionPool
 
-from src.config.settings import DATABASE_CONFIG
+from src.config.settings import DATABASE_CONFIG, POOL_CONFIG
 
 
 class DatabaseConnection:
     """
-    Uma classe para gerenciar a conexão com um banco de dados PostgreSQL usando psycopg2.
+    Uma classe para gerenciar as conexões com um banco de dados PostgreSQL usando psycopg2.
 
-    A classe fornece métodos para estabelecer e gerenciar uma conexão com o banco de dados.
-    Ela utiliza variáveis de ambiente para configurar os parâmetros de conexão.
+    As conexões são mantidas em um pool (`ThreadedConnectionPool`) compartilhado pelo processo, com tamanhos
+    mínimo e máximo configuráveis em `POOL_CONFIG`. Cada operação retira uma conexão do pool com
+    `get_connection()` e a devolve ao final, de modo que cargas e consultas possam ser executadas em paralelo,
+    cada uma em sua própria conexão. Ela utiliza variáveis de ambiente para configurar os parâmetros de conexão.
 
     Atributos:
-        connection (psycopg2.connection, opcional): Um objeto de conexão com o banco de dados PostgreSQL.
+        pool (ThreadedConnectionPool, opcional): O pool de conexões com o banco de dados PostgreSQL.
     """
 
-    connection = None
+    pool = None
+    __slots_available = None
+    __lock = threading.Lock()
 
     @classmethod
-    def connect(cls):
+    def connect(cls, config: dict = DATABASE_CONFIG) -> ThreadedConnectionPool:
         """
-        Estabelece uma conexão com o banco de dados PostgreSQL usando a configuração
-        especificada nas variáveis de ambiente.
+        Cria o pool de conexões com o banco de dados PostgreSQL usando a configuração
+        especificada nas variáveis de ambiente. Se o pool já existir, ele é reaproveitado.
 
         Variáveis de ambiente (carregadas de um arquivo .env) que devem ser definidas:
             - dbname: O nome do banco de dados para conectar.
@@ -29,21 +38,117 @@ class DatabaseConnection:
             - host: O host onde o servidor de banco de dados está localizado.
             - port: A porta em que o servidor de banco de dados está ouvindo.
 
+        Args:
+            config (dict): Os parâmetros de conexão. O padrão é `DATABASE_CONFIG`.
+
         Retorna:
-            conn (psycopg2.connection): O objeto de conexão com o banco de dados PostgreSQL.
+            ThreadedConnectionPool: O pool de conexões com o banco de dados PostgreSQL.
+
+        Raise:
+            Exception: Se ocorrer um erro ao conectar-se ao banco de dados.
+        """
+        with cls.__lock:
+            if cls.pool is not None and not cls.pool.closed:
+                return cls.pool
+            try:
+                cls.pool = ThreadedConnectionPool(
+                    POOL_CONFIG["min_size"],
+                    POOL_CONFIG["max_size"],
+                    dbname=config.get("dbname"),
+                    user=config.get("user"),
+                    password=config.get("password"),
+                    host=config.get("host"),
+                    port=config.get("port"),
+                )
+            except psycopg2.OperationalError as error:
+                raise Exception(f"Erro ao conectar-se ao banco de dados: {error}")
+            cls.__slots_available = threading.BoundedSemaphore(POOL_CONFIG["max_size"])
+            return cls.pool
+
+    @classmethod
+    @contextmanager
+    def get_connection(cls) -> Iterator:
+        """
+        Retira uma conexão do pool e a devolve ao final do bloco `with`.
+
+        Quando todas as conexões estão em uso, aguarda até `POOL_CONFIG["checkout_timeout"]` segundos por uma
+        conexão livre. Antes de ser entregue, a conexão passa por uma verificação de saúde (`SELECT 1`);
+        conexões encerradas pelo servidor são descartadas e substituídas por novas. Ao ser devolvida, uma
+        transação não confirmada é revertida pelo pool.
+
+        Yields:
+            psycopg2.extensions.connection: Uma conexão válida com o banco de dados.
+
+        Raise:
+            Exception: Se não houver conexão livre no tempo limite ou se não for possível reconectar.
+        """
+        pool = cls.connect()
+        if not cls.__slots_available.acquire(timeout=POOL_CONFIG["checkout_timeout"]):
+            raise Exception("Erro ao obter conexão: todas as conexões do pool estão em uso.")
+        connection = None
+        try:
+            connection = cls.__checkout(pool)
+            yield connection
+        finally:
+            if connection is not None:
+                pool.putconn(connection, close=bool(connection.closed))
+            cls.__slots_available.release()
+
+    @classmethod
+    def close(cls) -> None:
+        """
+        Fecha todas as conexões do pool. Uma chamada posterior a `connect` ou `get_connection` cria um novo pool.
+        """
+        with cls.__lock:
+            if cls.pool is not None and not cls.pool.closed:
+                cls.pool.closeall()
+            cls.pool = None
+
+    @classmethod
+    def __checkout(cls, pool: ThreadedConnectionPool):
+        """
+        Retira uma conexão saudável do pool, descartando as conexões que falharem na verificação.
+
+        Args:
+            pool (ThreadedConnectionPool): O pool de conexões.
+
+        Returns:
+            psycopg2.extensions.connection: Uma conexão válida.
 
         Raise:
-            psycopg2.OperationalError: Se ocorrer um erro ao conectar-se ao banco de dados.
+            Exception: Se nenhuma conexão válida for obtida após `POOL_CONFIG["reconnect_attempts"]` tentativas.
+        """
+        last_error = None
+        for _ in range(POOL_CONFIG["reconnect_attempts"]):
+            try:
+                connection = pool.getconn()
+            except psycopg2.OperationalError as error:
+                last_error = error
+                continue
+            if cls.__is_healthy(connection):
+                return connection
+            pool.putconn(connection, close=True)
+        raise Exception(f"Erro ao conectar-se ao banco de dados: {last_error or 'conexão indisponível'}")
+
+    @staticmethod
+    def __is_healthy(connection) -> bool:
+        """
+        Verifica se uma conexão está aberta e respondendo.
+
+        Args:
+            connection (psycopg2.extensions.connection): A conexão a ser verificada.
+
+        Returns:
+            bool: `True` se a conexão puder ser usada.
         """
+        if connection.closed:
+            return False
+        if not POOL_CONFIG["health_check"]:
+            return True
         try:
-            db_connection = psycopg2.connect(
-                dbname=DATABASE_CONFIG.get("dbname"),
-                user=DATABASE_CONFIG.get("user"),
-                password=DATABASE_CONFIG.get("password"),
-                host=DATABASE_CONFIG.get("host"),
-                port=DATABASE_CONFIG.get("port"),
-            )
-            cls.connection = db_connection
-            return db_connection
-        except psycopg2.OperationalError as error:
-            raise Exception(f"Erro ao conectar-se ao banco de dados: {error}")
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            connection.rollback()
+            return True
+        except psycopg2.Error:
+            return False
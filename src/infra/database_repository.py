@@ -1,7 +1,16 @@
+import io
+import time
+import uuid
+from contextlib import contextmanager, nullcontext
+from typing import Callable, Iterator, List, Optional, Sequence
+
 import pandas as pd
 from psycopg2.extras import execute_values
 
+from src.config.settings import LOAD_CONFIG, QUERY_CONFIG
+
 from .database_connector import DatabaseConnection
+from .instrumentation import instrumented
 from .interface.database_repository import DatabaseRepositoryInterface
 
 
@@ -9,10 +18,40 @@ class DatabaseRepository(DatabaseRepositoryInterface):
     """
     Implementa a interface `DatabaseRepositoryInterface` para interações com o banco de dados.
 
-    Esta classe fornece métodos para criar tabelas e inserir dados no banco de dados,
-    aproveitando uma conexão compartilhada com o banco de dados.
+    Esta classe fornece métodos para criar tabelas e inserir dados no banco de dados.
+    Cada operação retira uma conexão do pool de `DatabaseConnection` e a devolve ao terminar, de modo que
+    instâncias usadas em threads diferentes não disputam a mesma conexão.
+
+    Atributos:
+        load_method (str): O método de carga em massa utilizado por `insert_data`. `"copy"` transmite os dados
+                           com `COPY ... FROM STDIN` e `"values"` utiliza `execute_values`.
+        copy_chunk_size (int): A quantidade de linhas serializadas por bloco no buffer em memória do `COPY`.
     """
 
+    LOAD_METHODS = ("copy", "values")
+
+    def __init__(
+        self,
+        load_method: str = LOAD_CONFIG["method"],
+        copy_chunk_size: int = LOAD_CONFIG["copy_chunk_size"],
+    ) -> None:
+        """
+        Inicializa o repositório com o método de carga em massa desejado.
+
+        Args:
+            load_method (str): `"copy"` (padrão) ou `"values"`.
+            copy_chunk_size (int): A quantidade de linhas por bloco enviado ao `COPY`.
+
+        Raises:
+            ValueError: Se o método de carga não for suportado ou o tamanho do bloco não for positivo.
+        """
+        if load_method not in self.LOAD_METHODS:
+            raise ValueError(f"Método de carga inválido: {load_method}. Use um de {self.LOAD_METHODS}.")
+        if copy_chunk_size <= 0:
+            raise ValueError("O tamanho do bloco do COPY deve ser maior que zero.")
+        self.load_method = load_method
+        self.copy_chunk_size = copy_chunk_size
+
     @classmethod
     def create(cls, query: str) -> None:
         """
@@ -29,30 +68,39 @@ class DatabaseRepository(DatabaseRepositoryInterface):
                        a transação é revertida e uma mensagem de erro é registrada.
 
         Nota:
-            Este método usa uma conexão compartilhada com o banco de dados da classe `DatabaseConnection`.
+            Este método usa uma conexão retirada do pool da classe `DatabaseConnection`.
         """
-        cursor = DatabaseConnection.connection.cursor()
-        try:
-            cursor.execute(query)
-            DatabaseConnection.connection.commit()
-            print("Tabela criada com sucesso!")
-        except Exception as e:
-            DatabaseConnection.connection.rollback()
-            print(f"Erro ao criar a tabela: {e}")
-        finally:
-            cursor.close()
+        with DatabaseConnection.get_connection() as connection:
+            cursor = connection.cursor()
+            try:
+                cursor.execute(query)
+                connection.commit()
+                print("Tabela criada com sucesso!")
+            except Exception as e:
+                connection.rollback()
+                print(f"Erro ao criar a tabela: {e}")
+            finally:
+                cursor.close()
 
-    def insert_data(self, dataframe, table_name) -> None:
+    @instrumented(
+        "insert_data",
+        rows_in=lambda arguments: len(arguments["dataframe"]),
+        labels=lambda arguments: {"table": arguments["table_name"]},
+    )
+    def insert_data(self, dataframe, table_name, transaction=None) -> None:
         """
         Insere dados de um DataFrame na tabela especificada no banco de dados.
 
-        Transforma o DataFrame em tuplas e utiliza o método `execute_values` para inserção em massa.
-        Se ocorrer um erro durante o processo de inserção, a transação é revertida,
-        e uma mensagem de erro é exibida.
+        Com o método `"copy"`, o DataFrame é serializado em CSV, em blocos de `copy_chunk_size` linhas, num buffer
+        em memória e transmitido com `COPY ... FROM STDIN`, sem materializar uma tupla Python por linha. Se o `COPY`
+        falhar, a carga é desfeita até um savepoint e refeita com `execute_values`. Ao final, a vazão da carga
+        (linhas por segundo) é exibida para cada tabela.
 
         Args:
             dataframe (pd.DataFrame): O DataFrame pandas contendo os dados a serem inseridos.
             table_name (str): O nome da tabela onde os dados devem ser inseridos.
+            transaction (psycopg2.extensions.connection, opcional): Uma transação aberta por `transaction()`.
+                Quando informada, a confirmação ou reversão fica a cargo de quem abriu a transação.
 
         Raise:
             Exception: Se ocorrer um erro durante a inserção de dados,
@@ -60,25 +108,268 @@ class DatabaseRepository(DatabaseRepositoryInterface):
 
         Nota:
             - As colunas do DataFrame são usadas como os nomes das colunas da tabela.
-            - Este método usa uma conexão compartilhada com o banco de dados da classe `DatabaseConnection`.
+            - Sem transação, este método usa uma conexão retirada do pool da classe `DatabaseConnection`.
         """
-        cursor = DatabaseConnection.connection.cursor()
-        try:
-            rows = [tuple(row) for row in dataframe.to_numpy()]
-            columns = ", ".join(dataframe.columns)
+        self.__run_load(
+            table_name,
+            len(dataframe),
+            transaction,
+            lambda cursor, method: self.__write(cursor, dataframe, table_name, method),
+        )
+
+    def upsert_data(
+        self,
+        dataframe: pd.DataFrame,
+        table_name: str,
+        conflict_columns: Sequence[str],
+        additive_columns: Sequence[str] = (),
+        transaction=None,
+    ) -> None:
+        """
+        Insere ou atualiza dados de um DataFrame na tabela especificada, usando `INSERT ... ON CONFLICT`.
+
+        Os dados são carregados em massa (com o mesmo método de `insert_data`) em uma tabela temporária e,
+        em seguida, mesclados na tabela de destino pelas colunas de conflito. Colunas aditivas são somadas ao
+        valor existente (para mesclar agregados parciais); as demais são substituídas. Se todas as colunas
+        fizerem parte da chave, linhas já existentes são ignoradas.
+
+        Args:
+            dataframe (pd.DataFrame): O DataFrame com os dados a serem mesclados. Não deve conter chaves repetidas.
+            table_name (str): O nome da tabela de destino.
+            conflict_columns (Sequence[str]): As colunas da chave natural, cobertas por um índice único.
+            additive_columns (Sequence[str]): As colunas somadas ao valor existente em caso de conflito.
+            transaction (psycopg2.extensions.connection, opcional): Uma transação aberta por `transaction()`.
+
+        Raise:
+            Exception: Se ocorrer um erro durante a mesclagem dos dados.
+        """
+        staging_table = f"{table_name}_staging"
+        query = self._upsert_query(
+            list(dataframe.columns), table_name, staging_table, conflict_columns, additive_columns
+        )
+
+        def write(cursor, method: str) -> None:
+            cursor.execute(
+                f"CREATE TEMP TABLE IF NOT EXISTS {staging_table} (LIKE {table_name} INCLUDING DEFAULTS) ON COMMIT DROP"
+            )
+            cursor.execute(f"TRUNCATE {staging_table}")
+            self.__write(cursor, dataframe, staging_table, method)
+            cursor.execute(query)
+
+        self.__run_load(table_name, len(dataframe), transaction, write)
+
+    @staticmethod
+    def _upsert_query(
+        columns: List[str],
+        table_name: str,
+        staging_table: str,
+        conflict_columns: Sequence[str],
+        additive_columns: Sequence[str],
+    ) -> str:
+        """
+        Monta o comando que mescla a tabela temporária na tabela de destino com `INSERT ... ON CONFLICT`.
+
+        Args:
+            columns (List[str]): As colunas carregadas.
+            table_name (str): O nome da tabela de destino.
+            staging_table (str): O nome da tabela temporária com os dados carregados.
+            conflict_columns (Sequence[str]): As colunas da chave natural.
+            additive_columns (Sequence[str]): As colunas somadas ao valor existente em caso de conflito.
+
+        Returns:
+            str: O comando SQL.
+        """
+        assignments = [
+            (
+                f"{column} = {table_name}.{column} + EXCLUDED.{column}"
+                if column in additive_columns
+                else f"{column} = EXCLUDED.{column}"
+            )
+            for column in columns
+            if column not in conflict_columns
+        ]
+        action = f"DO UPDATE SET {', '.join(assignments)}" if assignments else "DO NOTHING"
+        return (
+            f"INSERT INTO {table_name} ({', '.join(columns)}) SELECT {', '.join(columns)} FROM {staging_table} "
+            f"ON CONFLICT ({', '.join(conflict_columns)}) {action}"
+        )
+
+    def execute(self, query: str, params: Optional[dict] = None, transaction=None) -> None:
+        """
+        Executa um comando SQL que não retorna registros.
+
+        Args:
+            query (str): O comando SQL, opcionalmente com parâmetros no formato `%(nome)s`.
+            params (Optional[dict]): Os valores dos parâmetros do comando.
+            transaction (psycopg2.extensions.connection, opcional): Uma transação aberta por `transaction()`.
+
+        Raises:
+            Exception: Se ocorrer um erro durante a execução do comando.
+        """
+        with self.__connection(transaction) as connection:
+            cursor = connection.cursor()
+            try:
+                cursor.execute(query, params)
+                if transaction is None:
+                    connection.commit()
+            except Exception as e:
+                if transaction is None:
+                    connection.rollback()
+                raise Exception(f"Erro ao executar o comando SQL: {e}") from e
+            finally:
+                cursor.close()
+
+    @contextmanager
+    def transaction(self) -> Iterator:
+        """
+        Abre uma transação que agrupa várias operações do repositório.
 
-            query = f"INSERT INTO {table_name} ({columns}) VALUES %s"
-            execute_values(cursor, query, rows)
-            DatabaseConnection.connection.commit()
-            print(f"Dados carregados com sucesso na tabela {table_name}.")
+        Uma conexão do pool fica reservada para a transação até o fim do bloco `with`, quando é confirmada,
+        ou revertida se uma exceção for levantada.
+
+        Yields:
+            psycopg2.extensions.connection: A conexão da transação, a ser repassada às operações do repositório.
+        """
+        with DatabaseConnection.get_connection() as connection:
+            try:
+                yield connection
+                connection.commit()
+            except Exception:
+                connection.rollback()
+                raise
+
+    def __run_load(self, table_name: str, row_count: int, transaction, write: Callable[..., None]) -> None:
+        """
+        Executa uma carga em massa, com fallback do `COPY` para `execute_values`, e exibe a sua vazão.
+
+        Args:
+            table_name (str): O nome da tabela de destino, usado nas mensagens.
+            row_count (int): A quantidade de linhas carregadas.
+            transaction (psycopg2.extensions.connection, opcional): Uma transação aberta por `transaction()`.
+            write (Callable[..., None]): A função que grava os dados, recebendo o cursor e o método de carga.
+
+        Raise:
+            Exception: Se a carga falhar com todos os métodos disponíveis.
+        """
+        with self.__connection(transaction) as connection:
+            self.__load(connection, table_name, row_count, transaction, write)
+
+    def __load(self, connection, table_name: str, row_count: int, transaction, write: Callable[..., None]) -> None:
+        """
+        Executa a carga em massa em uma conexão já obtida. Ver `__run_load`.
+
+        Args:
+            connection (psycopg2.extensions.connection): A conexão usada na carga.
+            table_name (str): O nome da tabela de destino, usado nas mensagens.
+            row_count (int): A quantidade de linhas carregadas.
+            transaction (psycopg2.extensions.connection, opcional): Uma transação aberta por `transaction()`.
+            write (Callable[..., None]): A função que grava os dados, recebendo o cursor e o método de carga.
+        """
+        cursor = connection.cursor()
+        method = self.load_method
+        start = time.perf_counter()
+        try:
+            if method == "copy":
+                cursor.execute("SAVEPOINT bulk_load")
+                try:
+                    write(cursor, method)
+                    cursor.execute("RELEASE SAVEPOINT bulk_load")
+                except Exception as e:
+                    cursor.execute("ROLLBACK TO SAVEPOINT bulk_load")
+                    print(f"Falha no COPY para a tabela {table_name}, utilizando execute_values: {e}")
+                    method = "values"
+            if method == "values":
+                write(cursor, method)
+            if transaction is None:
+                connection.commit()
+            elapsed = time.perf_counter() - start
+            rows_per_second = row_count / elapsed if elapsed > 0 else float(row_count)
+            print(
+                f"Dados carregados com sucesso na tabela {table_name}: {row_count} linhas em {elapsed:.2f}s "
+                f"({rows_per_second:,.0f} linhas/s via {method})."
+            )
         except Exception as e:
-            DatabaseConnection.connection.rollback()
+            if transaction is None:
+                connection.rollback()
             print(f"Erro ao carregar dados na tabela {table_name}: {e}")
             raise Exception("Erro ao carregar dados na tabela") from e
         finally:
             cursor.close()
 
-    def find(self, query: str) -> pd.DataFrame:
+    def __write(self, cursor, dataframe: pd.DataFrame, table_name: str, method: str) -> None:
+        """
+        Grava o DataFrame na tabela com o método de carga informado.
+
+        Args:
+            cursor (psycopg2.extensions.cursor): O cursor da transação corrente.
+            dataframe (pd.DataFrame): Os dados a serem carregados.
+            table_name (str): O nome da tabela de destino.
+            method (str): `"copy"` ou `"values"`.
+        """
+        if method == "copy":
+            self.__copy_data(cursor, dataframe, table_name)
+        else:
+            self.__execute_values(cursor, dataframe, table_name)
+
+    def __copy_data(self, cursor, dataframe: pd.DataFrame, table_name: str) -> None:
+        """
+        Transmite o DataFrame para a tabela com `COPY ... FROM STDIN` no formato CSV.
+
+        Args:
+            cursor (psycopg2.extensions.cursor): O cursor da transação corrente.
+            dataframe (pd.DataFrame): Os dados a serem carregados.
+            table_name (str): O nome da tabela de destino.
+        """
+        columns = ", ".join(dataframe.columns)
+        query = f"COPY {table_name} ({columns}) FROM STDIN WITH (FORMAT csv)"
+        for start in range(0, len(dataframe), self.copy_chunk_size):
+            chunk = self._to_copy_frame(dataframe.iloc[start : start + self.copy_chunk_size])
+            buffer = io.StringIO()
+            chunk.to_csv(buffer, index=False, header=False)
+            buffer.seek(0)
+            cursor.copy_expert(query, buffer)
+
+    def __execute_values(self, cursor, dataframe: pd.DataFrame, table_name: str) -> None:
+        """
+        Insere o DataFrame na tabela com `execute_values`, convertendo cada linha em uma tupla.
+
+        Args:
+            cursor (psycopg2.extensions.cursor): O cursor da transação corrente.
+            dataframe (pd.DataFrame): Os dados a serem carregados.
+            table_name (str): O nome da tabela de destino.
+        """
+        values = dataframe.astype(object).where(dataframe.notna(), None)
+        rows = [tuple(row) for row in values.to_numpy()]
+        columns = ", ".join(dataframe.columns)
+
+        query = f"INSERT INTO {table_name} ({columns}) VALUES %s"
+        execute_values(cursor, query, rows)
+
+    @staticmethod
+    def _to_copy_frame(dataframe: pd.DataFrame) -> pd.DataFrame:
+        """
+        Ajusta um bloco do DataFrame para serialização em CSV.
+
+        Colunas `float` cujos valores são todos inteiros (como códigos que viraram `float` por conterem
+        valores ausentes) são convertidas para `Int64`, evitando que `214.0` seja rejeitado por colunas `INT`.
+
+        Args:
+            dataframe (pd.DataFrame): O bloco a ser ajustado.
+
+        Returns:
+            pd.DataFrame: O bloco pronto para ser escrito no buffer do `COPY`.
+        """
+        integral_columns = [
+            column
+            for column in dataframe.select_dtypes(include="float").columns
+            if (dataframe[column].dropna() % 1 == 0).all()
+        ]
+        if not integral_columns:
+            return dataframe
+        return dataframe.astype({column: "Int64" for column in integral_columns})
+
+    @instrumented("find", rows_out=len, labels=lambda arguments: {"query": " ".join(arguments["query"].split())[:120]})
+    def find(self, query: str, params: Optional[dict] = None, timeout: Optional[float] = None) -> pd.DataFrame:
         """
         Executa uma consulta SQL e retorna os registros resultantes como um DataFrame pandas.
 
@@ -89,21 +380,112 @@ class DatabaseRepository(DatabaseRepositoryInterface):
         Args:
             query (str): A consulta SQL a ser executada. Pode ser uma consulta simples
             (e.g., `SELECT * FROM table_name`) ou uma consulta mais elaborada para relatórios.
+            params (Optional[dict]): Os valores dos parâmetros da consulta, no formato `%(nome)s`.
+            timeout (Optional[float]): O tempo máximo de execução da consulta, em segundos, aplicado no servidor
+                com `statement_timeout`. Sem valor, vale a configuração do servidor.
 
         Returns:
             pd.DataFrame: Um DataFrame contendo os registros retornados pela consulta.
 
         Raises:
             Exception: Se ocorrer algum erro durante a execução da consulta.
+
+        Nota:
+            O resultado inteiro é trazido para a memória. Para resultados grandes, use `find_chunks`.
         """
-        cursor = DatabaseConnection.connection.cursor()
-        try:
-            cursor.execute(query)
-            records = cursor.fetchall()
-            columns = [desc[0] for desc in cursor.description]
-            df = pd.DataFrame(records, columns=columns)
-            return df
-        except Exception as e:
-            raise Exception(f"Erro ao executar a consulta SQL: {e}") from e
-        finally:
-            cursor.close()
+        with DatabaseConnection.get_connection() as connection:
+            cursor = connection.cursor()
+            try:
+                if timeout:
+                    cursor.execute("SET LOCAL statement_timeout = %s", (int(timeout * 1000),))
+                cursor.execute(query, params)
+                records = cursor.fetchall()
+                columns = [desc[0] for desc in cursor.description]
+                df = self._records_to_frame(records, columns)
+                return df
+            except Exception as e:
+                raise Exception(f"Erro ao executar a consulta SQL: {e}") from e
+            finally:
+                cursor.close()
+
+    def find_chunks(
+        self,
+        query: str,
+        chunk_size: int = QUERY_CONFIG["itersize"],
+        params: Optional[dict] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Executa uma consulta SQL e retorna os registros resultantes em blocos de DataFrames.
+
+        A consulta é executada em um cursor nomeado (do lado do servidor), que envia ao cliente `chunk_size`
+        linhas por vez; apenas o bloco corrente fica na memória do cliente. A conexão permanece reservada até
+        que o gerador seja esgotado ou fechado.
+
+        Args:
+            query (str): A consulta SQL a ser executada.
+            chunk_size (int): A quantidade de linhas de cada bloco, usada também como `itersize` do cursor.
+            params (Optional[dict]): Os valores dos parâmetros da consulta, no formato `%(nome)s`.
+            timeout (Optional[float]): O tempo máximo de execução da consulta, em segundos.
+
+        Yields:
+            pd.DataFrame: O próximo bloco de registros.
+
+        Raises:
+            ValueError: Se `chunk_size` não for positivo.
+            Exception: Se ocorrer algum erro durante a execução da consulta.
+        """
+        if chunk_size <= 0:
+            raise ValueError("O tamanho do bloco deve ser maior que zero.")
+        with DatabaseConnection.get_connection() as connection:
+            if timeout:
+                with connection.cursor() as setup_cursor:
+                    setup_cursor.execute("SET LOCAL statement_timeout = %s", (int(timeout * 1000),))
+            cursor = connection.cursor(name=f"find_{uuid.uuid4().hex}")
+            cursor.itersize = chunk_size
+            try:
+                cursor.execute(query, params)
+                while True:
+                    records = cursor.fetchmany(chunk_size)
+                    if not records:
+                        break
+                    yield self._records_to_frame(records, [desc[0] for desc in cursor.description])
+            except Exception as e:
+                raise Exception(f"Erro ao executar a consulta SQL: {e}") from e
+            finally:
+                cursor.close()
+
+    @staticmethod
+    def _records_to_frame(records: List[tuple], columns: List[str]) -> pd.DataFrame:
+        """
+        Monta um DataFrame a partir de um lote de tuplas retornado pelo cursor.
+
+        `from_records` converte o lote inteiro em arrays por coluna em uma única passada vetorizada, mais
+        rápida que transpor as tuplas em Python; cada lote é convertido assim que é recebido.
+
+        Args:
+            records (List[tuple]): As linhas retornadas pelo cursor.
+            columns (List[str]): Os nomes das colunas.
+
+        Returns:
+            pd.DataFrame: O DataFrame com os registros.
+        """
+        if not records:
+            return pd.DataFrame(columns=columns)
+        return pd.DataFrame.from_records(records, columns=columns)
+
+    @staticmethod
+    def __connection(transaction):
+        """
+        Retorna o gerenciador de contexto da conexão de uma operação: a conexão da transação informada ou,
+        sem transação, uma conexão retirada do pool.
+
+        Args:
+            transaction (psycopg2.extensions.connection, opcional): Uma transação aberta por `transaction()`.
+
+        Returns:
+            AbstractContextManager: O gerenciador de contexto que fornece a conexão.
+        """
+        if transaction is not None:
+            return nullcontext(transaction)
+        return DatabaseConnection.get_connection()
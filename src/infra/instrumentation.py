@@ -0,0 +1,227 @@
+import cProfile
+import functools
+import inspect
+import json
+import os
+import resource
+import sys
+import threading
+import time
+import tracemalloc
+import uuid
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from src.config.settings import METRICS_CONFIG
+
+
+@dataclass
+class Measurement:
+    """
+    Métricas de uma execução de uma etapa ou operação do pipeline, gravadas como uma linha JSON.
+
+    Attributes:
+        stage (str): O nome da etapa ou operação (por exemplo, `extract` ou `find`).
+        run_id (Optional[str]): O identificador da execução do pipeline.
+        labels (Dict[str, Any]): Informações adicionais, como a tabela ou a consulta.
+        started_at (str): O instante de início, em ISO 8601 (UTC).
+        wall_seconds (float): O tempo decorrido.
+        cpu_seconds (float): O tempo de CPU do processo (todas as threads) durante a medição.
+        peak_rss_bytes (int): O pico de memória residente do processo até o fim da medição.
+        peak_traced_bytes (Optional[int]): O pico de memória alocada pelo Python durante a medição, quando o
+                                           `tracemalloc` está habilitado.
+        rows_in (Optional[int]): A quantidade de linhas recebidas.
+        rows_out (Optional[int]): A quantidade de linhas produzidas.
+        status (str): `"ok"` ou `"error"`.
+        error (Optional[str]): A mensagem de erro, se houver.
+        profile_path (Optional[str]): O arquivo `.prof` gerado pelo cProfile, se houver.
+    """
+
+    stage: str
+    run_id: Optional[str] = None
+    labels: Dict[str, Any] = field(default_factory=dict)
+    started_at: str = ""
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    peak_rss_bytes: int = 0
+    peak_traced_bytes: Optional[int] = None
+    rows_in: Optional[int] = None
+    rows_out: Optional[int] = None
+    status: str = "ok"
+    error: Optional[str] = None
+    profile_path: Optional[str] = None
+
+
+class Instrumentation:
+    """
+    Coleta métricas de tempo, CPU, memória e linhas das etapas do pipeline e as grava em JSON Lines.
+
+    Cada medição gera uma linha no arquivo `METRICS_CONFIG["path"]`, identificada pelo `run_id` da execução
+    corrente (ver `start_run`), de modo que execuções diferentes possam ser comparadas. As medições das
+    etapas (`profile=True`) podem ainda registrar o pico de memória do `tracemalloc` e gerar um arquivo do
+    cProfile por etapa, quando habilitados em `METRICS_CONFIG`; as operações frequentes, como `find` e
+    `insert_data`, registram apenas tempo, CPU, memória residente e linhas.
+
+    Com `METRICS_CONFIG["enabled"]` desligado, as medições não fazem nada.
+
+    Atributos:
+        run_id (Optional[str]): O identificador da execução corrente.
+    """
+
+    run_id = None
+    __lock = threading.Lock()
+
+    @classmethod
+    def start_run(cls) -> str:
+        """
+        Inicia uma nova execução, gerando o seu identificador e iniciando o `tracemalloc`, se habilitado.
+
+        Returns:
+            str: O identificador da execução.
+        """
+        cls.run_id = f"{datetime.now(timezone.utc):%Y%m%dT%H%M%SZ}-{uuid.uuid4().hex[:8]}"
+        if METRICS_CONFIG["enabled"] and METRICS_CONFIG["tracemalloc"] and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        return cls.run_id
+
+    @classmethod
+    @contextmanager
+    def measure(
+        cls, stage: str, rows_in: Optional[int] = None, profile: bool = False, **labels: Any
+    ) -> Iterator[Measurement]:
+        """
+        Mede o bloco `with`, gravando uma linha de métricas ao final, inclusive quando o bloco falha.
+
+        As linhas produzidas são informadas pelo próprio bloco, em `measurement.rows_out`.
+
+        Args:
+            stage (str): O nome da etapa ou operação.
+            rows_in (Optional[int]): A quantidade de linhas recebidas.
+            profile (bool): Se `True`, coleta também o pico do `tracemalloc` e o perfil do cProfile, quando
+                            habilitados. Deve ser usado apenas nas etapas, e não em operações aninhadas.
+            **labels (Any): Informações adicionais gravadas com as métricas.
+
+        Yields:
+            Measurement: A medição em andamento.
+        """
+        measurement = Measurement(stage=stage, run_id=cls.run_id, labels=labels, rows_in=rows_in)
+        if not METRICS_CONFIG["enabled"]:
+            yield measurement
+            return
+
+        profiler = cProfile.Profile() if profile and METRICS_CONFIG["profile"] else None
+        trace_memory = profile and tracemalloc.is_tracing()
+        if trace_memory:
+            tracemalloc.reset_peak()
+        measurement.started_at = datetime.now(timezone.utc).isoformat()
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        if profiler is not None:
+            profiler.enable()
+        try:
+            yield measurement
+        except BaseException as exception:
+            measurement.status = "error"
+            measurement.error = str(exception)
+            raise
+        finally:
+            if profiler is not None:
+                profiler.disable()
+                measurement.profile_path = cls.__dump_profile(profiler, stage)
+            measurement.wall_seconds = time.perf_counter() - wall_start
+            measurement.cpu_seconds = time.process_time() - cpu_start
+            measurement.peak_rss_bytes = cls.__peak_rss()
+            if trace_memory:
+                measurement.peak_traced_bytes = tracemalloc.get_traced_memory()[1]
+            cls.record(measurement)
+
+    @classmethod
+    def record(cls, measurement: Measurement) -> None:
+        """
+        Grava uma medição como uma linha JSON no arquivo de métricas.
+
+        Args:
+            measurement (Measurement): A medição concluída.
+        """
+        path = METRICS_CONFIG["path"]
+        line = json.dumps(asdict(measurement), default=str)
+        with cls.__lock:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(path, "a") as file:
+                file.write(line + "\n")
+
+    @classmethod
+    def __dump_profile(cls, profiler: cProfile.Profile, stage: str) -> str:
+        """Grava o perfil do cProfile de uma etapa e retorna o caminho do arquivo."""
+        os.makedirs(METRICS_CONFIG["profile_dir"], exist_ok=True)
+        path = os.path.join(METRICS_CONFIG["profile_dir"], f"{cls.run_id or 'norun'}_{stage}.prof")
+        profiler.dump_stats(path)
+        return path
+
+    @staticmethod
+    def __peak_rss() -> int:
+        """Retorna o pico de memória residente do processo, em bytes."""
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def instrumented(
+    stage: str,
+    rows_in: Optional[Callable[[Dict[str, Any]], int]] = None,
+    rows_out: Optional[Callable[[Any], int]] = None,
+    labels: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+) -> Callable:
+    """
+    Decorador que mede cada chamada da função com `Instrumentation.measure`. Em funções assíncronas, a medição
+    cobre a execução da corrotina até o seu término, e não apenas a sua criação.
+
+    Args:
+        stage (str): O nome da operação.
+        rows_in (Optional[Callable]): Recebe os argumentos da chamada (por nome) e retorna as linhas recebidas.
+        rows_out (Optional[Callable]): Recebe o retorno da função e retorna as linhas produzidas.
+        labels (Optional[Callable]): Recebe os argumentos da chamada (por nome) e retorna as informações
+                                     adicionais gravadas com as métricas.
+
+    Returns:
+        Callable: O decorador.
+    """
+
+    def decorator(function: Callable) -> Callable:
+        signature = inspect.signature(function)
+
+        def measure(args, kwargs):
+            arguments = signature.bind(*args, **kwargs).arguments
+            return Instrumentation.measure(
+                stage,
+                rows_in=rows_in(arguments) if rows_in else None,
+                **(labels(arguments) if labels else {}),
+            )
+
+        if inspect.iscoroutinefunction(function):
+
+            @functools.wraps(function)
+            async def async_wrapper(*args, **kwargs):
+                if not METRICS_CONFIG["enabled"]:
+                    return await function(*args, **kwargs)
+                with measure(args, kwargs) as measurement:
+                    result = await function(*args, **kwargs)
+                    if rows_out is not None:
+                        measurement.rows_out = rows_out(result)
+                    return result
+
+            return async_wrapper
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not METRICS_CONFIG["enabled"]:
+                return function(*args, **kwargs)
+            with measure(args, kwargs) as measurement:
+                result = function(*args, **kwargs)
+                if rows_out is not None:
+                    measurement.rows_out = rows_out(result)
+                return result
+
+        return wrapper
+
+    return decorator
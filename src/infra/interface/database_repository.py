@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from contextlib import AbstractContextManager
+from typing import Iterator, Optional, Sequence
 
 import pandas as pd
 
@@ -18,8 +20,20 @@ class DatabaseRepositoryInterface(ABC):
         insert_data(dataframe: pd.DataFrame, table_name: str) -> None:
             Insere os dados de um DataFrame pandas em uma tabela do banco de dados.
 
+        upsert_data(dataframe: pd.DataFrame, table_name: str, conflict_columns: Sequence[str]) -> None:
+            Insere ou atualiza os dados de um DataFrame pandas pela chave natural da tabela.
+
+        execute(query: str, params: dict) -> None:
+            Executa um comando SQL que não retorna registros.
+
+        transaction() -> AbstractContextManager:
+            Agrupa várias operações em uma única transação.
+
         find(table_name: str) -> pd.DataFrame:
             Retorna todos os registros de uma tabela específica como um DataFrame.
+
+        find_chunks(query: str, chunk_size: int) -> Iterator[pd.DataFrame]:
+            Retorna os registros de uma consulta em blocos, usando um cursor do lado do servidor.
     """
 
     @abstractmethod
@@ -38,18 +52,19 @@ class DatabaseRepositoryInterface(ABC):
                        a transação é revertida e uma mensagem de erro é registrada.
 
         Nota:
-            Este método usa uma conexão compartilhada com o banco de dados da classe `DatabaseConnection`.
+            Este método usa uma conexão retirada do pool da classe `DatabaseConnection`.
         """
         pass
 
     @abstractmethod
-    def insert_data(self, dataframe: pd.DataFrame, table_name: str) -> None:
+    def insert_data(self, dataframe: pd.DataFrame, table_name: str, transaction=None) -> None:
         """
         Insere dados de um DataFrame pandas na tabela especificada no banco de dados.
 
         Args:
             dataframe (pd.DataFrame): O DataFrame contendo os dados que serão inseridos.
             table_name (str): O nome da tabela no banco de dados onde os dados serão armazenados.
+            transaction (opcional): Uma transação aberta por `transaction()`.
 
         Raises:
             NotImplementedError: Se o método não for implementado em uma subclasse concreta.
@@ -57,7 +72,60 @@ class DatabaseRepositoryInterface(ABC):
         pass
 
     @abstractmethod
-    def find(self, query: str) -> pd.DataFrame:
+    def upsert_data(
+        self,
+        dataframe: pd.DataFrame,
+        table_name: str,
+        conflict_columns: Sequence[str],
+        additive_columns: Sequence[str] = (),
+        transaction=None,
+    ) -> None:
+        """
+        Insere ou atualiza dados de um DataFrame pandas na tabela especificada, pela sua chave natural.
+
+        Args:
+            dataframe (pd.DataFrame): O DataFrame contendo os dados que serão mesclados.
+            table_name (str): O nome da tabela no banco de dados.
+            conflict_columns (Sequence[str]): As colunas da chave natural da tabela.
+            additive_columns (Sequence[str]): As colunas somadas ao valor existente em caso de conflito.
+            transaction (opcional): Uma transação aberta por `transaction()`.
+
+        Raises:
+            NotImplementedError: Se o método não for implementado em uma subclasse concreta.
+        """
+        pass
+
+    @abstractmethod
+    def execute(self, query: str, params: Optional[dict] = None, transaction=None) -> None:
+        """
+        Executa um comando SQL que não retorna registros.
+
+        Args:
+            query (str): O comando SQL a ser executado.
+            params (Optional[dict]): Os valores dos parâmetros do comando.
+            transaction (opcional): Uma transação aberta por `transaction()`.
+
+        Raises:
+            NotImplementedError: Se o método não for implementado em uma subclasse concreta.
+        """
+        pass
+
+    @abstractmethod
+    def transaction(self) -> AbstractContextManager:
+        """
+        Abre uma transação que agrupa várias operações do repositório.
+
+        Returns:
+            AbstractContextManager: Um gerenciador de contexto que confirma a transação ao final do bloco
+            ou a reverte se uma exceção for levantada.
+
+        Raises:
+            NotImplementedError: Se o método não for implementado em uma subclasse concreta.
+        """
+        pass
+
+    @abstractmethod
+    def find(self, query: str, params: Optional[dict] = None, timeout: Optional[float] = None) -> pd.DataFrame:
         """
         Executa uma consulta SQL e retorna os registros resultantes como um DataFrame pandas.
 
@@ -68,6 +136,8 @@ class DatabaseRepositoryInterface(ABC):
         Args:
             query (str): A consulta SQL a ser executada. Pode ser uma consulta simples
             (e.g., `SELECT * FROM table_name`) ou uma consulta mais elaborada para relatórios.
+            params (Optional[dict]): Os valores dos parâmetros da consulta, no formato `%(nome)s`.
+            timeout (Optional[float]): O tempo máximo de execução da consulta, em segundos.
 
         Returns:
             pd.DataFrame: Um DataFrame contendo os registros retornados pela consulta.
@@ -76,3 +146,25 @@ class DatabaseRepositoryInterface(ABC):
             NotImplementedError: Se o método não for implementado em uma subclasse concreta.
         """
         pass
+
+    @abstractmethod
+    def find_chunks(
+        self, query: str, chunk_size: int, params: Optional[dict] = None, timeout: Optional[float] = None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Executa uma consulta SQL e retorna os registros resultantes em blocos de DataFrames, sem trazer o
+        resultado inteiro para a memória.
+
+        Args:
+            query (str): A consulta SQL a ser executada.
+            chunk_size (int): A quantidade de linhas de cada bloco.
+            params (Optional[dict]): Os valores dos parâmetros da consulta, no formato `%(nome)s`.
+            timeout (Optional[float]): O tempo máximo de execução da consulta, em segundos.
+
+        Yields:
+            pd.DataFrame: O próximo bloco de registros.
+
+        Raises:
+            NotImplementedError: Se o método não for implementado em uma subclasse concreta.
+        """
+        pass
@@ -1,10 +1,36 @@
+import asyncio
+from dataclasses import fields
+from typing import Iterator, Optional, Tuple
+
+import pandas as pd
+
+from src.config.settings import (
+    EXTRACT_CONFIG,
+    LOAD_CONFIG,
+    PARTITION_CONFIG,
+    PIPELINE_CONFIG,
+    STAGE_CACHE_CONFIG,
+    TRANSFORM_CONFIG,
+)
+from src.driver.columnar_cache import ColumnarCache
 from src.driver.dataloader import DataLoader
+from src.driver.source_discovery import DateRange
+from src.driver.stage_cache import StageCache
 from src.driver.visualization.reports_visualizer import ReportsVisualizer
+from src.infra.async_database_connector import AsyncDatabaseConnection
+from src.infra.async_database_repository import AsyncDatabaseRepository
+from src.infra.bounded_pipeline import BoundedPipeline
 from src.infra.database_connector import DatabaseConnection
 from src.infra.database_repository import DatabaseRepository
+from src.infra.instrumentation import Instrumentation
 from src.stages.analysis.analyze_data import AnalyzeData
+from src.stages.analysis.materialized_views import MaterializedViews
+from src.stages.contracts.extract_contract import ExtractContract
+from src.stages.contracts.extract_stream_contract import ExtractStreamContract
+from src.stages.contracts.transform_contract import TransformContract
 from src.stages.extract.extract_data import ExtractData
 from src.stages.load.load_data import LoadData
+from src.stages.transform.partitioned_transform import PartitionedTransformData
 from src.stages.transform.transform_data import TransformData
 
 
@@ -19,14 +45,35 @@ class MainPipeline:
     4. Visualização e análise dos dados de vendas para gerar relatórios e insights.
 
     Atributos:
+        __dataloader (DataLoader): O carregador dos arquivos de origem, usado pela extração e pelos workers da
+                                   transformação particionada.
         __extract_data (ExtractData): Objeto responsável por extrair dados da fonte de dados.
         __transform_data (TransformData): Objeto responsável por transformar os dados extraídos.
+        __batch_transform (TransformData | PartitionedTransformData): A transformação das cargas completa e
+                                                                      incremental, particionada ou não.
         __load_data (LoadData): Objeto responsável por carregar os dados transformados no banco de dados.
         __repository (DatabaseRepository): Objeto responsável pelas operações de banco de dados.
+        __materialized_views (MaterializedViews): Objeto responsável pelas views materializadas das análises.
+        __stage_cache (Optional[StageCache]): O cache dos resultados das etapas da carga completa, se habilitado.
+                                              A última carga completa é registrada no banco
+                                              de dados, e as cargas incrementais e em streaming a invalidam.
         __sales_visualizer (SalesVisualizer): Objeto responsável pela visualização dos dados de vendas.
+        __async_load_data (LoadData): A carga do pipeline assíncrono, sobre um `AsyncDatabaseRepository`.
+        __async_materialized_views (MaterializedViews): As views materializadas do pipeline assíncrono.
+        __async_analyze_data (AnalyzeData): As análises do pipeline assíncrono.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        chunk_size: int = EXTRACT_CONFIG["chunk_size"],
+        refresh_cache: bool = False,
+        incremental: bool = LOAD_CONFIG["incremental"],
+        partition_by: str = PARTITION_CONFIG["key"],
+        no_cache: bool = False,
+        pipelined: bool = PIPELINE_CONFIG["enabled"],
+        start_date: str = EXTRACT_CONFIG["start_date"],
+        end_date: str = EXTRACT_CONFIG["end_date"],
+    ) -> None:
         """
         Inicializa a classe MainPipeline com os componentes necessários para a extração, transformação,
         visualização e carga dos dados no banco de dados.
@@ -37,11 +84,63 @@ class MainPipeline:
         - Carregador de dados: `LoadData`
         - Repositório de banco de dados: `DatabaseRepository`
         - Visualizador de vendas: `SalesVisualizer`
+
+        Args:
+            chunk_size (int): Quantidade de linhas por bloco no modo de streaming. Com `0` (padrão), os arquivos
+                              são lidos por inteiro; com um valor positivo, extração, transformação e carga
+                              são feitas bloco a bloco.
+            refresh_cache (bool): Se `True`, ignora o cache colunar das fontes e o regrava a partir dos CSVs.
+            incremental (bool): Se `True`, extrai apenas as linhas posteriores às marcas d'água de cada fonte e
+                                mescla os deltas nas tabelas existentes, em vez de recarregar todos os dados.
+            partition_by (str): Com `"ID_FILIAL"` ou `"month"`, as vendas e o estoque são transformados em
+                                partições por essa chave, em processos paralelos (`PartitionedTransformData`).
+                                Com `""` (padrão), a transformação é feita em um único processo.
+            no_cache (bool): Se `True`, executa todas as etapas da carga completa mesmo que as suas entradas não
+                             tenham mudado desde a última execução, regravando o cache das etapas.
+            pipelined (bool): Se `True`, no modo de streaming, a leitura de cada fonte, a transformação e a carga
+                              são executadas ao mesmo tempo, em threads ligadas por filas limitadas
+                              (`BoundedPipeline`).
+            start_date (str): A primeira data (`AAAA-MM-DD`) das vendas e do estoque extraídos. Vazia (padrão),
+                              sem limite inicial. As partições das fontes anteriores a ela não são lidas.
+            end_date (str): A última data (`AAAA-MM-DD`) das vendas e do estoque extraídos. Vazia (padrão), sem
+                            limite final. As partições das fontes posteriores a ela não são lidas.
+
+        Raises:
+            ValueError: Se o modo incremental for combinado com o modo de streaming ou com uma velocidade de
+                        vendas agregada (`TRANSFORM_VELOCITY_GRANULARITY` diferente de `"row"`), ou se o modo
+                        particionado for combinado com o modo de streaming ou com um backend fora do pandas,
+                        ou se o modo em pipeline for usado sem o modo de streaming, ou se o intervalo de datas
+                        for inválido ou combinado com um backend fora do pandas.
         """
-        self.__extract_data = ExtractData(dataloader=DataLoader())
+        if incremental and chunk_size > 0:
+            raise ValueError("O modo incremental não pode ser combinado com o modo de streaming.")
+        if incremental and TRANSFORM_CONFIG["velocity_granularity"] != "row":
+            raise ValueError("O modo incremental exige a velocidade de vendas por venda (granularidade 'row').")
+        if partition_by and (chunk_size > 0 or TRANSFORM_CONFIG["backend"] != "pandas"):
+            raise ValueError("O modo particionado exige a carga completa e o backend pandas.")
+        if pipelined and chunk_size <= 0:
+            raise ValueError("O modo em pipeline exige o modo de streaming (tamanho de bloco maior que zero).")
+        date_range = DateRange.parse(start_date, end_date)
+        if date_range.bounded and TRANSFORM_CONFIG["backend"] != "pandas":
+            raise ValueError("O intervalo de datas exige o backend pandas.")
+        self.__chunk_size = chunk_size
+        self.__incremental = incremental
+        self.__pipelined = pipelined
+        self.__date_range = date_range
+        cache = ColumnarCache(refresh=refresh_cache) if EXTRACT_CONFIG["cache_enabled"] else None
+        self.__dataloader = DataLoader(cache=cache, date_range=date_range)
+        self.__extract_data = ExtractData(dataloader=self.__dataloader)
         self.__transform_data = TransformData()
+        self.__batch_transform = PartitionedTransformData(partition_by) if partition_by else self.__transform_data
+        visualizer = ReportsVisualizer()
         self.__load_data = LoadData(repository=DatabaseRepository())
-        self.__analyze_data = AnalyzeData(repository=DatabaseRepository(), visualizer=ReportsVisualizer())
+        self.__materialized_views = MaterializedViews(repository=DatabaseRepository())
+        self.__analyze_data = AnalyzeData(repository=DatabaseRepository(), visualizer=visualizer)
+        async_repository = AsyncDatabaseRepository()
+        self.__async_load_data = LoadData(repository=async_repository)
+        self.__async_materialized_views = MaterializedViews(repository=async_repository)
+        self.__async_analyze_data = AnalyzeData(repository=async_repository, visualizer=visualizer)
+        self.__stage_cache = StageCache(refresh=no_cache) if STAGE_CACHE_CONFIG["enabled"] else None
 
     def run_pipeline(self) -> None:
         """
@@ -49,11 +148,24 @@ class MainPipeline:
         e visualiza os resultados.
 
         Este método orquestra as seguintes etapas do pipeline:
-        1. Conecta ao banco de dados através do método `DatabaseConnection.connect()`.
+        1. Cria o pool de conexões através do método `DatabaseConnection.connect()`, fechado ao final.
         2. Extrai os dados brutos utilizando a classe `ExtractData`.
         3. Transforma os dados extraídos utilizando a classe `TransformData`.
         4. Carrega os dados transformados no banco de dados utilizando a classe `LoadData`.
-        5. Visualiza os dados de vendas e gera relatórios utilizando a classe `SalesVisualizer`.
+           No modo de streaming, as etapas 2 a 4 são encadeadas bloco a bloco; no modo em pipeline, elas são
+           executadas ao mesmo tempo, e o próximo bloco é lido e transformado enquanto o anterior é carregado.
+           No modo incremental, apenas as linhas a partir das marcas d'água que ainda não foram carregadas
+           são extraídas e mescladas às tabelas existentes. Com os backends `duckdb` e `polars`, os arquivos de
+           origem são transformados diretamente; no modo de streaming, os resultados são lidos do backend e
+           carregados bloco a bloco. No modo particionado, a transformação é dividida entre processos por filial ou
+           por mês. Na carga completa, os contratos de extração e de transformação são reaproveitados do
+           `StageCache` quando as suas entradas não mudaram, e as etapas 2 a 5 são puladas se os mesmos dados já
+           foram carregados.
+        5. Atualiza as views materializadas das análises utilizando a classe `MaterializedViews`.
+        6. Visualiza os dados de vendas e gera relatórios utilizando a classe `SalesVisualizer`.
+
+        Cada etapa é medida por `Instrumentation` (tempo, CPU, memória e linhas), assim como cada consulta e
+        cada carga do repositório; as métricas são gravadas em JSON Lines quando `METRICS_ENABLED` está ligado.
 
         Args:
             Nenhum
@@ -65,12 +177,256 @@ class MainPipeline:
             Exception: Se ocorrer qualquer erro durante a execução de qualquer uma das etapas do pipeline,
             uma exceção será levantada para indicar falhas no processo.
         """
+        Instrumentation.start_run()
         DatabaseConnection.connect()
+        try:
+            with Instrumentation.measure("pipeline"):
+                self.__run_stages()
+        finally:
+            DatabaseConnection.close()
+
+    async def run_pipeline_async(self) -> None:
+        """
+        Executa o pipeline completo de forma assíncrona, com o banco de dados acessado pelo asyncpg.
+
+        As etapas são as mesmas de `run_pipeline`, com as seguintes diferenças:
+        - No modo de streaming, o próximo bloco é extraído e transformado em uma thread enquanto o bloco anterior
+          é carregado (ver `LoadData.load_stream_async`).
+        - Na carga completa, a extração e a transformação, com o cache das etapas, são executadas em uma thread, e
+          as tabelas e as views materializadas são atualizadas ao mesmo tempo, cada uma em sua própria conexão.
+        - As consultas de análise são executadas ao mesmo tempo no loop de eventos.
+
+        O pool de conexões do asyncpg é criado no início e fechado ao final. Deve ser executado com
+        `asyncio.run(pipeline.run_pipeline_async())`; `run_pipeline` continua sendo o modo padrão.
+
+        Raises:
+            ValueError: Se o modo incremental estiver ligado, pois ele não é suportado pelo pipeline assíncrono.
+            Exception: Se ocorrer qualquer erro durante a execução de qualquer uma das etapas do pipeline.
+        """
+        if self.__incremental:
+            raise ValueError("O modo incremental não é suportado pelo pipeline assíncrono.")
+        Instrumentation.start_run()
+        await AsyncDatabaseConnection.connect()
+        try:
+            with Instrumentation.measure("pipeline", mode="async"):
+                await self.__run_stages_async()
+        finally:
+            await AsyncDatabaseConnection.close()
+
+    def __run_stages(self) -> None:
+        """Executa as etapas do pipeline no modo configurado, medindo cada uma delas."""
+        if self.__chunk_size > 0 or self.__incremental:
+            self.__load_data.forget_load()
+
+        if self.__chunk_size > 0:
+            with Instrumentation.measure("stream", profile=True, pipelined=self.__pipelined):
+                if self.__pipelined:
+                    self.__run_pipelined_stream()
+                else:
+                    self.__load_data.load_stream(self.__transform_stream())
+            self.__refresh_views()
+        elif self.__incremental:
+            with Instrumentation.measure("extract", profile=True) as extract_metrics:
+                extract_contract = self.__extract_data.extract(self.__load_data.get_high_water_marks())
+                extract_metrics.rows_out = self.__count_rows(extract_contract)
+
+            with Instrumentation.measure(
+                "transform", rows_in=extract_metrics.rows_out, profile=True
+            ) as transform_metrics:
+                extract_contract = self.__transform_data.drop_loaded_rows(
+                    extract_contract, self.__load_data.get_loaded_row_hashes()
+                )
+                transform_contract = self.__batch_transform.transform(
+                    extract_contract, available_stock_base=self.__load_data.get_available_stock()
+                )
+                transform_metrics.rows_out = self.__count_rows(transform_contract)
+
+            with Instrumentation.measure("load", rows_in=transform_metrics.rows_out, profile=True):
+                self.__load_data.load_incremental(transform_contract)
+            self.__refresh_views()
+        else:
+            self.__run_batch_stages()
+
+        with Instrumentation.measure("analyze", profile=True):
+            self.__analyze_data.execute_analysis()
+
+    def __transform_stream(self) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """
+        Produz os blocos transformados do modo de streaming: lidos dos arquivos de origem pelo backend, com os
+        backends `duckdb` e `polars`, ou transformados a partir da extração em blocos, com o backend pandas.
+        """
+        if self.__transform_data.backend != "pandas":
+            return self.__transform_data.transform_files_stream(self.__extract_data.source_paths(), self.__chunk_size)
+        return self.__transform_data.transform_stream(self.__extract_data.extract_stream(self.__chunk_size))
+
+    def __run_pipelined_stream(self) -> None:
+        """
+        Executa a carga em streaming com as etapas sobrepostas: cada fonte é lida em uma thread, a transformação em
+        outra e a carga na thread principal, ligadas por filas de `PIPELINE_QUEUE_SIZE` blocos. Com os backends
+        `duckdb` e `polars`, a leitura e a transformação ocorrem juntas na mesma thread. Um erro em qualquer
+        etapa interrompe as demais e é levantado pela carga.
+        """
+        with BoundedPipeline() as pipeline:
+            if self.__transform_data.backend != "pandas":
+                chunks = pipeline.stage(self.__transform_stream(), "transform")
+            else:
+                extract_stream_contract = self.__extract_data.extract_stream(self.__chunk_size)
+                prefetched_contract = ExtractStreamContract(
+                    **{
+                        item.name: pipeline.stage(getattr(extract_stream_contract, item.name), f"extract_{item.name}")
+                        for item in fields(ExtractStreamContract)
+                    }
+                )
+                chunks = pipeline.stage(self.__transform_data.transform_stream(prefetched_contract), "transform")
+            self.__load_data.load_stream(chunks)
+
+    async def __run_stages_async(self) -> None:
+        """Executa as etapas do pipeline assíncrono, na carga completa ou em streaming."""
+        if self.__chunk_size > 0:
+            await self.__async_load_data.forget_load_async()
+            with Instrumentation.measure("stream", profile=True):
+                await self.__async_load_data.load_stream_async(self.__transform_stream())
+            await self.__refresh_views_async()
+        else:
+            await self.__run_batch_stages_async()
+
+        with Instrumentation.measure("analyze", profile=True):
+            await self.__async_analyze_data.execute_analysis_async()
+
+    def __run_batch_stages(self) -> None:
+        """
+        Executa a carga completa, reaproveitando os resultados das etapas cujas entradas não mudaram.
+
+        As chaves das três etapas são calculadas antes de qualquer leitura: se a carga registrada no banco de
+        dados (ver `LoadData.get_load_key`) tem a mesma chave, a extração, a transformação, a carga e a
+        atualização das views são puladas; senão, o contrato de transformação (ou, na falta dele, o de extração)
+        é recuperado do cache, e apenas as etapas seguintes são executadas.
+        """
+        cache = self.__stage_cache
+        extract_key, transform_key, load_key = self.__batch_keys()
+        if cache is not None and not cache.refresh and self.__load_data.get_load_key() == load_key:
+            print("Fontes e código inalterados desde a última carga: extração, transformação e carga ignoradas.")
+            return
+
+        transform_contract = self.__batch_transform_contract(extract_key, transform_key)
+
+        self.__load_data.forget_load()
+        with Instrumentation.measure("load", rows_in=self.__count_rows(transform_contract), profile=True):
+            self.__load_data.load(transform_contract)
+
+        self.__refresh_views()
+        if cache is not None:
+            self.__load_data.mark_loaded(load_key)
+
+    async def __run_batch_stages_async(self) -> None:
+        """
+        Versão assíncrona de `__run_batch_stages`: o cálculo das chaves, a extração e a transformação são
+        executados em uma thread, e a carga e a atualização das views, no loop de eventos.
+        """
+        cache = self.__stage_cache
+        extract_key, transform_key, load_key = await asyncio.to_thread(self.__batch_keys)
+        if cache is not None and not cache.refresh and await self.__async_load_data.get_load_key_async() == load_key:
+            print("Fontes e código inalterados desde a última carga: extração, transformação e carga ignoradas.")
+            return
+
+        transform_contract = await asyncio.to_thread(self.__batch_transform_contract, extract_key, transform_key)
+
+        await self.__async_load_data.forget_load_async()
+        with Instrumentation.measure("load", rows_in=self.__count_rows(transform_contract), profile=True):
+            await self.__async_load_data.load_async(transform_contract)
+
+        await self.__refresh_views_async()
+        if cache is not None:
+            await self.__async_load_data.mark_loaded_async(load_key)
+
+    def __batch_keys(self) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """
+        Calcula as chaves de extração, de transformação e de carga da carga completa.
+
+        Returns:
+            Tuple[Optional[str], Optional[str], Optional[str]]: As três chaves, ou `None` sem o cache das etapas.
+        """
+        cache = self.__stage_cache
+        if cache is None:
+            return None, None, None
+        extract_key = cache.stage_key("extract", cache.files_key(self.__extract_data.source_paths()), self.__date_range)
+        transform_key = cache.stage_key(
+            "transform",
+            extract_key,
+            self.__transform_data.backend,
+            self.__transform_data.engine,
+            self.__transform_data.velocity_granularity,
+        )
+        load_key = cache.stage_key("load", transform_key)
+        return extract_key, transform_key, load_key
+
+    def __batch_transform_contract(self, extract_key: Optional[str], transform_key: Optional[str]) -> TransformContract:
+        """
+        Recupera o contrato de transformação do cache das etapas ou, na falta dele, executa a extração e a
+        transformação e grava o resultado no cache.
+        """
+        cache = self.__stage_cache
+        transform_contract = cache.get_contract(transform_key, TransformContract) if cache is not None else None
+        if transform_contract is not None:
+            print("Transformação reaproveitada do cache das etapas.")
+            return transform_contract
+
+        transform_contract = self.__extract_and_transform(extract_key)
+        if cache is not None:
+            cache.put_contract(transform_key, transform_contract)
+        return transform_contract
+
+    def __extract_and_transform(self, extract_key: Optional[str]) -> TransformContract:
+        """
+        Executa a transformação da carga completa: a partir dos arquivos de origem, com os backends `duckdb` e
+        `polars` e com a transformação particionada, cujos workers leem os arquivos das suas partições, ou a
+        partir do contrato de extração, reaproveitado do cache das etapas quando possível.
+        """
+        cache = self.__stage_cache
+        if self.__transform_data.backend != "pandas":
+            backend = self.__transform_data.backend
+            with Instrumentation.measure("transform", profile=True, backend=backend) as transform_metrics:
+                transform_contract = self.__transform_data.transform_files(self.__extract_data.source_paths())
+                transform_metrics.rows_out = self.__count_rows(transform_contract)
+            return transform_contract
+
+        if isinstance(self.__batch_transform, PartitionedTransformData):
+            partition_by = self.__batch_transform.partition_by
+            with Instrumentation.measure("transform", profile=True, partition_by=partition_by) as transform_metrics:
+                transform_contract = self.__batch_transform.transform_files(
+                    self.__extract_data.source_paths(), self.__dataloader
+                )
+                transform_metrics.rows_out = self.__count_rows(transform_contract)
+            return transform_contract
+
+        extract_contract = cache.get_contract(extract_key, ExtractContract) if cache is not None else None
+        if extract_contract is not None:
+            print("Extração reaproveitada do cache das etapas.")
+        else:
+            with Instrumentation.measure("extract", profile=True) as extract_metrics:
+                extract_contract = self.__extract_data.extract()
+                extract_metrics.rows_out = self.__count_rows(extract_contract)
+            if cache is not None:
+                cache.put_contract(extract_key, extract_contract)
 
-        extract_contract = self.__extract_data.extract()
+        with Instrumentation.measure(
+            "transform", rows_in=self.__count_rows(extract_contract), profile=True
+        ) as transform_metrics:
+            transform_contract = self.__batch_transform.transform(extract_contract)
+            transform_metrics.rows_out = self.__count_rows(transform_contract)
+        return transform_contract
 
-        transform_contract = self.__transform_data.transform(extract_contract)
+    def __refresh_views(self) -> None:
+        """Atualiza as views materializadas após a carga."""
+        with Instrumentation.measure("refresh_views", profile=True):
+            self.__materialized_views.refresh()
 
-        self.__load_data.load(transform_contract)
+    async def __refresh_views_async(self) -> None:
+        """Atualiza as views materializadas após a carga, no pipeline assíncrono."""
+        with Instrumentation.measure("refresh_views", profile=True):
+            await self.__async_materialized_views.refresh_async()
 
-        self.__analyze_data.execute_analysis()
+    @staticmethod
+    def __count_rows(contract) -> int:
+        """Soma as linhas de todos os DataFrames de um contrato."""
+        return sum(len(getattr(contract, item.name)) for item in fields(contract))
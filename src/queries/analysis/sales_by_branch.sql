@@ -1,3 +1,16 @@
-SELECT id_filial, SUM(venda_pecas) AS venda_pecas
-FROM sales
-GROUP BY id_filial;
+WITH ranked AS (
+    SELECT id_filial, venda_pecas, ROW_NUMBER() OVER (ORDER BY venda_pecas DESC NULLS LAST, id_filial) AS posicao
+    FROM mv_sales_by_branch
+)
+SELECT id_filial, venda_pecas
+FROM (
+    SELECT id_filial::TEXT AS id_filial, venda_pecas, posicao
+    FROM ranked
+    WHERE posicao <= %(group_limit)s
+    UNION ALL
+    SELECT 'OUTROS', SUM(venda_pecas), %(group_limit)s + 1
+    FROM ranked
+    WHERE posicao > %(group_limit)s
+    HAVING COUNT(*) > 0
+) AS top_n
+ORDER BY posicao;
@@ -1,3 +1,16 @@
-SELECT produto, SUM(venda_pecas) AS venda_pecas
-FROM sales
-GROUP BY produto;
+WITH ranked AS (
+    SELECT produto, venda_pecas, ROW_NUMBER() OVER (ORDER BY venda_pecas DESC NULLS LAST, produto) AS posicao
+    FROM mv_sales_by_product
+)
+SELECT produto, venda_pecas
+FROM (
+    SELECT produto::TEXT AS produto, venda_pecas, posicao
+    FROM ranked
+    WHERE posicao <= %(group_limit)s
+    UNION ALL
+    SELECT 'OUTROS', SUM(venda_pecas), %(group_limit)s + 1
+    FROM ranked
+    WHERE posicao > %(group_limit)s
+    HAVING COUNT(*) > 0
+) AS top_n
+ORDER BY posicao;
@@ -1,5 +1,4 @@
-SELECT produto, cor_produto, AVG(velocidade_venda) AS avg_velocidade_venda
-FROM sales_velocity
-GROUP BY produto, cor_produto
+SELECT produto, cor_produto, avg_velocidade_venda
+FROM mv_sales_velocity
 ORDER BY avg_velocidade_venda DESC
-LIMIT 10;
\ No newline at end of file
+LIMIT %(top_n)s;
\ No newline at end of file
@@ -1,3 +1,4 @@
-SELECT * 
-FROM sales_by_region
-ORDER BY venda_pecas ASC;
\ No newline at end of file
+SELECT uf, cidade, venda_pecas
+FROM mv_sales_by_region
+ORDER BY venda_pecas ASC
+LIMIT %(top_n)s;
\ No newline at end of file
@@ -0,0 +1,5 @@
+CREATE TABLE IF NOT EXISTS etl_loads (
+    NAME VARCHAR(50) PRIMARY KEY,
+    LOAD_KEY VARCHAR(64) NOT NULL,
+    LOADED_AT TIMESTAMP NOT NULL DEFAULT NOW()
+);
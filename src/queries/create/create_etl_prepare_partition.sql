@@ -0,0 +1,35 @@
+CREATE OR REPLACE FUNCTION etl_prepare_partition(
+    parent_table TEXT,
+    partition_column TEXT,
+    partition_month DATE,
+    reset BOOLEAN
+) RETURNS VOID AS $$
+DECLARE
+    month_start DATE := date_trunc('month', partition_month)::DATE;
+    month_end DATE := (date_trunc('month', partition_month) + INTERVAL '1 month')::DATE;
+    partition_name TEXT := lower(parent_table) || COALESCE('_' || to_char(partition_month, 'YYYY_MM'), '_default');
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(parent_table)) THEN
+        IF reset AND partition_month IS NULL THEN
+            EXECUTE format('DELETE FROM %I WHERE %I IS NULL', lower(parent_table), lower(partition_column));
+        ELSIF reset THEN
+            EXECUTE format(
+                'DELETE FROM %I WHERE %I >= %L AND %I < %L',
+                lower(parent_table), lower(partition_column), month_start, lower(partition_column), month_end
+            );
+        END IF;
+        RETURN;
+    END IF;
+
+    IF to_regclass(partition_name) IS NULL AND partition_month IS NULL THEN
+        EXECUTE format('CREATE TABLE %I PARTITION OF %I DEFAULT', partition_name, lower(parent_table));
+    ELSIF to_regclass(partition_name) IS NULL THEN
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+            partition_name, lower(parent_table), month_start, month_end
+        );
+    ELSIF reset THEN
+        EXECUTE format('TRUNCATE %I', partition_name);
+    END IF;
+END;
+$$ LANGUAGE plpgsql;
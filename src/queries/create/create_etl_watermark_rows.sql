@@ -0,0 +1,5 @@
+CREATE TABLE IF NOT EXISTS etl_watermark_rows (
+    SOURCE VARCHAR(50) NOT NULL,
+    ROW_HASH BIGINT NOT NULL,
+    PRIMARY KEY (SOURCE, ROW_HASH)
+);
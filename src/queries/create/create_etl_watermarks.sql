@@ -0,0 +1,5 @@
+CREATE TABLE IF NOT EXISTS etl_watermarks (
+    SOURCE VARCHAR(50) PRIMARY KEY,
+    HIGH_WATER_MARK DATE NOT NULL,
+    UPDATED_AT TIMESTAMP NOT NULL DEFAULT NOW()
+);
@@ -7,4 +7,4 @@ CREATE TABLE IF NOT EXISTS sales (
     VENDA_PECAS INT,
     VENDA_LIQUIDA DECIMAL(10, 2),
     VENDA_BRUTA DECIMAL(10, 2)
-);
\ No newline at end of file
+) PARTITION BY RANGE (DATA_VENDA);
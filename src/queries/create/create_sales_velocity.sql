@@ -8,5 +8,8 @@ CREATE TABLE IF NOT EXISTS sales_velocity (
     VENDA_LIQUIDA NUMERIC,
     VENDA_BRUTA NUMERIC,
     ESTOQUE_DISPONIVEL INT,
-    VELOCIDADE_VENDA DECIMAL
-);
\ No newline at end of file
+    VELOCIDADE_VENDA DECIMAL,
+    QTD_VENDAS INT DEFAULT 1
+) PARTITION BY RANGE (DATA_VENDA);
+
+ALTER TABLE sales_velocity ADD COLUMN IF NOT EXISTS QTD_VENDAS INT DEFAULT 1;
\ No newline at end of file
@@ -6,4 +6,4 @@ CREATE TABLE IF NOT EXISTS stock (
     TAMANHO CHAR(50) NOT NULL,
     TOTAL INT NOT NULL,
     TRANSITO INT NOT NULL
-);
+) PARTITION BY RANGE (DATA_FOTO);
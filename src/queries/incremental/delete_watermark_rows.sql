@@ -0,0 +1,7 @@
+DELETE FROM etl_watermark_rows
+WHERE SOURCE = %(source)s
+  AND EXISTS (
+      SELECT 1
+      FROM etl_watermarks
+      WHERE SOURCE = %(source)s AND HIGH_WATER_MARK < %(high_water_mark)s
+  );
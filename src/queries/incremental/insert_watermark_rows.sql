@@ -0,0 +1,8 @@
+INSERT INTO etl_watermark_rows (SOURCE, ROW_HASH)
+SELECT %(source)s, UNNEST(CAST(%(row_hashes)s AS BIGINT[]))
+WHERE NOT EXISTS (
+    SELECT 1
+    FROM etl_watermarks
+    WHERE SOURCE = %(source)s AND HIGH_WATER_MARK > %(high_water_mark)s
+)
+ON CONFLICT DO NOTHING;
@@ -0,0 +1,2 @@
+SELECT produto, cor_produto, estoque_disponivel
+FROM available_stock;
@@ -0,0 +1,2 @@
+SELECT source, row_hash
+FROM etl_watermark_rows;
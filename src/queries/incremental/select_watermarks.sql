@@ -0,0 +1,2 @@
+SELECT source, high_water_mark
+FROM etl_watermarks;
@@ -0,0 +1,5 @@
+INSERT INTO etl_watermarks (SOURCE, HIGH_WATER_MARK)
+VALUES (%(source)s, %(high_water_mark)s)
+ON CONFLICT (SOURCE) DO UPDATE
+SET HIGH_WATER_MARK = GREATEST(etl_watermarks.HIGH_WATER_MARK, EXCLUDED.HIGH_WATER_MARK),
+    UPDATED_AT = NOW();
@@ -0,0 +1,2 @@
+CREATE INDEX IF NOT EXISTS sales_by_region_venda_pecas_idx
+ON sales_by_region (VENDA_PECAS);
@@ -0,0 +1,2 @@
+CREATE INDEX IF NOT EXISTS sales_id_filial_idx
+ON sales (ID_FILIAL) INCLUDE (VENDA_PECAS);
@@ -0,0 +1,2 @@
+CREATE INDEX IF NOT EXISTS sales_produto_idx
+ON sales (PRODUTO) INCLUDE (VENDA_PECAS);
@@ -0,0 +1,2 @@
+CREATE INDEX IF NOT EXISTS sales_velocity_produto_cor_produto_idx
+ON sales_velocity (PRODUTO, COR_PRODUTO) INCLUDE (VELOCIDADE_VENDA);
@@ -0,0 +1,2 @@
+CREATE UNIQUE INDEX IF NOT EXISTS available_stock_natural_key
+ON available_stock (PRODUTO, COR_PRODUTO);
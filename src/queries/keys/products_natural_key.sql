@@ -0,0 +1,2 @@
+CREATE UNIQUE INDEX IF NOT EXISTS products_natural_key
+ON products (ARTIGO_COR, COLECAO);
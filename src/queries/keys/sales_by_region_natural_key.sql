@@ -0,0 +1,2 @@
+CREATE UNIQUE INDEX IF NOT EXISTS sales_by_region_natural_key
+ON sales_by_region (UF, CIDADE);
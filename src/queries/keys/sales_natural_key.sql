@@ -0,0 +1,2 @@
+CREATE UNIQUE INDEX IF NOT EXISTS sales_natural_key
+ON sales (DATA_VENDA, ID_FILIAL, PRODUTO, COR_PRODUTO, TAMANHO, VENDA_PECAS, VENDA_LIQUIDA, VENDA_BRUTA);
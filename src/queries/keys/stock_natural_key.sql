@@ -0,0 +1,2 @@
+CREATE UNIQUE INDEX IF NOT EXISTS stock_natural_key
+ON stock (DATA_FOTO, ID_FILIAL, PRODUTO, COR_PRODUTO, TAMANHO, TOTAL, TRANSITO);
@@ -0,0 +1,2 @@
+CREATE UNIQUE INDEX IF NOT EXISTS store_natural_key
+ON store (ID_FILIAL);
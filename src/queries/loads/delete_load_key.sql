@@ -0,0 +1,2 @@
+DELETE FROM etl_loads
+WHERE NAME = 'full';
@@ -0,0 +1,10 @@
+SELECT load_key
+FROM etl_loads
+WHERE name = 'full'
+  AND EXISTS (SELECT 1 FROM sales)
+  AND EXISTS (SELECT 1 FROM stock)
+  AND EXISTS (SELECT 1 FROM store)
+  AND EXISTS (SELECT 1 FROM products)
+  AND EXISTS (SELECT 1 FROM available_stock)
+  AND EXISTS (SELECT 1 FROM sales_velocity)
+  AND EXISTS (SELECT 1 FROM sales_by_region);
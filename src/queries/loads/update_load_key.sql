@@ -0,0 +1,5 @@
+INSERT INTO etl_loads (NAME, LOAD_KEY)
+VALUES ('full', %(load_key)s)
+ON CONFLICT (NAME) DO UPDATE
+SET LOAD_KEY = EXCLUDED.LOAD_KEY,
+    LOADED_AT = NOW();
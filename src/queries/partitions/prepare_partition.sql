@@ -0,0 +1 @@
+SELECT etl_prepare_partition(%(table_name)s, %(partition_column)s, %(partition_month)s::DATE, %(reset)s);
@@ -0,0 +1,7 @@
+SELECT PRODUTO, COR_PRODUTO, CAST(SUM(ESTOQUE_DISPONIVEL) AS BIGINT) AS ESTOQUE_DISPONIVEL
+FROM (
+    SELECT PRODUTO, COR_PRODUTO, ESTOQUE_DISPONIVEL FROM available_stock_base
+    UNION ALL
+    SELECT PRODUTO, COR_PRODUTO, ESTOQUE_DISPONIVEL FROM available_stock
+)
+GROUP BY PRODUTO, COR_PRODUTO;
@@ -0,0 +1,4 @@
+SELECT PRODUTO, COR_PRODUTO, CAST(SUM(TOTAL - TRANSITO) AS BIGINT) AS ESTOQUE_DISPONIVEL
+FROM stock
+GROUP BY PRODUTO, COR_PRODUTO
+ORDER BY PRODUTO, COR_PRODUTO;
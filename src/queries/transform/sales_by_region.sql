@@ -0,0 +1,10 @@
+WITH sales_by_branch AS (
+    SELECT ID_FILIAL, SUM(VENDA_PECAS) AS VENDA_PECAS
+    FROM sales
+    GROUP BY ID_FILIAL
+)
+SELECT store.UF, store.CIDADE, CAST(SUM(sales_by_branch.VENDA_PECAS) AS BIGINT) AS VENDA_PECAS
+FROM store
+JOIN sales_by_branch ON store.ID_FILIAL = sales_by_branch.ID_FILIAL
+GROUP BY store.UF, store.CIDADE
+ORDER BY store.UF, store.CIDADE;
@@ -0,0 +1,8 @@
+SELECT
+    sales.*,
+    velocity_stock.ESTOQUE_DISPONIVEL,
+    sales.VENDA_PECAS / NULLIF(velocity_stock.ESTOQUE_DISPONIVEL, 0) AS VELOCIDADE_VENDA
+FROM sales
+JOIN velocity_stock
+    ON sales.PRODUTO = velocity_stock.PRODUTO AND sales.COR_PRODUTO = velocity_stock.COR_PRODUTO
+WHERE sales.VENDA_PECAS / NULLIF(velocity_stock.ESTOQUE_DISPONIVEL, 0) IS NOT NULL;
@@ -0,0 +1,15 @@
+WITH grouped AS (
+    SELECT {keys}, {measures}, COUNT(*) AS QTD_VENDAS
+    FROM sales
+    WHERE VENDA_PECAS IS NOT NULL
+    GROUP BY {keys}
+)
+SELECT
+    grouped.*,
+    velocity_stock.ESTOQUE_DISPONIVEL,
+    grouped.VENDA_PECAS / grouped.QTD_VENDAS / NULLIF(velocity_stock.ESTOQUE_DISPONIVEL, 0) AS VELOCIDADE_VENDA
+FROM grouped
+JOIN velocity_stock
+    ON grouped.PRODUTO = velocity_stock.PRODUTO AND grouped.COR_PRODUTO = velocity_stock.COR_PRODUTO
+WHERE grouped.VENDA_PECAS / grouped.QTD_VENDAS / NULLIF(velocity_stock.ESTOQUE_DISPONIVEL, 0) IS NOT NULL
+ORDER BY {keys};
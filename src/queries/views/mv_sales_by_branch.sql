@@ -0,0 +1,8 @@
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_sales_by_branch AS
+SELECT id_filial, SUM(venda_pecas) AS venda_pecas
+FROM sales
+GROUP BY id_filial
+WITH NO DATA;
+
+CREATE UNIQUE INDEX IF NOT EXISTS mv_sales_by_branch_key
+ON mv_sales_by_branch (id_filial);
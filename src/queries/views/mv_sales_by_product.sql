@@ -0,0 +1,8 @@
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_sales_by_product AS
+SELECT produto, SUM(venda_pecas) AS venda_pecas
+FROM sales
+GROUP BY produto
+WITH NO DATA;
+
+CREATE UNIQUE INDEX IF NOT EXISTS mv_sales_by_product_key
+ON mv_sales_by_product (produto);
@@ -0,0 +1,17 @@
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_sales_by_region AS
+WITH sales_by_branch AS (
+    SELECT id_filial, SUM(venda_pecas) AS venda_pecas
+    FROM sales
+    GROUP BY id_filial
+)
+SELECT store.uf, store.cidade, CAST(SUM(sales_by_branch.venda_pecas) AS BIGINT) AS venda_pecas
+FROM store
+JOIN sales_by_branch ON store.id_filial = sales_by_branch.id_filial
+GROUP BY store.uf, store.cidade
+WITH NO DATA;
+
+CREATE UNIQUE INDEX IF NOT EXISTS mv_sales_by_region_key
+ON mv_sales_by_region (uf, cidade);
+
+CREATE INDEX IF NOT EXISTS mv_sales_by_region_venda_pecas_idx
+ON mv_sales_by_region (venda_pecas);
@@ -0,0 +1,12 @@
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_sales_velocity AS
+SELECT produto, cor_produto,
+    SUM(velocidade_venda * COALESCE(qtd_vendas, 1)) / SUM(COALESCE(qtd_vendas, 1)) AS avg_velocidade_venda
+FROM sales_velocity
+GROUP BY produto, cor_produto
+WITH NO DATA;
+
+CREATE UNIQUE INDEX IF NOT EXISTS mv_sales_velocity_key
+ON mv_sales_velocity (produto, cor_produto);
+
+CREATE INDEX IF NOT EXISTS mv_sales_velocity_avg_velocidade_venda_idx
+ON mv_sales_velocity (avg_velocidade_venda DESC);
@@ -1,21 +1,68 @@
+import asyncio
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
 
+import pandas as pd
+
+from src.config.settings import ANALYSIS_CONFIG
 from src.driver.visualization.interfaces.visualization_interface import ReportsVisualizerInterface
 from src.infra.interface.database_repository import DatabaseRepositoryInterface
 from src.stages.contracts.analyze_contract import AnalyzeContract
 
+ANALYSIS_QUERIES = {
+    "sales_by_product": "sales_by_product.sql",
+    "sales_by_branch": "sales_by_branch.sql",
+    "top_10_sales_by_region": "top_10_sales_by_region.sql",
+    "top_10_least_sales_by_region": "top_10_least_sales_by_region.sql",
+    "sales_velocity": "sales_velocity.sql",
+}
+"""Arquivo da consulta SQL de cada campo do `AnalyzeContract`, em `src/queries/analysis`."""
+
 
 class AnalyzeData:
-    def __init__(self, visualizer: ReportsVisualizerInterface, repository: DatabaseRepositoryInterface):
+    def __init__(
+        self,
+        visualizer: ReportsVisualizerInterface,
+        repository: DatabaseRepositoryInterface,
+        max_workers: int = ANALYSIS_CONFIG["max_workers"],
+        query_timeout: Optional[float] = ANALYSIS_CONFIG["query_timeout"],
+        top_n: int = ANALYSIS_CONFIG["top_n"],
+        group_top_n: int = ANALYSIS_CONFIG["group_top_n"],
+        group_pages: int = ANALYSIS_CONFIG["group_pages"],
+    ):
         """
         Inicializa a classe AnalyzeData.
 
         Args:
             visualizer (ReportsVisualizer): A interface para a visualização dos dados analisados.
             repository (DatabaseRepositoryInterface): O repositório para buscar os dados necessários para análise.
+            max_workers (int): A quantidade de consultas executadas ao mesmo tempo, cada uma em sua própria
+                               conexão do pool.
+            query_timeout (Optional[float]): O tempo máximo, em segundos, de cada consulta. `None` ou `0`
+                                             desativam o limite.
+            top_n (int): A quantidade de linhas dos rankings, aplicada pelo `LIMIT %(top_n)s` das consultas.
+            group_top_n (int): A quantidade de barras por página dos gráficos de vendas por produto e por filial.
+            group_pages (int): A quantidade de páginas desses gráficos. As consultas retornam os
+                               `group_top_n * group_pages` primeiros itens (`%(group_limit)s`) e somam os demais
+                               em uma única linha `OUTROS`.
+
+        Raises:
+            ValueError: Se `max_workers`, `top_n`, `group_top_n` ou `group_pages` não forem positivos.
         """
+        if max_workers <= 0:
+            raise ValueError("A quantidade de workers da análise deve ser maior que zero.")
+        if top_n <= 0:
+            raise ValueError("A quantidade de linhas dos rankings deve ser maior que zero.")
+        if group_top_n <= 0 or group_pages <= 0:
+            raise ValueError("A quantidade de barras e de páginas dos gráficos deve ser maior que zero.")
         self.__visualizer = visualizer
         self.__repository = repository
+        self.__max_workers = max_workers
+        self.__query_timeout = query_timeout or None
+        self.__params = {"top_n": top_n, "group_limit": group_top_n * group_pages}
+        self.__group_page_size = group_top_n
 
     def execute_analysis(self) -> None:
         """
@@ -24,41 +71,114 @@ class AnalyzeData:
         Este método busca os dados de vendas a partir do repositório, cria um contrato de análise
         com os dados adquiridos e passa esse contrato para o visualizador responsável pela
         criação dos gráficos e visualizações.
+
+        As consultas são disparadas todas de uma vez em um pool de threads, de modo que o tempo total da análise
+        acompanha a consulta mais lenta, e não a soma de todas. Cada consulta tem o seu próprio tempo limite
+        e o seu tempo de execução é exibido ao final.
+
+        Raises:
+            Exception: Se alguma consulta falhar ou exceder o tempo limite, após a conclusão das demais.
         """
-        sales_by_product = self.__read_query_from_file("sales_by_product.sql")
-        sales_by_branch = self.__read_query_from_file("sales_by_branch.sql")
-        top_10_sales_by_region = self.__read_query_from_file("top_10_sales_by_region.sql")
-        top_10_least_sales_by_region = self.__read_query_from_file("top_10_least_sales_by_region.sql")
-        sales_velocity_query = self.__read_query_from_file("sales_velocity.sql")
-
-        if not all(
-            [
-                sales_velocity_query,
-                top_10_least_sales_by_region,
-                sales_by_product,
-                sales_by_branch,
-                top_10_sales_by_region,
-            ]
-        ):
-            print("Uma ou mais consultas não foram encontradas.")
+        queries = self.__read_queries()
+        if queries is None:
             return
 
-        sales_velocity = self.__repository.find(query=sales_velocity_query)
-        sales_by_product = self.__repository.find(query=sales_by_product)
-        sales_by_branch = self.__repository.find(query=sales_by_branch)
-        top_10_sales_by_region = self.__repository.find(query=top_10_sales_by_region)
-        top_10_least_sales_by_region = self.__repository.find(query=top_10_least_sales_by_region)
-
-        analyze_contract = AnalyzeContract(
-            sales_velocity=sales_velocity,
-            sales_by_product=sales_by_product,
-            sales_by_branch=sales_by_branch,
-            top_10_sales_by_region=top_10_sales_by_region,
-            top_10_least_sales_by_region=top_10_least_sales_by_region,
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.__max_workers, thread_name_prefix="analysis") as executor:
+            futures = {field: executor.submit(self.__timed_find, query) for field, query in queries.items()}
+
+        analyze_contract = self.__build_contract(
+            {field: future.exception() or future.result() for field, future in futures.items()}, start
         )
 
         self.__visualizer.generate_reports(analyze_contract)
 
+    async def execute_analysis_async(self) -> None:
+        """
+        Versão assíncrona de `execute_analysis`, para um repositório cujos métodos são corrotinas.
+
+        As consultas são executadas ao mesmo tempo no loop de eventos, limitadas a `max_workers` consultas ativas,
+        cada uma em sua própria conexão do pool assíncrono. Os gráficos são gerados em uma thread, sem bloquear
+        o loop.
+
+        Raises:
+            Exception: Se alguma consulta falhar ou exceder o tempo limite, após a conclusão das demais.
+        """
+        queries = self.__read_queries()
+        if queries is None:
+            return
+
+        start = time.perf_counter()
+        slots = asyncio.Semaphore(self.__max_workers)
+
+        async def timed_find(query: str) -> Tuple[pd.DataFrame, float]:
+            async with slots:
+                query_start = time.perf_counter()
+                result = await self.__repository.find(query=query, params=self.__params, timeout=self.__query_timeout)
+                return result, time.perf_counter() - query_start
+
+        results = await asyncio.gather(*(timed_find(query) for query in queries.values()), return_exceptions=True)
+        analyze_contract = self.__build_contract(dict(zip(queries, results)), start)
+
+        await asyncio.to_thread(self.__visualizer.generate_reports, analyze_contract)
+
+    def __read_queries(self) -> Optional[Dict[str, str]]:
+        """
+        Lê a consulta de cada campo do `AnalyzeContract`.
+
+        Returns:
+            Optional[Dict[str, str]]: As consultas por campo, ou `None` se alguma delas não for encontrada.
+        """
+        queries = {field: self.__read_query_from_file(filename) for field, filename in ANALYSIS_QUERIES.items()}
+
+        if not all(queries.values()):
+            print("Uma ou mais consultas não foram encontradas.")
+            return None
+        return queries
+
+    def __build_contract(self, outcomes: Dict[str, object], start: float) -> AnalyzeContract:
+        """
+        Monta o contrato de análise com os resultados das consultas e exibe o tempo de cada uma. O contrato leva
+        também a quantidade de barras por página (`group_top_n`), para que os gráficos sejam paginados com o mesmo
+        valor usado no limite das consultas.
+
+        Args:
+            outcomes (Dict[str, object]): O resultado e o tempo de cada consulta, ou o erro de cada consulta que falhou.
+            start (float): O instante de início da análise, de `time.perf_counter`.
+
+        Returns:
+            AnalyzeContract: O contrato com os resultados.
+
+        Raises:
+            Exception: Se alguma consulta tiver falhado.
+        """
+        errors = [f"{field}: {outcome}" for field, outcome in outcomes.items() if isinstance(outcome, BaseException)]
+        if errors:
+            raise Exception(f"Erro ao executar as consultas de análise ({'; '.join(errors)})")
+
+        results = {}
+        for field, (result, elapsed) in outcomes.items():
+            results[field] = result
+            print(f"Consulta {field} concluída em {elapsed:.2f}s.")
+        print(f"Análise concluída em {time.perf_counter() - start:.2f}s.")
+        return AnalyzeContract(**results, group_page_size=self.__group_page_size)
+
+    def __timed_find(self, query: str) -> Tuple[pd.DataFrame, float]:
+        """
+        Executa uma consulta com o tempo limite configurado e mede a sua duração. Todas as consultas recebem
+        os parâmetros `top_n` e `group_limit`, usados pelas consultas de ranking e de vendas por grupo para que
+        o limite seja aplicado no banco.
+
+        Args:
+            query (str): A consulta SQL.
+
+        Returns:
+            Tuple[pd.DataFrame, float]: O resultado da consulta e o tempo de execução em segundos.
+        """
+        start = time.perf_counter()
+        result = self.__repository.find(query=query, params=self.__params, timeout=self.__query_timeout)
+        return result, time.perf_counter() - start
+
     def __read_query_from_file(self, filename: str) -> str:
         """
         Lê o conteúdo de uma consulta SQL a partir de um arquivo.
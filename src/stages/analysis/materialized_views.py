@@ -0,0 +1,216 @@
+import asyncio
+import hashlib
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Set, Tuple
+
+import pandas as pd
+
+from src.config.settings import ANALYSIS_CONFIG
+from src.infra.interface.database_repository import DatabaseRepositoryInterface
+
+
+class MaterializedViews:
+    """
+    Classe responsável pelas views materializadas que servem as consultas de análise.
+
+    Cada relatório lê de uma view materializada (`mv_*`) definida em 'src/queries/views', que guarda o
+    resultado já agregado das tabelas carregadas. As views são criadas vazias e atualizadas após cada carga;
+    as consultas de análise passam a ler resultados pré-calculados em vez de reagregar as tabelas.
+
+    Cada view guarda no seu comentário (`COMMENT ON MATERIALIZED VIEW`) a versão da sua definição, o hash do
+    seu arquivo. Uma view cuja definição mudou é removida e criada de novo, vazia, antes da atualização; sem
+    isso, `CREATE MATERIALIZED VIEW IF NOT EXISTS` manteria a definição antiga nos bancos onde a view já existe.
+
+    Atributos:
+        __repository (DatabaseRepositoryInterface): O repositório usado para criar e atualizar as views.
+        __max_workers (int): A quantidade de views atualizadas ao mesmo tempo.
+    """
+
+    QUERIES_DIR = "src/queries/views"
+    POPULATED_QUERY = "SELECT matviewname FROM pg_matviews WHERE ispopulated AND matviewname = ANY(%(views)s)"
+    VERSIONS_QUERY = (
+        "SELECT relname AS matviewname, obj_description(oid, 'pg_class') AS version "
+        "FROM pg_class WHERE relkind = 'm' AND relname = ANY(%(views)s)"
+    )
+
+    def __init__(
+        self, repository: DatabaseRepositoryInterface, max_workers: int = ANALYSIS_CONFIG["max_workers"]
+    ) -> None:
+        """
+        Inicializa a classe MaterializedViews.
+
+        Args:
+            repository (DatabaseRepositoryInterface): O repositório de banco de dados.
+            max_workers (int): A quantidade de views atualizadas ao mesmo tempo, cada uma em sua própria
+                               conexão do pool.
+        """
+        self.__repository = repository
+        self.__max_workers = max_workers
+
+    def view_names(self) -> List[str]:
+        """
+        Retorna os nomes das views materializadas, a partir dos arquivos da pasta de views.
+
+        Returns:
+            List[str]: Os nomes das views, em ordem alfabética.
+        """
+        return sorted(filename[:-4] for filename in os.listdir(self.QUERIES_DIR) if filename.endswith(".sql"))
+
+    def create(self) -> None:
+        """
+        Cria as views materializadas e os seus índices, se ainda não existirem ou se a sua definição mudou.
+
+        As views são criadas sem dados (`WITH NO DATA`); o primeiro preenchimento é feito por `refresh`. Uma
+        view com outra versão, ou sem versão, é removida e criada de novo no mesmo comando, com a nova versão no
+        comentário. Views na versão atual não são alteradas.
+
+        Raises:
+            Exception: Se alguma view não puder ser criada.
+        """
+        versions = self.__versions(self.__repository.find(self.VERSIONS_QUERY, params={"views": self.view_names()}))
+        for view_name, query in self.__view_queries():
+            if versions.get(view_name) == self.__version(query):
+                continue
+            try:
+                self.__repository.execute(self.__create_statement(view_name, query))
+            except Exception as exception:
+                raise Exception(f"Erro ao criar a view {view_name}: {exception}") from exception
+
+    def refresh(self) -> None:
+        """
+        Cria as views que ainda não existem e atualiza todas elas em paralelo.
+
+        Views já preenchidas são atualizadas com `REFRESH MATERIALIZED VIEW CONCURRENTLY`, que usa o índice
+        único de cada view e não bloqueia as leituras durante a atualização. Views ainda vazias, que não
+        aceitam a atualização concorrente, são preenchidas com `REFRESH MATERIALIZED VIEW`.
+
+        Raises:
+            Exception: Se alguma view não puder ser atualizada, após a conclusão das demais.
+        """
+        self.create()
+        populated_views = self.__populated_views(
+            self.__repository.find(self.POPULATED_QUERY, params={"views": self.view_names()})
+        )
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.__max_workers, thread_name_prefix="refresh") as executor:
+            futures = {
+                view_name: executor.submit(
+                    self.__repository.execute, self.__refresh_statement(view_name, view_name in populated_views)
+                )
+                for view_name in self.view_names()
+            }
+
+        self.__raise_failures({view_name: future.exception() for view_name, future in futures.items()})
+        print(f"Views materializadas atualizadas em {time.perf_counter() - start:.2f}s.")
+
+    async def refresh_async(self) -> None:
+        """
+        Versão assíncrona de `refresh`, para um repositório cujos métodos são corrotinas: as views são atualizadas
+        ao mesmo tempo, cada uma em sua própria conexão do pool assíncrono.
+
+        Raises:
+            Exception: Se alguma view não puder ser criada ou atualizada, após a conclusão das demais.
+        """
+        versions = self.__versions(
+            await self.__repository.find(self.VERSIONS_QUERY, params={"views": self.view_names()})
+        )
+        for view_name, query in self.__view_queries():
+            if versions.get(view_name) == self.__version(query):
+                continue
+            try:
+                await self.__repository.execute(self.__create_statement(view_name, query))
+            except Exception as exception:
+                raise Exception(f"Erro ao criar a view {view_name}: {exception}") from exception
+        populated_views = self.__populated_views(
+            await self.__repository.find(self.POPULATED_QUERY, params={"views": self.view_names()})
+        )
+
+        start = time.perf_counter()
+        view_names = self.view_names()
+        results = await asyncio.gather(
+            *(
+                self.__repository.execute(self.__refresh_statement(view_name, view_name in populated_views))
+                for view_name in view_names
+            ),
+            return_exceptions=True,
+        )
+
+        self.__raise_failures(dict(zip(view_names, results)))
+        print(f"Views materializadas atualizadas em {time.perf_counter() - start:.2f}s.")
+
+    def __view_queries(self) -> List[Tuple[str, str]]:
+        """Lê a consulta de criação de cada view materializada."""
+        queries = []
+        for view_name in self.view_names():
+            with open(os.path.join(self.QUERIES_DIR, f"{view_name}.sql"), "r") as file:
+                queries.append((view_name, file.read()))
+        return queries
+
+    @staticmethod
+    def __version(query: str) -> str:
+        """Calcula a versão da definição de uma view: o hash SHA-256 do seu arquivo."""
+        return hashlib.sha256(query.encode()).hexdigest()
+
+    @classmethod
+    def __create_statement(cls, view_name: str, query: str) -> str:
+        """
+        Monta o comando que recria uma view materializada e registra a versão da sua definição.
+
+        A remoção, a criação e o comentário formam um único comando, executado em uma só transação: uma falha
+        mantém a view anterior.
+
+        Args:
+            view_name (str): O nome da view.
+            query (str): A consulta de criação da view e dos seus índices.
+
+        Returns:
+            str: Os comandos `DROP`, `CREATE` e `COMMENT`.
+        """
+        return (
+            f"DROP MATERIALIZED VIEW IF EXISTS {view_name};\n"
+            f"{query.rstrip().rstrip(';')};\n"
+            f"COMMENT ON MATERIALIZED VIEW {view_name} IS '{cls.__version(query)}';"
+        )
+
+    @staticmethod
+    def __versions(versions: pd.DataFrame) -> Dict[str, str]:
+        """Retorna a versão registrada de cada view existente, a partir do resultado de `VERSIONS_QUERY`."""
+        return dict(zip(versions["matviewname"], versions["version"])) if not versions.empty else {}
+
+    @staticmethod
+    def __populated_views(populated: pd.DataFrame) -> Set[str]:
+        """Retorna os nomes das views já preenchidas, a partir do resultado de `POPULATED_QUERY`."""
+        return set(populated["matviewname"]) if not populated.empty else set()
+
+    @staticmethod
+    def __refresh_statement(view_name: str, concurrently: bool) -> str:
+        """
+        Monta o comando de atualização de uma view materializada.
+
+        Args:
+            view_name (str): O nome da view.
+            concurrently (bool): Se `True`, atualiza sem bloquear as leituras da view.
+
+        Returns:
+            str: O comando `REFRESH MATERIALIZED VIEW`.
+        """
+        mode = "CONCURRENTLY " if concurrently else ""
+        return f"REFRESH MATERIALIZED VIEW {mode}{view_name}"
+
+    @staticmethod
+    def __raise_failures(failures: Dict[str, object]) -> None:
+        """
+        Levanta um único erro descrevendo todas as views cuja atualização falhou.
+
+        Args:
+            failures (Dict[str, object]): O erro de cada view; views sem erro têm valor `None`.
+
+        Raises:
+            Exception: Se alguma view tiver falhado.
+        """
+        errors = [f"{view_name}: {error}" for view_name, error in failures.items() if isinstance(error, BaseException)]
+        if errors:
+            raise Exception(f"Erro ao atualizar as views materializadas ({'; '.join(errors)})")
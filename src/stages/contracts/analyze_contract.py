@@ -15,6 +15,8 @@ class AnalyzeContract:
         sales_velocity (pd.DataFrame): Dados transformados que indicam a velocidade de vendas.
         sales_by_region (pd.DataFrame): Dados transformados sobre as vendas agregadas por região.
         sales (pd.DataFrame): Dados de vendas transformados, que contêm informações detalhadas sobre vendas realizadas.
+        group_page_size (int): A quantidade de barras por página dos gráficos de vendas por produto e por filial,
+                               a mesma usada no limite das suas consultas.
     """
 
     sales_velocity: pd.DataFrame
@@ -22,3 +24,4 @@ class AnalyzeContract:
     sales_by_branch: pd.DataFrame
     top_10_sales_by_region: pd.DataFrame
     top_10_least_sales_by_region: pd.DataFrame
+    group_page_size: int
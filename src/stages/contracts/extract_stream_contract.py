@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+from typing import Iterator
+
+from pandas import DataFrame
+
+
+@dataclass
+class ExtractStreamContract:
+    """
+    Contrato de extração de dados em blocos.
+
+    Variante do `ExtractContract` usada no modo de streaming: em vez de DataFrames completos, cada fonte é
+    representada por um iterador que produz blocos de tamanho fixo, mantendo o uso de memória limitado
+    independentemente do tamanho dos arquivos de entrada.
+
+    Attributes:
+        sales (Iterator[DataFrame]): Blocos extraídos relacionados às vendas.
+        stock (Iterator[DataFrame]): Blocos extraídos relacionados ao estoque.
+        store (Iterator[DataFrame]): Blocos extraídos relacionados às lojas.
+        products (Iterator[DataFrame]): Blocos extraídos relacionados aos produtos.
+    """
+
+    sales: Iterator[DataFrame]
+    stock: Iterator[DataFrame]
+    store: Iterator[DataFrame]
+    products: Iterator[DataFrame]
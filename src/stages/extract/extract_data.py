@@ -1,7 +1,13 @@
+from pathlib import Path
 from tarfile import ExtractError
+from typing import Dict, List, Optional
+
+import pandas as pd
 
 from src.driver.interface.dataloader_interface import DataLoaderInterface
+from src.driver.schemas import SOURCE_SCHEMAS
 from src.stages.contracts.extract_contract import ExtractContract
+from src.stages.contracts.extract_stream_contract import ExtractStreamContract
 
 
 class ExtractData:
@@ -24,13 +30,23 @@ class ExtractData:
         """
         self.__dataloader = dataloader
 
-    def extract(self) -> ExtractContract:
+    def extract(self, high_water_marks: Optional[Dict[str, pd.Timestamp]] = None) -> ExtractContract:
         """
         Extrai dados do DataLoader e os encapsula em um ExtractContract.
 
         Este método chama o método `extract_all` do DataLoader para recuperar os dados,
         e então cria um ExtractContract contendo os dados e a data da extração atual.
 
+        Na carga incremental, as fontes com marca d'água são filtradas para conter apenas as linhas a partir
+        da última data carregada (ver `SourceSchema.watermark_column`): as partições que terminam antes da marca
+        não são lidas, e as linhas anteriores a ela das partições lidas são descartadas. As linhas da própria
+        data da marca são extraídas de novo, pois podem ter chegado depois da última carga; as que já foram
+        carregadas são descartadas antes da transformação (ver `TransformData.drop_loaded_rows`).
+
+        Args:
+            high_water_marks (Optional[Dict[str, pd.Timestamp]]): A última data carregada de cada fonte.
+                Fontes ausentes do dicionário são extraídas por inteiro.
+
         Retorna:
             ExtractContract: Um contrato contendo os dados extraídos e a data da extração.
 
@@ -38,7 +54,9 @@ class ExtractData:
             ExtractError: Se ocorrer um erro durante o processo de extração de dados.
         """
         try:
-            data = self.__dataloader.extract_all()
+            data = self.__dataloader.extract_all(high_water_marks)
+            if high_water_marks:
+                data = self.__filter_new_rows(data, high_water_marks)
 
             return ExtractContract(
                 sales=data.get("sales"),
@@ -48,3 +66,69 @@ class ExtractData:
             )
         except Exception as exception:
             raise ExtractError(str(exception)) from exception
+
+    def extract_stream(self, chunk_size: int) -> ExtractStreamContract:
+        """
+        Prepara a extração em blocos dos dados e os encapsula em um ExtractStreamContract.
+
+        Os arquivos não são lidos neste momento: cada fonte é representada por um gerador de blocos
+        com `chunk_size` linhas, consumido sob demanda pelas etapas seguintes.
+
+        Args:
+            chunk_size (int): A quantidade de linhas de cada bloco.
+
+        Retorna:
+            ExtractStreamContract: Um contrato contendo os geradores de blocos de cada fonte.
+
+        Raise:
+            ExtractError: Se ocorrer um erro ao preparar a extração dos dados.
+        """
+        try:
+            data = self.__dataloader.extract_all_chunks(chunk_size)
+
+            return ExtractStreamContract(
+                sales=data.get("sales"),
+                stock=data.get("stock"),
+                store=data.get("store"),
+                products=data.get("products"),
+            )
+        except Exception as exception:
+            raise ExtractError(str(exception)) from exception
+
+    def source_paths(self) -> Dict[str, List[Path]]:
+        """
+        Localiza os arquivos de origem sem lê-los, para os backends de transformação que os leem diretamente.
+
+        Retorna:
+            Dict[str, List[Path]]: Os caminhos dos arquivos de cada fonte.
+
+        Raise:
+            ExtractError: Se algum arquivo de origem não for encontrado.
+        """
+        try:
+            return self.__dataloader.source_paths()
+        except Exception as exception:
+            raise ExtractError(str(exception)) from exception
+
+    @staticmethod
+    def __filter_new_rows(
+        data: Dict[str, pd.DataFrame], high_water_marks: Dict[str, pd.Timestamp]
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Mantém apenas as linhas da data da marca d'água de cada fonte ou posteriores a ela.
+
+        Args:
+            data (Dict[str, pd.DataFrame]): Os DataFrames extraídos de cada fonte.
+            high_water_marks (Dict[str, pd.Timestamp]): A última data carregada de cada fonte.
+
+        Returns:
+            Dict[str, pd.DataFrame]: Os DataFrames filtrados.
+        """
+        filtered = dict(data)
+        for source, high_water_mark in high_water_marks.items():
+            schema = SOURCE_SCHEMAS.get(source)
+            if schema is None or schema.watermark_column is None or filtered.get(source) is None:
+                continue
+            df = filtered[source]
+            filtered[source] = df[df[schema.watermark_column] >= pd.Timestamp(high_water_mark)].reset_index(drop=True)
+        return filtered
@@ -1,12 +1,47 @@
+import asyncio
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import fields
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
+from src.config.settings import LOAD_CONFIG, POOL_CONFIG
+from src.driver.schemas import SOURCE_SCHEMAS
 from src.errors.load_error import LoadError
 from src.infra.interface.database_repository import DatabaseRepositoryInterface
 from src.stages.contracts.transform_contract import TransformContract
 
+NATURAL_KEYS = {
+    "sales": (
+        ["DATA_VENDA", "ID_FILIAL", "PRODUTO", "COR_PRODUTO", "TAMANHO", "VENDA_PECAS", "VENDA_LIQUIDA", "VENDA_BRUTA"],
+        [],
+    ),
+    "stock": (["DATA_FOTO", "ID_FILIAL", "PRODUTO", "COR_PRODUTO", "TAMANHO", "TOTAL", "TRANSITO"], []),
+    "sales_velocity": (
+        ["DATA_VENDA", "ID_FILIAL", "PRODUTO", "COR_PRODUTO", "TAMANHO", "VENDA_PECAS", "VENDA_LIQUIDA", "VENDA_BRUTA"],
+        [],
+    ),
+    "available_stock": (["PRODUTO", "COR_PRODUTO"], ["ESTOQUE_DISPONIVEL"]),
+    "sales_by_region": (["UF", "CIDADE"], ["VENDA_PECAS"]),
+    "store": (["ID_FILIAL"], []),
+    "products": (["ARTIGO_COR", "COLECAO"], []),
+}
+"""
+Chaves naturais usadas na carga incremental, por tabela: as colunas de conflito (cobertas pelos índices únicos
+de `src/queries/keys`) e as colunas aditivas, somadas ao valor existente para mesclar agregados parciais.
+As tabelas de fatos não têm identificador próprio e linhas idênticas são duplicatas, por isso a chave de
+`sales` e `stock` é a linha inteira.
+"""
+
+PARTITIONED_TABLES = {"sales": "DATA_VENDA", "stock": "DATA_FOTO", "sales_velocity": "DATA_VENDA"}
+"""
+Tabelas de fatos particionadas por mês (`PARTITION BY RANGE`) e a coluna de data de cada uma. As partições
+(`sales_2024_06`, ...) são criadas pela função `etl_prepare_partition` durante a carga, antes da inserção de cada
+mês; as linhas sem data ficam na partição padrão (`sales_default`).
+"""
+
 
 class LoadData:
     """
@@ -16,24 +51,100 @@ class LoadData:
     inserir dados armazenados em DataFrames do pandas nas tabelas apropriadas do banco de dados.
     Ela também se assegura de que as tabelas necessárias sejam criadas antes do carregamento, caso não existam.
 
+    Os métodos `load_async` e `load_stream_async` são as versões assíncronas de `load` e `load_stream`, usadas
+    pelo pipeline assíncrono com um repositório cujos métodos são corrotinas (`AsyncDatabaseRepository`).
+
+    As tabelas de fatos (`PARTITIONED_TABLES`) são particionadas por mês. Nas cargas completas e em streaming,
+    cada mês presente nos dados substitui o mês já carregado: a partição do mês é esvaziada com `TRUNCATE` (ou
+    criada, se ainda não existir) antes da inserção, o que torna a recarga de um período idempotente e evita
+    `DELETE`s sobre a tabela inteira. Os meses ausentes dos dados são mantidos. O `TRUNCATE` e a inserção
+    acontecem na mesma transação, de modo que uma recarga que falha mantém os dados anteriores do mês. As demais
+    tabelas (dimensões e agregados) não têm data e são substituídas por inteiro: cada uma é esvaziada com
+    `TRUNCATE` na mesma transação da sua inserção.
+
     Atributos:
         __repository (DatabaseRepositoryInterface): Uma instância de uma interface de repositório de banco de dados
                                                     usada para interagir com o banco de dados.
+        __max_workers (int): A quantidade de tabelas carregadas em paralelo por `load`.
+        __atomic (bool): Se `True`, `load` confirma todas as tabelas juntas ou nenhuma delas.
     """
 
-    def __init__(self, repository: DatabaseRepositoryInterface) -> None:
+    def __init__(
+        self,
+        repository: DatabaseRepositoryInterface,
+        max_workers: int = LOAD_CONFIG["max_workers"],
+        atomic: bool = LOAD_CONFIG["atomic"],
+    ) -> None:
         """
         Inicializa a classe LoadData com um repositório especificado.
 
         Args:
             repository (DatabaseRepositoryInterface): O repositório de banco de dados usado para inserção de dados.
+            max_workers (int): A quantidade de tabelas carregadas em paralelo, cada uma em sua própria conexão
+                               do pool. Com `1` (padrão), as tabelas são carregadas uma após a outra.
+            atomic (bool): Se `True`, todas as tabelas são carregadas em uma única transação, e uma falha em
+                           qualquer tabela reverte a carga de todas elas.
+
+        Raises:
+            ValueError: Se `max_workers` não for positivo ou for maior que o pool de conexões (`DB_POOL_MAX_SIZE`).
         """
+        if max_workers <= 0:
+            raise ValueError("A quantidade de workers da carga deve ser maior que zero.")
+        if max_workers > POOL_CONFIG["max_size"]:
+            raise ValueError(
+                f"A quantidade de workers da carga ({max_workers}) é maior que o pool de conexões "
+                f"({POOL_CONFIG['max_size']}); aumente DB_POOL_MAX_SIZE ou reduza LOAD_MAX_WORKERS."
+            )
         self.__repository = repository
+        self.__max_workers = max_workers
+        self.__atomic = atomic
 
     def load(self, data: TransformContract) -> None:
         """
         Carrega os dados no banco de dados iterando sobre os campos da classe TransformContract.
 
+        Com `max_workers` maior que `1`, as tabelas são carregadas em paralelo em um pool de threads limitado,
+        cada worker com sua própria conexão do pool, e o tempo total se aproxima do tempo da maior tabela.
+        As falhas são tratadas por tabela: as demais tabelas continuam sendo carregadas e o erro informa todas
+        as tabelas que falharam. No modo atômico, as tabelas são carregadas em sequência em uma única transação,
+        que só é confirmada se todas as tabelas forem carregadas; `max_workers` não se aplica a esse modo.
+
+        Nas tabelas de fatos, as partições dos meses carregados são esvaziadas antes da inserção, e as demais
+        tabelas são esvaziadas por inteiro, na mesma transação da inserção da tabela. As marcas d'água de cada
+        fonte também são registradas (no modo atômico, na mesma transação das tabelas), para que uma carga
+        incremental posterior parta dos dados já carregados.
+        Ao final, os índices das consultas de análise são criados e as estatísticas das tabelas são atualizadas
+        (ver `optimize_tables`).
+
+        Args:
+            data (TransformContract): Um objeto contendo os DataFrames a serem inseridos nas tabelas.
+
+        Raises:
+            ValueError: Se o objeto 'data' não for uma instância de TransformContract ou algum DataFrame estiver vazio.
+            LoadError: Se ocorrer um erro durante o processo de carregamento dos dados no banco de dados.
+        """
+        tables = self.__tables(data)
+        try:
+            self.create_table_if_not_exists()
+            if self.__atomic:
+                self.__load_atomic(tables, data)
+            else:
+                if self.__max_workers > 1:
+                    self.__load_parallel(tables)
+                else:
+                    for table_name, dataframe in tables:
+                        self.__replace_data(table_name, dataframe)
+                self.__update_watermarks(data)
+            self.optimize_tables([table_name for table_name, _ in tables])
+        except Exception as exception:
+            raise LoadError(str(exception)) from exception
+
+    async def load_async(self, data: TransformContract) -> None:
+        """
+        Versão assíncrona de `load`: as tabelas são carregadas ao mesmo tempo, cada uma em sua própria conexão do
+        pool assíncrono, e o pool limita quantas cargas ficam ativas. No modo atômico, todas as tabelas e as marcas
+        d'água são carregadas em uma única transação.
+
         Args:
             data (TransformContract): Um objeto contendo os DataFrames a serem inseridos nas tabelas.
 
@@ -41,24 +152,350 @@ class LoadData:
             ValueError: Se o objeto 'data' não for uma instância de TransformContract ou algum DataFrame estiver vazio.
             LoadError: Se ocorrer um erro durante o processo de carregamento dos dados no banco de dados.
         """
+        tables = self.__tables(data)
+        try:
+            await self.__create_tables_async()
+            if self.__atomic:
+                async with self.__repository.transaction() as transaction:
+                    for table_name, dataframe in tables:
+                        await self.__replace_data_async(table_name, dataframe, transaction)
+                    for query, params in self.__watermark_statements(data):
+                        await self.__repository.execute(query, params, transaction=transaction)
+            else:
+                results = await asyncio.gather(
+                    *(self.__replace_data_async(table_name, dataframe) for table_name, dataframe in tables),
+                    return_exceptions=True,
+                )
+                self.__raise_failures(
+                    {
+                        table_name: result if isinstance(result, BaseException) else None
+                        for (table_name, _), result in zip(tables, results)
+                    }
+                )
+                async with self.__repository.transaction() as transaction:
+                    for query, params in self.__watermark_statements(data):
+                        await self.__repository.execute(query, params, transaction=transaction)
+            await self.__optimize_tables_async([table_name for table_name, _ in tables])
+        except Exception as exception:
+            raise LoadError(str(exception)) from exception
+
+    def load_incremental(self, data: TransformContract) -> None:
+        """
+        Carrega apenas os novos dados no banco de dados, mesclando-os pelas chaves naturais de cada tabela.
+
+        Todas as tabelas do `TransformContract` são mescladas com `INSERT ... ON CONFLICT` (ver `NATURAL_KEYS`):
+        linhas de fatos já existentes são ignoradas, dimensões são atualizadas e os agregados `available_stock`
+        e `sales_by_region` recebem a soma dos deltas. As partições dos novos meses das tabelas de fatos são
+        criadas, sem esvaziar as existentes. As marcas d'água de cada fonte são atualizadas na mesma
+        transação, de modo que uma falha não deixa deltas aplicados sem a marca correspondente.
+        DataFrames vazios são ignorados.
+
+        Args:
+            data (TransformContract): Um objeto contendo os DataFrames com os deltas a serem mesclados.
+
+        Raises:
+            ValueError: Se o objeto 'data' não for uma instância de TransformContract.
+            LoadError: Se ocorrer um erro durante a criação das chaves ou a mesclagem dos dados.
+        """
         if not isinstance(data, TransformContract):
             raise ValueError("Os dados devem ser uma instância de TransformContract.")
 
-        for field in fields(data):
-            field_name = field.name
-            field_value = getattr(data, field_name)
-            if isinstance(field_value, pd.DataFrame) and field_value.empty:
-                raise ValueError(f"O DataFrame para {field_name} está vazio.")
-
         try:
             self.create_table_if_not_exists()
-            for field in fields(TransformContract):
-                field_name = field.name
-                field_value = getattr(data, field_name)
-                if isinstance(field_value, pd.DataFrame):
-                    self.__repository.insert_data(dataframe=field_value, table_name=field_name)
+            self.create_natural_keys()
+            with self.__repository.transaction() as transaction:
+                for field in fields(TransformContract):
+                    field_value = getattr(data, field.name)
+                    if not isinstance(field_value, pd.DataFrame) or field_value.empty:
+                        continue
+                    conflict_columns, additive_columns = NATURAL_KEYS[field.name]
+                    for params in self.__partition_params(field.name, field_value, reset=False):
+                        self.__execute_partition(params, transaction)
+                    self.__repository.upsert_data(
+                        dataframe=field_value.drop_duplicates(subset=conflict_columns, keep="last"),
+                        table_name=field.name,
+                        conflict_columns=conflict_columns,
+                        additive_columns=additive_columns,
+                        transaction=transaction,
+                    )
+                self.__update_watermarks(data, transaction)
+            self.optimize_tables([field.name for field in fields(TransformContract)])
+        except Exception as exception:
+            raise LoadError(str(exception)) from exception
+
+    def get_high_water_marks(self) -> Dict[str, pd.Timestamp]:
+        """
+        Recupera as marcas d'água registradas pela última carga incremental de cada fonte.
+
+        Returns:
+            Dict[str, pd.Timestamp]: A data mais recente já carregada de cada fonte. Fontes ainda não
+            carregadas não aparecem no dicionário.
+
+        Raises:
+            LoadError: Se ocorrer um erro ao criar as tabelas ou consultar as marcas d'água.
+        """
+        self.create_table_if_not_exists()
+        try:
+            marks = self.__repository.find(self.__read_query("src/queries/incremental", "select_watermarks.sql"))
+        except Exception as exception:
+            raise LoadError(str(exception)) from exception
+        return {source: pd.Timestamp(mark) for source, mark in zip(marks["source"], marks["high_water_mark"])}
+
+    def get_loaded_row_hashes(self) -> Dict[str, np.ndarray]:
+        """
+        Recupera os hashes das linhas carregadas na data da marca d'água de cada fonte.
+
+        Returns:
+            Dict[str, np.ndarray]: Os hashes (`int64`) de cada fonte. Fontes sem marca d'água não aparecem no
+            dicionário.
+
+        Raises:
+            LoadError: Se ocorrer um erro ao criar as tabelas ou consultar os hashes.
+        """
+        self.create_table_if_not_exists()
+        try:
+            rows = self.__repository.find(self.__read_query("src/queries/incremental", "select_watermark_rows.sql"))
         except Exception as exception:
             raise LoadError(str(exception)) from exception
+        return {
+            source: group["row_hash"].to_numpy(dtype="int64") for source, group in rows.groupby("source", sort=False)
+        }
+
+    def get_available_stock(self) -> pd.DataFrame:
+        """
+        Recupera o estoque disponível já carregado, para que os deltas de vendas sejam combinados com ele.
+
+        Returns:
+            pd.DataFrame: O estoque disponível com as colunas `PRODUTO`, `COR_PRODUTO` e `ESTOQUE_DISPONIVEL`.
+
+        Raises:
+            LoadError: Se ocorrer um erro ao consultar a tabela.
+        """
+        try:
+            available_stock = self.__repository.find(
+                self.__read_query("src/queries/incremental", "select_available_stock.sql")
+            )
+        except Exception as exception:
+            raise LoadError(str(exception)) from exception
+        return available_stock.rename(columns=str.upper)
+
+    def get_load_key(self) -> Optional[str]:
+        """
+        Recupera a chave da última carga completa registrada no banco de dados (ver `mark_loaded`).
+
+        O registro só é considerado enquanto todas as tabelas carregadas têm linhas: um banco recriado ou com as
+        tabelas esvaziadas não tem carga registrada, mesmo que o cache local das etapas esteja intacto.
+
+        Returns:
+            Optional[str]: A chave da carga, ou `None` se não houver carga completa válida registrada.
+
+        Raises:
+            LoadError: Se ocorrer um erro ao criar as tabelas ou consultar o registro.
+        """
+        self.create_table_if_not_exists()
+        try:
+            loads = self.__repository.find(self.__read_query("src/queries/loads", "select_load_key.sql"))
+        except Exception as exception:
+            raise LoadError(str(exception)) from exception
+        return None if loads.empty else loads["load_key"].iloc[0]
+
+    async def get_load_key_async(self) -> Optional[str]:
+        """Versão assíncrona de `get_load_key`."""
+        await self.__create_tables_async()
+        try:
+            loads = await self.__repository.find(self.__read_query("src/queries/loads", "select_load_key.sql"))
+        except Exception as exception:
+            raise LoadError(str(exception)) from exception
+        return None if loads.empty else loads["load_key"].iloc[0]
+
+    def mark_loaded(self, load_key: str) -> None:
+        """
+        Registra no banco de dados a chave da carga completa concluída, na tabela `etl_loads`.
+
+        Args:
+            load_key (str): A chave da carga, calculada por `StageCache.stage_key`.
+
+        Raises:
+            LoadError: Se ocorrer um erro ao registrar a carga.
+        """
+        try:
+            self.__repository.execute(
+                self.__read_query("src/queries/loads", "update_load_key.sql"), {"load_key": load_key}
+            )
+        except Exception as exception:
+            raise LoadError(str(exception)) from exception
+
+    async def mark_loaded_async(self, load_key: str) -> None:
+        """Versão assíncrona de `mark_loaded`."""
+        try:
+            await self.__repository.execute(
+                self.__read_query("src/queries/loads", "update_load_key.sql"), {"load_key": load_key}
+            )
+        except Exception as exception:
+            raise LoadError(str(exception)) from exception
+
+    def forget_load(self) -> None:
+        """
+        Remove o registro da última carga completa, antes de qualquer carga que altere as tabelas.
+
+        Raises:
+            LoadError: Se ocorrer um erro ao criar as tabelas ou remover o registro.
+        """
+        self.create_table_if_not_exists()
+        try:
+            self.__repository.execute(self.__read_query("src/queries/loads", "delete_load_key.sql"))
+        except Exception as exception:
+            raise LoadError(str(exception)) from exception
+
+    async def forget_load_async(self) -> None:
+        """Versão assíncrona de `forget_load`."""
+        await self.__create_tables_async()
+        try:
+            await self.__repository.execute(self.__read_query("src/queries/loads", "delete_load_key.sql"))
+        except Exception as exception:
+            raise LoadError(str(exception)) from exception
+
+    def create_natural_keys(self) -> None:
+        """
+        Cria os índices únicos das chaves naturais usados pela carga incremental, a partir dos arquivos
+        encontrados na pasta 'src/queries/keys'.
+
+        Raise:
+            LoadError: Se algum índice não puder ser criado, por exemplo quando a tabela já contém
+                       duplicatas carregadas por cargas completas anteriores.
+        """
+        queries_dir = "src/queries/keys"
+        for filename in sorted(os.listdir(queries_dir)):
+            if filename.endswith(".sql"):
+                try:
+                    self.__repository.execute(self.__read_query(queries_dir, filename))
+                except Exception as exception:
+                    raise LoadError(f"Erro ao criar a chave natural {filename}: {str(exception)}") from exception
+
+    def load_stream(self, chunks: Iterable[Tuple[str, pd.DataFrame]]) -> None:
+        """
+        Carrega no banco de dados, bloco a bloco, os pares `(tabela, DataFrame)` produzidos pela transformação
+        em streaming.
+
+        Cada bloco é inserido assim que é recebido, de modo que apenas o bloco corrente fica em memória.
+        Blocos vazios são ignorados. Nas tabelas de fatos, a partição de cada mês é esvaziada antes do primeiro
+        bloco com esse mês; as demais tabelas são esvaziadas antes do seu primeiro bloco. Todos os blocos são
+        inseridos em uma única transação, confirmada apenas no fim do streaming: uma falha em qualquer bloco
+        reverte os `TRUNCATE`s e mantém os dados carregados antes.
+        Ao final, as tabelas carregadas são otimizadas (ver `optimize_tables`).
+
+        Args:
+            chunks (Iterable[Tuple[str, pd.DataFrame]]): Os blocos transformados e suas tabelas de destino.
+
+        Raises:
+            LoadError: Se ocorrer um erro durante a criação das tabelas ou a inserção de algum bloco.
+        """
+        self.create_table_if_not_exists()
+        try:
+            loaded_tables = []
+            prepared_partitions = set()
+            with self.__repository.transaction() as transaction:
+                for table_name, chunk in chunks:
+                    if chunk.empty:
+                        continue
+                    for query, params in self.__new_resets(table_name, chunk, prepared_partitions):
+                        self.__execute_reset(query, params, transaction)
+                    self.__repository.insert_data(dataframe=chunk, table_name=table_name, transaction=transaction)
+                    if table_name not in loaded_tables:
+                        loaded_tables.append(table_name)
+            self.optimize_tables(loaded_tables)
+        except Exception as exception:
+            raise LoadError(str(exception)) from exception
+
+    async def load_stream_async(self, chunks: Iterable[Tuple[str, pd.DataFrame]]) -> None:
+        """
+        Versão assíncrona de `load_stream`, que sobrepõe a produção e a carga dos blocos.
+
+        Os blocos são consumidos em uma thread (`asyncio.to_thread`), de modo que a extração e a transformação do
+        próximo bloco acontecem enquanto o bloco anterior é carregado no loop de eventos. Há no máximo um bloco
+        sendo carregado por vez, e os blocos são carregados na ordem em que são produzidos; em memória ficam
+        apenas o bloco em carga e o bloco em produção. Como em `load_stream`, todos os blocos são inseridos em uma
+        única transação.
+
+        Args:
+            chunks (Iterable[Tuple[str, pd.DataFrame]]): Os blocos transformados e suas tabelas de destino.
+
+        Raises:
+            LoadError: Se ocorrer um erro durante a criação das tabelas, a produção ou a inserção de algum bloco.
+        """
+        await self.__create_tables_async()
+        try:
+            async with self.__repository.transaction() as transaction:
+                loaded_tables = await self.__load_chunks_async(iter(chunks), transaction)
+            await self.__optimize_tables_async(loaded_tables)
+        except Exception as exception:
+            raise LoadError(str(exception)) from exception
+
+    async def __load_chunks_async(self, iterator: Iterator[Tuple[str, pd.DataFrame]], transaction) -> List[str]:
+        """
+        Insere os blocos de `load_stream_async` na transação, produzindo o próximo bloco durante a carga do anterior.
+
+        A carga em andamento é cancelada antes de retornar em caso de erro, para que a transação só seja revertida
+        quando a sua conexão não estiver mais em uso.
+
+        Args:
+            iterator (Iterator[Tuple[str, pd.DataFrame]]): Os blocos transformados e suas tabelas de destino.
+            transaction: A conexão da transação da carga.
+
+        Returns:
+            List[str]: As tabelas carregadas, na ordem do primeiro bloco de cada uma.
+        """
+        loading: Optional[asyncio.Task] = None
+        try:
+            loaded_tables = []
+            prepared_partitions = set()
+            while True:
+                item = await asyncio.to_thread(next, iterator, None)
+                if loading is not None:
+                    await loading
+                    loading = None
+                if item is None:
+                    return loaded_tables
+                table_name, chunk = item
+                if chunk.empty:
+                    continue
+                for query, params in self.__new_resets(table_name, chunk, prepared_partitions):
+                    await self.__repository.execute(query, params, transaction=transaction)
+                loading = asyncio.create_task(
+                    self.__repository.insert_data(dataframe=chunk, table_name=table_name, transaction=transaction)
+                )
+                if table_name not in loaded_tables:
+                    loaded_tables.append(table_name)
+        finally:
+            if loading is not None:
+                loading.cancel()
+                await asyncio.gather(loading, return_exceptions=True)
+
+    def optimize_tables(self, table_names: List[str]) -> None:
+        """
+        Prepara as tabelas carregadas para as consultas de análise.
+
+        Cria os índices definidos em 'src/queries/indexes' e executa `ANALYZE` nas tabelas carregadas,
+        para que o planejador conheça a distribuição dos novos dados. Os índices são criados depois da carga
+        em massa, pois construir um índice sobre a tabela cheia é mais barato do que mantê-lo a cada linha
+        inserida; nas cargas seguintes, os índices já existentes são apenas atualizados.
+
+        Args:
+            table_names (List[str]): As tabelas carregadas.
+
+        Raise:
+            LoadError: Se algum índice não puder ser criado ou alguma tabela não puder ser analisada.
+        """
+        for filename, query in self.__index_queries():
+            try:
+                self.__repository.execute(query)
+            except Exception as exception:
+                raise LoadError(f"Erro ao criar o índice {filename}: {str(exception)}") from exception
+        for table_name in table_names:
+            try:
+                self.__repository.execute(f"ANALYZE {table_name}")
+            except Exception as exception:
+                raise LoadError(f"Erro ao analisar a tabela {table_name}: {str(exception)}") from exception
 
     def create_table_if_not_exists(self):
         """
@@ -66,25 +503,371 @@ class LoadData:
         encontrados na pasta 'src/queries/create'.
 
         O método verifica se a pasta de consultas existe e, para cada arquivo SQL nela, executa a consulta
-        correspondente para garantir que as tabelas necessárias sejam criadas.
+        correspondente para garantir que as tabelas necessárias sejam criadas. As tabelas de fatos
+        (`PARTITIONED_TABLES`) são criadas particionadas por mês, sem partições: a função `etl_prepare_partition`,
+        criada na mesma pasta, cria as partições de cada mês durante a carga.
 
         Raise:
             LoadError: Se ocorrer um erro durante a criação das tabelas ou ao ler os arquivos SQL.
         """
+        for filename, query in self.__create_queries():
+            try:
+                self.__repository.create(query)
+            except Exception as exception:
+                raise LoadError(f"Erro ao criar tabela com a consulta {filename}: {str(exception)}") from exception
+
+    async def __create_tables_async(self) -> None:
+        """Versão assíncrona de `create_table_if_not_exists`."""
+        for filename, query in self.__create_queries():
+            try:
+                await self.__repository.create(query)
+            except Exception as exception:
+                raise LoadError(f"Erro ao criar tabela com a consulta {filename}: {str(exception)}") from exception
+
+    async def __optimize_tables_async(self, table_names: List[str]) -> None:
+        """Versão assíncrona de `optimize_tables`."""
+        for filename, query in self.__index_queries():
+            try:
+                await self.__repository.execute(query)
+            except Exception as exception:
+                raise LoadError(f"Erro ao criar o índice {filename}: {str(exception)}") from exception
+        for table_name in table_names:
+            try:
+                await self.__repository.execute(f"ANALYZE {table_name}")
+            except Exception as exception:
+                raise LoadError(f"Erro ao analisar a tabela {table_name}: {str(exception)}") from exception
+
+    @classmethod
+    def __create_queries(cls) -> List[Tuple[str, str]]:
+        """
+        Lê as consultas de criação das tabelas da pasta 'src/queries/create'.
+
+        Returns:
+            List[Tuple[str, str]]: O nome do arquivo e a consulta de cada tabela; nenhuma se a pasta não existir.
+        """
         queries_dir = "src/queries/create"
 
         if not os.path.exists(queries_dir):
             print(f"A pasta {queries_dir} não foi encontrada!")
-            return
+            return []
 
-        for filename in os.listdir(queries_dir):
-            if filename.endswith(".sql"):
-                file_path = os.path.join(queries_dir, filename)
+        return [
+            (filename, cls.__read_query(queries_dir, filename))
+            for filename in os.listdir(queries_dir)
+            if filename.endswith(".sql")
+        ]
 
-                with open(file_path, "r") as file:
-                    query = file.read()
+    @classmethod
+    def __index_queries(cls) -> List[Tuple[str, str]]:
+        """
+        Lê as consultas de criação dos índices da pasta 'src/queries/indexes', em ordem alfabética.
 
+        Returns:
+            List[Tuple[str, str]]: O nome do arquivo e a consulta de cada índice.
+        """
+        queries_dir = "src/queries/indexes"
+        return [
+            (filename, cls.__read_query(queries_dir, filename))
+            for filename in sorted(os.listdir(queries_dir))
+            if filename.endswith(".sql")
+        ]
+
+    @staticmethod
+    def __tables(data: TransformContract) -> List[Tuple[str, pd.DataFrame]]:
+        """
+        Valida os dados de uma carga completa e retorna as tabelas a carregar.
+
+        Args:
+            data (TransformContract): Os dados transformados.
+
+        Returns:
+            List[Tuple[str, pd.DataFrame]]: Os pares (tabela, DataFrame), na ordem do contrato.
+
+        Raises:
+            ValueError: Se o objeto 'data' não for uma instância de TransformContract ou algum DataFrame estiver vazio.
+        """
+        if not isinstance(data, TransformContract):
+            raise ValueError("Os dados devem ser uma instância de TransformContract.")
+
+        for field in fields(data):
+            field_name = field.name
+            field_value = getattr(data, field_name)
+            if isinstance(field_value, pd.DataFrame) and field_value.empty:
+                raise ValueError(f"O DataFrame para {field_name} está vazio.")
+
+        return [
+            (field.name, getattr(data, field.name))
+            for field in fields(TransformContract)
+            if isinstance(getattr(data, field.name), pd.DataFrame)
+        ]
+
+    def __load_parallel(self, tables: List[Tuple[str, pd.DataFrame]]) -> None:
+        """
+        Carrega as tabelas em paralelo, cada uma confirmada de forma independente.
+
+        Args:
+            tables (List[Tuple[str, pd.DataFrame]]): Os pares (tabela, DataFrame) a serem carregados.
+
+        Raises:
+            LoadError: Se alguma tabela falhar, após a conclusão das demais.
+        """
+        with ThreadPoolExecutor(max_workers=self.__max_workers, thread_name_prefix="load") as executor:
+            futures = {
+                table_name: executor.submit(self.__replace_data, table_name, dataframe)
+                for table_name, dataframe in tables
+            }
+        self.__raise_failures({table_name: future.exception() for table_name, future in futures.items()})
+
+    def __load_atomic(self, tables: List[Tuple[str, pd.DataFrame]], data: TransformContract) -> None:
+        """
+        Carrega as tabelas e as marcas d'água em uma única transação, confirmada apenas se todas forem carregadas.
+
+        As tabelas são carregadas em sequência em uma só conexão: transações em conexões diferentes seriam
+        confirmadas uma a uma, e uma falha entre as confirmações deixaria parte das tabelas confirmada.
+
+        Args:
+            tables (List[Tuple[str, pd.DataFrame]]): Os pares (tabela, DataFrame) a serem carregados.
+            data (TransformContract): Os dados carregados, usados no cálculo das marcas d'água.
+
+        Raises:
+            LoadError: Se alguma tabela falhar. Nenhuma tabela é confirmada nesse caso.
+        """
+        with self.__repository.transaction() as transaction:
+            for table_name, dataframe in tables:
                 try:
-                    self.__repository.create(query)
+                    self.__replace_data(table_name, dataframe, transaction)
                 except Exception as exception:
-                    raise LoadError(f"Erro ao criar tabela com a consulta {filename}: {str(exception)}") from exception
+                    self.__raise_failures({table_name: exception})
+            self.__update_watermarks(data, transaction)
+
+    def __replace_data(self, table_name: str, dataframe: pd.DataFrame, transaction=None) -> None:
+        """
+        Substitui os dados de uma tabela: nas tabelas de fatos, os meses presentes nos dados; nas demais, a tabela
+        inteira.
+
+        Sem uma transação em andamento, a tabela é esvaziada e os dados inseridos em uma transação própria da
+        tabela, para que uma inserção que falha não deixe os dados anteriores apagados.
+
+        Args:
+            table_name (str): O nome da tabela.
+            dataframe (pd.DataFrame): Os dados a serem inseridos.
+            transaction: A conexão da transação em andamento, se houver.
+        """
+        if transaction is None:
+            with self.__repository.transaction() as transaction:
+                self.__replace_data(table_name, dataframe, transaction)
+            return
+        for query, params in self.__reset_statements(table_name, dataframe):
+            self.__execute_reset(query, params, transaction)
+        self.__repository.insert_data(dataframe=dataframe, table_name=table_name, transaction=transaction)
+
+    async def __replace_data_async(self, table_name: str, dataframe: pd.DataFrame, transaction=None) -> None:
+        """Versão assíncrona de `__replace_data`."""
+        if transaction is None:
+            async with self.__repository.transaction() as transaction:
+                await self.__replace_data_async(table_name, dataframe, transaction)
+            return
+        for query, params in self.__reset_statements(table_name, dataframe):
+            await self.__repository.execute(query, params, transaction=transaction)
+        await self.__repository.insert_data(dataframe=dataframe, table_name=table_name, transaction=transaction)
+
+    def __execute_reset(self, query: str, params: Optional[Dict[str, object]], transaction) -> None:
+        """
+        Esvazia, na transação da carga, os dados de uma tabela que serão substituídos.
+
+        Args:
+            query (str): O comando montado por `__reset_statements`.
+            params (Optional[Dict[str, object]]): Os parâmetros do comando.
+            transaction: A conexão da transação em andamento.
+
+        Raises:
+            LoadError: Se a tabela ou a partição não puder ser esvaziada.
+        """
+        if params is not None:
+            self.__execute_partition(params, transaction)
+            return
+        try:
+            self.__repository.execute(query, transaction=transaction)
+        except Exception as exception:
+            raise LoadError(f"Erro ao esvaziar a tabela: {str(exception)}") from exception
+
+    def __reset_statements(
+        self, table_name: str, dataframe: pd.DataFrame
+    ) -> List[Tuple[str, Optional[Dict[str, object]]]]:
+        """
+        Monta os comandos que esvaziam os dados de uma tabela substituídos por uma carga completa.
+
+        Args:
+            table_name (str): O nome da tabela.
+            dataframe (pd.DataFrame): Os dados a serem inseridos.
+
+        Returns:
+            List[Tuple[str, Optional[Dict[str, object]]]]: Nas tabelas de fatos, a consulta `prepare_partition.sql`
+            de cada mês presente nos dados; nas demais, um `TRUNCATE` da tabela, sem parâmetros.
+        """
+        if table_name not in PARTITIONED_TABLES:
+            return [(f"TRUNCATE {table_name}", None)]
+        query = self.__prepare_partition_query()
+        return [(query, params) for params in self.__partition_params(table_name, dataframe, reset=True)]
+
+    def __execute_partition(self, params: Dict[str, object], transaction=None) -> None:
+        """
+        Cria ou esvazia a partição de um mês de uma tabela de fatos.
+
+        Args:
+            params (Dict[str, object]): Os parâmetros da consulta `prepare_partition.sql`.
+            transaction: A conexão da transação em andamento, se houver.
+
+        Raises:
+            LoadError: Se a partição não puder ser criada ou esvaziada.
+        """
+        try:
+            self.__repository.execute(self.__prepare_partition_query(), params, transaction=transaction)
+        except Exception as exception:
+            raise LoadError(
+                f"Erro ao preparar a partição de {params['partition_month'] or 'padrão'} da tabela "
+                f"{params['table_name']}: {str(exception)}"
+            ) from exception
+
+    def __new_resets(
+        self, table_name: str, chunk: pd.DataFrame, prepared_partitions: set
+    ) -> List[Tuple[str, Optional[Dict[str, object]]]]:
+        """
+        Retorna os comandos de `__reset_statements` de um bloco ainda não executados na carga em streaming,
+        marcando as suas partições como preparadas.
+
+        Args:
+            table_name (str): O nome da tabela.
+            chunk (pd.DataFrame): O bloco a ser inserido.
+            prepared_partitions (set): Os pares (tabela, mês) já preparados nesta carga; nas tabelas sem
+                                       partições, o mês é `None`.
+
+        Returns:
+            List[Tuple[str, Optional[Dict[str, object]]]]: Os comandos dos meses novos do bloco, ou o `TRUNCATE`
+            do primeiro bloco de uma tabela sem partições.
+        """
+        new_resets = []
+        for query, params in self.__reset_statements(table_name, chunk):
+            partition = (table_name, params["partition_month"] if params is not None else None)
+            if partition not in prepared_partitions:
+                prepared_partitions.add(partition)
+                new_resets.append((query, params))
+        return new_resets
+
+    @staticmethod
+    def __partition_params(table_name: str, dataframe: pd.DataFrame, reset: bool) -> List[Dict[str, object]]:
+        """
+        Calcula os meses de uma tabela de fatos presentes nos dados, um por partição.
+
+        Args:
+            table_name (str): O nome da tabela.
+            dataframe (pd.DataFrame): Os dados a serem inseridos.
+            reset (bool): Se `True`, as partições existentes são esvaziadas; senão, apenas as ausentes são criadas.
+
+        Returns:
+            List[Dict[str, object]]: Os parâmetros da consulta `prepare_partition.sql` de cada mês, com `None`
+            para as linhas sem data (partição padrão). Tabelas não particionadas não têm partições.
+        """
+        column = PARTITIONED_TABLES.get(table_name)
+        if column is None:
+            return []
+        if column in dataframe:
+            dates = pd.to_datetime(dataframe[column])
+            days = pd.DatetimeIndex(dates.dropna().unique())
+            months = sorted({day.replace(day=1).date() for day in days})
+            if dates.isna().any():
+                months.append(None)
+        else:
+            months = [None]
+        return [
+            {"table_name": table_name, "partition_column": column, "partition_month": month, "reset": reset}
+            for month in months
+        ]
+
+    @classmethod
+    def __prepare_partition_query(cls) -> str:
+        """Lê a consulta que cria ou esvazia a partição de um mês (`src/queries/partitions`)."""
+        return cls.__read_query("src/queries/partitions", "prepare_partition.sql")
+
+    @staticmethod
+    def __raise_failures(failures: Dict[str, Exception]) -> None:
+        """
+        Levanta um único erro descrevendo todas as tabelas cuja carga falhou.
+
+        Args:
+            failures (Dict[str, Exception]): O erro de cada tabela; tabelas sem erro têm valor `None`.
+
+        Raises:
+            LoadError: Se alguma tabela tiver falhado.
+        """
+        errors = [f"{table_name}: {error}" for table_name, error in failures.items() if error is not None]
+        if errors:
+            raise LoadError(f"Erro ao carregar as tabelas ({'; '.join(errors)})")
+
+    def __update_watermarks(self, data: TransformContract, transaction=None) -> None:
+        """
+        Atualiza a marca d'água de cada fonte com a data mais recente dos dados carregados, e as linhas
+        registradas nessa data.
+
+        Sem uma transação em andamento, as consultas de cada fonte são executadas em uma transação própria.
+
+        Args:
+            data (TransformContract): Os dados carregados.
+            transaction: A conexão da transação em andamento, se houver.
+        """
+        if transaction is None:
+            with self.__repository.transaction() as transaction:
+                self.__update_watermarks(data, transaction)
+            return
+        for query, params in self.__watermark_statements(data):
+            self.__repository.execute(query, params, transaction=transaction)
+
+    @classmethod
+    def __watermark_statements(cls, data: TransformContract) -> List[Tuple[str, Dict[str, object]]]:
+        """
+        Monta as consultas que atualizam a marca d'água de cada fonte presente nos dados carregados.
+
+        A marca é a data mais recente das linhas de cada fonte, e nunca retrocede: a consulta mantém o maior valor
+        entre a marca registrada e a nova. Como a carga incremental extrai de novo as linhas da própria data da
+        marca, os hashes das linhas carregadas nessa data (ver `SourceSchema.row_hashes`) também são registrados:
+        substituem os da marca anterior quando a data avança e são somados a eles quando ela se mantém.
+
+        Args:
+            data (TransformContract): Os dados carregados.
+
+        Returns:
+            List[Tuple[str, Dict[str, object]]]: As consultas e os seus parâmetros, na ordem de execução.
+        """
+        queries = [
+            cls.__read_query("src/queries/incremental", filename)
+            for filename in ("delete_watermark_rows.sql", "insert_watermark_rows.sql", "update_watermark.sql")
+        ]
+        statements = []
+        for source, schema in SOURCE_SCHEMAS.items():
+            frame = getattr(data, source, None)
+            if not isinstance(frame, pd.DataFrame) or schema.watermark_column not in frame or frame.empty:
+                continue
+            high_water_mark = frame[schema.watermark_column].max()
+            rows = frame[frame[schema.watermark_column] == high_water_mark]
+            params = {
+                "source": source,
+                "high_water_mark": pd.Timestamp(high_water_mark).date(),
+                "row_hashes": schema.row_hashes(rows).tolist(),
+            }
+            statements.extend((query, params) for query in queries)
+        return statements
+
+    @staticmethod
+    def __read_query(queries_dir: str, filename: str) -> str:
+        """
+        Lê o conteúdo de uma consulta SQL a partir de um arquivo.
+
+        Args:
+            queries_dir (str): A pasta da consulta.
+            filename (str): O nome do arquivo contendo a consulta SQL.
+
+        Returns:
+            str: O conteúdo da consulta SQL.
+        """
+        with open(os.path.join(queries_dir, filename), "r") as file:
+            return file.read()
@@ -0,0 +1,325 @@
+import os
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import pandas as pd
+import pyarrow as pa
+
+from src.config.settings import TRANSFORM_CONFIG
+from src.driver.schemas import SOURCE_SCHEMAS
+from src.errors.transform_error import TransformError
+from src.stages.contracts.extract_contract import ExtractContract
+from src.stages.contracts.transform_contract import TransformContract
+from src.stages.transform.backends.source_types import SOURCES, frame_dtypes, restore_dtypes, schema_dtypes
+from src.stages.transform.interface.transform_backend_interface import TransformBackendInterface
+
+try:
+    import duckdb
+except ImportError:  # pragma: no cover - dependência opcional
+    duckdb = None
+
+
+class DuckDBTransformBackend(TransformBackendInterface):
+    """
+    Backend de transformação que executa a mesma lógica do backend pandas como SQL no DuckDB.
+
+    As fontes são lidas diretamente dos arquivos CSV ou Parquet (`transform_files`) ou dos DataFrames de um
+    contrato de extração (`transform`), sem cópia. A remoção de duplicatas, as junções e os agrupamentos são
+    executados pelo DuckDB, que respeita `memory_limit` e grava em `temp_dir` os dados intermediários que não
+    cabem em memória. Apenas os resultados são convertidos em DataFrames, com os tipos das fontes.
+
+    Diferenças em relação ao backend pandas: a ordem das linhas das tabelas por linha não é garantida, e
+    valores de texto ausentes são preenchidos com `"0"` em vez do inteiro `0`.
+
+    Atributos:
+        velocity_keys (List[str]): As colunas de agregação da velocidade de vendas; vazia para uma linha por venda.
+        memory_limit (str): O limite de memória do DuckDB (por exemplo, `"4GB"`).
+        temp_dir (str): O diretório onde o DuckDB grava os dados que excedem o limite de memória.
+    """
+
+    QUERIES_DIR = "src/queries/transform"
+    NUMERIC_TYPES = ("TINYINT", "SMALLINT", "INTEGER", "BIGINT", "HUGEINT", "FLOAT", "DOUBLE", "DECIMAL")
+    TEMPORAL_TYPES = ("DATE", "TIMESTAMP")
+    MEASURES = ("VENDA_PECAS", "VENDA_LIQUIDA", "VENDA_BRUTA")
+
+    def __init__(
+        self,
+        velocity_keys: Optional[List[str]] = None,
+        memory_limit: str = TRANSFORM_CONFIG["memory_limit"],
+        temp_dir: str = TRANSFORM_CONFIG["temp_dir"],
+    ) -> None:
+        """
+        Inicializa o backend DuckDB.
+
+        Args:
+            velocity_keys (Optional[List[str]]): As colunas de agregação da velocidade de vendas.
+            memory_limit (str): O limite de memória do DuckDB. O padrão vem de `TRANSFORM_MEMORY_LIMIT`.
+            temp_dir (str): O diretório de transbordo em disco. O padrão vem de `TRANSFORM_TEMP_DIR`.
+
+        Raises:
+            ImportError: Se o pacote `duckdb` não estiver instalado.
+        """
+        if duckdb is None:
+            raise ImportError("O backend duckdb requer o pacote duckdb (poetry install --extras duckdb).")
+        self.velocity_keys = list(velocity_keys or [])
+        self.memory_limit = memory_limit
+        self.temp_dir = temp_dir
+
+    def transform(
+        self, extract_contract: ExtractContract, available_stock_base: Optional[pd.DataFrame] = None
+    ) -> TransformContract:
+        """
+        Transforma os DataFrames de um contrato de extração no DuckDB.
+
+        Args:
+            extract_contract (ExtractContract): O contrato de dados a ser transformado.
+            available_stock_base (Optional[pd.DataFrame]): O estoque disponível já carregado no banco de dados,
+                usado apenas no cálculo da velocidade de vendas.
+
+        Returns:
+            TransformContract: O contrato de dados transformados.
+
+        Raises:
+            TransformError: Se alguma consulta falhar.
+        """
+        with self.__connect() as connection:
+            dtypes = {}
+            for source in SOURCES:
+                frame = getattr(extract_contract, source)
+                connection.register(f"raw_{source}", frame)
+                dtypes[source] = frame_dtypes(frame)
+            if available_stock_base is not None:
+                connection.register("available_stock_base", available_stock_base)
+            return self.__run(connection, dtypes, available_stock_base is not None)
+
+    def transform_files(self, paths: Dict[str, List[Path]]) -> TransformContract:
+        """
+        Transforma as fontes lendo os arquivos diretamente no DuckDB.
+
+        Arquivos `.parquet` são lidos como estão; os demais são lidos como CSV, compactados ou não, com os tipos
+        do esquema da fonte. Os arquivos de uma mesma fonte são lidos como uma única tabela.
+
+        Args:
+            paths (Dict[str, List[Path]]): Os caminhos dos arquivos de cada fonte.
+
+        Returns:
+            TransformContract: O contrato de dados transformados.
+
+        Raises:
+            TransformError: Se algum arquivo não puder ser lido ou alguma consulta falhar.
+        """
+        with self.__connect() as connection:
+            self.__create_raw_views(connection, paths)
+            return self.__run(connection, {source: schema_dtypes(source) for source in SOURCES}, False)
+
+    def transform_files_stream(
+        self, paths: Dict[str, List[Path]], chunk_size: int
+    ) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """
+        Transforma as fontes lendo os arquivos diretamente no DuckDB e produz os resultados bloco a bloco.
+
+        A limpeza e os agregados são calculados como em `transform_files`, mas cada tabela é lida do DuckDB em
+        lotes Arrow de até `chunk_size` linhas (`to_arrow_reader`), convertidos em DataFrames apenas quando
+        consumidos. Assim, as tabelas por linha (`sales`, `stock` e `sales_velocity` por venda) nunca são
+        materializadas por inteiro em memória. O banco de dados temporário é mantido aberto até o fim da
+        iteração, ou até o gerador ser fechado.
+
+        Args:
+            paths (Dict[str, List[Path]]): Os caminhos dos arquivos de cada fonte.
+            chunk_size (int): A quantidade máxima de linhas de cada bloco.
+
+        Yields:
+            Tuple[str, pd.DataFrame]: O nome da tabela de destino e o bloco transformado.
+
+        Raises:
+            TransformError: Se algum arquivo não puder ser lido ou alguma consulta falhar.
+        """
+        with self.__connect() as connection:
+            self.__create_raw_views(connection, paths)
+            results = self.__prepare(connection, {source: schema_dtypes(source) for source in SOURCES}, False)
+            for table, (query, table_dtypes) in results.items():
+                for chunk in self.__fetch_batches(connection, query, chunk_size):
+                    yield table, restore_dtypes(chunk, table_dtypes)
+
+    @contextmanager
+    def __connect(self) -> Iterator:
+        """
+        Abre uma conexão DuckDB com um banco de dados temporário em `temp_dir`, removido ao final do bloco.
+
+        As tabelas intermediárias ficam no arquivo do banco, e não em memória, para que apenas as páginas em
+        uso ocupem o limite de memória. A ordem de inserção não é preservada, o que permite ao DuckDB
+        transbordar para o disco também nas leituras e nas remoções de duplicatas.
+
+        Yields:
+            duckdb.DuckDBPyConnection: A conexão com o banco de dados temporário.
+        """
+        os.makedirs(self.temp_dir, exist_ok=True)
+        database = Path(self.temp_dir) / f"transform_{uuid.uuid4().hex}.duckdb"
+        config = {"memory_limit": self.memory_limit, "temp_directory": self.temp_dir, "preserve_insertion_order": False}
+        try:
+            with duckdb.connect(str(database), config=config) as connection:
+                yield connection
+        finally:
+            database.unlink(missing_ok=True)
+            database.with_name(f"{database.name}.wal").unlink(missing_ok=True)
+
+    def __run(self, connection, dtypes: Dict[str, Dict[str, str]], has_base: bool) -> TransformContract:
+        """
+        Executa a limpeza das fontes e o cálculo dos agregados sobre as fontes `raw_*` registradas.
+
+        Args:
+            connection (duckdb.DuckDBPyConnection): A conexão com as fontes registradas.
+            dtypes (Dict[str, Dict[str, str]]): Os tipos das colunas de cada fonte, restaurados nos resultados.
+            has_base (bool): Se `available_stock_base` foi registrado.
+
+        Returns:
+            TransformContract: O contrato de dados transformados.
+        """
+        results = self.__prepare(connection, dtypes, has_base)
+        return TransformContract(
+            **{
+                table: restore_dtypes(self.__fetch(connection, query), table_dtypes)
+                for table, (query, table_dtypes) in results.items()
+            }
+        )
+
+    def __prepare(
+        self, connection, dtypes: Dict[str, Dict[str, str]], has_base: bool
+    ) -> Dict[str, Tuple[str, Dict[str, str]]]:
+        """
+        Cria as tabelas limpas das fontes `raw_*` registradas e o estoque disponível, e monta as consultas das
+        tabelas do contrato de transformação.
+
+        Args:
+            connection (duckdb.DuckDBPyConnection): A conexão com as fontes registradas.
+            dtypes (Dict[str, Dict[str, str]]): Os tipos das colunas de cada fonte.
+            has_base (bool): Se `available_stock_base` foi registrado.
+
+        Returns:
+            Dict[str, Tuple[str, Dict[str, str]]]: A consulta e os tipos a restaurar de cada tabela, na ordem dos
+                                                    campos de `TransformContract`.
+        """
+        for source in SOURCES:
+            self.__execute(connection, f"CREATE TABLE {source} AS {self.__clean_query(connection, source)}")
+
+        self.__execute(connection, f"CREATE TABLE available_stock AS {self.__read_query('available_stock.sql')}")
+        velocity_stock = "accumulate_available_stock.sql" if has_base else "available_stock.sql"
+        self.__execute(connection, f"CREATE VIEW velocity_stock AS {self.__read_query(velocity_stock)}")
+
+        return {
+            "sales_velocity": (self.__sales_velocity_query(connection), dtypes["sales"]),
+            "available_stock": ("SELECT * FROM available_stock", dtypes["stock"]),
+            "sales_by_region": (self.__read_query("sales_by_region.sql"), dtypes["store"]),
+            "store": ("SELECT * FROM store", dtypes["store"]),
+            "sales": ("SELECT * FROM sales", dtypes["sales"]),
+            "stock": ("SELECT * FROM stock", dtypes["stock"]),
+            "products": ("SELECT * FROM products", dtypes["products"]),
+        }
+
+    def __create_raw_views(self, connection, paths: Dict[str, List[Path]]) -> None:
+        """Registra a leitura dos arquivos de cada fonte como a view `raw_<fonte>`."""
+        for source in SOURCES:
+            self.__execute(
+                connection,
+                f"CREATE VIEW raw_{source} AS {self.__scan(source, [Path(path) for path in paths[source]])}",
+            )
+
+    def __clean_query(self, connection, source: str) -> str:
+        """
+        Monta a consulta de limpeza de uma fonte: remove as linhas duplicadas e preenche os valores ausentes
+        com `0`, mantendo as colunas de data como estão.
+
+        Args:
+            connection (duckdb.DuckDBPyConnection): A conexão com a fonte `raw_<source>` registrada.
+            source (str): O nome da fonte.
+
+        Returns:
+            str: A consulta de limpeza.
+        """
+        columns = self.__execute(connection, f"DESCRIBE raw_{source}").fetchall()
+        expressions = []
+        for name, column_type, *_ in columns:
+            if column_type.startswith(self.TEMPORAL_TYPES):
+                expressions.append(f'"{name}"')
+            elif column_type.startswith(self.NUMERIC_TYPES):
+                expressions.append(f'COALESCE("{name}", 0) AS "{name}"')
+            else:
+                expressions.append(f'COALESCE(CAST("{name}" AS VARCHAR), \'0\') AS "{name}"')
+        return f"SELECT {', '.join(expressions)} FROM (SELECT DISTINCT * FROM raw_{source})"
+
+    def __sales_velocity_query(self, connection) -> str:
+        """Monta a consulta da velocidade de vendas, por venda ou agregada por `velocity_keys`."""
+        if not self.velocity_keys:
+            return self.__read_query("sales_velocity.sql")
+        sales_columns = [row[0] for row in self.__execute(connection, "DESCRIBE sales").fetchall()]
+        measures = [f"SUM({column}) AS {column}" for column in self.MEASURES if column in sales_columns]
+        return self.__read_query("sales_velocity_aggregated.sql").format(
+            keys=", ".join(self.velocity_keys), measures=", ".join(measures)
+        )
+
+    def __scan(self, source: str, paths: List[Path]) -> str:
+        """
+        Monta a leitura dos arquivos de uma fonte, com as colunas e os tipos do esquema da fonte.
+
+        Args:
+            source (str): O nome da fonte.
+            paths (List[Path]): Os caminhos dos arquivos CSV (compactados ou não) ou Parquet.
+
+        Returns:
+            str: A consulta que lê os arquivos.
+        """
+        location = "[" + ", ".join("'" + str(path).replace("'", "''") + "'" for path in paths) + "]"
+        if paths[0].suffix == ".parquet":
+            return f"SELECT * FROM read_parquet({location})"
+        schema = SOURCE_SCHEMAS[source]
+        types = {column: self.__sql_type(dtype) for column, dtype in schema.dtypes.items()}
+        types.update({column: "VARCHAR" for column in schema.date_columns})
+        types_literal = ", ".join(f"'{column}': '{column_type}'" for column, column_type in types.items())
+        selected = [f'CAST("{column}" AS DATE) AS "{column}"' for column in schema.date_columns]
+        selected += [f'"{column}"' for column in schema.dtypes]
+        return f"SELECT {', '.join(selected)} FROM read_csv({location}, header = true, types = {{{types_literal}}})"
+
+    @staticmethod
+    def __sql_type(dtype: str) -> str:
+        """Converte um tipo pandas do esquema no tipo SQL correspondente do DuckDB."""
+        if dtype.lower() == "int32":
+            return "INTEGER"
+        if dtype == "float64":
+            return "DOUBLE"
+        return "VARCHAR"
+
+    @staticmethod
+    def __execute(connection, query: str):
+        """Executa uma consulta no DuckDB, convertendo as falhas em `TransformError`."""
+        try:
+            return connection.execute(query)
+        except duckdb.Error as error:
+            raise TransformError(f"Erro ao executar a transformação no DuckDB: {error}") from error
+
+    def __fetch(self, connection, query: str) -> pd.DataFrame:
+        """Executa uma consulta e retorna o resultado como DataFrame."""
+        return self.__execute(connection, query).df()
+
+    def __fetch_batches(self, connection, query: str, chunk_size: int) -> Iterator[pd.DataFrame]:
+        """Executa uma consulta e produz o resultado em DataFrames de até `chunk_size` linhas."""
+        reader = self.__execute(connection, query).to_arrow_reader(chunk_size)
+        try:
+            for batch in reader:
+                yield batch.to_pandas()
+        except (duckdb.Error, pa.ArrowException) as error:
+            raise TransformError(f"Erro ao executar a transformação no DuckDB: {error}") from error
+
+    def __read_query(self, filename: str) -> str:
+        """
+        Lê o conteúdo de uma consulta SQL da pasta de consultas de transformação.
+
+        Args:
+            filename (str): O nome do arquivo contendo a consulta SQL.
+
+        Returns:
+            str: O conteúdo da consulta SQL, sem o `;` final.
+        """
+        with open(os.path.join(self.QUERIES_DIR, filename), "r") as file:
+            return file.read().strip().rstrip(";")
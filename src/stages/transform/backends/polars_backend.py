@@ -0,0 +1,275 @@
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from src.config.settings import TRANSFORM_CONFIG
+from src.driver.schemas import SOURCE_SCHEMAS
+from src.errors.transform_error import TransformError
+from src.stages.contracts.extract_contract import ExtractContract
+from src.stages.contracts.transform_contract import TransformContract
+from src.stages.transform.backends.source_types import SOURCES, frame_dtypes, restore_dtypes, schema_dtypes
+from src.stages.transform.interface.transform_backend_interface import TransformBackendInterface
+
+try:
+    import polars as pl
+except ImportError:  # pragma: no cover - dependência opcional
+    pl = None
+
+
+class PolarsTransformBackend(TransformBackendInterface):
+    """
+    Backend de transformação que executa a mesma lógica do backend pandas como consultas preguiçosas do Polars.
+
+    Cada fonte é lida com `scan_csv`/`scan_parquet` (ou a partir dos DataFrames do contrato) e a transformação
+    é montada como um plano `LazyFrame`, executado pelo motor de streaming do Polars, que processa os dados
+    em lotes. Apenas os resultados são convertidos em DataFrames pandas, com os tipos das fontes. Em
+    `transform_files_stream`, os resultados são gravados em Parquet em `temp_dir` e lidos bloco a bloco.
+
+    Diferenças em relação ao backend pandas: valores de texto ausentes são preenchidos com `"0"` em vez do
+    inteiro `0`.
+
+    Atributos:
+        velocity_keys (List[str]): As colunas de agregação da velocidade de vendas; vazia para uma linha por venda.
+        temp_dir (str): O diretório onde os resultados de `transform_files_stream` são gravados.
+    """
+
+    MEASURES = ("VENDA_PECAS", "VENDA_LIQUIDA", "VENDA_BRUTA")
+    REFERENCE = {"sales_velocity": "sales", "available_stock": "stock", "sales_by_region": "store"}
+
+    def __init__(self, velocity_keys: Optional[List[str]] = None, temp_dir: str = TRANSFORM_CONFIG["temp_dir"]) -> None:
+        """
+        Inicializa o backend Polars.
+
+        Args:
+            velocity_keys (Optional[List[str]]): As colunas de agregação da velocidade de vendas.
+            temp_dir (str): O diretório dos resultados em streaming. O padrão vem de `TRANSFORM_TEMP_DIR`.
+
+        Raises:
+            ImportError: Se o pacote `polars` não estiver instalado.
+        """
+        if pl is None:
+            raise ImportError("O backend polars requer o pacote polars (poetry install --extras polars).")
+        self.velocity_keys = list(velocity_keys or [])
+        self.temp_dir = temp_dir
+
+    def transform(
+        self, extract_contract: ExtractContract, available_stock_base: Optional[pd.DataFrame] = None
+    ) -> TransformContract:
+        """
+        Transforma os DataFrames de um contrato de extração com o Polars.
+
+        Args:
+            extract_contract (ExtractContract): O contrato de dados a ser transformado.
+            available_stock_base (Optional[pd.DataFrame]): O estoque disponível já carregado no banco de dados,
+                usado apenas no cálculo da velocidade de vendas.
+
+        Returns:
+            TransformContract: O contrato de dados transformados.
+
+        Raises:
+            TransformError: Se a execução do plano falhar.
+        """
+        sources = {source: self.__from_pandas(getattr(extract_contract, source)) for source in SOURCES}
+        dtypes = {source: frame_dtypes(getattr(extract_contract, source)) for source in SOURCES}
+        base = None if available_stock_base is None else self.__from_pandas(available_stock_base)
+        return self.__run(sources, dtypes, base)
+
+    def transform_files(self, paths: Dict[str, List[Path]]) -> TransformContract:
+        """
+        Transforma as fontes lendo os arquivos diretamente com o Polars.
+
+        Arquivos `.parquet` são lidos como estão; os demais são lidos como CSV, compactados ou não, com os tipos
+        do esquema da fonte. Os arquivos de uma mesma fonte são lidos como uma única tabela.
+
+        Args:
+            paths (Dict[str, List[Path]]): Os caminhos dos arquivos de cada fonte.
+
+        Returns:
+            TransformContract: O contrato de dados transformados.
+
+        Raises:
+            TransformError: Se algum arquivo não puder ser lido ou a execução do plano falhar.
+        """
+        sources = {source: self.__scan(source, [Path(path) for path in paths[source]]) for source in SOURCES}
+        return self.__run(sources, {source: schema_dtypes(source) for source in SOURCES}, None)
+
+    def transform_files_stream(
+        self, paths: Dict[str, List[Path]], chunk_size: int
+    ) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """
+        Transforma as fontes lendo os arquivos diretamente com o Polars e produz os resultados bloco a bloco.
+
+        O plano de cada tabela é gravado pelo motor de streaming em um arquivo Parquet em `temp_dir`
+        (`sink_parquet`), lido em lotes de até `chunk_size` linhas e removido em seguida. Assim, as tabelas por
+        linha nunca são materializadas por inteiro em memória. Como os planos não são executados juntos, as
+        fontes são lidas uma vez por tabela.
+
+        Args:
+            paths (Dict[str, List[Path]]): Os caminhos dos arquivos de cada fonte.
+            chunk_size (int): A quantidade máxima de linhas de cada bloco.
+
+        Yields:
+            Tuple[str, pd.DataFrame]: O nome da tabela de destino e o bloco transformado.
+
+        Raises:
+            TransformError: Se algum arquivo não puder ser lido ou a execução de algum plano falhar.
+        """
+        sources = {source: self.__scan(source, [Path(path) for path in paths[source]]) for source in SOURCES}
+        dtypes = {source: schema_dtypes(source) for source in SOURCES}
+        os.makedirs(self.temp_dir, exist_ok=True)
+        with tempfile.TemporaryDirectory(dir=self.temp_dir) as directory:
+            for table, plan in self.__plans(sources, None).items():
+                path = Path(directory) / f"{table}.parquet"
+                try:
+                    plan.sink_parquet(path)
+                except pl.exceptions.PolarsError as error:
+                    raise TransformError(f"Erro ao executar a transformação no Polars: {error}") from error
+                for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size):
+                    yield table, restore_dtypes(batch.to_pandas(), dtypes[self.REFERENCE.get(table, table)])
+                path.unlink()
+
+    def __run(self, sources: Dict[str, "pl.LazyFrame"], dtypes: Dict[str, Dict[str, str]], base) -> TransformContract:
+        """
+        Executa, de uma só vez, os planos de limpeza das fontes e de cálculo dos agregados.
+
+        Args:
+            sources (Dict[str, pl.LazyFrame]): As fontes, ainda não limpas.
+            dtypes (Dict[str, Dict[str, str]]): Os tipos das colunas de cada fonte, restaurados nos resultados.
+            base (Optional[pl.LazyFrame]): O estoque disponível já carregado, somado ao estoque das fontes.
+
+        Returns:
+            TransformContract: O contrato de dados transformados.
+        """
+        plans = self.__plans(sources, base)
+        try:
+            results = dict(zip(plans, pl.collect_all(list(plans.values()), engine="streaming")))
+        except pl.exceptions.PolarsError as error:
+            raise TransformError(f"Erro ao executar a transformação no Polars: {error}") from error
+
+        return TransformContract(
+            **{
+                table: restore_dtypes(result.to_pandas(), dtypes[self.REFERENCE.get(table, table)])
+                for table, result in results.items()
+            }
+        )
+
+    def __plans(self, sources: Dict[str, "pl.LazyFrame"], base) -> Dict[str, "pl.LazyFrame"]:
+        """
+        Monta os planos de limpeza das fontes e de cálculo dos agregados.
+
+        Args:
+            sources (Dict[str, pl.LazyFrame]): As fontes, ainda não limpas.
+            base (Optional[pl.LazyFrame]): O estoque disponível já carregado, somado ao estoque das fontes.
+
+        Returns:
+            Dict[str, pl.LazyFrame]: O plano de cada tabela do contrato de transformação.
+        """
+        cleaned = {source: self.__clean(frame) for source, frame in sources.items()}
+        available_stock = (
+            cleaned["stock"]
+            .group_by(["PRODUTO", "COR_PRODUTO"])
+            .agg((pl.col("TOTAL") - pl.col("TRANSITO")).sum().cast(pl.Int64).alias("ESTOQUE_DISPONIVEL"))
+            .sort(["PRODUTO", "COR_PRODUTO"])
+        )
+        velocity_stock = available_stock
+        if base is not None:
+            velocity_stock = (
+                pl.concat(
+                    [
+                        base.select("PRODUTO", "COR_PRODUTO", pl.col("ESTOQUE_DISPONIVEL").cast(pl.Int64)),
+                        available_stock,
+                    ]
+                )
+                .group_by(["PRODUTO", "COR_PRODUTO"])
+                .agg(pl.col("ESTOQUE_DISPONIVEL").sum())
+            )
+
+        return {
+            "sales_velocity": self.__sales_velocity(cleaned["sales"], velocity_stock),
+            "available_stock": available_stock,
+            "sales_by_region": self.__sales_by_region(cleaned["sales"], cleaned["store"]),
+            **cleaned,
+        }
+
+    def __sales_velocity(self, sales: "pl.LazyFrame", stock: "pl.LazyFrame") -> "pl.LazyFrame":
+        """Monta o plano da velocidade de vendas, por venda ou agregada por `velocity_keys`."""
+        keys = ["PRODUTO", "COR_PRODUTO"]
+        stock_value = pl.when(pl.col("ESTOQUE_DISPONIVEL") != 0).then(pl.col("ESTOQUE_DISPONIVEL"))
+        if not self.velocity_keys:
+            return (
+                sales.join(stock, on=keys, how="inner")
+                .with_columns((pl.col("VENDA_PECAS") / stock_value).alias("VELOCIDADE_VENDA"))
+                .filter(pl.col("VELOCIDADE_VENDA").is_not_null())
+            )
+        measures = [pl.col(column).sum() for column in self.MEASURES if column in sales.collect_schema()]
+        return (
+            sales.filter(pl.col("VENDA_PECAS").is_not_null())
+            .group_by(self.velocity_keys)
+            .agg(*measures, pl.len().cast(pl.Int64).alias("QTD_VENDAS"))
+            .join(stock, on=keys, how="inner")
+            .with_columns((pl.col("VENDA_PECAS") / pl.col("QTD_VENDAS") / stock_value).alias("VELOCIDADE_VENDA"))
+            .filter(pl.col("VELOCIDADE_VENDA").is_not_null())
+            .sort(self.velocity_keys)
+        )
+
+    @staticmethod
+    def __sales_by_region(sales: "pl.LazyFrame", store: "pl.LazyFrame") -> "pl.LazyFrame":
+        """Monta o plano das vendas por região, agregando as vendas por filial antes da junção com as lojas."""
+        sales_by_branch = sales.group_by("ID_FILIAL").agg(pl.col("VENDA_PECAS").sum())
+        return (
+            store.select("ID_FILIAL", "UF", "CIDADE")
+            .join(sales_by_branch, on="ID_FILIAL", how="inner")
+            .group_by(["UF", "CIDADE"])
+            .agg(pl.col("VENDA_PECAS").sum().cast(pl.Int64))
+            .sort(["UF", "CIDADE"])
+        )
+
+    @staticmethod
+    def __clean(frame: "pl.LazyFrame") -> "pl.LazyFrame":
+        """
+        Monta o plano de limpeza de uma fonte: remove as linhas duplicadas e preenche os valores ausentes
+        com `0`, mantendo as colunas de data como estão.
+        """
+        expressions = []
+        for name, dtype in frame.collect_schema().items():
+            if dtype.is_temporal():
+                expressions.append(pl.col(name))
+            elif dtype.is_numeric():
+                expressions.append(pl.col(name).fill_null(0))
+            else:
+                expressions.append(pl.col(name).cast(pl.String).fill_null("0"))
+        return frame.unique(maintain_order=True).select(expressions)
+
+    @staticmethod
+    def __from_pandas(df: pd.DataFrame) -> "pl.LazyFrame":
+        """Converte um DataFrame pandas em um `LazyFrame`, com as colunas categóricas como texto."""
+        categorical_columns = df.select_dtypes(include="category").columns
+        return pl.from_pandas(df.astype({column: "string" for column in categorical_columns})).lazy()
+
+    @staticmethod
+    def __scan(source: str, paths: List[Path]) -> "pl.LazyFrame":
+        """
+        Monta a leitura preguiçosa dos arquivos de uma fonte, com as colunas e os tipos do esquema da fonte.
+
+        Args:
+            source (str): O nome da fonte.
+            paths (List[Path]): Os caminhos dos arquivos CSV (compactados ou não) ou Parquet.
+
+        Returns:
+            pl.LazyFrame: A leitura dos arquivos.
+        """
+        if paths[0].suffix == ".parquet":
+            return pl.scan_parquet(paths)
+        schema = SOURCE_SCHEMAS[source]
+        overrides = {
+            column: pl.Int32 if dtype.lower() == "int32" else pl.Float64 if dtype == "float64" else pl.String
+            for column, dtype in schema.dtypes.items()
+        }
+        overrides.update({column: pl.String for column in schema.date_columns})
+        return pl.scan_csv(paths, schema_overrides=overrides).select(
+            *[pl.col(column).str.to_date() for column in schema.date_columns], *schema.dtypes
+        )
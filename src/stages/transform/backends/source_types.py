@@ -0,0 +1,57 @@
+from typing import Dict
+
+import pandas as pd
+
+from src.driver.schemas import SOURCE_SCHEMAS
+
+SOURCES = ("sales", "stock", "store", "products")
+
+
+def schema_dtypes(source: str) -> Dict[str, str]:
+    """
+    Retorna os tipos pandas de cada coluna de uma fonte, conforme o seu esquema em `SOURCE_SCHEMAS`.
+
+    Args:
+        source (str): O nome da fonte (`sales`, `stock`, `store` ou `products`).
+
+    Returns:
+        Dict[str, str]: O tipo de cada coluna, com as colunas de data como `datetime64[ns]`.
+    """
+    schema = SOURCE_SCHEMAS[source]
+    return {**{column: "datetime64[ns]" for column in schema.date_columns}, **schema.dtypes}
+
+
+def frame_dtypes(df: pd.DataFrame) -> Dict[str, str]:
+    """
+    Retorna os tipos de cada coluna de um DataFrame de origem.
+
+    Colunas categóricas são descritas apenas como `category`, sem as categorias originais, para que valores
+    preenchidos na limpeza (como `0`) não sejam descartados ao restaurar o tipo.
+
+    Args:
+        df (pd.DataFrame): O DataFrame de origem.
+
+    Returns:
+        Dict[str, str]: O tipo de cada coluna.
+    """
+    return {
+        column: "category" if isinstance(dtype, pd.CategoricalDtype) else str(dtype)
+        for column, dtype in df.dtypes.items()
+    }
+
+
+def restore_dtypes(df: pd.DataFrame, dtypes: Dict[str, str]) -> pd.DataFrame:
+    """
+    Converte as colunas de um resultado de volta aos tipos das fontes, como o backend pandas as produziria.
+
+    Args:
+        df (pd.DataFrame): O resultado lido de um backend fora do pandas.
+        dtypes (Dict[str, str]): Os tipos das colunas de origem. Colunas ausentes em `df` são ignoradas.
+
+    Returns:
+        pd.DataFrame: O DataFrame com os tipos restaurados.
+    """
+    conversions = {column: dtype for column, dtype in dtypes.items() if column in df and str(df[column].dtype) != dtype}
+    if not conversions:
+        return df
+    return df.astype(conversions)
@@ -0,0 +1,57 @@
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+from src.stages.contracts.extract_contract import ExtractContract
+from src.stages.contracts.transform_contract import TransformContract
+
+
+class TransformBackendInterface(ABC):
+    """Interface para um backend de transformação, que produz o `TransformContract` a partir das fontes."""
+
+    @abstractmethod
+    def transform(
+        self, extract_contract: ExtractContract, available_stock_base: Optional[pd.DataFrame] = None
+    ) -> TransformContract:
+        """Transforma os DataFrames de um contrato de extração.
+
+        Args:
+            extract_contract (ExtractContract): O contrato de dados a ser transformado.
+            available_stock_base (Optional[pd.DataFrame]): O estoque disponível já carregado no banco de dados,
+                somado ao estoque do contrato no cálculo da velocidade de vendas.
+
+        Returns:
+            TransformContract: O contrato de dados transformados.
+        """
+        pass
+
+    @abstractmethod
+    def transform_files(self, paths: Dict[str, List[Path]]) -> TransformContract:
+        """Transforma as fontes lendo os arquivos diretamente, sem carregá-los antes em DataFrames.
+
+        Args:
+            paths (Dict[str, List[Path]]): Os caminhos dos arquivos (CSV, compactados ou não, ou Parquet) de cada
+                                           fonte.
+
+        Returns:
+            TransformContract: O contrato de dados transformados.
+        """
+        pass
+
+    @abstractmethod
+    def transform_files_stream(
+        self, paths: Dict[str, List[Path]], chunk_size: int
+    ) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """Transforma as fontes lendo os arquivos diretamente e produz os resultados bloco a bloco.
+
+        Args:
+            paths (Dict[str, List[Path]]): Os caminhos dos arquivos (CSV, compactados ou não, ou Parquet) de cada
+                                           fonte.
+            chunk_size (int): A quantidade máxima de linhas de cada bloco.
+
+        Yields:
+            Tuple[str, pd.DataFrame]: O nome da tabela de destino e o bloco transformado.
+        """
+        pass
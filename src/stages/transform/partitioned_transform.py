@@ -0,0 +1,314 @@
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from src.config.settings import PARTITION_CONFIG, TRANSFORM_CONFIG
+from src.driver.dataloader import DataLoader
+from src.driver.schemas import SOURCE_SCHEMAS
+from src.driver.source_discovery import SourceDiscovery
+from src.stages.contracts.extract_contract import ExtractContract
+from src.stages.contracts.transform_contract import TransformContract
+from src.stages.transform.transform_data import TransformData
+
+_worker_transform: Optional[TransformData] = None
+_worker_store: Optional[pd.DataFrame] = None
+_worker_loader: Optional[DataLoader] = None
+
+Partition = Union[pd.DataFrame, List[Path]]
+"""Uma partição enviada a um worker: os seus dados ou os caminhos dos arquivos que o próprio worker lê."""
+
+
+def _init_worker(
+    engine: str, velocity_granularity: str, store: pd.DataFrame, dataloader: Optional[DataLoader] = None
+) -> None:
+    """
+    Prepara um processo worker: cria o seu `TransformData` e guarda as lojas já limpas e o carregador das
+    partições recebidas como arquivos, recebidos uma única vez por processo em vez de uma vez por partição.
+    """
+    global _worker_transform, _worker_store, _worker_loader
+    _worker_transform = TransformData(engine=engine, velocity_granularity=velocity_granularity, backend="pandas")
+    _worker_store = store
+    _worker_loader = dataloader
+
+
+def _read_partition(source: str, partition: Partition) -> pd.DataFrame:
+    """Retorna os dados de uma partição, lendo no processo worker os arquivos das partições enviadas como caminhos."""
+    if isinstance(partition, pd.DataFrame):
+        return partition
+    return _worker_loader.load_source(source, partition)
+
+
+def _transform_stock(partition: Partition) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Transforma uma partição de estoque no processo worker."""
+    return _worker_transform.transform_stock_partition(_read_partition("stock", partition))
+
+
+def _transform_sales(
+    partition: Partition, available_stock: pd.DataFrame
+) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """Transforma uma partição de vendas no processo worker."""
+    return _worker_transform.transform_sales_partition(
+        _read_partition("sales", partition), available_stock, _worker_store
+    )
+
+
+class PartitionedTransformData:
+    """
+    Executa a transformação em várias partições das vendas e do estoque, em processos separados.
+
+    As vendas e o estoque são divididos por filial (`ID_FILIAL`) ou por mês da data de cada fonte
+    (`DATA_VENDA` e `DATA_FOTO`). Os valores da chave são distribuídos entre `max_workers` partições, do
+    mais frequente para o menos frequente, sempre para a partição com menos linhas. Como linhas idênticas
+    têm a mesma chave, a remoção de duplicatas dentro de cada partição é igual à remoção no conjunto inteiro.
+
+    A execução segue duas fases em um `ProcessPoolExecutor`, cujos processos recebem as lojas já limpas
+    uma única vez, na inicialização:
+
+    1. Cada partição do estoque é limpa e gera o seu estoque disponível parcial; os parciais são somados.
+    2. Cada partição das vendas é limpa e gera a sua velocidade de vendas, a partir do estoque disponível
+       total, e as suas vendas por região parciais, que são somadas ao final. Nas granularidades agregadas
+       da velocidade, os grupos presentes em várias partições também são somados
+       (ver `TransformData._merge_velocity_partials`).
+
+    Os produtos, pequenos e sem agregados, são limpos no processo principal.
+
+    Com `transform_files`, as fontes particionadas por mês em arquivos são distribuídas como caminhos, e cada
+    worker lê os arquivos da sua partição, sem que as vendas e o estoque passem pelo processo principal antes
+    da transformação.
+
+    Atributos:
+        partition_by (str): A chave de partição, `"ID_FILIAL"` ou `"month"`.
+        max_workers (int): A quantidade de processos e de partições.
+        transform_data (TransformData): A transformação usada no processo principal e replicada nos workers.
+    """
+
+    PARTITION_KEYS = ("ID_FILIAL", "month")
+
+    def __init__(
+        self,
+        partition_by: str,
+        max_workers: int = PARTITION_CONFIG["max_workers"],
+        engine: str = TRANSFORM_CONFIG["engine"],
+        velocity_granularity: str = TRANSFORM_CONFIG["velocity_granularity"],
+    ) -> None:
+        """
+        Inicializa a transformação particionada.
+
+        Args:
+            partition_by (str): `"ID_FILIAL"` ou `"month"`.
+            max_workers (int): A quantidade de processos. O padrão vem de `PARTITION_MAX_WORKERS`.
+            engine (str): O motor de transformação do pandas usado em cada partição.
+            velocity_granularity (str): A granularidade da tabela `sales_velocity`.
+
+        Raises:
+            ValueError: Se a chave de partição não for suportada ou se `max_workers` não for positivo.
+        """
+        if partition_by not in self.PARTITION_KEYS:
+            raise ValueError(f"Chave de partição inválida: {partition_by}. Use uma de {self.PARTITION_KEYS}.")
+        if max_workers <= 0:
+            raise ValueError("A quantidade de workers deve ser maior que zero.")
+        self.partition_by = partition_by
+        self.max_workers = max_workers
+        self.transform_data = TransformData(engine=engine, velocity_granularity=velocity_granularity, backend="pandas")
+
+    def transform(
+        self, extract_contract: ExtractContract, available_stock_base: Optional[pd.DataFrame] = None
+    ) -> TransformContract:
+        """
+        Executa a transformação particionada, produzindo as mesmas tabelas que `TransformData.transform`.
+
+        Args:
+            extract_contract (ExtractContract): O contrato de dados a ser transformado.
+            available_stock_base (Optional[pd.DataFrame]): O estoque disponível já carregado no banco de dados,
+                usado apenas no cálculo da velocidade de vendas.
+
+        Returns:
+            TransformContract: O contrato de dados transformados.
+
+        Raises:
+            ValueError: Se alguma fonte particionada não contiver a coluna da chave de partição.
+        """
+        return self.__transform_partitions(
+            self.transform_data.clean(extract_contract.store),
+            self.transform_data.clean(extract_contract.products),
+            self.split(extract_contract.stock, "stock"),
+            self.split(extract_contract.sales, "sales"),
+            available_stock_base,
+        )
+
+    def transform_files(self, paths: Dict[str, List[Path]], dataloader: DataLoader) -> TransformContract:
+        """
+        Executa a transformação particionada a partir dos arquivos de origem, produzindo as mesmas tabelas que
+        `transform`.
+
+        Na partição por mês, os arquivos das vendas e do estoque com data no caminho (ver
+        `SourceDiscovery.partition_period`) são agrupados pelo mês com `group_files`, e cada worker recebe
+        apenas os caminhos dos arquivos da sua partição: a leitura acontece no próprio worker, com o
+        `dataloader` recebido na inicialização, e só os resultados voltam ao processo principal. As fontes
+        entregues em um único arquivo ou com algum arquivo sem data, e todas as fontes na partição por filial,
+        são lidas no processo principal e divididas com `split`.
+
+        Args:
+            paths (Dict[str, List[Path]]): Os caminhos dos arquivos de cada fonte (ver `DataLoader.source_paths`).
+            dataloader (DataLoader): O carregador dos arquivos, usado no processo principal e nos workers.
+
+        Returns:
+            TransformContract: O contrato de dados transformados.
+
+        Raises:
+            FileNotFoundError: Se algum dos arquivos não existir.
+            SchemaError: Se algum dos arquivos não corresponder ao seu esquema.
+            ValueError: Se alguma fonte dividida no processo principal não contiver a coluna da chave de partição.
+        """
+        return self.__transform_partitions(
+            self.transform_data.clean(dataloader.load_source("store", paths["store"])),
+            self.transform_data.clean(dataloader.load_source("products", paths["products"])),
+            self.__file_partitions("stock", paths["stock"], dataloader),
+            self.__file_partitions("sales", paths["sales"], dataloader),
+            dataloader=dataloader,
+        )
+
+    def __transform_partitions(
+        self,
+        store: pd.DataFrame,
+        products: pd.DataFrame,
+        stock_partitions: List[Partition],
+        sales_partitions: List[Partition],
+        available_stock_base: Optional[pd.DataFrame] = None,
+        dataloader: Optional[DataLoader] = None,
+    ) -> TransformContract:
+        """
+        Transforma as partições do estoque e das vendas nos workers e junta os seus resultados.
+
+        Args:
+            store (pd.DataFrame): As lojas já limpas.
+            products (pd.DataFrame): Os produtos já limpos.
+            stock_partitions (List[Partition]): As partições do estoque, como dados ou caminhos de arquivos.
+            sales_partitions (List[Partition]): As partições das vendas, como dados ou caminhos de arquivos.
+            available_stock_base (Optional[pd.DataFrame]): O estoque disponível já carregado no banco de dados.
+            dataloader (Optional[DataLoader]): O carregador das partições enviadas como caminhos.
+
+        Returns:
+            TransformContract: O contrato de dados transformados.
+        """
+        keys = ["PRODUTO", "COR_PRODUTO"]
+        with self.__executor(store, dataloader) as executor:
+            stock_results = list(executor.map(_transform_stock, stock_partitions))
+            available_stock = TransformData._merge_partials(
+                [partial for _, partial in stock_results], keys, "ESTOQUE_DISPONIVEL"
+            )
+            stock_for_velocity = available_stock
+            if available_stock_base is not None:
+                stock_for_velocity = TransformData._accumulate(
+                    available_stock_base, available_stock, keys, "ESTOQUE_DISPONIVEL"
+                )
+            sales_results = list(
+                executor.map(_transform_sales, sales_partitions, [stock_for_velocity] * len(sales_partitions))
+            )
+
+        return TransformContract(
+            sales_velocity=self.transform_data._merge_velocity_partials([velocity for _, velocity, _ in sales_results]),
+            available_stock=available_stock,
+            sales_by_region=TransformData._merge_partials(
+                [region for _, _, region in sales_results], ["UF", "CIDADE"], "VENDA_PECAS"
+            ),
+            store=store,
+            sales=TransformData._concat_partitions([sales for sales, _, _ in sales_results]),
+            stock=TransformData._concat_partitions([stock for stock, _ in stock_results]),
+            products=products,
+        )
+
+    def split(self, df: pd.DataFrame, source: str) -> List[pd.DataFrame]:
+        """
+        Divide uma fonte em até `max_workers` partições balanceadas pela quantidade de linhas.
+
+        Args:
+            df (pd.DataFrame): Os dados da fonte.
+            source (str): O nome da fonte (`sales` ou `stock`), usado para localizar a coluna de data.
+
+        Returns:
+            List[pd.DataFrame]: As partições não vazias; ao menos uma, mesmo que a fonte esteja vazia.
+
+        Raises:
+            ValueError: Se a fonte não contiver a coluna da chave de partição.
+        """
+        column = self.partition_by if self.partition_by != "month" else SOURCE_SCHEMAS[source].watermark_column
+        if column not in df:
+            raise ValueError(f"A fonte {source} não contém a coluna de partição {column}.")
+        key = df[column] if self.partition_by != "month" else df[column].dt.to_period("M")
+        codes, _ = pd.factorize(key, use_na_sentinel=False)
+        if len(codes) == 0:
+            return [df]
+
+        counts = np.bincount(codes)
+        partition_of_code = np.zeros(len(counts), dtype=np.int64)
+        partition_rows = [0] * min(self.max_workers, len(counts))
+        for code in np.argsort(-counts, kind="stable"):
+            target = partition_rows.index(min(partition_rows))
+            partition_of_code[code] = target
+            partition_rows[target] += counts[code]
+
+        partition_of_row = partition_of_code[codes]
+        return [df[partition_of_row == partition] for partition in range(len(partition_rows))]
+
+    def group_files(self, paths: List[Path], directory: Path) -> Optional[List[List[Path]]]:
+        """
+        Divide os arquivos de uma fonte particionada por data em até `max_workers` partições pelo mês.
+
+        Os arquivos são agrupados pelo mês da data no seu caminho, e os meses são distribuídos, do maior para o
+        menor em bytes, sempre para a partição com menos bytes. Como na poda pelo intervalo de datas, cada
+        arquivo deve conter apenas linhas do período da sua partição: assim, linhas idênticas, que têm a mesma
+        data, ficam na mesma partição.
+
+        Args:
+            paths (List[Path]): Os arquivos da fonte.
+            directory (Path): O diretório particionado da fonte (`SourceSchema.directory`).
+
+        Returns:
+            Optional[List[List[Path]]]: Os arquivos de cada partição, ou `None` se a partição não for por mês
+            ou se algum arquivo estiver fora do diretório ou não tiver data no caminho.
+        """
+        if self.partition_by != "month":
+            return None
+        months: Dict[pd.Period, List[Path]] = {}
+        for path in paths:
+            if not path.is_relative_to(directory):
+                return None
+            period = SourceDiscovery.partition_period(path.relative_to(directory))
+            if period is None:
+                return None
+            months.setdefault(period[0].to_period("M"), []).append(path)
+
+        month_bytes = {month: sum(path.stat().st_size for path in files) for month, files in months.items()}
+        partitions: List[List[Path]] = [[] for _ in range(min(self.max_workers, len(months)))]
+        partition_bytes = [0] * len(partitions)
+        for month in sorted(months, key=lambda month: -month_bytes[month]):
+            target = partition_bytes.index(min(partition_bytes))
+            partitions[target].extend(months[month])
+            partition_bytes[target] += month_bytes[month]
+        return partitions
+
+    def __file_partitions(self, source: str, paths: List[Path], dataloader: DataLoader) -> List[Partition]:
+        """
+        Divide uma fonte em partições de arquivos com `group_files` ou, quando os arquivos não podem ser
+        agrupados, lê a fonte no processo principal e a divide com `split`.
+        """
+        directory = SOURCE_SCHEMAS[source].directory
+        partitions = self.group_files(paths, dataloader.base_path / directory) if directory else None
+        if partitions is None:
+            return self.split(dataloader.load_source(source, paths), source)
+        return partitions
+
+    def __executor(self, store: pd.DataFrame, dataloader: Optional[DataLoader] = None) -> ProcessPoolExecutor:
+        """
+        Cria o pool de processos, enviando a cada worker a configuração da transformação, as lojas e o
+        carregador das partições enviadas como caminhos.
+        """
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=_init_worker,
+            initargs=(self.transform_data.engine, self.transform_data.velocity_granularity, store, dataloader),
+        )
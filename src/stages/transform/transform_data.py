@@ -1,32 +1,128 @@
+from dataclasses import replace
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
 import pandas as pd
 
+from src.config.settings import TRANSFORM_CONFIG
+from src.driver.schemas import SOURCE_SCHEMAS
 from src.stages.contracts.extract_contract import ExtractContract
+from src.stages.contracts.extract_stream_contract import ExtractStreamContract
 from src.stages.contracts.transform_contract import TransformContract
+from src.stages.transform.backends.duckdb_backend import DuckDBTransformBackend
+from src.stages.transform.backends.polars_backend import PolarsTransformBackend
+from src.stages.transform.interface.transform_backend_interface import TransformBackendInterface
 
 
 class TransformData:
-    """Classe responsável por coordenar as transformações dos dados."""
+    """
+    Classe responsável por coordenar as transformações dos dados.
+
+    Dois motores produzem os mesmos resultados:
+
+    - `"legacy"`: o motor original, que remove duplicatas comparando todas as colunas e calcula cada
+      agregado com uma junção e um agrupamento próprios.
+    - `"vectorized"`: compara linhas inteiras apenas entre as que têm o mesmo hash, mantém as colunas
+      numéricas (ausências como `NaN` em vez de `None`), agrega as vendas por filial antes da junção com
+      as lojas e não copia os DataFrames de entrada.
+
+    A granularidade da velocidade de vendas é configurável (ver `VELOCITY_GRANULARITIES`): com `"row"`, uma
+    linha por venda; com `"daily"` ou `"product"`, as vendas são agregadas antes da junção com o estoque,
+    e cada linha registra em `QTD_VENDAS` quantas vendas resume, para que a média ponderada por essa coluna
+    seja igual à média calculada sobre as vendas individuais.
+
+    O backend define onde a transformação em lote é executada (ver `BACKENDS`): `"pandas"` usa os motores
+    acima; `"duckdb"` e `"polars"` executam a mesma lógica fora do pandas, lendo os arquivos de origem
+    diretamente (`transform_files`) e processando volumes maiores que a memória. Em streaming, o pandas
+    transforma cada bloco extraído (`transform_stream`), e os demais backends entregam os seus resultados
+    bloco a bloco (`transform_files_stream`).
+
+    Atributos:
+        engine (str): O motor de transformação utilizado.
+        velocity_granularity (str): A granularidade da tabela `sales_velocity`.
+        backend (str): O backend da transformação em lote.
+    """
+
+    ENGINES = ("legacy", "vectorized")
+    MEASURES = ("VENDA_PECAS", "VENDA_LIQUIDA", "VENDA_BRUTA")
+    BACKENDS = {"pandas": None, "duckdb": DuckDBTransformBackend, "polars": PolarsTransformBackend}
+    VELOCITY_GRANULARITIES = {
+        "row": [],
+        "daily": ["DATA_VENDA", "ID_FILIAL", "PRODUTO", "COR_PRODUTO"],
+        "product": ["PRODUTO", "COR_PRODUTO"],
+    }
+
+    def __init__(
+        self,
+        engine: str = TRANSFORM_CONFIG["engine"],
+        velocity_granularity: str = TRANSFORM_CONFIG["velocity_granularity"],
+        backend: str = TRANSFORM_CONFIG["backend"],
+    ) -> None:
+        """
+        Inicializa a transformação com o motor desejado.
+
+        Args:
+            engine (str): `"vectorized"` (padrão) ou `"legacy"`.
+            velocity_granularity (str): `"row"` (padrão), `"daily"` (por dia, filial, produto e cor) ou
+                                        `"product"` (por produto e cor).
+            backend (str): `"pandas"` (padrão), `"duckdb"` ou `"polars"`.
+
+        Raises:
+            ValueError: Se o motor, a granularidade ou o backend não forem suportados.
+            ImportError: Se o pacote do backend escolhido não estiver instalado.
+        """
+        if engine not in self.ENGINES:
+            raise ValueError(f"Motor de transformação inválido: {engine}. Use um de {self.ENGINES}.")
+        if velocity_granularity not in self.VELOCITY_GRANULARITIES:
+            raise ValueError(
+                f"Granularidade inválida: {velocity_granularity}. Use uma de {tuple(self.VELOCITY_GRANULARITIES)}."
+            )
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Backend de transformação inválido: {backend}. Use um de {tuple(self.BACKENDS)}.")
+        self.engine = engine
+        self.velocity_granularity = velocity_granularity
+        self.backend = backend
+        self.__backend: Optional[TransformBackendInterface] = None
+        if self.BACKENDS[backend] is not None:
+            self.__backend = self.BACKENDS[backend](velocity_keys=self.VELOCITY_GRANULARITIES[velocity_granularity])
 
-    def transform(self, extract_contract: "ExtractContract") -> "TransformContract":
+    def transform(
+        self, extract_contract: "ExtractContract", available_stock_base: Optional[pd.DataFrame] = None
+    ) -> "TransformContract":
         """
         Executa a transformação dos dados a partir do contrato de entrada.
 
+        Na carga incremental, o contrato contém apenas as linhas novas e os agregados produzidos são deltas,
+        mesclados aos valores já carregados pela etapa de carga. A velocidade de vendas, porém, depende do
+        estoque disponível total, por isso o estoque já carregado é informado em `available_stock_base` e
+        somado ao delta antes do cálculo.
+
         Args:
             extract_contract (ExtractContract): O contrato de dados a ser transformado.
+            available_stock_base (Optional[pd.DataFrame]): O estoque disponível já carregado no banco de dados,
+                usado apenas no cálculo da velocidade de vendas.
 
         Returns:
             TransformContract: O contrato de dados transformados.
         """
-        stock = self._clean_data(extract_contract.stock)
-        sales = self._clean_data(extract_contract.sales)
-        products = self._clean_data(extract_contract.products)
-        store = self._clean_data(extract_contract.store)
+        if self.__backend is not None:
+            return self.__backend.transform(extract_contract, available_stock_base)
+
+        stock = self.__clean(extract_contract.stock)
+        sales = self.__clean(extract_contract.sales)
+        products = self.__clean(extract_contract.products)
+        store = self.__clean(extract_contract.store)
 
-        available_stock = self._calculate_available_stock(stock)
+        available_stock = self.__available_stock(stock)
 
-        sales_velocity = self._calculate_sales_velocity(sales, available_stock)
+        stock_for_velocity = available_stock
+        if available_stock_base is not None:
+            stock_for_velocity = self._accumulate(
+                available_stock_base, available_stock, ["PRODUTO", "COR_PRODUTO"], "ESTOQUE_DISPONIVEL"
+            )
 
-        sales_by_region = self._calculate_sales_by_region(sales, store)
+        sales_velocity, sales_by_region = self.__sales_aggregates(sales, stock_for_velocity, store)
 
         transform_contract = TransformContract(
             sales_velocity=sales_velocity,
@@ -40,19 +136,341 @@ class TransformData:
 
         return transform_contract
 
+    def drop_loaded_rows(
+        self, extract_contract: "ExtractContract", loaded_row_hashes: Dict[str, np.ndarray]
+    ) -> "ExtractContract":
+        """
+        Descarta as linhas já carregadas da data da marca d'água, que a carga incremental extrai de novo.
+
+        Apenas as linhas da data mais antiga de cada fonte (a data da marca) são comparadas: elas são
+        preenchidas como na limpeza (ver `_fill_missing`) e os seus hashes (ver `SourceSchema.row_hashes`) são
+        buscados entre os registrados na última carga. Assim, as linhas que chegaram depois da última carga com a
+        data da marca são carregadas, e os agregados somados aos já carregados (`available_stock` e
+        `sales_by_region`), assim como o estoque usado na velocidade de vendas, não contam duas vezes as demais.
+
+        Args:
+            extract_contract (ExtractContract): O contrato extraído a partir das marcas d'água.
+            loaded_row_hashes (Dict[str, np.ndarray]): Os hashes das linhas carregadas na data da marca de cada
+                fonte (ver `LoadData.get_loaded_row_hashes`).
+
+        Returns:
+            ExtractContract: O contrato sem as linhas já carregadas.
+        """
+        frames = {}
+        for source, hashes in loaded_row_hashes.items():
+            schema = SOURCE_SCHEMAS.get(source)
+            df = getattr(extract_contract, source, None)
+            if schema is None or schema.watermark_column is None or df is None or df.empty:
+                continue
+            dates = df[schema.watermark_column]
+            boundary = (dates == dates.min()).to_numpy()
+            loaded = np.zeros(len(df), dtype=bool)
+            loaded[boundary] = np.isin(schema.row_hashes(self._fill_missing(df[boundary])), hashes)
+            frames[source] = df[~loaded].reset_index(drop=True)
+        return replace(extract_contract, **frames)
+
+    def transform_files(self, paths: Dict[str, List[Path]]) -> "TransformContract":
+        """
+        Executa a transformação lendo os arquivos de origem diretamente no backend configurado.
+
+        Args:
+            paths (Dict[str, List[Path]]): Os caminhos dos arquivos (CSV, compactados ou não, ou Parquet) de cada
+                                           fonte.
+
+        Returns:
+            TransformContract: O contrato de dados transformados.
+
+        Raises:
+            ValueError: Se o backend for `"pandas"`, que transforma apenas os DataFrames já extraídos.
+        """
+        if self.__backend is None:
+            raise ValueError("O backend pandas não lê os arquivos de origem; use `transform`.")
+        return self.__backend.transform_files(paths)
+
+    def transform_files_stream(
+        self, paths: Dict[str, List[Path]], chunk_size: int
+    ) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """
+        Executa a transformação lendo os arquivos de origem diretamente no backend configurado e produz os
+        resultados bloco a bloco, no formato consumido por `LoadData.load_stream`.
+
+        Ao contrário de `transform_files`, nenhuma tabela é materializada por inteiro: as tabelas por linha
+        (`sales`, `stock` e `sales_velocity` por venda) são lidas do backend em blocos de até `chunk_size` linhas.
+        Como a limpeza e os agregados são calculados pelo backend sobre as fontes inteiras, as duplicatas são
+        removidas entre todos os blocos, e cada agregado é produzido uma única vez.
+
+        Args:
+            paths (Dict[str, List[Path]]): Os caminhos dos arquivos (CSV, compactados ou não, ou Parquet) de cada
+                                           fonte.
+            chunk_size (int): A quantidade máxima de linhas de cada bloco.
+
+        Yields:
+            Tuple[str, pd.DataFrame]: O nome da tabela de destino e o bloco transformado.
+
+        Raises:
+            ValueError: Se o backend for `"pandas"`, que transforma apenas os DataFrames já extraídos.
+        """
+        if self.__backend is None:
+            raise ValueError("O backend pandas não lê os arquivos de origem; use `transform_stream`.")
+        return self.__backend.transform_files_stream(paths, chunk_size)
+
+    def transform_stream(self, extract_contract: ExtractStreamContract) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """
+        Executa a transformação bloco a bloco a partir do contrato de extração em streaming.
+
+        Produz pares `(tabela, DataFrame)` na ordem em que podem ser carregados. As tabelas de dimensão
+        (`store` e `products`) são materializadas, pois são pequenas e necessárias por inteiro nas junções.
+        Os blocos de estoque são consumidos primeiro, acumulando `available_stock`; em seguida cada bloco de
+        vendas gera seus blocos de `sales` e `sales_velocity` e alimenta o acumulado de `sales_by_region`.
+        Nas granularidades agregadas da velocidade, `sales_velocity` também é acumulada entre os blocos (ver
+        `_merge_velocity_partials`), com uma linha por grupo em vez de uma por grupo e bloco. Os agregados são
+        produzidos ao final. Apenas os blocos correntes e os agregados (limitados pela quantidade de chaves)
+        ficam em memória.
+
+        A remoção de duplicatas é feita dentro de cada bloco; duplicatas espalhadas em blocos diferentes
+        não são removidas.
+
+        Args:
+            extract_contract (ExtractStreamContract): O contrato com os geradores de blocos de cada fonte.
+
+        Yields:
+            Tuple[str, pd.DataFrame]: O nome da tabela de destino e o bloco transformado.
+        """
+        store = self.clean(self._concat_chunks(extract_contract.store))
+        products = self.clean(self._concat_chunks(extract_contract.products))
+
+        available_stock = pd.DataFrame(columns=["PRODUTO", "COR_PRODUTO", "ESTOQUE_DISPONIVEL"])
+        for chunk in extract_contract.stock:
+            stock, partial_stock = self.transform_stock_partition(chunk)
+            available_stock = self._accumulate(
+                available_stock, partial_stock, ["PRODUTO", "COR_PRODUTO"], "ESTOQUE_DISPONIVEL"
+            )
+            yield "stock", stock
+
+        sales_by_region = pd.DataFrame(columns=["UF", "CIDADE", "VENDA_PECAS"])
+        accumulated_velocity: Optional[pd.DataFrame] = None
+        for chunk in extract_contract.sales:
+            sales, sales_velocity, partial_region = self.transform_sales_partition(chunk, available_stock, store)
+            yield "sales", sales
+            if not self.VELOCITY_GRANULARITIES[self.velocity_granularity]:
+                yield "sales_velocity", sales_velocity
+            elif accumulated_velocity is None:
+                accumulated_velocity = sales_velocity
+            else:
+                accumulated_velocity = self._merge_velocity_partials([accumulated_velocity, sales_velocity])
+            sales_by_region = self._accumulate(sales_by_region, partial_region, ["UF", "CIDADE"], "VENDA_PECAS")
+
+        if accumulated_velocity is not None:
+            yield "sales_velocity", accumulated_velocity
+        yield "available_stock", available_stock
+        yield "sales_by_region", sales_by_region
+        yield "store", store
+        yield "products", products
+
+    def clean(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Limpa os dados de uma fonte com o motor configurado.
+
+        Args:
+            df (pd.DataFrame): O DataFrame a ser limpo.
+
+        Returns:
+            pd.DataFrame: DataFrame limpo.
+        """
+        return self.__clean(df)
+
+    def transform_stock_partition(self, stock_df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Transforma uma parte (bloco ou partição) dos dados de estoque.
+
+        Args:
+            stock_df (pd.DataFrame): A parte dos dados de estoque.
+
+        Returns:
+            Tuple[pd.DataFrame, pd.DataFrame]: O estoque limpo e o estoque disponível parcial, a ser somado
+            aos das demais partes.
+        """
+        stock = self.__clean(stock_df)
+        return stock, self.__available_stock(stock)
+
+    def transform_sales_partition(
+        self, sales_df: pd.DataFrame, available_stock: pd.DataFrame, store: pd.DataFrame
+    ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+        """
+        Transforma uma parte (bloco ou partição) dos dados de vendas.
+
+        Args:
+            sales_df (pd.DataFrame): A parte dos dados de vendas.
+            available_stock (pd.DataFrame): O estoque disponível total, somado sobre todas as partes do estoque.
+            store (pd.DataFrame): Os dados das lojas, já limpos.
+
+        Returns:
+            Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]: As vendas limpas, a velocidade de vendas da parte e
+            as vendas por região parciais, a serem somadas às das demais partes.
+        """
+        sales = self.__clean(sales_df)
+        return (sales, *self.__sales_aggregates(sales, available_stock, store))
+
+    @staticmethod
+    def _concat_chunks(chunks: Iterator[pd.DataFrame]) -> pd.DataFrame:
+        """
+        Materializa os blocos de uma fonte em um único DataFrame.
+
+        Args:
+            chunks (Iterator[pd.DataFrame]): Os blocos da fonte.
+
+        Returns:
+            pd.DataFrame: A concatenação dos blocos.
+        """
+        frames: List[pd.DataFrame] = list(chunks)
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, ignore_index=True)
+
+    @staticmethod
+    def _accumulate(total: pd.DataFrame, partial: pd.DataFrame, keys: List[str], column: str) -> pd.DataFrame:
+        """
+        Soma um agregado parcial ao agregado acumulado, reagrupando pelas chaves.
+
+        Args:
+            total (pd.DataFrame): O agregado acumulado até o momento.
+            partial (pd.DataFrame): O agregado do bloco corrente.
+            keys (List[str]): As colunas de agrupamento.
+            column (str): A coluna somada.
+
+        Returns:
+            pd.DataFrame: O novo agregado acumulado.
+        """
+        if total.empty:
+            return partial
+        combined = pd.concat([total, partial], ignore_index=True)
+        return combined.groupby(keys, observed=True).agg({column: "sum"}).reset_index()
+
+    @staticmethod
+    def _merge_partials(partials: List[pd.DataFrame], keys: List[str], column: str) -> pd.DataFrame:
+        """
+        Soma de uma só vez os agregados parciais de várias partições, reagrupando pelas chaves.
+
+        Args:
+            partials (List[pd.DataFrame]): Os agregados parciais.
+            keys (List[str]): As colunas de agrupamento.
+            column (str): A coluna somada.
+
+        Returns:
+            pd.DataFrame: O agregado total.
+        """
+        if len(partials) == 1:
+            return partials[0]
+        combined = TransformData._concat_partitions(partials)
+        return combined.groupby(keys, observed=True).agg({column: "sum"}).reset_index()
+
+    def _merge_velocity_partials(self, partials: List[pd.DataFrame]) -> pd.DataFrame:
+        """
+        Combina as velocidades de vendas de várias partes (partições ou blocos) das vendas.
+
+        Com a granularidade `"row"`, as partes são apenas concatenadas. Nas granularidades agregadas, um mesmo
+        grupo pode aparecer em várias partes (um produto vendido em filiais ou meses diferentes): as medidas e
+        `QTD_VENDAS` dos grupos repetidos são somadas e a velocidade é recalculada a partir das somas, como se
+        as vendas tivessem sido agregadas de uma só vez. O estoque de um grupo é o mesmo em todas as partes.
+
+        Args:
+            partials (List[pd.DataFrame]): As velocidades de vendas de cada parte.
+
+        Returns:
+            pd.DataFrame: A velocidade de vendas de todas as partes, com uma linha por grupo.
+        """
+        combined = self._concat_partitions(partials)
+        keys = self.VELOCITY_GRANULARITIES[self.velocity_granularity]
+        if not keys or len(partials) == 1:
+            return combined
+        measures = [
+            column for column in ("VENDA_PECAS", "VENDA_LIQUIDA", "VENDA_BRUTA", "QTD_VENDAS") if column in combined
+        ]
+        grouped = combined.groupby(keys, observed=True)
+        merged = grouped[measures].sum()
+        merged["ESTOQUE_DISPONIVEL"] = grouped["ESTOQUE_DISPONIVEL"].first()
+        merged = merged.reset_index()
+        sold = merged["VENDA_PECAS"].to_numpy(dtype="float64", na_value=np.nan)
+        stock = merged["ESTOQUE_DISPONIVEL"].to_numpy(dtype="float64", na_value=np.nan)
+        merged["VELOCIDADE_VENDA"] = sold / merged["QTD_VENDAS"].to_numpy() / stock
+        return merged[combined.columns].astype(combined.dtypes.to_dict())
+
+    @staticmethod
+    def _concat_partitions(frames: List[pd.DataFrame]) -> pd.DataFrame:
+        """
+        Concatena os resultados de várias partições, mantendo categóricas as colunas que o eram nas partições.
+
+        As partições podem ter categorias diferentes (a limpeza acrescenta a categoria `0` apenas onde há
+        valores ausentes), o que faria o pandas converter essas colunas em `object` na concatenação.
+
+        Args:
+            frames (List[pd.DataFrame]): Os resultados das partições, com as mesmas colunas.
+
+        Returns:
+            pd.DataFrame: A concatenação dos resultados.
+        """
+        combined = pd.concat(frames, ignore_index=True)
+        categorical_columns = {column for frame in frames for column in frame.select_dtypes(include="category").columns}
+        lost = [column for column in categorical_columns if not isinstance(combined[column].dtype, pd.CategoricalDtype)]
+        return combined.astype({column: "category" for column in lost})
+
     def _clean_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Limpa os dados removendo duplicatas e preenchendo valores ausentes.
 
+        Colunas categóricas recebem a categoria `0` antes do preenchimento, e colunas de data mantêm
+        os valores ausentes, para que nenhuma delas perca o seu tipo.
+
         Args:
             df (pd.DataFrame): O DataFrame a ser limpo.
 
         Returns:
             pd.DataFrame: DataFrame limpo.
         """
-        cleaned_df = df.drop_duplicates().fillna(0)
+        return self._fill_missing(df.drop_duplicates())
+
+    def _fill_missing(self, cleaned_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Preenche os valores ausentes com `0`, preservando os tipos das colunas categóricas e de data.
+
+        Args:
+            cleaned_df (pd.DataFrame): O DataFrame sem duplicatas.
+
+        Returns:
+            pd.DataFrame: DataFrame com os valores ausentes preenchidos.
+        """
+        date_columns = cleaned_df.select_dtypes(include="datetime").columns
+        missing = cleaned_df.isna().any()
+        fill_columns = [column for column in cleaned_df.columns if missing[column] and column not in date_columns]
+        categorical_columns = cleaned_df[fill_columns].select_dtypes(include="category").columns
+        cleaned_df = cleaned_df.astype(
+            {column: pd.CategoricalDtype([*cleaned_df[column].cat.categories, 0]) for column in categorical_columns}
+        )
+        cleaned_df = cleaned_df.fillna({column: 0 for column in fill_columns})
         return cleaned_df
 
+    def _clean_data_hashed(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Limpa os dados como `_clean_data`, comparando linhas inteiras apenas entre as candidatas a duplicata.
+
+        Cada linha é reduzida a um hash de 64 bits calculado de forma vetorizada; linhas idênticas têm o mesmo
+        hash, por isso apenas as linhas com hash repetido são comparadas coluna a coluna. As linhas removidas
+        são as mesmas de `drop_duplicates`.
+
+        Args:
+            df (pd.DataFrame): O DataFrame a ser limpo.
+
+        Returns:
+            pd.DataFrame: DataFrame limpo.
+        """
+        row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+        candidates = pd.Series(row_hashes).duplicated(keep=False).to_numpy()
+        if candidates.any():
+            duplicated = np.zeros(len(df), dtype=bool)
+            duplicated[candidates] = df[candidates].duplicated().to_numpy()
+            df = df[~duplicated]
+        return self._fill_missing(df)
+
     def _calculate_sales_velocity(self, sales_df: pd.DataFrame, stock_df: pd.DataFrame) -> pd.DataFrame:
         """
         Calcula a velocidade de vendas ao combinar dados de vendas e estoque.
@@ -85,7 +503,11 @@ class TransformData:
 
         # Realiza a modificação na cópia
         stock_copy["ESTOQUE_DISPONIVEL"] = stock_copy["TOTAL"] - stock_copy["TRANSITO"]
-        aggregated_df = stock_copy.groupby(["PRODUTO", "COR_PRODUTO"]).agg({"ESTOQUE_DISPONIVEL": "sum"}).reset_index()
+        aggregated_df = (
+            stock_copy.groupby(["PRODUTO", "COR_PRODUTO"], observed=True)
+            .agg({"ESTOQUE_DISPONIVEL": "sum"})
+            .reset_index()
+        )
 
         return aggregated_df
 
@@ -100,5 +522,190 @@ class TransformData:
             DataFrame: Dados de vendas agregados por UF e cidade, com o total de peças vendidas.
         """
         sales_region = sales_df.merge(store_df, on="ID_FILIAL", how="inner")
-        aggregated_sales = sales_region.groupby(["UF", "CIDADE"]).agg({"VENDA_PECAS": "sum"}).reset_index()
+        aggregated_sales = (
+            sales_region.groupby(["UF", "CIDADE"], observed=True).agg({"VENDA_PECAS": "sum"}).reset_index()
+        )
         return aggregated_sales
+
+    def _calculate_sales_velocity_vectorized(self, sales_df: pd.DataFrame, stock_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Calcula a velocidade de vendas como `_calculate_sales_velocity`, mantendo a coluna numérica.
+
+        Estoques iguais a zero são mascarados como `NaN` na divisão, em vez de substituídos por `None`, o que
+        transformaria a coluna em `object`; as linhas sem velocidade são descartadas pela mesma máscara.
+
+        Args:
+            sales_df (pd.DataFrame): DataFrame contendo dados de vendas.
+            stock_df (pd.DataFrame): DataFrame contendo o estoque disponível por produto e cor.
+
+        Returns:
+            pd.DataFrame: DataFrame transformado com a velocidade de vendas.
+        """
+        merged_df = pd.merge(sales_df, stock_df, on=["PRODUTO", "COR_PRODUTO"], how="inner")
+        stock = merged_df["ESTOQUE_DISPONIVEL"].to_numpy(dtype="float64", na_value=np.nan)
+        sold = merged_df["VENDA_PECAS"].to_numpy(dtype="float64", na_value=np.nan)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            velocity = sold / np.where(stock == 0, np.nan, stock)
+        merged_df["VELOCIDADE_VENDA"] = velocity
+        return merged_df[~np.isnan(velocity)]
+
+    def _calculate_sales_velocity_aggregated(
+        self, sales_df: pd.DataFrame, stock_df: pd.DataFrame, keys: List[str]
+    ) -> pd.DataFrame:
+        """
+        Calcula a velocidade de vendas agregando as vendas pelas chaves antes de buscar o estoque.
+
+        As vendas são somadas por `keys` (ver `_group_sales`) e o estoque de cada grupo é buscado por produto e
+        cor (ver `_calculate_sales_velocity_from_groups`), sem juntar a tabela de vendas inteira ao estoque.
+
+        Args:
+            sales_df (pd.DataFrame): DataFrame contendo dados de vendas.
+            stock_df (pd.DataFrame): DataFrame contendo o estoque disponível por produto e cor.
+            keys (List[str]): As colunas de agrupamento, que incluem `PRODUTO` e `COR_PRODUTO`.
+
+        Returns:
+            pd.DataFrame: As vendas agregadas com `ESTOQUE_DISPONIVEL`, `VELOCIDADE_VENDA` e `QTD_VENDAS`.
+        """
+        return self._calculate_sales_velocity_from_groups(self._group_sales(sales_df, keys), stock_df, keys)
+
+    def _group_sales(self, sales_df: pd.DataFrame, keys: List[str]) -> pd.DataFrame:
+        """
+        Soma as medidas das vendas por `keys` e registra em `QTD_VENDAS` quantas vendas cada grupo resume.
+
+        Vendas sem `VENDA_PECAS` são descartadas. Grupos com chaves ausentes são mantidos, para que o resultado
+        possa ser reagrupado por outras chaves (ver `_calculate_sales_velocity_from_groups`).
+
+        Args:
+            sales_df (pd.DataFrame): DataFrame contendo dados de vendas.
+            keys (List[str]): As colunas de agrupamento.
+
+        Returns:
+            pd.DataFrame: Uma linha por grupo, com as chaves, as medidas somadas e `QTD_VENDAS`.
+        """
+        measures = [column for column in self.MEASURES if column in sales_df]
+        sales_df = sales_df[sales_df["VENDA_PECAS"].notna()]
+        grouped = sales_df.groupby(keys, observed=True, dropna=False)
+        aggregated = grouped[measures].sum()
+        aggregated["QTD_VENDAS"] = grouped.size()
+        return aggregated.reset_index()
+
+    def _calculate_sales_velocity_from_groups(
+        self, grouped_sales: pd.DataFrame, stock_df: pd.DataFrame, keys: List[str]
+    ) -> pd.DataFrame:
+        """
+        Calcula a velocidade de vendas agregada a partir das vendas já agrupadas por `_group_sales`.
+
+        Se as vendas foram agrupadas por mais colunas que `keys`, os grupos são somados por `keys`. O estoque de
+        cada grupo é buscado por produto e cor em um índice de hash do estoque disponível. A velocidade de cada
+        grupo é a média das velocidades das vendas que ele resume (`VENDA_PECAS / QTD_VENDAS / estoque`). Grupos
+        com chaves ausentes e grupos sem estoque, ou com estoque igual a zero, são descartados, como no cálculo
+        por venda.
+
+        Args:
+            grouped_sales (pd.DataFrame): As vendas agrupadas por `keys` ou por um superconjunto delas.
+            stock_df (pd.DataFrame): DataFrame contendo o estoque disponível por produto e cor.
+            keys (List[str]): As colunas de agregação, que incluem `PRODUTO` e `COR_PRODUTO`.
+
+        Returns:
+            pd.DataFrame: As vendas agregadas com `ESTOQUE_DISPONIVEL`, `VELOCIDADE_VENDA` e `QTD_VENDAS`.
+        """
+        measures = [column for column in self.MEASURES if column in grouped_sales]
+        aggregated = grouped_sales.dropna(subset=keys)
+        if set(grouped_sales.columns) - set(keys) - set(measures) - {"QTD_VENDAS"}:
+            aggregated = aggregated.groupby(keys, observed=True)[measures + ["QTD_VENDAS"]].sum().reset_index()
+
+        stock_index = stock_df.set_index(["PRODUTO", "COR_PRODUTO"])["ESTOQUE_DISPONIVEL"]
+        positions = stock_index.index.get_indexer(pd.MultiIndex.from_frame(aggregated[["PRODUTO", "COR_PRODUTO"]]))
+        stock = stock_index.to_numpy(dtype="float64", na_value=np.nan)[positions]
+        stock[positions < 0] = np.nan
+
+        sold = aggregated["VENDA_PECAS"].to_numpy(dtype="float64", na_value=np.nan)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            velocity = sold / aggregated["QTD_VENDAS"].to_numpy() / np.where(stock == 0, np.nan, stock)
+        aggregated = aggregated.assign(ESTOQUE_DISPONIVEL=stock, VELOCIDADE_VENDA=velocity)
+        aggregated = aggregated[~np.isnan(velocity)]
+        return aggregated.astype({"ESTOQUE_DISPONIVEL": stock_index.dtype})
+
+    def _calculate_available_stock_vectorized(self, stock_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Calcula o estoque disponível como `_calculate_available_stock`, sem copiar o DataFrame de estoque.
+
+        Args:
+            stock_df (pd.DataFrame): DataFrame contendo dados de estoque.
+
+        Returns:
+            pd.DataFrame: DataFrame transformado com o estoque disponível.
+        """
+        available = stock_df["TOTAL"] - stock_df["TRANSITO"]
+        return (
+            available.groupby([stock_df["PRODUTO"], stock_df["COR_PRODUTO"]], observed=True)
+            .sum()
+            .rename("ESTOQUE_DISPONIVEL")
+            .reset_index()
+        )
+
+    def _calculate_sales_by_region_vectorized(self, sales_df: pd.DataFrame, store_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Calcula as vendas por região como `_calculate_sales_by_region`, agregando as vendas por filial antes
+        da junção com as lojas, de modo que a junção envolve uma linha por filial em vez de uma por venda.
+
+        Args:
+            sales_df (DataFrame): DataFrame contendo os dados de vendas, ou as vendas já agrupadas por filial e
+                                  outras chaves (ver `_group_sales`).
+            store_df (DataFrame): DataFrame contendo os dados das lojas.
+        Returns:
+            DataFrame: Dados de vendas agregados por UF e cidade, com o total de peças vendidas.
+        """
+        sales_by_branch = sales_df.groupby("ID_FILIAL", observed=True)["VENDA_PECAS"].sum().reset_index()
+        sales_region = store_df[["ID_FILIAL", "UF", "CIDADE"]].merge(sales_by_branch, on="ID_FILIAL", how="inner")
+        return sales_region.groupby(["UF", "CIDADE"], observed=True).agg({"VENDA_PECAS": "sum"}).reset_index()
+
+    def __clean(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Limpa os dados de uma fonte com o motor configurado."""
+        if self.engine == "legacy":
+            return self._clean_data(df)
+        return self._clean_data_hashed(df)
+
+    def __available_stock(self, stock_df: pd.DataFrame) -> pd.DataFrame:
+        """Calcula o estoque disponível com o motor configurado."""
+        if self.engine == "legacy":
+            return self._calculate_available_stock(stock_df)
+        return self._calculate_available_stock_vectorized(stock_df)
+
+    def __sales_aggregates(
+        self, sales_df: pd.DataFrame, stock_df: pd.DataFrame, store_df: pd.DataFrame
+    ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Calcula a velocidade de vendas e as vendas por região com o motor e a granularidade configurados.
+
+        No motor vetorizado com a velocidade agregada, as vendas são agrupadas uma única vez pelas chaves da
+        velocidade e pela filial (`_group_sales`), e esse intermediário alimenta os dois cálculos: a velocidade
+        reagrupa os grupos pelas suas chaves, e as vendas por região os somam por filial antes da junção com as
+        lojas. Com a velocidade por venda, que mantém uma linha por venda, os cálculos são independentes.
+
+        Returns:
+            Tuple[pd.DataFrame, pd.DataFrame]: A velocidade de vendas e as vendas por região.
+        """
+        keys = self.VELOCITY_GRANULARITIES[self.velocity_granularity]
+        if keys and self.engine == "vectorized":
+            grouped_sales = self._group_sales(sales_df, keys + [key for key in ["ID_FILIAL"] if key not in keys])
+            return (
+                self._calculate_sales_velocity_from_groups(grouped_sales, stock_df, keys),
+                self._calculate_sales_by_region_vectorized(grouped_sales, store_df),
+            )
+        return self.__sales_velocity(sales_df, stock_df), self.__sales_by_region(sales_df, store_df)
+
+    def __sales_velocity(self, sales_df: pd.DataFrame, stock_df: pd.DataFrame) -> pd.DataFrame:
+        """Calcula a velocidade de vendas com o motor e a granularidade configurados."""
+        keys = self.VELOCITY_GRANULARITIES[self.velocity_granularity]
+        if keys:
+            return self._calculate_sales_velocity_aggregated(sales_df, stock_df, keys)
+        if self.engine == "legacy":
+            return self._calculate_sales_velocity(sales_df, stock_df)
+        return self._calculate_sales_velocity_vectorized(sales_df, stock_df)
+
+    def __sales_by_region(self, sales_df: pd.DataFrame, store_df: pd.DataFrame) -> pd.DataFrame:
+        """Calcula as vendas por região com o motor configurado."""
+        if self.engine == "legacy":
+            return self._calculate_sales_by_region(sales_df, store_df)
+        return self._calculate_sales_by_region_vectorized(sales_df, store_df)
@@ -0,0 +1,54 @@
+import importlib.util
+import os
+from pathlib import Path
+
+import pytest
+
+from src.driver.dataloader import DataLoader
+from src.driver.schemas import SOURCE_SCHEMAS
+from src.stages.contracts.extract_contract import ExtractContract
+from src.stages.transform.transform_data import TransformData
+from tests.benchmarks.synthetic_data import generate_sources
+
+BENCHMARK_ROWS = int(os.getenv("BENCHMARK_ROWS", "10000"))
+
+if importlib.util.find_spec("pytest_benchmark") is None:
+    collect_ignore_glob = ["test_*.py"]
+
+
+@pytest.fixture(scope="session")
+def source_dir(tmp_path_factory) -> Path:
+    """
+    Fixture with the synthetic sources at the `BENCHMARK_ROWS` scale.
+
+    When `BENCHMARK_DATA_DIR` is set, the files are generated there once and reused by later runs, which avoids
+    regenerating large scales.
+    """
+    data_dir = os.getenv("BENCHMARK_DATA_DIR")
+    if data_dir is None:
+        output = tmp_path_factory.mktemp("sources")
+    else:
+        output = Path(data_dir) / str(BENCHMARK_ROWS)
+        if all((output / schema.file_name).exists() for schema in SOURCE_SCHEMAS.values()):
+            return output
+    generate_sources(str(output), BENCHMARK_ROWS)
+    return output
+
+
+@pytest.fixture(scope="session")
+def extract_contract(source_dir) -> ExtractContract:
+    """Fixture with the synthetic sources extracted once per session."""
+    return ExtractContract(**DataLoader(base_path=str(source_dir)).extract_all())
+
+
+@pytest.fixture(scope="session")
+def transform_contract(extract_contract):
+    """Fixture with the synthetic sources transformed once per session by the default pandas transform."""
+    return TransformData(engine="vectorized", backend="pandas").transform(extract_contract)
+
+
+@pytest.fixture(autouse=True)
+def benchmark_scale(request):
+    """Records the scale in every saved result, so that runs are only compared at the same scale."""
+    if "benchmark" in request.fixturenames:
+        request.getfixturevalue("benchmark").extra_info["rows"] = BENCHMARK_ROWS
@@ -0,0 +1,291 @@
+"""
+Gerador de fontes sintéticas para os benchmarks.
+
+Escreve `vendas_hering.csv`, `estoque_hering.csv`, `lojas_hering.csv` e `produtos_hering.csv` com as colunas de
+`SOURCE_SCHEMAS`, em qualquer escala (de 10 mil a 100 milhões de linhas de vendas). As cardinalidades das chaves
+crescem com a raiz quadrada da escala, a partir das observadas na amostra do projeto (cerca de 50 mil vendas,
+125 lojas e 1.350 produtos), e a popularidade de produtos e lojas segue uma distribuição de Zipf, de modo que
+os agrupamentos e junções se comportem como nos dados reais. As vendas e o estoque são escritos em blocos,
+com memória limitada pelo tamanho do bloco.
+
+Uso:
+    python -m tests.benchmarks.synthetic_data --rows 1_000_000 --output data/synthetic
+"""
+
+import argparse
+import math
+import string
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+from src.driver.schemas import SOURCE_SCHEMAS
+
+SAMPLE_SALES_ROWS = 50_000
+SIZES = np.array(["PP", "P", "M", "G", "GG", "XG", "U"])
+SIZE_WEIGHTS = np.array([0.05, 0.2, 0.3, 0.25, 0.12, 0.05, 0.03])
+STATES = {
+    "SP": ["SAO PAULO", "CAMPINAS", "SANTOS", "SOROCABA"],
+    "RJ": ["RIO DE JANEIRO", "NITEROI", "PETROPOLIS"],
+    "SC": ["JOINVILLE", "BLUMENAU", "FLORIANOPOLIS"],
+    "MG": ["BELO HORIZONTE", "UBERLANDIA", "JUIZ DE FORA"],
+    "PR": ["CURITIBA", "LONDRINA", "MARINGA"],
+    "RS": ["PORTO ALEGRE", "CAXIAS DO SUL"],
+    "BA": ["SALVADOR", "FEIRA DE SANTANA"],
+    "PE": ["RECIFE", "OLINDA"],
+    "CE": ["FORTALEZA"],
+    "GO": ["GOIANIA"],
+    "DF": ["BRASILIA"],
+    "ES": ["VITORIA", "VILA VELHA"],
+}
+BUSINESSES = ["HERING", "HERING KIDS", "HERING INTIMA", "HERING SPORTS"]
+COLLECTIONS = ["VERAO 2024", "OUTONO 2024", "INVERNO 2024"]
+
+
+@dataclass(frozen=True)
+class SyntheticScale:
+    """
+    Tamanho das fontes sintéticas.
+
+    Attributes:
+        sales_rows (int): A quantidade de linhas de vendas.
+        stock_rows (int): A quantidade de linhas de estoque (um terço das vendas, como na amostra).
+        stores (int): A quantidade de lojas.
+        articles (int): A quantidade de produtos; cada produto tem de 1 a 4 cores.
+        days (int): A quantidade de dias cobertos pelas vendas e pelas fotos do estoque.
+    """
+
+    sales_rows: int
+    stock_rows: int
+    stores: int
+    articles: int
+    days: int
+
+    @classmethod
+    def for_rows(cls, sales_rows: int, days: int = 365) -> "SyntheticScale":
+        """
+        Deriva as cardinalidades a partir da quantidade de linhas de vendas.
+
+        Args:
+            sales_rows (int): A quantidade de linhas de vendas.
+            days (int): A quantidade de dias cobertos pelos dados.
+
+        Returns:
+            SyntheticScale: A escala correspondente.
+        """
+        growth = math.sqrt(sales_rows / SAMPLE_SALES_ROWS)
+        return cls(
+            sales_rows=sales_rows,
+            stock_rows=max(sales_rows // 3, 1),
+            stores=int(np.clip(125 * growth, 20, 2_000)),
+            articles=int(np.clip(1_350 * growth, 50, 50_000)),
+            days=days,
+        )
+
+
+def generate_sources(
+    output_dir: str, sales_rows: int, seed: int = 42, chunk_size: int = 1_000_000, days: int = 365
+) -> Dict[str, Path]:
+    """
+    Escreve as quatro fontes sintéticas no diretório informado.
+
+    Args:
+        output_dir (str): O diretório de saída, criado se necessário.
+        sales_rows (int): A quantidade de linhas de vendas; as demais fontes são derivadas dela.
+        seed (int): A semente do gerador, para que a mesma escala produza sempre os mesmos arquivos.
+        chunk_size (int): A quantidade de linhas de vendas e de estoque geradas e escritas por vez.
+        days (int): A quantidade de dias cobertos pelas vendas e pelo estoque, a partir de 2024-01-01.
+
+    Returns:
+        Dict[str, Path]: O caminho de cada arquivo, indexado pelo nome da fonte.
+    """
+    output = Path(output_dir)
+    output.mkdir(parents=True, exist_ok=True)
+    scale = SyntheticScale.for_rows(sales_rows, days)
+    rng = np.random.default_rng(seed)
+
+    store_ids = _write_stores(output / SOURCE_SCHEMAS["store"].file_name, scale, rng)
+    products, colors = _write_products(output / SOURCE_SCHEMAS["products"].file_name, scale, rng)
+
+    _write_chunks(
+        output / SOURCE_SCHEMAS["sales"].file_name,
+        scale.sales_rows,
+        chunk_size,
+        lambda size, chunk_rng: _sales_chunk(size, chunk_rng, scale, store_ids, products, colors),
+        seed,
+    )
+    _write_chunks(
+        output / SOURCE_SCHEMAS["stock"].file_name,
+        scale.stock_rows,
+        chunk_size,
+        lambda size, chunk_rng: _stock_chunk(size, chunk_rng, scale, store_ids, products, colors),
+        seed + 1,
+    )
+    return {source: output / schema.file_name for source, schema in SOURCE_SCHEMAS.items()}
+
+
+def _zipf_choice(rng: np.random.Generator, population: int, size: int, exponent: float = 1.1) -> np.ndarray:
+    """Sorteia índices de `0` a `population - 1` com popularidade decrescente (distribuição de Zipf)."""
+    weights = 1.0 / np.arange(1, population + 1) ** exponent
+    return rng.choice(population, size=size, p=weights / weights.sum())
+
+
+def _codes(rng: np.random.Generator, count: int, length: int) -> np.ndarray:
+    """Gera `count` códigos alfanuméricos distintos com `length` caracteres."""
+    alphabet = np.array(list(string.ascii_uppercase + string.digits))
+    codes = set()
+    while len(codes) < count:
+        codes.update("".join(code) for code in rng.choice(alphabet, size=(count, length)))
+    return np.array(sorted(codes)[:count])
+
+
+def _write_stores(path: Path, scale: SyntheticScale, rng: np.random.Generator) -> np.ndarray:
+    """Escreve as lojas, com cerca de 7% sem cidade e UF, como na amostra, e retorna os seus identificadores."""
+    store_ids = np.arange(10_000, 10_000 + scale.stores, dtype=np.int32)
+    states = rng.choice(list(STATES), size=scale.stores)
+    cities = np.array([rng.choice(STATES[state]) for state in states], dtype=object)
+    missing = rng.random(scale.stores) < 0.07
+    cities[missing] = None
+    states = states.astype(object)
+    states[missing] = None
+    point_of_sale = np.arange(100, 100 + scale.stores)
+    pd.DataFrame(
+        {
+            "ID_FILIAL": store_ids,
+            "LOJA": [f"Loja {store_id}" for store_id in store_ids],
+            "PONTO_VENDA_COD": point_of_sale,
+            "PONTO_VENDA": [f"{code}:Ponto de venda {code}" for code in point_of_sale],
+            "PUBLICO_LOJA": rng.choice(["A", "AB", "B", "C"], size=scale.stores),
+            "CANAL": "Lojas",
+            "CIDADE": cities,
+            "LOJA_M2": rng.integers(30, 400, size=scale.stores),
+            "PAIS": "BR",
+            "UF": states,
+            "CLIMA": rng.choice(["Quente", "Fria"], size=scale.stores),
+            "STATUS": rng.choice(["ACTIVE", "INACTIVE"], size=scale.stores, p=[0.85, 0.15]),
+        }
+    ).to_csv(path, index=False)
+    return store_ids
+
+
+def _write_products(path: Path, scale: SyntheticScale, rng: np.random.Generator) -> tuple:
+    """
+    Escreve o catálogo, com uma linha por produto e cor, e retorna o produto e a cor de cada par, ordenados do
+    mais para o menos popular.
+    """
+    articles = _codes(rng, scale.articles, 4)
+    color_codes = _codes(rng, max(scale.articles // 3, 20), 4)
+    colors_per_article = rng.integers(1, 5, size=scale.articles)
+    products = np.repeat(articles, colors_per_article)
+    colors = color_codes[_zipf_choice(rng, len(color_codes), len(products), exponent=0.8)]
+    order = rng.permutation(len(products))
+    products, colors = products[order], colors[order]
+
+    descriptions = np.array([f"PRODUTO {code}" for code in products])
+    pd.DataFrame(
+        {
+            "ARTIGO_COR": np.char.add(products.astype(str), colors.astype(str)),
+            "ARTIGO": products,
+            "DESC_PRODUTO": descriptions,
+            "COR": colors,
+            "COR_DESCRICAO": np.char.add("COR ", colors.astype(str)),
+            "NEGOCIO": rng.choice(BUSINESSES, size=len(products)),
+            "PARTE": rng.choice(["CIMA", "BAIXO", "INTEIRO"], size=len(products)),
+            "GRUPO": rng.choice([f"GRUPO {index}" for index in range(57)], size=len(products)),
+            "GENERO": rng.choice(["MASCULINO", "FEMININO", "UNISSEX"], size=len(products)),
+            "COD_COTA": rng.choice([124, 424, 524], size=len(products)),
+            "COLECAO": rng.choice(COLLECTIONS, size=len(products)),
+            "PIRAMIDE": rng.choice(["CORE", "MODA", "BASICO"], size=len(products)),
+        }
+    ).to_csv(path, index=False)
+    return products, colors
+
+
+def _dates(rng: np.random.Generator, size: int, days: int) -> np.ndarray:
+    """Sorteia datas a partir de 2024-01-01, uniformes em `days` dias."""
+    return np.datetime64("2024-01-01") + rng.integers(0, days, size=size).astype("timedelta64[D]")
+
+
+def _sales_chunk(
+    size: int,
+    rng: np.random.Generator,
+    scale: SyntheticScale,
+    store_ids: np.ndarray,
+    products: np.ndarray,
+    colors: np.ndarray,
+) -> pd.DataFrame:
+    """Gera um bloco de vendas, com cerca de 2% de linhas duplicadas e 0,5% sem peças vendidas."""
+    duplicates = int(size * 0.02)
+    unique = size - duplicates
+    pairs = _zipf_choice(rng, len(products), unique)
+    pieces = rng.geometric(0.6, size=unique).astype(np.float64)
+    pieces[rng.random(unique) < 0.005] = np.nan
+    gross = np.round(pieces * rng.uniform(19.99, 199.99, size=unique), 2)
+    chunk = pd.DataFrame(
+        {
+            "DATA_VENDA": _dates(rng, unique, scale.days),
+            "ID_FILIAL": store_ids[_zipf_choice(rng, len(store_ids), unique, exponent=0.7)],
+            "PRODUTO": products[pairs],
+            "COR_PRODUTO": colors[pairs],
+            "TAMANHO": rng.choice(SIZES, size=unique, p=SIZE_WEIGHTS),
+            "VENDA_PECAS": pd.array(pieces, dtype="Int32"),
+            "VENDA_LIQUIDA": np.round(gross * rng.uniform(0.8, 1.0, size=unique), 2),
+            "VENDA_BRUTA": gross,
+        }
+    )
+    return pd.concat([chunk, chunk.iloc[rng.integers(0, unique, size=duplicates)]], ignore_index=True)
+
+
+def _stock_chunk(
+    size: int,
+    rng: np.random.Generator,
+    scale: SyntheticScale,
+    store_ids: np.ndarray,
+    products: np.ndarray,
+    colors: np.ndarray,
+) -> pd.DataFrame:
+    """Gera um bloco de estoque, com fotos mensais e cerca de 10% dos itens zerados."""
+    pairs = _zipf_choice(rng, len(products), size, exponent=0.6)
+    dates = _dates(rng, size, scale.days).astype("datetime64[M]").astype("datetime64[D]")
+    total = rng.integers(0, 60, size=size)
+    total[rng.random(size) < 0.1] = 0
+    return pd.DataFrame(
+        {
+            "DATA_FOTO": dates,
+            "ID_FILIAL": store_ids[rng.integers(0, len(store_ids), size=size)],
+            "PRODUTO": products[pairs],
+            "COR_PRODUTO": colors[pairs],
+            "TAMANHO": rng.choice(SIZES, size=size, p=SIZE_WEIGHTS),
+            "TOTAL": total,
+            "TRANSITO": rng.integers(0, 5, size=size),
+        }
+    )
+
+
+def _write_chunks(path: Path, rows: int, chunk_size: int, make_chunk, seed: int) -> None:
+    """Escreve `rows` linhas em blocos de `chunk_size`, cada um com uma semente derivada de `seed`."""
+    path.unlink(missing_ok=True)
+    for index, start in enumerate(range(0, rows, chunk_size)):
+        chunk = make_chunk(min(chunk_size, rows - start), np.random.default_rng([seed, index]))
+        chunk.to_csv(path, mode="a", header=index == 0, index=False, float_format="%.2f")
+
+
+def main() -> None:
+    """Ponto de entrada da linha de comando do gerador."""
+    parser = argparse.ArgumentParser(description="Gera as fontes sintéticas usadas nos benchmarks.")
+    parser.add_argument("--rows", type=int, default=100_000, help="Quantidade de linhas de vendas.")
+    parser.add_argument("--output", default="data/synthetic", help="Diretório de saída.")
+    parser.add_argument("--seed", type=int, default=42, help="Semente do gerador.")
+    parser.add_argument("--days", type=int, default=365, help="Quantidade de dias cobertos pelos dados.")
+    args = parser.parse_args()
+
+    paths = generate_sources(args.output, args.rows, seed=args.seed, days=args.days)
+    for source, path in paths.items():
+        print(f"{source}: {path} ({path.stat().st_size / 1024**2:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
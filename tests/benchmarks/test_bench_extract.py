@@ -0,0 +1,37 @@
+from src.driver.columnar_cache import ColumnarCache
+from src.driver.dataloader import DataLoader
+
+
+def test_extract_all(benchmark, source_dir):
+    """
+    Benchmark `DataLoader.extract_all` reading every CSV source.
+    """
+    loader = DataLoader(base_path=str(source_dir))
+
+    data = benchmark(loader.extract_all)
+
+    assert set(data) == set(DataLoader.FILE_NAMES)
+
+
+def test_extract_all_from_columnar_cache(benchmark, source_dir, tmp_path):
+    """
+    Benchmark `DataLoader.extract_all` served by a warm columnar cache.
+    """
+    loader = DataLoader(base_path=str(source_dir), cache=ColumnarCache(cache_dir=str(tmp_path)))
+    loader.extract_all()
+
+    data = benchmark(loader.extract_all)
+
+    assert set(data) == set(DataLoader.FILE_NAMES)
+
+
+def test_extract_all_chunks(benchmark, source_dir):
+    """
+    Benchmark reading every source in blocks of 100k rows.
+    """
+    loader = DataLoader(base_path=str(source_dir))
+
+    def consume():
+        return sum(len(chunk) for chunks in loader.extract_all_chunks(100_000).values() for chunk in chunks)
+
+    assert benchmark(consume) > 0
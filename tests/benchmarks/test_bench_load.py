@@ -0,0 +1,49 @@
+import psycopg2
+import pytest
+
+from src.infra.database_connector import DatabaseConnection
+from src.infra.database_repository import DatabaseRepository
+from src.stages.load.load_data import LoadData
+from tests.config.settings import TEST_DATABASE_CONFIG
+
+TABLES = ("sales", "stock", "sales_velocity")
+
+
+@pytest.fixture
+def benchmark_database(request):
+    """
+    Fixture with an empty test database holding the pipeline tables, skipped when the local Postgres is unreachable.
+    """
+    try:
+        psycopg2.connect(
+            dbname="postgres",
+            user=TEST_DATABASE_CONFIG["user"],
+            password=TEST_DATABASE_CONFIG["password"],
+            host=TEST_DATABASE_CONFIG["host"],
+            port=TEST_DATABASE_CONFIG["port"],
+            connect_timeout=3,
+        ).close()
+    except psycopg2.OperationalError as error:
+        pytest.skip(f"Postgres de teste indisponível: {error}")
+
+    config = request.getfixturevalue("setup_test_database")
+    DatabaseConnection.connect(config)
+    LoadData(DatabaseRepository()).create_table_if_not_exists()
+    yield config
+    DatabaseConnection.close()
+
+
+@pytest.mark.parametrize("load_method", DatabaseRepository.LOAD_METHODS)
+@pytest.mark.parametrize("table_name", TABLES)
+def test_insert_data(benchmark, benchmark_database, transform_contract, load_method, table_name):
+    """
+    Benchmark `DatabaseRepository.insert_data` with each load method, truncating the table before every round.
+    """
+    benchmark.group = f"insert_data-{table_name}"
+    repository = DatabaseRepository(load_method=load_method)
+    dataframe = getattr(transform_contract, table_name)
+
+    def truncate():
+        repository.execute(f"TRUNCATE TABLE {table_name}")
+
+    benchmark.pedantic(repository.insert_data, args=(dataframe, table_name), setup=truncate, rounds=3)
@@ -0,0 +1,73 @@
+import pandas as pd
+import pytest
+
+from src.config.settings import ANALYSIS_CONFIG
+from src.driver.visualization.reports_visualizer import ReportsVisualizer
+from src.stages.contracts.analyze_contract import AnalyzeContract
+
+
+def as_query_result(df: pd.DataFrame) -> pd.DataFrame:
+    """Converts a DataFrame to what the analysis queries return: lower-case columns and text keys."""
+    df = df.rename(columns=str.lower).reset_index(drop=True)
+    for column in df.select_dtypes(include="category").columns:
+        df[column] = df[column].astype(str)
+    return df
+
+
+def top_n_with_others(df: pd.DataFrame, column: str) -> pd.DataFrame:
+    """Keeps the `ANALYSIS_GROUP_TOP_N * ANALYSIS_GROUP_PAGES` largest groups and sums the rest, as the query does."""
+    limit = ANALYSIS_CONFIG["group_top_n"] * ANALYSIS_CONFIG["group_pages"]
+    totals = df.groupby(column, observed=True)["VENDA_PECAS"].sum().sort_values(ascending=False).reset_index()
+    totals[column] = totals[column].astype(str)
+    if len(totals) > limit:
+        others = pd.DataFrame({column: ["OUTROS"], "VENDA_PECAS": [totals["VENDA_PECAS"].iloc[limit:].sum()]})
+        totals = pd.concat([totals.head(limit), others], ignore_index=True)
+    return totals
+
+
+@pytest.fixture(scope="module")
+def analyze_contract(transform_contract) -> AnalyzeContract:
+    """
+    Fixture with the analysis results computed from the transformed synthetic data, as the materialized views do.
+    """
+    sales = transform_contract.sales
+    velocity = (
+        transform_contract.sales_velocity.groupby(["PRODUTO", "COR_PRODUTO"], observed=True)["VELOCIDADE_VENDA"]
+        .mean()
+        .rename("AVG_VELOCIDADE_VENDA")
+        .reset_index()
+        .sort_values("AVG_VELOCIDADE_VENDA", ascending=False)
+    )
+    region = transform_contract.sales_by_region.sort_values("VENDA_PECAS", ascending=False)
+    return AnalyzeContract(
+        sales_velocity=as_query_result(velocity.head(10)),
+        sales_by_product=as_query_result(top_n_with_others(sales, "PRODUTO")),
+        sales_by_branch=as_query_result(top_n_with_others(sales, "ID_FILIAL")),
+        top_10_sales_by_region=as_query_result(region.head(10)),
+        top_10_least_sales_by_region=as_query_result(region.tail(10).iloc[::-1]),
+        group_page_size=ANALYSIS_CONFIG["group_top_n"],
+    )
+
+
+@pytest.mark.parametrize("max_workers", [1, 5])
+def test_generate_reports(benchmark, analyze_contract, tmp_path, max_workers):
+    """
+    Benchmark `ReportsVisualizer.generate_reports` rendering and saving every chart, in process or in a process pool.
+    """
+    benchmark.group = "reports"
+    visualizer = ReportsVisualizer(output_directory=str(tmp_path), max_workers=max_workers, cache_enabled=False)
+
+    benchmark.pedantic(visualizer.generate_reports, args=(analyze_contract,), rounds=3)
+
+    assert len(list(tmp_path.glob("*.png"))) == 5
+
+
+def test_generate_reports_unchanged(benchmark, analyze_contract, tmp_path):
+    """
+    Benchmark `ReportsVisualizer.generate_reports` when every chart is up to date and only the hashes are computed.
+    """
+    benchmark.group = "reports"
+    visualizer = ReportsVisualizer(output_directory=str(tmp_path), max_workers=1)
+    visualizer.generate_reports(analyze_contract)
+
+    benchmark(visualizer.generate_reports, analyze_contract)
@@ -0,0 +1,90 @@
+import pytest
+
+from src.driver.dataloader import DataLoader
+from src.stages.transform.partitioned_transform import PartitionedTransformData
+from src.stages.transform.transform_data import TransformData
+
+DAILY_KEYS = TransformData.VELOCITY_GRANULARITIES["daily"]
+PRODUCT_KEYS = TransformData.VELOCITY_GRANULARITIES["product"]
+
+TRANSFORM_METHODS = {
+    "clean_data": lambda transform, extracted, transformed: transform._clean_data(extracted.sales),
+    "clean_data_hashed": lambda transform, extracted, transformed: transform._clean_data_hashed(extracted.sales),
+    "available_stock": lambda transform, extracted, transformed: transform._calculate_available_stock(
+        transformed.stock
+    ),
+    "available_stock_vectorized": lambda transform, extracted, transformed: (
+        transform._calculate_available_stock_vectorized(transformed.stock)
+    ),
+    "sales_velocity": lambda transform, extracted, transformed: transform._calculate_sales_velocity(
+        transformed.sales, transformed.available_stock
+    ),
+    "sales_velocity_vectorized": lambda transform, extracted, transformed: (
+        transform._calculate_sales_velocity_vectorized(transformed.sales, transformed.available_stock)
+    ),
+    "sales_velocity_daily": lambda transform, extracted, transformed: (
+        transform._calculate_sales_velocity_aggregated(transformed.sales, transformed.available_stock, DAILY_KEYS)
+    ),
+    "sales_velocity_product": lambda transform, extracted, transformed: (
+        transform._calculate_sales_velocity_aggregated(transformed.sales, transformed.available_stock, PRODUCT_KEYS)
+    ),
+    "sales_by_region": lambda transform, extracted, transformed: transform._calculate_sales_by_region(
+        transformed.sales, transformed.store
+    ),
+    "sales_by_region_vectorized": lambda transform, extracted, transformed: (
+        transform._calculate_sales_by_region_vectorized(transformed.sales, transformed.store)
+    ),
+}
+
+
+@pytest.mark.parametrize("method", list(TRANSFORM_METHODS))
+def test_transform_method(benchmark, extract_contract, transform_contract, method):
+    """
+    Benchmark each `TransformData` method on the synthetic sources, with already cleaned inputs for the aggregates.
+    """
+    benchmark.group = "transform-methods"
+    transform = TransformData(backend="pandas")
+
+    result = benchmark(TRANSFORM_METHODS[method], transform, extract_contract, transform_contract)
+
+    assert len(result) > 0
+
+
+@pytest.mark.parametrize("engine", TransformData.ENGINES)
+def test_transform_engine(benchmark, extract_contract, engine):
+    """
+    Benchmark the whole pandas transform with each engine.
+    """
+    benchmark.group = "transform"
+    transform = TransformData(engine=engine, backend="pandas")
+
+    result = benchmark(transform.transform, extract_contract)
+
+    assert len(result.sales) > 0
+
+
+@pytest.mark.parametrize("backend", ["duckdb", "polars"])
+def test_transform_backend_files(benchmark, source_dir, backend):
+    """
+    Benchmark each out-of-core backend reading the source files directly.
+    """
+    pytest.importorskip(backend)
+    benchmark.group = "transform"
+    transform = TransformData(backend=backend)
+
+    result = benchmark(transform.transform_files, DataLoader(base_path=str(source_dir)).source_paths())
+
+    assert len(result.sales) > 0
+
+
+@pytest.mark.parametrize("partition_by", PartitionedTransformData.PARTITION_KEYS)
+def test_partitioned_transform(benchmark, extract_contract, partition_by):
+    """
+    Benchmark the multi-process transform with each partition key.
+    """
+    benchmark.group = "transform"
+    transform = PartitionedTransformData(partition_by, max_workers=2)
+
+    result = benchmark(transform.transform, extract_contract)
+
+    assert len(result.sales) > 0
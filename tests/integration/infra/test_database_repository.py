@@ -12,15 +12,17 @@ def setup_database_connection(setup_test_database):
     Fixture to set up a connection for the tests using the test database.
     """
     config = setup_test_database
-    DatabaseConnection.connection = psycopg2.connect(
+    DatabaseConnection.connect(config)
+    connection = psycopg2.connect(
         dbname=config["dbname"],
         user=config["user"],
         password=config["password"],
         host=config["host"],
         port=config["port"],
     )
-    yield DatabaseConnection.connection
-    DatabaseConnection.connection.close()
+    yield connection
+    connection.close()
+    DatabaseConnection.close()
 
 
 def test_create_table(setup_database_connection):
@@ -93,3 +95,27 @@ def test_insert_data_handles_exceptions(setup_database_connection):
     # Verifique se a exceção correta é lançada
     with pytest.raises(Exception, match="Erro ao carregar dados na tabela"):
         DatabaseRepository().insert_data(dataframe, "test_table")
+
+
+def test_insert_data_with_execute_values(setup_database_connection):
+    """
+    Test the `insert_data` method of `DatabaseRepository` using the `execute_values` fallback.
+    """
+    create_table_query = """
+    CREATE TABLE IF NOT EXISTS test_table (
+        id SERIAL PRIMARY KEY,
+        name TEXT NOT NULL,
+        age INTEGER NOT NULL
+    )
+    """
+    DatabaseRepository.create(create_table_query)
+
+    dataframe = pd.DataFrame({"name": ["Alice", "Bob"], "age": [25, 30]})
+
+    DatabaseRepository(load_method="values").insert_data(dataframe, "test_table")
+
+    with setup_database_connection.cursor() as cursor:
+        cursor.execute("SELECT COUNT(*) FROM test_table")
+        count = cursor.fetchone()[0]
+
+    assert count == len(dataframe), "Data was not inserted correctly."
@@ -0,0 +1,241 @@
+from dataclasses import fields
+
+import pandas as pd
+import psycopg2
+import pytest
+
+from src.driver.schemas import SOURCE_SCHEMAS
+from src.errors.load_error import LoadError
+from src.infra.database_connector import DatabaseConnection
+from src.infra.database_repository import DatabaseRepository
+from src.stages.contracts.transform_contract import TransformContract
+from src.stages.load.load_data import LoadData
+
+
+@pytest.fixture(scope="function")
+def setup_database_connection(setup_test_database):
+    """
+    Fixture to set up a connection for the tests using the test database.
+
+    The connection runs in autocommit mode, so that its reads do not hold locks on the partitions truncated
+    by the loads.
+    """
+    config = setup_test_database
+    DatabaseConnection.connect(config)
+    connection = psycopg2.connect(
+        dbname=config["dbname"],
+        user=config["user"],
+        password=config["password"],
+        host=config["host"],
+        port=config["port"],
+    )
+    connection.autocommit = True
+    yield connection
+    connection.close()
+    DatabaseConnection.close()
+
+
+def sales_velocity(dates, product="A"):
+    """Builds a `sales_velocity` chunk with one row per date (`None` for rows without a date)."""
+    return pd.DataFrame(
+        {
+            "DATA_VENDA": pd.to_datetime(dates),
+            "PRODUTO": [product] * len(dates),
+            "VENDA_PECAS": list(range(1, len(dates) + 1)),
+        }
+    )
+
+
+def rows_by_partition(connection):
+    """Counts the rows of `sales_velocity` stored in each partition."""
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT tableoid::regclass::text, COUNT(*) FROM sales_velocity GROUP BY 1")
+        return dict(cursor.fetchall())
+
+
+def row_count(connection, table_name):
+    """Counts the rows of a table."""
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
+        return cursor.fetchone()[0]
+
+
+def test_reload_truncates_only_the_loaded_months(setup_database_connection):
+    """
+    Test that the monthly and DEFAULT partitions are created on the first load and that a reload replaces only
+    the months present in the new data.
+    """
+    load_data = LoadData(repository=DatabaseRepository())
+
+    load_data.load_stream(iter([("sales_velocity", sales_velocity(["2024-06-01", "2024-06-30", "2024-07-15", None]))]))
+
+    assert rows_by_partition(setup_database_connection) == {
+        "sales_velocity_2024_06": 2,
+        "sales_velocity_2024_07": 1,
+        "sales_velocity_default": 1,
+    }
+
+    load_data.load_stream(iter([("sales_velocity", sales_velocity(["2024-06-10"], product="B"))]))
+
+    assert rows_by_partition(setup_database_connection) == {
+        "sales_velocity_2024_06": 1,
+        "sales_velocity_2024_07": 1,
+        "sales_velocity_default": 1,
+    }
+
+
+def test_failed_reload_keeps_the_loaded_month(setup_database_connection):
+    """
+    Test that a reload that fails after truncating a month rolls the truncate back.
+    """
+    load_data = LoadData(repository=DatabaseRepository())
+    load_data.load_stream(iter([("sales_velocity", sales_velocity(["2024-06-01", "2024-06-02"]))]))
+
+    invalid_chunk = sales_velocity(["2024-06-03"]).assign(COLUNA_INEXISTENTE=1)
+    with pytest.raises(LoadError):
+        load_data.load_stream(iter([("sales_velocity", invalid_chunk)]))
+
+    assert rows_by_partition(setup_database_connection) == {"sales_velocity_2024_06": 2}
+
+
+def test_unpartitioned_table_falls_back_to_delete(setup_database_connection):
+    """
+    Test that a table created before the partitioning keeps working, with the reloaded months deleted.
+    """
+    with setup_database_connection.cursor() as cursor:
+        cursor.execute(
+            "CREATE TABLE sales_velocity (DATA_VENDA DATE, PRODUTO VARCHAR(255), COR_PRODUTO VARCHAR(255), "
+            "VENDA_PECAS INT, VELOCIDADE_VENDA DECIMAL)"
+        )
+    load_data = LoadData(repository=DatabaseRepository())
+
+    for _ in range(2):
+        load_data.load_stream(iter([("sales_velocity", sales_velocity(["2024-06-01", "2024-07-01", None]))]))
+
+    assert rows_by_partition(setup_database_connection) == {"sales_velocity": 3}
+
+
+def sales_contract(rows):
+    """Builds a transform contract with only the `sales` rows `(DATA_VENDA, VENDA_PECAS)`."""
+    dates, quantities = zip(*rows)
+    sales = pd.DataFrame(
+        {
+            "DATA_VENDA": pd.to_datetime(dates),
+            "ID_FILIAL": [1] * len(rows),
+            "PRODUTO": ["A"] * len(rows),
+            "COR_PRODUTO": ["Azul"] * len(rows),
+            "TAMANHO": ["P"] * len(rows),
+            "VENDA_PECAS": list(quantities),
+            "VENDA_LIQUIDA": [10.0] * len(rows),
+            "VENDA_BRUTA": [12.0] * len(rows),
+        }
+    )
+    empty = pd.DataFrame()
+    contract = TransformContract(
+        sales=sales,
+        stock=empty,
+        store=empty,
+        products=empty,
+        available_stock=empty,
+        sales_velocity=empty,
+        sales_by_region=empty,
+    )
+    return contract, SOURCE_SCHEMAS["sales"].row_hashes(sales)
+
+
+def full_contract():
+    """Builds a transform contract with one valid row in every table."""
+    sales = sales_contract([("2024-06-01", 1)])[0].sales
+    return TransformContract(
+        sales=sales,
+        stock=pd.DataFrame(
+            {
+                "DATA_FOTO": pd.to_datetime(["2024-06-01"]),
+                "ID_FILIAL": [1],
+                "PRODUTO": ["A"],
+                "COR_PRODUTO": ["Azul"],
+                "TAMANHO": ["P"],
+                "TOTAL": [10],
+                "TRANSITO": [0],
+            }
+        ),
+        store=pd.DataFrame(
+            {
+                "ID_FILIAL": [1],
+                "LOJA": ["Loja 1"],
+                "PONTO_VENDA_COD": [1],
+                "PONTO_VENDA": ["PDV 1"],
+                "PUBLICO_LOJA": ["Adulto"],
+                "CANAL": ["Loja"],
+                "CIDADE": ["São Paulo"],
+                "LOJA_M2": [100],
+                "PAIS": ["BR"],
+                "UF": ["SP"],
+                "CLIMA": ["Tropical"],
+                "STATUS": ["Ativa"],
+            }
+        ),
+        products=pd.DataFrame(
+            {"ARTIGO_COR": ["A-Azul"], "ARTIGO": ["A"], "DESC_PRODUTO": ["Produto A"], "COLECAO": ["V24"]}
+        ),
+        available_stock=pd.DataFrame({"PRODUTO": ["A"], "COR_PRODUTO": ["Azul"], "ESTOQUE_DISPONIVEL": [10]}),
+        sales_velocity=sales.assign(ESTOQUE_DISPONIVEL=10, VELOCIDADE_VENDA=0.1),
+        sales_by_region=pd.DataFrame({"UF": ["SP"], "CIDADE": ["São Paulo"], "VENDA_PECAS": [1]}),
+    )
+
+
+def test_full_reload_keeps_the_row_counts(setup_database_connection):
+    """
+    Test that loading the same data twice replaces the rows of every table, including the tables without
+    partitions, instead of appending them again.
+    """
+    load_data = LoadData(repository=DatabaseRepository())
+    counts = []
+    for _ in range(2):
+        load_data.load(full_contract())
+        counts.append(
+            {item.name: row_count(setup_database_connection, item.name) for item in fields(TransformContract)}
+        )
+
+    assert counts[0] == counts[1] == {item.name: 1 for item in fields(TransformContract)}
+
+
+def test_load_marker_requires_loaded_tables(setup_database_connection):
+    """
+    Test that the key of the last full load is kept in the database and is no longer found once a loaded table
+    is emptied.
+    """
+    load_data = LoadData(repository=DatabaseRepository())
+    load_data.load(full_contract())
+    load_data.mark_loaded("key")
+    assert load_data.get_load_key() == "key"
+
+    with setup_database_connection.cursor() as cursor:
+        cursor.execute("TRUNCATE sales_by_region")
+    assert load_data.get_load_key() is None
+
+    load_data.forget_load()
+    with setup_database_connection.cursor() as cursor:
+        cursor.execute("SELECT COUNT(*) FROM etl_loads")
+        assert cursor.fetchone() == (0,)
+
+
+def test_watermark_rows_follow_the_high_water_mark(setup_database_connection):
+    """
+    Test that the hashes of the rows loaded on the high water mark date are added while the mark stays on the
+    same date and replaced when it moves forward.
+    """
+    load_data = LoadData(repository=DatabaseRepository())
+
+    first, first_hashes = sales_contract([("2024-06-01", 1), ("2024-06-02", 2)])
+    load_data.load_incremental(first)
+    assert set(load_data.get_loaded_row_hashes()["sales"]) == {first_hashes[1]}
+
+    late, late_hashes = sales_contract([("2024-06-02", 3)])
+    load_data.load_incremental(late)
+    assert set(load_data.get_loaded_row_hashes()["sales"]) == {first_hashes[1], late_hashes[0]}
+
+    following, following_hashes = sales_contract([("2024-06-03", 4)])
+    load_data.load_incremental(following)
+    assert set(load_data.get_loaded_row_hashes()["sales"]) == {following_hashes[0]}
+    assert load_data.get_high_water_marks()["sales"] == pd.Timestamp("2024-06-03")
@@ -0,0 +1,147 @@
+import json
+import os
+
+import pandas as pd
+import pytest
+
+from src.driver.visualization.reports_visualizer import ReportsVisualizer
+from src.driver.visualization.sales_by_group_visualizer import SalesByGroupVisualizer
+from src.stages.contracts.analyze_contract import AnalyzeContract
+
+FILE_NAMES = {
+    "top_10_regioes_com_mais_vendas.png",
+    "top_10_regioes_com_menos_vendas.png",
+    "top_10_produtos_maior_velocidade_venda.png",
+    "vendas_por_produto.png",
+    "vendas_por_filial.png",
+}
+
+
+@pytest.fixture
+def analyze_contract():
+    """
+    Fixture para fornecer os dados de todos os gráficos.
+    """
+    region = pd.DataFrame({"uf": ["SP", "RJ"], "cidade": ["São Paulo", "Rio de Janeiro"], "venda_pecas": [10, 5]})
+    return AnalyzeContract(
+        sales_velocity=pd.DataFrame(
+            {"produto": ["A", "B"], "cor_produto": ["Red", "Blue"], "avg_velocidade_venda": [0.5, 0.2]}
+        ),
+        sales_by_product=pd.DataFrame({"produto": ["A", "B"], "venda_pecas": [7, 8]}),
+        sales_by_branch=pd.DataFrame({"id_filial": [1, 2], "venda_pecas": [9, 6]}),
+        top_10_sales_by_region=region,
+        top_10_least_sales_by_region=region.iloc[::-1],
+        group_page_size=10,
+    )
+
+
+def modification_times(directory):
+    """Retorna o instante de modificação de cada gráfico."""
+    return {name: os.stat(os.path.join(directory, name)).st_mtime_ns for name in FILE_NAMES}
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_generate_reports_writes_every_chart(tmp_path, analyze_contract, max_workers):
+    """
+    Testa se todos os gráficos são gerados, no próprio processo ou no pool de processos.
+    """
+    ReportsVisualizer(output_directory=str(tmp_path), max_workers=max_workers).generate_reports(analyze_contract)
+
+    assert FILE_NAMES <= set(os.listdir(tmp_path))
+    assert ReportsVisualizer.CACHE_FILE_NAME in os.listdir(tmp_path)
+
+
+def test_generate_reports_skips_unchanged_charts(tmp_path, analyze_contract):
+    """
+    Testa se apenas os gráficos cujos dados mudaram são gerados novamente.
+    """
+    visualizer = ReportsVisualizer(output_directory=str(tmp_path), max_workers=1)
+    visualizer.generate_reports(analyze_contract)
+    before = modification_times(tmp_path)
+
+    analyze_contract.sales_by_product = pd.DataFrame({"produto": ["A", "B"], "venda_pecas": [7, 9]})
+    ReportsVisualizer(output_directory=str(tmp_path), max_workers=1).generate_reports(analyze_contract)
+    after = modification_times(tmp_path)
+
+    changed = {name for name in FILE_NAMES if after[name] != before[name]}
+    assert changed == {"vendas_por_produto.png"}
+
+
+def test_generate_reports_paginates_group_charts_with_the_contract_page_size(tmp_path, analyze_contract):
+    """
+    Testa se os gráficos por grupo são paginados com o tamanho de página do contrato e gerados novamente quando
+    ele muda, mesmo com os dados inalterados.
+    """
+    analyze_contract.sales_by_product = pd.DataFrame({"produto": list("ABCD"), "venda_pecas": [9, 8, 7, 6]})
+    analyze_contract.group_page_size = 2
+    ReportsVisualizer(output_directory=str(tmp_path), max_workers=1).generate_reports(analyze_contract)
+    assert "vendas_por_produto_pagina_2.png" in os.listdir(tmp_path)
+    before = modification_times(tmp_path)
+
+    analyze_contract.group_page_size = 4
+    ReportsVisualizer(output_directory=str(tmp_path), max_workers=1).generate_reports(analyze_contract)
+    after = modification_times(tmp_path)
+
+    changed = {name for name in FILE_NAMES if after[name] != before[name]}
+    assert changed == {"vendas_por_produto.png", "vendas_por_filial.png"}
+    assert "vendas_por_produto_pagina_2.png" not in os.listdir(tmp_path)
+
+
+def test_generate_reports_renders_removed_charts_again(tmp_path, analyze_contract, mocker):
+    """
+    Testa se um gráfico apagado é gerado novamente e se, sem cache, todos os gráficos são gerados.
+    """
+    visualizer = ReportsVisualizer(output_directory=str(tmp_path), max_workers=1)
+    visualizer.generate_reports(analyze_contract)
+    os.remove(tmp_path / "vendas_por_filial.png")
+    plot_branch = mocker.spy(SalesByGroupVisualizer, "plot_sales_by_branch")
+    plot_product = mocker.spy(SalesByGroupVisualizer, "plot_sales_by_product")
+
+    ReportsVisualizer(output_directory=str(tmp_path), max_workers=1).generate_reports(analyze_contract)
+    assert (plot_branch.call_count, plot_product.call_count) == (1, 0)
+
+    ReportsVisualizer(output_directory=str(tmp_path), max_workers=1, cache_enabled=False).generate_reports(
+        analyze_contract
+    )
+    assert (plot_branch.call_count, plot_product.call_count) == (2, 1)
+
+
+def test_generate_reports_renders_paginated_charts_with_a_missing_page_again(tmp_path, analyze_contract, mocker):
+    """
+    Testa se todas as páginas de um gráfico paginado são registradas no cache e se o gráfico é gerado novamente
+    quando uma página além da primeira é apagada.
+    """
+    analyze_contract.sales_by_product = pd.DataFrame({"produto": list("ABCD"), "venda_pecas": [9, 8, 7, 6]})
+    analyze_contract.group_page_size = 2
+    ReportsVisualizer(output_directory=str(tmp_path), max_workers=1).generate_reports(analyze_contract)
+    entries = json.loads((tmp_path / ReportsVisualizer.CACHE_FILE_NAME).read_text())
+    assert entries["vendas_por_produto.png"]["files"] == ["vendas_por_produto.png", "vendas_por_produto_pagina_2.png"]
+
+    os.remove(tmp_path / "vendas_por_produto_pagina_2.png")
+    plot_product = mocker.spy(SalesByGroupVisualizer, "plot_sales_by_product")
+    ReportsVisualizer(output_directory=str(tmp_path), max_workers=1).generate_reports(analyze_contract)
+
+    assert plot_product.call_count == 1
+    assert "vendas_por_produto_pagina_2.png" in os.listdir(tmp_path)
+
+
+def test_generate_reports_propagates_errors_after_saving_the_others(tmp_path, analyze_contract):
+    """
+    Testa se o erro de um gráfico é propagado e se os hashes dos demais são registrados.
+    """
+    analyze_contract.sales_by_branch = pd.DataFrame({"filial": [1]})
+    visualizer = ReportsVisualizer(output_directory=str(tmp_path), max_workers=2)
+
+    with pytest.raises(KeyError, match="id_filial"):
+        visualizer.generate_reports(analyze_contract)
+
+    hashes = pd.read_json(tmp_path / ReportsVisualizer.CACHE_FILE_NAME, typ="series")
+    assert set(hashes.index) == FILE_NAMES - {"vendas_por_filial.png"}
+
+
+def test_invalid_max_workers(tmp_path):
+    """
+    Testa se uma quantidade de workers inválida é rejeitada.
+    """
+    with pytest.raises(ValueError, match="workers dos relatórios"):
+        ReportsVisualizer(output_directory=str(tmp_path), max_workers=0)
@@ -30,7 +30,7 @@ def test_plot_sales_by_product(visualizer, vendas_df, mocker):
     """
     Testa a geração do gráfico de vendas por produto.
     """
-    mock_savefig = mocker.patch("matplotlib.pyplot.savefig")
+    mock_savefig = mocker.patch("matplotlib.figure.Figure.savefig")
 
     visualizer.plot_sales_by_product(vendas_df)
 
@@ -42,7 +42,7 @@ def test_plot_sales_by_branch(visualizer, vendas_df, mocker):
     """
     Testa a geração do gráfico de vendas por filial.
     """
-    mock_savefig = mocker.patch("matplotlib.pyplot.savefig")
+    mock_savefig = mocker.patch("matplotlib.figure.Figure.savefig")
 
     visualizer.plot_sales_by_branch(vendas_df)
 
@@ -54,10 +54,39 @@ def test_output_filenames(visualizer, vendas_df, mocker):
     """
     Verifica se os arquivos possuem os nomes esperados.
     """
-    mock_savefig = mocker.patch("matplotlib.pyplot.savefig")
+    mock_savefig = mocker.patch("matplotlib.figure.Figure.savefig")
 
     visualizer.plot_sales_by_product(vendas_df)
     mock_savefig.assert_any_call(visualizer.output_directory + "/vendas_por_produto.png")
 
     visualizer.plot_sales_by_branch(vendas_df)
     mock_savefig.assert_any_call(visualizer.output_directory + "/vendas_por_filial.png")
+
+
+def test_paginate_keeps_others_on_the_last_page(tmp_path):
+    """
+    Verifica se os dados são divididos em páginas e se a linha OUTROS fica na última página.
+    """
+    visualizer = SalesByGroupVisualizer(output_directory=str(tmp_path), page_size=2)
+    sales_df = pd.DataFrame({"produto": ["A", "B", "C", "D", "OUTROS"], "venda_pecas": [50, 40, 30, 20, 15]})
+
+    pages = visualizer.paginate(sales_df)
+
+    assert [list(page["produto"]) for page in pages] == [["A", "B"], ["C", "D", "OUTROS"]]
+
+
+def test_plot_sales_by_product_saves_one_file_per_page(tmp_path):
+    """
+    Verifica se cada página é salva em um arquivo e se as páginas que deixaram de existir são removidas.
+    """
+    stale_page = tmp_path / "vendas_por_produto_pagina_4.png"
+    stale_page.write_bytes(b"")
+    visualizer = SalesByGroupVisualizer(output_directory=str(tmp_path), page_size=2)
+    sales_df = pd.DataFrame({"produto": ["A", "B", "C", "D", "OUTROS"], "venda_pecas": [50, 40, 30, 20, 15]})
+
+    visualizer.plot_sales_by_product(sales_df)
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "vendas_por_produto.png",
+        "vendas_por_produto_pagina_2.png",
+    ]
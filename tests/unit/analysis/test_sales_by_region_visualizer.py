@@ -41,7 +41,7 @@ def test_plot_top_10_sales_by_region(visualizer, sales_by_region_df, mocker):
     """
     Testa a geração do gráfico das 10 regiões com mais vendas.
     """
-    mock_savefig = mocker.patch("matplotlib.pyplot.savefig")
+    mock_savefig = mocker.patch("matplotlib.figure.Figure.savefig")
 
     visualizer.plot_top_10_sales_by_region(sales_by_region_df)
 
@@ -53,7 +53,7 @@ def test_plot_top_10_least_sales_by_region(visualizer, sales_by_region_df, mocke
     """
     Testa a geração do gráfico das 10 regiões com menos vendas.
     """
-    mock_savefig = mocker.patch("matplotlib.pyplot.savefig")
+    mock_savefig = mocker.patch("matplotlib.figure.Figure.savefig")
 
     visualizer.plot_top_10_least_sales_by_region(sales_by_region_df)
 
@@ -65,7 +65,7 @@ def test_output_filenames(visualizer, sales_by_region_df, mocker):
     """
     Verifica se os arquivos possuem os nomes esperados.
     """
-    mock_savefig = mocker.patch("matplotlib.pyplot.savefig")
+    mock_savefig = mocker.patch("matplotlib.figure.Figure.savefig")
 
     visualizer.plot_top_10_sales_by_region(sales_by_region_df)
     mock_savefig.assert_any_call(f"{visualizer.output_directory}/top_10_regioes_com_mais_vendas.png")
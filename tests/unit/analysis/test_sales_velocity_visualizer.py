@@ -41,7 +41,7 @@ def test_plot_sales_velocity(visualizer, sales_velocity_df, mocker):
     """
     Testa a geração do gráfico de velocidade de vendas.
     """
-    mock_savefig = mocker.patch("matplotlib.pyplot.savefig")
+    mock_savefig = mocker.patch("matplotlib.figure.Figure.savefig")
 
     visualizer.plot_sales_velocity(sales_velocity_df)
 
@@ -53,7 +53,7 @@ def test_output_filename(visualizer, sales_velocity_df, mocker):
     """
     Verifica se o arquivo possui o nome esperado.
     """
-    mock_savefig = mocker.patch("matplotlib.pyplot.savefig")
+    mock_savefig = mocker.patch("matplotlib.figure.Figure.savefig")
 
     visualizer.plot_sales_velocity(sales_velocity_df)
 
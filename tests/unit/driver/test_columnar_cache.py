@@ -0,0 +1,108 @@
+import os
+
+import pandas as pd
+import pytest
+
+from src.driver.columnar_cache import ColumnarCache
+from src.driver.dataloader import DataLoader
+
+
+@pytest.fixture
+def source_file(tmp_path):
+    """Fixture que cria um arquivo de origem simples."""
+    file_path = tmp_path / "source.csv"
+    file_path.write_text("column1,column2\n1,a\n2,b\n")
+    return file_path
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Fixture que cria um cache colunar em um diretório temporário."""
+    return ColumnarCache(cache_dir=str(tmp_path / "cache"), max_bytes=10 * 1024**2)
+
+
+def test_put_and_get_preserve_dtypes(cache, source_file):
+    """Testa se o DataFrame recuperado do cache mantém os tipos originais."""
+    df = pd.DataFrame(
+        {
+            "UF": pd.Series(["SP", "RJ"], dtype="category"),
+            "VENDA_PECAS": pd.array([1, None], dtype="Int32"),
+            "DATA_VENDA": pd.to_datetime(["2024-06-09", "2024-06-10"]),
+        }
+    )
+    key = cache.key(source_file)
+
+    assert cache.get(key) is None
+    cache.put(key, df)
+
+    pd.testing.assert_frame_equal(cache.get(key), df)
+
+
+def test_iter_chunks(cache, source_file):
+    """Testa a leitura de uma entrada do cache em blocos."""
+    key = cache.key(source_file)
+    cache.put(key, pd.DataFrame({"column1": range(5)}))
+
+    chunks = list(cache.iter_chunks(key, chunk_size=2))
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+
+
+def test_key_changes_with_content_and_variant(cache, source_file):
+    """Testa se a chave muda quando o conteúdo do arquivo ou a variante de leitura mudam."""
+    key = cache.key(source_file)
+
+    assert cache.key(source_file, variant="outro esquema") != key
+
+    source_file.write_text("column1,column2\n3,c\n")
+    assert cache.key(source_file) != key
+
+
+def test_key_reuses_hash_for_unchanged_file(cache, source_file):
+    """Testa se o hash do conteúdo vem do manifesto quando tamanho e mtime não mudaram."""
+    key = cache.key(source_file)
+    stat = source_file.stat()
+
+    source_file.write_text("column1,column2\n3,c\n4,d\n")
+    os.utime(source_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert cache.key(source_file) == key
+
+
+def test_refresh_ignores_existing_entries(tmp_path, source_file):
+    """Testa se o modo de atualização ignora as entradas já armazenadas."""
+    cache = ColumnarCache(cache_dir=str(tmp_path / "cache"))
+    key = cache.key(source_file)
+    cache.put(key, pd.DataFrame({"column1": [1]}))
+
+    refreshing_cache = ColumnarCache(cache_dir=str(tmp_path / "cache"), refresh=True)
+
+    assert refreshing_cache.get(key) is None
+    assert refreshing_cache.iter_chunks(key, chunk_size=1) is None
+
+
+def test_evict_removes_least_recently_used_entries(tmp_path):
+    """Testa se as entradas usadas há mais tempo são removidas quando o limite é excedido."""
+    cache = ColumnarCache(cache_dir=str(tmp_path / "cache"), max_bytes=10 * 1024**2)
+    df = pd.DataFrame({"column1": range(1000)})
+    cache.put("old", df)
+    cache.put("new", df)
+    os.utime(cache.cache_dir / "old.parquet", (0, 0))
+
+    cache.max_bytes = (cache.cache_dir / "new.parquet").stat().st_size
+    cache.evict()
+
+    assert not (cache.cache_dir / "old.parquet").exists()
+    assert (cache.cache_dir / "new.parquet").exists()
+
+
+def test_data_loader_serves_cached_source(tmp_path, source_file, cache, mocker):
+    """Testa se o DataLoader lê o CSV apenas uma vez quando o cache está configurado."""
+    data_loader = DataLoader(base_path=str(tmp_path), cache=cache)
+    read_csv = mocker.spy(pd, "read_csv")
+
+    first = data_loader.load_csv("source.csv")
+    second = data_loader.load_csv("source.csv")
+
+    assert read_csv.call_count == 1
+    pd.testing.assert_frame_equal(first, second)
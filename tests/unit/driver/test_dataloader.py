@@ -1,12 +1,47 @@
+import gzip
+import threading
 from pathlib import Path
 
 import pandas as pd
 import pytest
 
 from src.driver.dataloader import DataLoader
+from src.driver.source_discovery import DateRange
+from src.errors.schema_error import SchemaError
 
 MOCK_CSV_DATA = pd.DataFrame({"column1": [1, 2, 3], "column2": ["a", "b", "c"]})
 
+SOURCE_FILES = {
+    "estoque_hering.csv": (
+        "DATA_FOTO,ID_FILIAL,PRODUTO,COR_PRODUTO,TAMANHO,TOTAL,TRANSITO\n"
+        "2024-06-09,10709,KFRB,1BSN,M,10,2\n"
+        "2024-06-10,10709,KFRB,1BSN,G,5,0\n"
+    ),
+    "lojas_hering.csv": (
+        "ID_FILIAL,LOJA,PONTO_VENDA_COD,PONTO_VENDA,PUBLICO_LOJA,CANAL,CIDADE,LOJA_M2,PAIS,UF,CLIMA,STATUS\n"
+        "10115,Loja Ipanema,214,214:Rua Visconde De Piraja,A,Lojas,RIO DE JANEIRO,129,BR,RJ,Quente,INACTIVE\n"
+        "10392,Puc Shopping Garten,,,,Lojas,JOINVILLE,44,BR,SC,Fria,INACTIVE\n"
+    ),
+    "produtos_hering.csv": (
+        "ARTIGO_COR,ARTIGO,DESC_PRODUTO,COR,COR_DESCRICAO,NEGOCIO,PARTE,GRUPO,GENERO,COD_COTA,COLECAO,PIRAMIDE\n"
+        "0995CTHKM,0995,PACOTE HK M,GER,PACOTE DZ M,HERING KIDS,,,,424,VERAO 2024,CORE\n"
+        "0995CTHKM,0995,PACOTE HK M,GER,PACOTE DZ M,HERING KIDS,,,,124,OUTONO 2024,CORE\n"
+    ),
+    "vendas_hering.csv": (
+        "DATA_VENDA,ID_FILIAL,PRODUTO,COR_PRODUTO,TAMANHO,VENDA_PECAS,VENDA_LIQUIDA,VENDA_BRUTA\n"
+        "2024-06-09,10709,KFRB,1BSN,M,1,32.86,35.99\n"
+        "2024-06-10,10709,KFRB,1BSN,G,2,65.72,71.98\n"
+    ),
+}
+
+
+@pytest.fixture
+def source_files(tmp_path):
+    """Fixture that writes one small CSV file per registered source schema."""
+    for file_name, content in SOURCE_FILES.items():
+        (tmp_path / file_name).write_text(content)
+    return tmp_path
+
 
 @pytest.fixture
 def data_loader(mocker):
@@ -49,19 +84,181 @@ def test_data_loader_load_csv_file_not_found(mocker, data_loader):
     mock_exists_file.assert_called_once()
 
 
-def test_data_loader_extract_all(mocker, data_loader):
-    """Test that extract_all loads multiple predefined CSV files."""
-    mock_read_csv = mocker.patch("pandas.read_csv", return_value=MOCK_CSV_DATA)
-
-    mock_exists_file = mocker.patch.object(Path, "exists", return_value=True)
-
-    data = data_loader.extract_all()
+def test_data_loader_extract_all(source_files):
+    """Test that extract_all loads multiple predefined CSV files with their schemas."""
+    data = DataLoader(base_path=str(source_files)).extract_all()
 
     assert len(data) == 4
     for key in ["stock", "products", "store", "sales"]:
         assert key in data
         assert isinstance(data[key], pd.DataFrame)
-        assert data[key].equals(MOCK_CSV_DATA)
+        assert len(data[key]) == 2
+
+    assert data["sales"]["PRODUTO"].dtype == "category"
+    assert data["sales"]["ID_FILIAL"].dtype == "int32"
+    assert pd.api.types.is_datetime64_any_dtype(data["sales"]["DATA_VENDA"])
+    assert pd.api.types.is_datetime64_any_dtype(data["stock"]["DATA_FOTO"])
+    assert data["store"]["UF"].dtype == "category"
+    assert data["store"]["PONTO_VENDA_COD"].isna().sum() == 1
+
+
+def test_data_loader_extract_all_in_parallel(mocker, source_files):
+    """Test that extract_all reads the files at the same time and returns the same data as a sequential read."""
+    sequential = DataLoader(base_path=str(source_files), max_workers=1).extract_all()
+    loader = DataLoader(base_path=str(source_files), max_workers=4)
+    all_files_started = threading.Barrier(len(DataLoader.FILE_NAMES), timeout=5)
+    load_csv = loader.load_csv
+
+    def wait_for_the_other_files(*args):
+        all_files_started.wait()
+        return load_csv(*args)
+
+    mocker.patch.object(loader, "load_csv", side_effect=wait_for_the_other_files)
+
+    data = loader.extract_all()
+
+    assert list(data) == list(sequential)
+    for key, df in sequential.items():
+        pd.testing.assert_frame_equal(data[key], df)
+
+
+def test_data_loader_extract_all_in_parallel_propagates_errors(source_files):
+    """Test that an error reading one of the files is raised by the parallel extract_all."""
+    (source_files / "lojas_hering.csv").unlink()
+
+    with pytest.raises(FileNotFoundError, match="lojas_hering.csv"):
+        DataLoader(base_path=str(source_files), max_workers=4).extract_all()
+
+
+def test_data_loader_load_csv_missing_schema_column(source_files):
+    """Test that load_csv fails fast when a file lacks a column of its schema."""
+    pd.read_csv(source_files / "vendas_hering.csv").drop(columns=["TAMANHO"]).to_csv(
+        source_files / "vendas_hering.csv", index=False
+    )
+
+    with pytest.raises(SchemaError, match="TAMANHO"):
+        DataLoader(base_path=str(source_files)).load_csv("vendas_hering.csv")
+
+
+def test_data_loader_load_csv_invalid_schema_value(source_files):
+    """Test that load_csv fails fast when a value does not match its schema type."""
+    (source_files / "vendas_hering.csv").write_text(
+        "DATA_VENDA,ID_FILIAL,PRODUTO,COR_PRODUTO,TAMANHO,VENDA_PECAS,VENDA_LIQUIDA,VENDA_BRUTA\n"
+        "2024-06-09,loja,KFRB,1BSN,M,1,32.86,35.99\n"
+    )
+
+    with pytest.raises(SchemaError, match="não corresponde ao esquema"):
+        DataLoader(base_path=str(source_files)).load_csv("vendas_hering.csv")
+
+
+def test_data_loader_load_csv_invalid_date(source_files):
+    """Test that load_csv fails fast when a date column cannot be parsed."""
+    (source_files / "vendas_hering.csv").write_text(
+        "DATA_VENDA,ID_FILIAL,PRODUTO,COR_PRODUTO,TAMANHO,VENDA_PECAS,VENDA_LIQUIDA,VENDA_BRUTA\n"
+        "09/06/2024x,10709,KFRB,1BSN,M,1,32.86,35.99\n"
+    )
+
+    with pytest.raises(SchemaError, match="DATA_VENDA"):
+        DataLoader(base_path=str(source_files)).load_csv("vendas_hering.csv")
+
+
+def test_data_loader_load_csv_chunks(tmp_path):
+    """Test that load_csv_chunks yields fixed-size chunks of the file."""
+    pd.DataFrame({"column1": range(5), "column2": list("abcde")}).to_csv(tmp_path / "file.csv", index=False)
+    data_loader = DataLoader(base_path=str(tmp_path))
+
+    chunks = list(data_loader.load_csv_chunks("file.csv", chunk_size=2))
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert pd.concat(chunks)["column1"].tolist() == [0, 1, 2, 3, 4]
+
+
+def test_data_loader_load_csv_chunks_file_not_found(mocker, data_loader):
+    """Test that load_csv_chunks fails before any chunk is consumed when the file does not exist."""
+    mocker.patch.object(Path, "exists", return_value=False)
+
+    with pytest.raises(FileNotFoundError, match="Arquivo não encontrado: mock_data/mock_file.csv"):
+        data_loader.load_csv_chunks("mock_file.csv", chunk_size=10)
+
+
+def test_data_loader_extract_all_chunks(source_files):
+    """Test that extract_all_chunks returns one typed chunk iterator per predefined file."""
+    data = DataLoader(base_path=str(source_files)).extract_all_chunks(chunk_size=1)
+
+    assert set(data) == {"stock", "products", "store", "sales"}
+    sales_chunks = list(data["sales"])
+    assert len(sales_chunks) == 2
+    assert all(pd.api.types.is_datetime64_any_dtype(chunk["DATA_VENDA"]) for chunk in sales_chunks)
+
+
+@pytest.fixture
+def partitioned_files(source_files):
+    """Fixture that moves the sales into gzip-compressed monthly partitions, one of them outside June."""
+    (source_files / "vendas_hering.csv").unlink()
+    header = "DATA_VENDA,ID_FILIAL,PRODUTO,COR_PRODUTO,TAMANHO,VENDA_PECAS,VENDA_LIQUIDA,VENDA_BRUTA\n"
+    partitions = {
+        "2024-05": "2024-05-31,10709,KFRA,2ASN,P,3,90.00,99.00\n",
+        "2024-06": "2024-06-09,10709,KFRB,1BSN,M,1,32.86,35.99\n2024-06-10,10709,KFRB,1BSN,G,2,65.72,71.98\n",
+    }
+    for month, rows in partitions.items():
+        (source_files / "vendas" / month).mkdir(parents=True)
+        with gzip.open(source_files / "vendas" / month / "parte-1.csv.gz", "wt") as file:
+            file.write(header + rows)
+    return source_files
+
+
+def test_data_loader_extract_all_partitioned_compressed_files(partitioned_files):
+    """Test that extract_all joins the compressed partitions of a source, keeping the schema dtypes."""
+    loader = DataLoader(base_path=str(partitioned_files))
+
+    data = loader.extract_all()
+
+    assert [path.parent.name for path in loader.source_paths()["sales"]] == ["2024-05", "2024-06"]
+    assert data["sales"]["PRODUTO"].tolist() == ["KFRA", "KFRB", "KFRB"]
+    assert data["sales"]["PRODUTO"].dtype == "category"
+    assert data["sales"]["ID_FILIAL"].dtype == "int32"
+
+
+def test_data_loader_prunes_partitions_outside_the_date_range(mocker, partitioned_files):
+    """Test that a date range skips the partitions of other months without reading them."""
+    loader = DataLoader(base_path=str(partitioned_files), date_range=DateRange.parse("2024-06-01", "2024-06-30"))
+    read_csv = mocker.spy(pd, "read_csv")
+
+    data = loader.extract_all()
+
+    read_files = {str(call.args[0]) for call in read_csv.call_args_list}
+    assert not any("2024-05" in file_name for file_name in read_files)
+    assert data["sales"]["DATA_VENDA"].dt.month.unique().tolist() == [6]
+    assert len(data["stock"]) == 2
+
+
+def test_data_loader_prunes_partitions_before_the_high_water_marks(mocker, partitioned_files):
+    """Test that the partitions ending before the high water mark of a source are skipped without being read."""
+    loader = DataLoader(base_path=str(partitioned_files))
+    read_csv = mocker.spy(pd, "read_csv")
+
+    data = loader.extract_all({"sales": pd.Timestamp("2024-06-10")})
+
+    read_files = {str(call.args[0]) for call in read_csv.call_args_list}
+    assert not any("2024-05" in file_name for file_name in read_files)
+    assert data["sales"]["DATA_VENDA"].dt.day.tolist() == [9, 10]
+
+
+def test_data_loader_filters_single_files_by_date_range(source_files):
+    """Test that the rows of a single-file source are filtered by the date range, in batches and in chunks."""
+    loader = DataLoader(base_path=str(source_files), date_range=DateRange.parse("2024-06-10", ""))
+
+    sales = loader.extract_all()["sales"]
+    chunks = list(loader.extract_all_chunks(chunk_size=1)["sales"])
+
+    assert sales["DATA_VENDA"].tolist() == [pd.Timestamp("2024-06-10")]
+    assert [chunk["DATA_VENDA"].tolist() for chunk in chunks] == [[pd.Timestamp("2024-06-10")]]
+    assert len(loader.extract_all()["products"]) == 2
+
+
+def test_data_loader_no_partition_in_date_range(partitioned_files):
+    """Test that a date range without any partition of a source is reported as missing files."""
+    loader = DataLoader(base_path=str(partitioned_files), date_range=DateRange.parse("2023-01-01", "2023-01-31"))
 
-    assert mock_read_csv.call_count == 4
-    mock_exists_file.assert_called()
+    with pytest.raises(FileNotFoundError, match="Nenhuma partição"):
+        loader.extract_all()
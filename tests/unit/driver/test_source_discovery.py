@@ -0,0 +1,97 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from src.driver.schemas import SOURCE_SCHEMAS
+from src.driver.source_discovery import DateRange, SourceDiscovery
+
+
+@pytest.mark.parametrize(
+    "relative_path, expected",
+    [
+        ("2024-06/parte-1.csv.zst", ("2024-06-01", "2024-06-30")),
+        ("2024-02/data=2024-02-29/parte-1.csv", ("2024-02-29", "2024-02-29")),
+        ("vendas_2024-12.csv.gz", ("2024-12-01", "2024-12-31")),
+    ],
+)
+def test_partition_period(relative_path, expected):
+    """Test that the innermost date of a file path defines the period of its partition."""
+    first, last = SourceDiscovery.partition_period(Path(relative_path))
+
+    assert (first, last) == (pd.Timestamp(expected[0]), pd.Timestamp(expected[1]))
+
+
+def test_partition_period_without_date():
+    """Test that files without a date in their path have no partition period."""
+    assert SourceDiscovery.partition_period(Path("historico/parte-1.csv")) is None
+
+
+def test_find_prefers_the_partitioned_directory(tmp_path):
+    """Test that the partitioned directory wins over the single file and that only CSV files are listed."""
+    (tmp_path / "vendas_hering.csv").write_text("")
+    (tmp_path / "vendas" / "2024-06").mkdir(parents=True)
+    for name in ["parte-2.csv.zst", "parte-1.csv.gz", "_SUCCESS", ".parte-3.csv.gz"]:
+        (tmp_path / "vendas" / "2024-06" / name).write_text("")
+
+    files = SourceDiscovery(tmp_path).find(SOURCE_SCHEMAS["sales"])
+
+    assert [path.name for path in files] == ["parte-1.csv.gz", "parte-2.csv.zst"]
+
+
+def test_find_compressed_single_file(tmp_path):
+    """Test that a single compressed file is found when the plain CSV does not exist."""
+    (tmp_path / "lojas_hering.csv.gz").write_text("")
+
+    assert SourceDiscovery(tmp_path).find(SOURCE_SCHEMAS["store"]) == [tmp_path / "lojas_hering.csv.gz"]
+
+    with pytest.raises(FileNotFoundError, match="Arquivo não encontrado"):
+        SourceDiscovery(tmp_path).find(SOURCE_SCHEMAS["products"])
+
+
+def test_find_keeps_every_partition_of_sources_without_date(tmp_path):
+    """Test that the date range does not prune sources without a date column."""
+    (tmp_path / "produtos" / "2023-01").mkdir(parents=True)
+    (tmp_path / "produtos" / "2023-01" / "catalogo.csv").write_text("")
+
+    files = SourceDiscovery(tmp_path, DateRange.parse("2024-06-01", "2024-06-30")).find(SOURCE_SCHEMAS["products"])
+
+    assert len(files) == 1
+
+
+def test_find_prunes_partitions_before_since(tmp_path):
+    """
+    Test that partitions ending before `since` are skipped, that undated files are kept and that the last
+    partition is kept when none reaches `since`.
+    """
+    for name in ["2024-05/parte-1.csv", "2024-06/parte-1.csv", "historico/parte-1.csv"]:
+        (tmp_path / "vendas" / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / "vendas" / name).write_text("")
+    discovery = SourceDiscovery(tmp_path)
+
+    files = discovery.find(SOURCE_SCHEMAS["sales"], since=pd.Timestamp("2024-06-30"))
+    assert [path.parent.name for path in files] == ["2024-06", "historico"]
+
+    (tmp_path / "vendas" / "historico" / "parte-1.csv").unlink()
+    files = discovery.find(SOURCE_SCHEMAS["sales"], since=pd.Timestamp("2024-07-01"))
+    assert [path.parent.name for path in files] == ["2024-06"]
+
+
+def test_date_range_filter():
+    """Test that both limits of the date range are inclusive, whatever the time of the day."""
+    df = pd.DataFrame(
+        {"DATA_VENDA": pd.to_datetime(["2024-05-31", "2024-06-01", "2024-06-30 18:00", "2024-07-01"], format="ISO8601")}
+    )
+
+    filtered = DateRange.parse("2024-06-01", "2024-06-30").filter(df, "DATA_VENDA")
+
+    assert filtered["DATA_VENDA"].dt.day.tolist() == [1, 30]
+    assert DateRange().filter(df, "DATA_VENDA") is df
+
+
+def test_date_range_parse_errors():
+    """Test that invalid dates and inverted ranges are rejected."""
+    with pytest.raises(ValueError, match="Intervalo de datas inválido"):
+        DateRange.parse("2024-13-01", "")
+    with pytest.raises(ValueError, match="anterior à data inicial"):
+        DateRange.parse("2024-06-30", "2024-06-01")
@@ -0,0 +1,98 @@
+import pandas as pd
+import pytest
+
+from src.driver.stage_cache import StageCache
+from src.stages.contracts.extract_contract import ExtractContract
+
+
+@pytest.fixture
+def cache(tmp_path, mocker):
+    """Fixture que cria um cache das etapas cuja versão do código depende de um único arquivo."""
+    code_file = tmp_path / "stage.py"
+    code_file.write_text("VERSION = 1\n")
+    mocker.patch.dict(StageCache.STAGE_SOURCES, {"extract": (str(code_file),)})
+    return StageCache(cache_dir=str(tmp_path / "cache"), max_bytes=10 * 1024**2)
+
+
+@pytest.fixture
+def extract_contract():
+    """Fixture com um contrato de extração com tipos variados."""
+    sales = pd.DataFrame(
+        {
+            "DATA_VENDA": pd.to_datetime(["2024-06-09", "2024-06-10"]),
+            "PRODUTO": pd.Series(["A", "B"], dtype="category"),
+            "VENDA_PECAS": pd.array([1, None], dtype="Int32"),
+        }
+    )
+    other = pd.DataFrame({"ID_FILIAL": [1, 2]})
+    return ExtractContract(sales=sales, stock=other, store=other, products=other)
+
+
+def test_put_and_get_contract_preserve_dtypes(cache, extract_contract):
+    """Testa se o contrato recuperado do cache mantém os DataFrames e os tipos originais."""
+    assert cache.get_contract("key", ExtractContract) is None
+
+    cache.put_contract("key", extract_contract)
+    cached = cache.get_contract("key", ExtractContract)
+
+    pd.testing.assert_frame_equal(cached.sales, extract_contract.sales)
+    pd.testing.assert_frame_equal(cached.products, extract_contract.products)
+
+
+def test_contract_with_an_evicted_frame_is_a_miss(cache, extract_contract):
+    """Testa se um contrato com algum DataFrame removido pela política LRU deixa de ser encontrado."""
+    cache.put_contract("key", extract_contract)
+    (cache.cache_dir / "key-stock.parquet").unlink()
+
+    assert cache.get_contract("key", ExtractContract) is None
+
+
+def test_eviction_removes_least_recently_used_contracts(tmp_path, extract_contract):
+    """Testa se os contratos usados há mais tempo são removidos quando o cache ultrapassa o limite."""
+    cache = StageCache(cache_dir=str(tmp_path / "cache"), max_bytes=1)
+
+    cache.put_contract("old", extract_contract)
+    cache.put_contract("new", extract_contract)
+
+    assert cache.get_contract("old", ExtractContract) is None
+    assert not list(cache.cache_dir.glob("old-*.parquet"))
+
+
+def test_stage_key_depends_on_files_code_and_inputs(cache, tmp_path):
+    """Testa se a chave de uma etapa muda com o conteúdo das fontes, o código da etapa e a configuração."""
+    source = tmp_path / "vendas.csv"
+    source.write_text("A\n1\n")
+    key = cache.stage_key("extract", cache.files_key({"sales": [source]}), "vectorized")
+
+    assert cache.stage_key("extract", cache.files_key({"sales": [source]}), "vectorized") == key
+    assert cache.stage_key("extract", cache.files_key({"sales": [source]}), "legacy") != key
+
+    (tmp_path / "stage.py").write_text("VERSION = 2\n")
+    code_key = cache.stage_key("extract", cache.files_key({"sales": [source]}), "vectorized")
+    assert code_key != key
+
+    source.write_text("A\n2\n")
+    assert cache.stage_key("extract", cache.files_key({"sales": [source]}), "vectorized") != code_key
+
+
+def test_refresh_ignores_cached_stages(cache, extract_contract):
+    """Testa se, com `refresh` (`--no-cache`), nenhuma etapa é reaproveitada."""
+    cache.put_contract("key", extract_contract)
+
+    refreshed = StageCache(cache_dir=str(cache.cache_dir), refresh=True)
+
+    assert refreshed.get_contract("key", ExtractContract) is None
+
+
+def test_put_contract_stores_mixed_text_columns_as_text(cache, extract_contract):
+    """Testa se as colunas de texto preenchidas com `0` pela limpeza são gravadas como texto."""
+    store = pd.DataFrame({"UF": pd.Series(["SP", 0, None], dtype="category"), "ID_FILIAL": [1, 2, 3]})
+    extract_contract.store = store
+
+    cache.put_contract("key", extract_contract)
+    cached = cache.get_contract("key", ExtractContract)
+
+    assert cached.store["UF"].tolist()[:2] == ["SP", "0"]
+    assert cached.store["UF"].isna().tolist() == [False, False, True]
+    assert isinstance(cached.store["UF"].dtype, pd.CategoricalDtype)
+    assert store["UF"].tolist()[1] == 0
@@ -0,0 +1,133 @@
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import date
+from decimal import Decimal
+
+import pandas as pd
+import pytest
+
+from src.infra.async_database_connector import AsyncDatabaseConnection
+from src.infra.async_database_repository import AsyncDatabaseRepository
+
+COLUMN_TYPES = [
+    {"column_name": "data_venda", "data_type": "date"},
+    {"column_name": "id_filial", "data_type": "integer"},
+    {"column_name": "cor_produto", "data_type": "character varying"},
+    {"column_name": "venda_liquida", "data_type": "numeric"},
+]
+
+
+@pytest.fixture
+def mock_connection(mocker):
+    """Mocka a conexão assíncrona retirada do pool de conexões."""
+    connection = mocker.MagicMock()
+    for method in ("execute", "executemany", "fetch", "prepare", "copy_records_to_table"):
+        setattr(connection, method, mocker.AsyncMock(name=method))
+    connection.fetch.return_value = COLUMN_TYPES
+
+    @asynccontextmanager
+    async def get_connection():
+        yield connection
+
+    mocker.patch.object(AsyncDatabaseConnection, "get_connection", get_connection)
+    return connection
+
+
+@pytest.fixture
+def dataframe():
+    return pd.DataFrame(
+        {
+            "DATA_VENDA": pd.to_datetime(["2024-12-01", "2024-12-02", "2024-12-03"]),
+            "ID_FILIAL": [1.0, 2.0, None],
+            "COR_PRODUTO": pd.Categorical(["Azul", 0, "Verde"]),
+            "VENDA_LIQUIDA": [32.86, 10.5, 7.0],
+        }
+    )
+
+
+def test_to_positional_numbers_parameters_by_first_occurrence():
+    """Testa a conversão dos parâmetros `%(nome)s` em parâmetros posicionais."""
+    sql, args = AsyncDatabaseRepository._to_positional(
+        "SELECT * FROM t WHERE a < %(limit)s AND b = %(name)s AND c < %(limit)s AND d LIKE 'x%%'",
+        {"limit": 10, "name": "SP", "unused": True},
+    )
+
+    assert sql == "SELECT * FROM t WHERE a < $1 AND b = $2 AND c < $1 AND d LIKE 'x%'"
+    assert args == [10, "SP"]
+    assert AsyncDatabaseRepository._to_positional("SELECT 'x%%'", None) == ("SELECT 'x%%'", [])
+
+
+def test_to_records_converts_values_to_column_types(dataframe):
+    """Testa se os valores são convertidos para os tipos Python das colunas de destino."""
+    types = {row["column_name"]: row["data_type"] for row in COLUMN_TYPES}
+
+    records = AsyncDatabaseRepository._to_records(dataframe, types)
+
+    assert records == [
+        (date(2024, 12, 1), 1, "Azul", Decimal("32.86")),
+        (date(2024, 12, 2), 2, "0", Decimal("10.5")),
+        (date(2024, 12, 3), None, "Verde", Decimal("7.0")),
+    ]
+    assert [type(value) for value in records[0]] == [date, int, str, Decimal]
+
+
+def test_insert_data_uses_binary_copy_in_chunks(mock_connection, dataframe):
+    """Testa se a carga usa o COPY binário, em blocos, com as colunas em minúsculas."""
+    repository = AsyncDatabaseRepository(load_method="copy", copy_chunk_size=2)
+
+    asyncio.run(repository.insert_data(dataframe, "sales"))
+    asyncio.run(repository.insert_data(dataframe, "sales"))
+
+    assert mock_connection.copy_records_to_table.await_count == 4
+    call = mock_connection.copy_records_to_table.await_args_list[0]
+    assert call.args == ("sales",)
+    assert call.kwargs["columns"] == ["data_venda", "id_filial", "cor_produto", "venda_liquida"]
+    assert len(call.kwargs["records"]) == 2
+    mock_connection.fetch.assert_awaited_once()
+    mock_connection.executemany.assert_not_awaited()
+
+
+def test_insert_data_falls_back_to_executemany(mock_connection, dataframe):
+    """Testa se a carga é refeita com executemany quando o COPY falha."""
+    mock_connection.copy_records_to_table.side_effect = Exception("COPY falhou")
+
+    asyncio.run(AsyncDatabaseRepository(load_method="copy").insert_data(dataframe, "sales"))
+
+    mock_connection.executemany.assert_awaited_once()
+    query, records = mock_connection.executemany.await_args.args
+    assert query == "INSERT INTO sales (data_venda, id_filial, cor_produto, venda_liquida) VALUES ($1, $2, $3, $4)"
+    assert len(records) == 3
+
+
+def test_insert_data_failure(mock_connection, dataframe):
+    """Testa se uma falha em todos os métodos de carga levanta uma exceção."""
+    mock_connection.executemany.side_effect = Exception("INSERT falhou")
+
+    with pytest.raises(Exception, match="Erro ao carregar dados na tabela"):
+        asyncio.run(AsyncDatabaseRepository(load_method="values").insert_data(dataframe, "sales"))
+
+
+def test_find_runs_a_prepared_statement(mock_connection, mocker):
+    """Testa se a consulta é preparada e executada com os parâmetros posicionais."""
+    statement = mocker.MagicMock()
+    statement.fetch = mocker.AsyncMock(return_value=[("A", 10), ("B", 5)])
+    statement.get_attributes.return_value = [mocker.Mock(), mocker.Mock()]
+    statement.get_attributes.return_value[0].name = "produto"
+    statement.get_attributes.return_value[1].name = "venda_pecas"
+    mock_connection.prepare.return_value = statement
+
+    result = asyncio.run(
+        AsyncDatabaseRepository().find("SELECT * FROM mv LIMIT %(top_n)s", params={"top_n": 2}, timeout=5)
+    )
+
+    mock_connection.prepare.assert_awaited_once_with("SELECT * FROM mv LIMIT $1", timeout=5)
+    statement.fetch.assert_awaited_once_with(2, timeout=5)
+    assert result.to_dict("list") == {"produto": ["A", "B"], "venda_pecas": [10, 5]}
+
+
+def test_execute_wraps_errors(mock_connection):
+    """Testa se os erros dos comandos são propagados com uma mensagem descritiva."""
+    mock_connection.execute.side_effect = Exception("sintaxe")
+
+    with pytest.raises(Exception, match="Erro ao executar o comando SQL: sintaxe"):
+        asyncio.run(AsyncDatabaseRepository().execute("ANALYZE sales"))
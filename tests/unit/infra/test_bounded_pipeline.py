@@ -0,0 +1,110 @@
+import threading
+import time
+
+import pytest
+
+from src.infra.bounded_pipeline import BoundedPipeline
+
+
+def test_stages_deliver_items_in_order():
+    """
+    Test that chained stages deliver every item, in order, and count them.
+    """
+    with BoundedPipeline(queue_size=2, poll_interval=0.01) as pipeline:
+        numbers = pipeline.stage(range(10), "read")
+        squares = pipeline.stage((number * number for number in numbers), "transform")
+        result = list(squares)
+
+    assert result == [number * number for number in range(10)]
+    assert pipeline.stats["read"].items == 10
+    assert pipeline.stats["transform"].items == 10
+
+
+def test_next_item_is_produced_while_the_previous_one_is_consumed():
+    """
+    Test that the producer runs ahead of the consumer, overlapping both stages.
+    """
+    second_item_produced = threading.Event()
+
+    def produce():
+        yield 1
+        yield 2
+        second_item_produced.set()
+        yield 3
+
+    with BoundedPipeline(queue_size=2, poll_interval=0.01) as pipeline:
+        items = pipeline.stage(produce(), "read")
+        assert next(items) == 1
+        assert second_item_produced.wait(timeout=5)
+        assert list(items) == [2, 3]
+
+
+def test_full_queue_blocks_the_producer():
+    """
+    Test the backpressure: a producer never runs more than the queue size (plus the item it holds) ahead.
+    """
+    produced = []
+
+    def produce():
+        for number in range(10):
+            produced.append(number)
+            yield number
+
+    with BoundedPipeline(queue_size=2, poll_interval=0.01) as pipeline:
+        items = pipeline.stage(produce(), "read")
+        time.sleep(0.3)
+        assert len(produced) == 3
+        assert list(items) == list(range(10))
+
+
+def test_stage_errors_reach_the_final_consumer():
+    """
+    Test that an error raised by the first stage goes through the next stages after the items produced before it.
+    """
+
+    def produce():
+        yield 1
+        raise ValueError("arquivo corrompido")
+
+    consumed = []
+    with BoundedPipeline(queue_size=1, poll_interval=0.01) as pipeline:
+        items = pipeline.stage(produce(), "read")
+        doubled = pipeline.stage((item * 2 for item in items), "transform")
+        with pytest.raises(ValueError, match="arquivo corrompido"):
+            for item in doubled:
+                consumed.append(item)
+
+    assert consumed == [2]
+
+
+def test_consumer_failure_cancels_the_producers():
+    """
+    Test that leaving the pipeline stops the producers, closes their generators and joins their threads.
+    """
+    closed = threading.Event()
+
+    def produce():
+        try:
+            number = 0
+            while True:
+                yield number
+                number += 1
+        finally:
+            closed.set()
+
+    with pytest.raises(RuntimeError, match="falha na carga"):
+        with BoundedPipeline(queue_size=1, poll_interval=0.01) as pipeline:
+            items = pipeline.stage(produce(), "read")
+            next(items)
+            raise RuntimeError("falha na carga")
+
+    assert closed.is_set()
+    assert not any(thread.name == "pipeline-read" for thread in threading.enumerate())
+
+
+def test_invalid_queue_size():
+    """
+    Test that a non-positive queue size is rejected.
+    """
+    with pytest.raises(ValueError):
+        BoundedPipeline(queue_size=0)
@@ -18,3 +18,54 @@ def test_connect_failure():
     with patch("psycopg2.connect", side_effect=OperationalError("Erro ao conectar")):
         with pytest.raises(Exception, match="Erro ao conectar-se ao banco de dados"):
             DatabaseConnection.connect()
+
+
+@pytest.fixture
+def mock_pool(mocker):
+    """Mocka o pool de conexões, garantindo que nenhum pool anterior seja reaproveitado."""
+    DatabaseConnection.close()
+    pool = mocker.patch("src.infra.database_connector.ThreadedConnectionPool").return_value
+    pool.closed = False
+    yield pool
+    DatabaseConnection.pool = None
+
+
+def test_get_connection_returns_connection_to_pool(mock_pool, mocker):
+    connection = mocker.MagicMock(closed=0)
+    mock_pool.getconn.return_value = connection
+
+    with DatabaseConnection.get_connection() as checked_out:
+        assert checked_out is connection
+
+    connection.cursor.return_value.__enter__.return_value.execute.assert_called_once_with("SELECT 1")
+    mock_pool.putconn.assert_called_once_with(connection, close=False)
+
+
+def test_get_connection_replaces_broken_connection(mock_pool, mocker):
+    broken = mocker.MagicMock(closed=0)
+    broken.cursor.return_value.__enter__.return_value.execute.side_effect = OperationalError("conexão perdida")
+    healthy = mocker.MagicMock(closed=0)
+    mock_pool.getconn.side_effect = [broken, healthy]
+
+    with DatabaseConnection.get_connection() as checked_out:
+        assert checked_out is healthy
+
+    mock_pool.putconn.assert_any_call(broken, close=True)
+    mock_pool.putconn.assert_called_with(healthy, close=False)
+
+
+def test_get_connection_fails_after_reconnect_attempts(mock_pool):
+    mock_pool.getconn.side_effect = OperationalError("servidor indisponível")
+
+    with pytest.raises(Exception, match="Erro ao conectar-se ao banco de dados"):
+        with DatabaseConnection.get_connection():
+            pass
+
+
+def test_close_closes_every_connection(mock_pool):
+    DatabaseConnection.connect()
+
+    DatabaseConnection.close()
+
+    mock_pool.closeall.assert_called_once()
+    assert DatabaseConnection.pool is None
@@ -0,0 +1,142 @@
+import pandas as pd
+import pytest
+
+from src.infra.database_connector import DatabaseConnection
+from src.infra.database_repository import DatabaseRepository
+
+
+@pytest.fixture
+def mock_connection(mocker):
+    """Mocka a conexão retirada do pool de conexões."""
+    connection = mocker.MagicMock()
+    checkout = mocker.patch.object(DatabaseConnection, "get_connection")
+    checkout.return_value.__enter__.return_value = connection
+    return connection
+
+
+@pytest.fixture
+def dataframe():
+    return pd.DataFrame(
+        {
+            "ID_FILIAL": [1, 2, 3],
+            "PONTO_VENDA_COD": [214.0, 370.0, 0.0],
+            "VENDA_LIQUIDA": [32.86, 10.5, 7.0],
+        }
+    )
+
+
+def test_insert_data_with_copy_streams_chunks(mock_connection, dataframe):
+    """Testa se o COPY é executado em blocos e confirma a transação."""
+    cursor = mock_connection.cursor.return_value
+    buffers = []
+    cursor.copy_expert.side_effect = lambda query, buffer: buffers.append(buffer.getvalue())
+
+    DatabaseRepository(load_method="copy", copy_chunk_size=2).insert_data(dataframe, "store")
+
+    assert cursor.copy_expert.call_count == 2
+    query = cursor.copy_expert.call_args.args[0]
+    assert query == "COPY store (ID_FILIAL, PONTO_VENDA_COD, VENDA_LIQUIDA) FROM STDIN WITH (FORMAT csv)"
+    assert buffers == ["1,214,32.86\n2,370,10.5\n", "3,0,7\n"]
+    mock_connection.commit.assert_called_once()
+
+
+def test_insert_data_falls_back_to_execute_values(mock_connection, dataframe, mocker):
+    """Testa se a carga é refeita com execute_values quando o COPY falha."""
+    cursor = mock_connection.cursor.return_value
+    cursor.copy_expert.side_effect = Exception("COPY falhou")
+    mock_execute_values = mocker.patch("src.infra.database_repository.execute_values")
+
+    DatabaseRepository(load_method="copy").insert_data(dataframe, "store")
+
+    cursor.execute.assert_any_call("ROLLBACK TO SAVEPOINT bulk_load")
+    mock_connection.rollback.assert_not_called()
+    mock_execute_values.assert_called_once()
+    assert (
+        mock_execute_values.call_args.args[1]
+        == "INSERT INTO store (ID_FILIAL, PONTO_VENDA_COD, VENDA_LIQUIDA) VALUES %s"
+    )
+    mock_connection.commit.assert_called_once()
+
+
+def test_insert_data_raises_when_every_method_fails(mock_connection, dataframe, mocker):
+    """Testa se o erro é propagado quando nem o COPY nem o execute_values funcionam."""
+    mock_connection.cursor.return_value.copy_expert.side_effect = Exception("COPY falhou")
+    mocker.patch("src.infra.database_repository.execute_values", side_effect=Exception("INSERT falhou"))
+
+    with pytest.raises(Exception, match="Erro ao carregar dados na tabela"):
+        DatabaseRepository(load_method="copy").insert_data(dataframe, "store")
+
+
+def test_invalid_load_method():
+    """Testa se um método de carga desconhecido é rejeitado."""
+    with pytest.raises(ValueError, match="Método de carga inválido"):
+        DatabaseRepository(load_method="bulk")
+
+
+def test_upsert_data_merges_staging_into_table(mock_connection, dataframe):
+    """Testa se o upsert carrega a tabela temporária e mescla as linhas pela chave natural."""
+    cursor = mock_connection.cursor.return_value
+
+    DatabaseRepository(load_method="copy").upsert_data(
+        dataframe, "store", conflict_columns=["ID_FILIAL"], additive_columns=["VENDA_LIQUIDA"]
+    )
+
+    cursor.copy_expert.assert_called_once()
+    assert "COPY store_staging" in cursor.copy_expert.call_args.args[0]
+    cursor.execute.assert_any_call(
+        "INSERT INTO store (ID_FILIAL, PONTO_VENDA_COD, VENDA_LIQUIDA) "
+        "SELECT ID_FILIAL, PONTO_VENDA_COD, VENDA_LIQUIDA FROM store_staging "
+        "ON CONFLICT (ID_FILIAL) DO UPDATE SET PONTO_VENDA_COD = EXCLUDED.PONTO_VENDA_COD, "
+        "VENDA_LIQUIDA = store.VENDA_LIQUIDA + EXCLUDED.VENDA_LIQUIDA"
+    )
+    mock_connection.commit.assert_called_once()
+
+
+def test_upsert_data_in_transaction_does_not_commit(mock_connection, dataframe):
+    """Testa se o upsert dentro de uma transação deixa a confirmação para o chamador."""
+    repository = DatabaseRepository(load_method="copy")
+
+    with repository.transaction() as transaction:
+        repository.upsert_data(dataframe, "store", conflict_columns=["ID_FILIAL"], transaction=transaction)
+        mock_connection.commit.assert_not_called()
+
+    mock_connection.commit.assert_called_once()
+
+
+def test_find_applies_statement_timeout(mock_connection):
+    """Testa se o tempo limite da consulta é aplicado com statement_timeout na transação da consulta."""
+    cursor = mock_connection.cursor.return_value
+    cursor.fetchall.return_value = [(1, "SP")]
+    cursor.description = [("id_filial",), ("uf",)]
+
+    result = DatabaseRepository().find("SELECT id_filial, uf FROM store", timeout=1.5)
+
+    assert cursor.execute.call_args_list[0].args == ("SET LOCAL statement_timeout = %s", (1500,))
+    cursor.execute.assert_called_with("SELECT id_filial, uf FROM store", None)
+    assert result.to_dict("records") == [{"id_filial": 1, "uf": "SP"}]
+
+
+def test_find_chunks_streams_from_named_cursor(mock_connection):
+    """Testa se find_chunks usa um cursor nomeado e produz um DataFrame por lote."""
+    cursor = mock_connection.cursor.return_value
+    cursor.fetchmany.side_effect = [[(1, "SP"), (2, "RJ")], [(3, "MG")], []]
+    cursor.description = [("id_filial",), ("uf",)]
+
+    chunks = list(DatabaseRepository().find_chunks("SELECT id_filial, uf FROM store", chunk_size=2))
+
+    assert mock_connection.cursor.call_args.kwargs["name"].startswith("find_")
+    assert cursor.itersize == 2
+    cursor.fetchmany.assert_called_with(2)
+    assert [chunk.to_dict("list") for chunk in chunks] == [
+        {"id_filial": [1, 2], "uf": ["SP", "RJ"]},
+        {"id_filial": [3], "uf": ["MG"]},
+    ]
+    cursor.close.assert_called_once()
+
+
+def test_records_to_frame_keeps_columns_when_empty():
+    """Testa se um resultado vazio mantém as colunas da consulta."""
+    result = DatabaseRepository._records_to_frame([], ["uf", "cidade"])
+
+    assert result.empty
+    assert list(result.columns) == ["uf", "cidade"]
@@ -0,0 +1,128 @@
+import asyncio
+import json
+import tracemalloc
+
+import pandas as pd
+import pytest
+
+from src.infra.instrumentation import METRICS_CONFIG, Instrumentation, instrumented
+
+
+@pytest.fixture
+def metrics_config(mocker, tmp_path):
+    """Fixture that enables the metrics and writes them to a temporary directory."""
+    config = {
+        "enabled": True,
+        "path": str(tmp_path / "metrics.jsonl"),
+        "tracemalloc": False,
+        "profile": False,
+        "profile_dir": str(tmp_path / "profiles"),
+    }
+    mocker.patch.dict(METRICS_CONFIG, config)
+    return METRICS_CONFIG
+
+
+def read_lines(config):
+    """Reads the metrics written so far."""
+    with open(config["path"]) as file:
+        return [json.loads(line) for line in file]
+
+
+def test_measure_writes_one_json_line(metrics_config):
+    """
+    Test that a measurement records time, memory, rows and labels under the current run id.
+    """
+    run_id = Instrumentation.start_run()
+
+    with Instrumentation.measure("transform", rows_in=10, table="sales") as measurement:
+        measurement.rows_out = 7
+
+    [line] = read_lines(metrics_config)
+    assert line["run_id"] == run_id
+    assert line["stage"] == "transform"
+    assert line["labels"] == {"table": "sales"}
+    assert (line["rows_in"], line["rows_out"], line["status"]) == (10, 7, "ok")
+    assert line["wall_seconds"] >= 0 and line["cpu_seconds"] >= 0 and line["peak_rss_bytes"] > 0
+
+
+def test_measure_records_errors(metrics_config):
+    """
+    Test that a failing block is recorded with its error and the exception is propagated.
+    """
+    with pytest.raises(ValueError, match="falhou"):
+        with Instrumentation.measure("load"):
+            raise ValueError("falhou")
+
+    [line] = read_lines(metrics_config)
+    assert (line["status"], line["error"]) == ("error", "falhou")
+
+
+def test_measure_profiles_stages(metrics_config):
+    """
+    Test that stage measurements dump a cProfile file and the tracemalloc peak when enabled.
+    """
+    metrics_config.update(profile=True, tracemalloc=True)
+    Instrumentation.start_run()
+    try:
+        with Instrumentation.measure("extract", profile=True):
+            data = [0] * 100_000
+        del data
+    finally:
+        tracemalloc.stop()
+
+    [line] = read_lines(metrics_config)
+    assert line["profile_path"].endswith("_extract.prof")
+    assert line["peak_traced_bytes"] >= 800_000
+
+
+def test_measure_is_a_no_op_when_disabled(metrics_config):
+    """
+    Test that nothing is written when the metrics are disabled.
+    """
+    metrics_config["enabled"] = False
+
+    with Instrumentation.measure("analyze"):
+        pass
+
+    with pytest.raises(FileNotFoundError):
+        read_lines(metrics_config)
+
+
+def test_instrumented_decorator_counts_rows(metrics_config):
+    """
+    Test that the decorator derives rows and labels from the call arguments and the result.
+    """
+
+    @instrumented(
+        "insert_data",
+        rows_in=lambda arguments: len(arguments["dataframe"]),
+        rows_out=len,
+        labels=lambda arguments: {"table": arguments["table_name"]},
+    )
+    def insert_data(dataframe, table_name):
+        return dataframe.head(2)
+
+    result = insert_data(pd.DataFrame({"a": [1, 2, 3]}), table_name="sales")
+
+    assert len(result) == 2
+    [line] = read_lines(metrics_config)
+    assert (line["stage"], line["rows_in"], line["rows_out"]) == ("insert_data", 3, 2)
+    assert line["labels"] == {"table": "sales"}
+
+
+def test_instrumented_decorator_measures_coroutines(metrics_config):
+    """
+    Test that the decorator awaits coroutine functions and measures them until they finish.
+    """
+
+    @instrumented("find", rows_out=len)
+    async def find(query):
+        await asyncio.sleep(0.01)
+        return pd.DataFrame({"a": [1, 2]})
+
+    result = asyncio.run(find("SELECT 1"))
+
+    assert len(result) == 2
+    [line] = read_lines(metrics_config)
+    assert (line["stage"], line["rows_out"]) == ("find", 2)
+    assert line["wall_seconds"] >= 0.01
@@ -1,10 +1,13 @@
+import asyncio
+import threading
 from unittest import mock
 
+import pandas as pd
 import pytest
 
 from src.driver.visualization.interfaces.visualization_interface import ReportsVisualizerInterface
 from src.infra.interface.database_repository import DatabaseRepositoryInterface
-from src.stages.analysis.analyze_data import AnalyzeData
+from src.stages.analysis.analyze_data import ANALYSIS_QUERIES, AnalyzeData
 
 
 @pytest.fixture
@@ -120,3 +123,97 @@ def test_read_query_from_file_not_found(analyze_data, mocker):
     # Verifica se o método lida corretamente com um erro ao tentar abrir o arquivo
     with pytest.raises(FileNotFoundError):
         analyze_data._AnalyzeData__read_query_from_file("non_existent_query.sql")
+
+
+def test_execute_analysis_runs_queries_concurrently(mock_visualizer, mock_repository, mocker):
+    # Todas as consultas precisam estar em execução ao mesmo tempo para atravessar a barreira
+    barrier = threading.Barrier(len(ANALYSIS_QUERIES), timeout=5)
+
+    def find(query, params=None, timeout=None):
+        barrier.wait()
+        return pd.DataFrame({"query": [query]})
+
+    mock_repository.find.side_effect = find
+    analyze_data = AnalyzeData(
+        visualizer=mock_visualizer,
+        repository=mock_repository,
+        query_timeout=30,
+        top_n=5,
+        group_top_n=20,
+        group_pages=3,
+    )
+    mocker.patch.object(analyze_data, "_AnalyzeData__read_query_from_file", side_effect=lambda filename: filename)
+
+    analyze_data.execute_analysis()
+
+    contract = mock_visualizer.generate_reports.call_args.args[0]
+    for field, filename in ANALYSIS_QUERIES.items():
+        assert getattr(contract, field)["query"].iloc[0] == filename
+    assert contract.group_page_size == 20
+    mock_repository.find.assert_any_call(query="sales_velocity.sql", params={"top_n": 5, "group_limit": 60}, timeout=30)
+
+
+def test_execute_analysis_reports_failed_queries(analyze_data, mock_visualizer, mock_repository, mocker):
+    def find(query, params=None, timeout=None):
+        if query == "sales_by_branch.sql":
+            raise Exception("canceling statement due to statement timeout")
+        return pd.DataFrame()
+
+    mock_repository.find.side_effect = find
+    mocker.patch.object(analyze_data, "_AnalyzeData__read_query_from_file", side_effect=lambda filename: filename)
+
+    with pytest.raises(Exception, match="sales_by_branch: canceling statement due to statement timeout"):
+        analyze_data.execute_analysis()
+
+    assert mock_repository.find.call_count == len(ANALYSIS_QUERIES)
+    mock_visualizer.generate_reports.assert_not_called()
+
+
+def test_invalid_group_chart_size(mock_visualizer, mock_repository):
+    """
+    Testa se uma quantidade de barras ou de páginas inválida é rejeitada.
+    """
+    with pytest.raises(ValueError, match="barras e de páginas"):
+        AnalyzeData(visualizer=mock_visualizer, repository=mock_repository, group_pages=0)
+
+
+def test_execute_analysis_async_runs_queries_concurrently(mock_visualizer, mock_repository, mocker):
+    # Todas as consultas precisam estar pendentes ao mesmo tempo para que a primeira seja concluída
+    pending = []
+    all_started = asyncio.Event()
+
+    async def find(query, params=None, timeout=None):
+        pending.append(query)
+        if len(pending) == len(ANALYSIS_QUERIES):
+            all_started.set()
+        await asyncio.wait_for(all_started.wait(), timeout=5)
+        return pd.DataFrame({"query": [query]})
+
+    mock_repository.find = mocker.AsyncMock(side_effect=find)
+    analyze_data = AnalyzeData(visualizer=mock_visualizer, repository=mock_repository, query_timeout=30, top_n=5)
+    mocker.patch.object(analyze_data, "_AnalyzeData__read_query_from_file", side_effect=lambda filename: filename)
+
+    asyncio.run(analyze_data.execute_analysis_async())
+
+    contract = mock_visualizer.generate_reports.call_args.args[0]
+    for field, filename in ANALYSIS_QUERIES.items():
+        assert getattr(contract, field)["query"].iloc[0] == filename
+    mock_repository.find.assert_any_await(
+        query="sales_velocity.sql", params={"top_n": 5, "group_limit": 30}, timeout=30
+    )
+
+
+def test_execute_analysis_async_reports_failed_queries(analyze_data, mock_visualizer, mock_repository, mocker):
+    async def find(query, params=None, timeout=None):
+        if query == "sales_by_branch.sql":
+            raise Exception("canceling statement due to statement timeout")
+        return pd.DataFrame()
+
+    mock_repository.find = mocker.AsyncMock(side_effect=find)
+    mocker.patch.object(analyze_data, "_AnalyzeData__read_query_from_file", side_effect=lambda filename: filename)
+
+    with pytest.raises(Exception, match="sales_by_branch: canceling statement due to statement timeout"):
+        asyncio.run(analyze_data.execute_analysis_async())
+
+    assert mock_repository.find.await_count == len(ANALYSIS_QUERIES)
+    mock_visualizer.generate_reports.assert_not_called()
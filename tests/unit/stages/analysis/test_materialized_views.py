@@ -0,0 +1,102 @@
+import asyncio
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+from src.infra.interface.database_repository import DatabaseRepositoryInterface
+from src.stages.analysis.materialized_views import MaterializedViews
+
+
+@pytest.fixture
+def mock_repository():
+    return mock.create_autospec(DatabaseRepositoryInterface)
+
+
+def test_view_names_match_query_files():
+    views = MaterializedViews(repository=mock.Mock()).view_names()
+
+    assert views == ["mv_sales_by_branch", "mv_sales_by_product", "mv_sales_by_region", "mv_sales_velocity"]
+
+
+def catalog(populated=(), versions=None):
+    """Simula as consultas ao catálogo: as views preenchidas e a versão registrada de cada view existente."""
+    versions = versions or {}
+
+    def find(query, params=None, timeout=None):
+        if query == MaterializedViews.VERSIONS_QUERY:
+            return pd.DataFrame({"matviewname": list(versions), "version": list(versions.values())})
+        return pd.DataFrame({"matviewname": list(populated)})
+
+    return find
+
+
+def test_refresh_uses_concurrent_refresh_only_for_populated_views(mock_repository):
+    mock_repository.find.side_effect = catalog(populated=["mv_sales_by_product", "mv_sales_velocity"])
+
+    MaterializedViews(repository=mock_repository).refresh()
+
+    statements = [call.args[0] for call in mock_repository.execute.call_args_list]
+    assert sum("CREATE MATERIALIZED VIEW IF NOT EXISTS" in statement for statement in statements) == 4
+    refreshes = sorted(statement for statement in statements if statement.startswith("REFRESH"))
+    assert refreshes == [
+        "REFRESH MATERIALIZED VIEW CONCURRENTLY mv_sales_by_product",
+        "REFRESH MATERIALIZED VIEW CONCURRENTLY mv_sales_velocity",
+        "REFRESH MATERIALIZED VIEW mv_sales_by_branch",
+        "REFRESH MATERIALIZED VIEW mv_sales_by_region",
+    ]
+
+
+def test_create_recreates_only_views_with_another_definition(mock_repository):
+    views = MaterializedViews(repository=mock_repository)
+    mock_repository.find.side_effect = catalog()
+    views.create()
+    statements = [call.args[0] for call in mock_repository.execute.call_args_list]
+    current = {
+        view_name: statement.rsplit("IS '", 1)[1].rstrip("';")
+        for view_name, statement in zip(views.view_names(), statements)
+    }
+    assert all(statement.startswith("DROP MATERIALIZED VIEW IF EXISTS") for statement in statements)
+    mock_repository.execute.reset_mock()
+
+    mock_repository.find.side_effect = catalog(versions={**current, "mv_sales_velocity": "antiga"})
+    views.create()
+
+    statements = [call.args[0] for call in mock_repository.execute.call_args_list]
+    assert len(statements) == 1
+    assert statements[0].startswith("DROP MATERIALIZED VIEW IF EXISTS mv_sales_velocity;")
+    assert f"COMMENT ON MATERIALIZED VIEW mv_sales_velocity IS '{current['mv_sales_velocity']}';" in statements[0]
+
+
+def test_refresh_reports_failed_views(mock_repository):
+    mock_repository.find.side_effect = catalog()
+
+    def execute(query, params=None, transaction=None):
+        if query == "REFRESH MATERIALIZED VIEW mv_sales_by_region":
+            raise Exception("permissão negada")
+
+    mock_repository.execute.side_effect = execute
+
+    with pytest.raises(Exception, match="mv_sales_by_region: permissão negada"):
+        MaterializedViews(repository=mock_repository).refresh()
+
+
+def test_refresh_async_refreshes_views_concurrently(mock_repository):
+    mock_repository.find = mock.AsyncMock(side_effect=catalog(populated=["mv_sales_velocity"]))
+    started = []
+
+    async def execute(query, params=None, transaction=None):
+        if query.startswith("REFRESH"):
+            started.append(query)
+            await asyncio.sleep(0)
+            assert len(started) == 4
+            if query == "REFRESH MATERIALIZED VIEW mv_sales_by_region":
+                raise Exception("permissão negada")
+
+    mock_repository.execute = mock.AsyncMock(side_effect=execute)
+
+    with pytest.raises(Exception, match="mv_sales_by_region: permissão negada"):
+        asyncio.run(MaterializedViews(repository=mock_repository).refresh_async())
+
+    assert "REFRESH MATERIALIZED VIEW CONCURRENTLY mv_sales_velocity" in started
+    assert mock_repository.find.await_count == 2
@@ -1,9 +1,11 @@
 from tarfile import ExtractError
 
+import pandas as pd
 import pytest
 
 from src.driver.interface.dataloader_interface import DataLoaderInterface
 from src.stages.contracts.extract_contract import ExtractContract
+from src.stages.contracts.extract_stream_contract import ExtractStreamContract
 from src.stages.extract.extract_data import ExtractData
 
 
@@ -56,3 +58,63 @@ def test_extract_failure(mock_dataloader):
     assert "Erro ao extrair dados" in str(exc_info.value)
 
     mock_dataloader.extract_all.assert_called_once()
+
+
+def test_extract_stream_success(mock_dataloader):
+    """
+    Testa se o método extract_stream encapsula os geradores de blocos em um ExtractStreamContract.
+    """
+    mock_data = {key: iter([]) for key in ["sales", "stock", "store", "products"]}
+    mock_dataloader.extract_all_chunks.return_value = mock_data
+
+    result = ExtractData(mock_dataloader).extract_stream(chunk_size=100)
+
+    assert isinstance(result, ExtractStreamContract)
+    assert result.sales is mock_data["sales"]
+    assert result.stock is mock_data["stock"]
+    mock_dataloader.extract_all_chunks.assert_called_once_with(100)
+
+
+def test_extract_stream_failure(mock_dataloader):
+    """
+    Testa o comportamento do método extract_stream quando ocorre uma exceção.
+    """
+    mock_dataloader.extract_all_chunks.side_effect = FileNotFoundError("Arquivo não encontrado")
+
+    with pytest.raises(ExtractError, match="Arquivo não encontrado"):
+        ExtractData(mock_dataloader).extract_stream(chunk_size=100)
+
+
+def test_extract_filters_rows_from_high_water_marks(mock_dataloader):
+    """
+    Testa se o método extract mantém apenas as linhas a partir das marcas d'água, incluindo as da própria data.
+    """
+    mock_dataloader.extract_all.return_value = {
+        "sales": pd.DataFrame({"DATA_VENDA": pd.to_datetime(["2024-12-01", "2024-12-02", "2024-12-03"])}),
+        "stock": pd.DataFrame({"DATA_FOTO": pd.to_datetime(["2024-12-01"])}),
+        "store": pd.DataFrame({"ID_FILIAL": [1]}),
+        "products": pd.DataFrame({"ARTIGO_COR": ["A"]}),
+    }
+
+    result = ExtractData(mock_dataloader).extract(
+        {"sales": pd.Timestamp("2024-12-02"), "store": pd.Timestamp("2024-12-01")}
+    )
+
+    assert result.sales["DATA_VENDA"].tolist() == list(pd.to_datetime(["2024-12-02", "2024-12-03"]))
+    assert len(result.stock) == 1
+    assert len(result.store) == 1
+    mock_dataloader.extract_all.assert_called_once_with(
+        {"sales": pd.Timestamp("2024-12-02"), "store": pd.Timestamp("2024-12-01")}
+    )
+
+
+def test_source_paths_wraps_missing_files(mock_dataloader):
+    """
+    Testa que source_paths repassa os caminhos do DataLoader e converte arquivos ausentes em ExtractError.
+    """
+    mock_dataloader.source_paths.return_value = {"sales": ["data/vendas_hering.csv"]}
+    assert ExtractData(mock_dataloader).source_paths() == {"sales": ["data/vendas_hering.csv"]}
+
+    mock_dataloader.source_paths.side_effect = FileNotFoundError("Arquivo não encontrado: data/vendas_hering.csv")
+    with pytest.raises(ExtractError, match="Arquivo não encontrado"):
+        ExtractData(mock_dataloader).source_paths()
@@ -1,7 +1,12 @@
+import asyncio
+import dataclasses
+import threading
+
 import pandas as pd
 import pytest
 import pytest_mock
 
+from src.driver.schemas import SOURCE_SCHEMAS
 from src.errors.load_error import LoadError
 from src.infra.interface.database_repository import DatabaseRepositoryInterface
 from src.stages.contracts.transform_contract import TransformContract
@@ -83,7 +88,9 @@ def test_load_data_success(mock_repository, mocker: pytest_mock.MockerFixture):
 
     mock_repository.create.assert_called()
 
-    mock_repository.insert_data.assert_any_call(dataframe=mocker.ANY, table_name="available_stock")
+    mock_repository.insert_data.assert_any_call(
+        dataframe=mocker.ANY, table_name="available_stock", transaction=mocker.ANY
+    )
 
 
 def test_load_data_failure(mock_repository):
@@ -251,3 +258,360 @@ def test_load_data_invalid_data(mock_repository):
 
     with pytest.raises(ValueError):
         load_data.load(data)
+
+
+def test_load_stream_inserts_each_chunk(mock_repository):
+    """Testa se o método load_stream insere cada bloco e ignora blocos vazios."""
+    chunks = [
+        ("sales", pd.DataFrame({"PRODUTO": ["A"], "VENDA_PECAS": [1]})),
+        ("sales_velocity", pd.DataFrame()),
+        ("sales", pd.DataFrame({"PRODUTO": ["B"], "VENDA_PECAS": [2]})),
+    ]
+
+    LoadData(repository=mock_repository).load_stream(iter(chunks))
+
+    mock_repository.create.assert_called()
+    assert mock_repository.insert_data.call_count == 2
+
+
+def test_load_truncates_the_loaded_months_before_inserting(mock_repository, small_contract, mocker):
+    """
+    Testa se a carga completa esvazia a partição de cada mês das tabelas de fatos, e as demais tabelas por
+    inteiro, e insere os dados na mesma transação.
+    """
+    sales = pd.DataFrame({"DATA_VENDA": pd.to_datetime(["2024-12-03", "2024-11-30", None, "2024-12-01"])})
+    transaction = mock_repository.transaction.return_value.__enter__.return_value
+    calls = mocker.MagicMock()
+    calls.attach_mock(mock_repository.execute, "execute")
+    calls.attach_mock(mock_repository.insert_data, "insert_data")
+
+    LoadData(repository=mock_repository).load(dataclasses.replace(small_contract, sales=sales))
+
+    sales_calls = [
+        call
+        for call in calls.mock_calls
+        if call.kwargs.get("table_name") == "sales"
+        or (len(call.args) > 1 and call.args[1].get("table_name") == "sales")
+    ]
+    assert [call.args[1]["partition_month"] for call in sales_calls[:-1]] == [
+        pd.Timestamp("2024-11-01").date(),
+        pd.Timestamp("2024-12-01").date(),
+        None,
+    ]
+    assert all(call.args[1]["reset"] and "etl_prepare_partition" in call.args[0] for call in sales_calls[:-1])
+    assert all(call.kwargs["transaction"] is transaction for call in sales_calls)
+    assert sales_calls[-1] == mocker.call.insert_data(dataframe=sales, table_name="sales", transaction=transaction)
+    store_calls = [
+        call
+        for call in calls.mock_calls
+        if call.args[:1] == ("TRUNCATE store",) or call.kwargs.get("table_name") == "store"
+    ]
+    assert store_calls == [
+        mocker.call.execute("TRUNCATE store", transaction=transaction),
+        mocker.call.insert_data(dataframe=small_contract.store, table_name="store", transaction=transaction),
+    ]
+
+
+def test_load_stream_truncates_each_month_once(mock_repository):
+    """
+    Testa se a carga em streaming esvazia a partição de cada mês apenas antes do primeiro bloco com esse mês, e as
+    tabelas sem partições apenas antes do seu primeiro bloco, na mesma transação de todos os blocos.
+    """
+    chunks = [
+        ("stock", pd.DataFrame({"DATA_FOTO": pd.to_datetime(["2024-06-01", "2024-06-02"])})),
+        ("stock", pd.DataFrame({"DATA_FOTO": pd.to_datetime(["2024-06-03", "2024-07-01"])})),
+        ("available_stock", pd.DataFrame({"PRODUTO": ["A"]})),
+        ("available_stock", pd.DataFrame({"PRODUTO": ["B"]})),
+    ]
+
+    LoadData(repository=mock_repository).load_stream(iter(chunks))
+
+    prepared = [
+        call.args[1]
+        for call in mock_repository.execute.call_args_list
+        if len(call.args) > 1 and "partition_month" in call.args[1]
+    ]
+    assert [(params["table_name"], params["partition_month"].isoformat()) for params in prepared] == [
+        ("stock", "2024-06-01"),
+        ("stock", "2024-07-01"),
+    ]
+    truncates = [call.args[0] for call in mock_repository.execute.call_args_list if "TRUNCATE" in call.args[0]]
+    assert truncates == ["TRUNCATE available_stock"]
+    transaction = mock_repository.transaction.return_value.__enter__.return_value
+    mock_repository.transaction.assert_called_once()
+    assert all(call.kwargs["transaction"] is transaction for call in mock_repository.insert_data.call_args_list)
+
+
+def test_load_stream_failure(mock_repository):
+    """Testa o método load_stream quando ocorre uma exceção ao inserir um bloco."""
+    mock_repository.insert_data.side_effect = Exception("Erro ao inserir dados")
+
+    with pytest.raises(LoadError, match="Erro ao inserir dados"):
+        LoadData(repository=mock_repository).load_stream(iter([("sales", pd.DataFrame({"PRODUTO": ["A"]}))]))
+
+
+def test_load_incremental_upserts_deltas_and_updates_watermarks(mock_repository, mocker: pytest_mock.MockerFixture):
+    """Testa se o método load_incremental mescla os deltas e atualiza as marcas d'água na mesma transação."""
+    data = TransformContract(
+        sales=pd.DataFrame(
+            {
+                "DATA_VENDA": pd.to_datetime(["2024-12-01", "2024-12-03"]),
+                "ID_FILIAL": [1, 2],
+                "PRODUTO": ["A", "B"],
+                "COR_PRODUTO": ["Azul", "Vermelho"],
+                "TAMANHO": ["P", "M"],
+                "VENDA_PECAS": [10, 20],
+                "VENDA_LIQUIDA": [1000, 2000],
+                "VENDA_BRUTA": [1200, 2400],
+            }
+        ),
+        stock=pd.DataFrame(),
+        store=pd.DataFrame(),
+        products=pd.DataFrame(),
+        available_stock=pd.DataFrame(),
+        sales_velocity=pd.DataFrame(),
+        sales_by_region=pd.DataFrame({"UF": ["SP"], "CIDADE": ["São Paulo"], "VENDA_PECAS": [30]}),
+    )
+    transaction = mock_repository.transaction.return_value.__enter__.return_value
+
+    LoadData(repository=mock_repository).load_incremental(data)
+
+    upserts = {call.kwargs["table_name"]: call.kwargs for call in mock_repository.upsert_data.call_args_list}
+    assert set(upserts) == {"sales", "sales_by_region"}
+    assert upserts["sales_by_region"]["conflict_columns"] == ["UF", "CIDADE"]
+    assert upserts["sales_by_region"]["additive_columns"] == ["VENDA_PECAS"]
+    assert all(upsert["transaction"] is transaction for upsert in upserts.values())
+    watermark_params = {
+        "source": "sales",
+        "high_water_mark": pd.Timestamp("2024-12-03").date(),
+        "row_hashes": SOURCE_SCHEMAS["sales"].row_hashes(data.sales.iloc[[1]]).tolist(),
+    }
+    watermark_queries = [
+        call.args[0] for call in mock_repository.execute.call_args_list if call.args[1:] == (watermark_params,)
+    ]
+    assert [query.split()[0] for query in watermark_queries] == ["DELETE", "INSERT", "INSERT"]
+    assert "etl_watermark_rows" in watermark_queries[1] and "etl_watermarks" in watermark_queries[2]
+    assert all(
+        call.kwargs["transaction"] is transaction
+        for call in mock_repository.execute.call_args_list
+        if call.args[1:] == (watermark_params,)
+    )
+    mock_repository.execute.assert_any_call(
+        mocker.ANY,
+        {
+            "table_name": "sales",
+            "partition_column": "DATA_VENDA",
+            "partition_month": pd.Timestamp("2024-12-01").date(),
+            "reset": False,
+        },
+        transaction=transaction,
+    )
+
+
+def test_load_incremental_failure(mock_repository):
+    """Testa o método load_incremental quando ocorre uma exceção ao mesclar os dados."""
+    mock_repository.upsert_data.side_effect = Exception("Erro ao mesclar dados")
+    data = TransformContract(
+        sales=pd.DataFrame(),
+        stock=pd.DataFrame(),
+        store=pd.DataFrame({"ID_FILIAL": [1], "UF": ["SP"], "CIDADE": ["São Paulo"]}),
+        products=pd.DataFrame(),
+        available_stock=pd.DataFrame(),
+        sales_velocity=pd.DataFrame(),
+        sales_by_region=pd.DataFrame(),
+    )
+
+    with pytest.raises(LoadError, match="Erro ao mesclar dados"):
+        LoadData(repository=mock_repository).load_incremental(data)
+
+
+def test_load_marker_is_kept_in_the_database(mock_repository):
+    """Testa se a chave da última carga é lida, gravada e removida por consultas ao banco de dados."""
+    load_data = LoadData(repository=mock_repository)
+
+    mock_repository.find.return_value = pd.DataFrame({"load_key": []})
+    assert load_data.get_load_key() is None
+    mock_repository.find.return_value = pd.DataFrame({"load_key": ["abc"]})
+    assert load_data.get_load_key() == "abc"
+    assert "EXISTS (SELECT 1 FROM sales)" in mock_repository.find.call_args.args[0]
+
+    load_data.mark_loaded("abc")
+    query, params = mock_repository.execute.call_args.args
+    assert "etl_loads" in query and params == {"load_key": "abc"}
+
+    load_data.forget_load()
+    assert mock_repository.execute.call_args.args[0].startswith("DELETE FROM etl_loads")
+
+
+@pytest.fixture
+def small_contract():
+    """Cria um TransformContract com tabelas de tamanhos diferentes."""
+    return TransformContract(
+        **{
+            field: pd.DataFrame({"ID": list(range(size))})
+            for field, size in [
+                ("sales", 5),
+                ("stock", 4),
+                ("sales_velocity", 6),
+                ("available_stock", 3),
+                ("sales_by_region", 2),
+                ("store", 1),
+                ("products", 1),
+            ]
+        }
+    )
+
+
+def test_load_parallel_reports_every_failed_table(mock_repository, small_contract):
+    """Testa se a carga paralela continua após uma falha e informa as tabelas que falharam."""
+
+    def insert_data(dataframe, table_name, transaction=None):
+        if table_name in ("stock", "store"):
+            raise Exception(f"falha em {table_name}")
+
+    mock_repository.insert_data.side_effect = insert_data
+
+    with pytest.raises(LoadError) as exc_info:
+        LoadData(repository=mock_repository, max_workers=4).load(small_contract)
+
+    assert mock_repository.insert_data.call_count == 7
+    assert "stock: falha em stock" in str(exc_info.value)
+    assert "store: falha em store" in str(exc_info.value)
+
+
+def test_load_atomic_uses_a_single_transaction(mock_repository, small_contract, mocker):
+    """Testa se, no modo atômico, todas as tabelas e as marcas d'água são carregadas na mesma transação."""
+    transaction = mock_repository.transaction.return_value.__enter__.return_value
+    data = dataclasses.replace(small_contract, sales=pd.DataFrame({"DATA_VENDA": pd.to_datetime(["2024-06-01"])}))
+
+    LoadData(repository=mock_repository, max_workers=3, atomic=True).load(data)
+
+    mock_repository.transaction.assert_called_once()
+    assert mock_repository.insert_data.call_count == 7
+    assert all(call.kwargs["transaction"] is transaction for call in mock_repository.insert_data.call_args_list)
+    mock_repository.execute.assert_any_call(
+        mocker.ANY,
+        {
+            "source": "sales",
+            "high_water_mark": pd.Timestamp("2024-06-01").date(),
+            "row_hashes": SOURCE_SCHEMAS["sales"].row_hashes(data.sales).tolist(),
+        },
+        transaction=transaction,
+    )
+
+
+def test_load_atomic_rolls_back_on_failure(mock_repository, small_contract):
+    """Testa se, no modo atômico, a falha de uma tabela reverte a transação e interrompe a carga."""
+    transaction_context = mock_repository.transaction.return_value
+    transaction_context.__exit__.return_value = False
+
+    def insert_data(dataframe, table_name, transaction):
+        if table_name == "available_stock":
+            raise Exception("falha")
+
+    mock_repository.insert_data.side_effect = insert_data
+
+    with pytest.raises(LoadError, match="available_stock: falha"):
+        LoadData(repository=mock_repository, atomic=True).load(small_contract)
+
+    assert transaction_context.__exit__.call_args.args[0] is LoadError
+    assert "store" not in [call.kwargs["table_name"] for call in mock_repository.insert_data.call_args_list]
+    assert not any(str(call.args[0]).startswith("ANALYZE") for call in mock_repository.execute.call_args_list)
+
+
+def test_load_invalid_max_workers(mock_repository):
+    """Testa se uma quantidade de workers não positiva é rejeitada."""
+    with pytest.raises(ValueError):
+        LoadData(repository=mock_repository, max_workers=0)
+
+
+def test_load_max_workers_larger_than_the_pool(mock_repository, mocker):
+    """Testa se uma quantidade de workers maior que o pool de conexões é rejeitada."""
+    mocker.patch.dict("src.stages.load.load_data.POOL_CONFIG", {"max_size": 2})
+
+    with pytest.raises(ValueError, match="DB_POOL_MAX_SIZE"):
+        LoadData(repository=mock_repository, max_workers=3)
+
+
+def test_load_creates_indexes_and_analyzes_tables(mock_repository, small_contract):
+    """Testa se, após a carga, os índices das análises são criados e as tabelas carregadas são analisadas."""
+    LoadData(repository=mock_repository).load(small_contract)
+
+    statements = [call.args[0] for call in mock_repository.execute.call_args_list]
+    assert any("CREATE INDEX IF NOT EXISTS sales_produto_idx" in statement for statement in statements)
+    assert any("sales_by_region (VENDA_PECAS)" in statement for statement in statements)
+    assert [statement for statement in statements if statement.startswith("ANALYZE")] == [
+        f"ANALYZE {table_name}" for table_name in small_contract.__dataclass_fields__
+    ]
+
+
+@pytest.fixture
+def mock_async_repository(mocker):
+    """Mocka um repositório de banco de dados cujos métodos são corrotinas."""
+    repository = mocker.MagicMock(spec=DatabaseRepositoryInterface)
+    for method in ("create", "insert_data", "execute"):
+        setattr(repository, method, mocker.AsyncMock(name=method))
+    return repository
+
+
+def test_load_async_loads_tables_concurrently_and_reports_failures(mock_async_repository, small_contract):
+    """Testa se load_async inicia todas as cargas ao mesmo tempo e informa todas as tabelas que falharam."""
+    started = []
+
+    async def insert_data(dataframe, table_name, transaction=None):
+        started.append(table_name)
+        await asyncio.sleep(0)
+        assert len(started) == len(small_contract.__dataclass_fields__)
+        if table_name in ("stock", "store"):
+            raise Exception(f"falha em {table_name}")
+
+    mock_async_repository.insert_data.side_effect = insert_data
+
+    with pytest.raises(LoadError) as error:
+        asyncio.run(LoadData(repository=mock_async_repository).load_async(small_contract))
+
+    assert "stock: falha em stock" in str(error.value)
+    assert "store: falha em store" in str(error.value)
+    assert "sales:" not in str(error.value)
+
+
+def test_load_stream_async_overlaps_production_and_load(mock_async_repository):
+    """Testa se o próximo bloco é produzido enquanto o bloco anterior ainda está sendo carregado."""
+    second_chunk_produced = threading.Event()
+    overlapped = []
+
+    def chunks():
+        yield "sales", pd.DataFrame({"PRODUTO": ["A"]})
+        second_chunk_produced.set()
+        yield "sales", pd.DataFrame()
+        yield "stock", pd.DataFrame({"PRODUTO": ["B"]})
+
+    async def insert_data(dataframe, table_name, transaction=None):
+        if not overlapped:
+            overlapped.append(await asyncio.to_thread(second_chunk_produced.wait, 5))
+
+    mock_async_repository.insert_data.side_effect = insert_data
+
+    asyncio.run(LoadData(repository=mock_async_repository).load_stream_async(chunks()))
+
+    assert overlapped == [True]
+    assert [call.kwargs["table_name"] for call in mock_async_repository.insert_data.await_args_list] == [
+        "sales",
+        "stock",
+    ]
+    statements = [call.args[0] for call in mock_async_repository.execute.await_args_list]
+    assert [statement for statement in statements if statement.startswith("ANALYZE")] == [
+        "ANALYZE sales",
+        "ANALYZE stock",
+    ]
+
+
+def test_load_stream_async_failure(mock_async_repository):
+    """Testa se um erro na carga de um bloco interrompe a carga em streaming."""
+    mock_async_repository.insert_data.side_effect = Exception("Erro ao inserir dados")
+    chunks = iter([("sales", pd.DataFrame({"PRODUTO": ["A"]})), ("sales", pd.DataFrame({"PRODUTO": ["B"]}))])
+
+    with pytest.raises(LoadError, match="Erro ao inserir dados"):
+        asyncio.run(LoadData(repository=mock_async_repository).load_stream_async(chunks))
+
+    assert mock_async_repository.insert_data.await_count == 1
@@ -0,0 +1,191 @@
+import pandas as pd
+import pytest
+
+from src.driver.dataloader import DataLoader
+from src.driver.schemas import SOURCE_SCHEMAS
+from src.stages.contracts.extract_contract import ExtractContract
+from src.stages.transform.partitioned_transform import PartitionedTransformData
+from src.stages.transform.transform_data import TransformData
+from tests.benchmarks.synthetic_data import generate_sources
+
+TABLES = ("sales", "stock", "store", "products", "available_stock", "sales_by_region", "sales_velocity")
+
+
+@pytest.fixture
+def extract_contract():
+    """Fixture with sales and stock spread over several branches and months, including duplicates."""
+    sales = pd.DataFrame(
+        {
+            "DATA_VENDA": pd.to_datetime(
+                ["2024-05-30", "2024-05-30", "2024-06-09", "2024-06-10", "2024-07-01", "2024-07-02"]
+            ),
+            "ID_FILIAL": pd.array([1, 1, 2, 3, 1, 2], dtype="int32"),
+            "PRODUTO": pd.Series(["A", "A", "B", "C", "A", "B"], dtype="category"),
+            "COR_PRODUTO": pd.Series(["Red", "Red", "Blue", "Green", "Red", "Blue"], dtype="category"),
+            "TAMANHO": pd.Series(["M", "M", None, "G", "P", "M"], dtype="category"),
+            "VENDA_PECAS": pd.array([3, 3, 5, 2, None, 4], dtype="Int32"),
+        }
+    )
+    stock = pd.DataFrame(
+        {
+            "DATA_FOTO": pd.to_datetime(["2024-05-01", "2024-06-01", "2024-06-01", "2024-07-01", "2024-07-01"]),
+            "ID_FILIAL": pd.array([1, 2, 2, 3, 1], dtype="int32"),
+            "PRODUTO": pd.Series(["A", "B", "B", "C", "A"], dtype="category"),
+            "COR_PRODUTO": pd.Series(["Red", "Blue", "Blue", "Green", "Red"], dtype="category"),
+            "TOTAL": pd.array([10, 20, 20, 0, 5], dtype="int32"),
+            "TRANSITO": pd.array([1, 2, 2, 0, 0], dtype="int32"),
+        }
+    )
+    store = pd.DataFrame(
+        {
+            "ID_FILIAL": pd.array([1, 2, 3], dtype="int32"),
+            "UF": pd.Series(["SP", "RJ", "SP"], dtype="category"),
+            "CIDADE": pd.Series(["São Paulo", "Rio de Janeiro", "Campinas"], dtype="category"),
+        }
+    )
+    products = pd.DataFrame({"PRODUTO": ["A", "B", "C"], "DESCRICAO": ["Product A", "Product B", "Product C"]})
+    return ExtractContract(sales=sales, stock=stock, store=store, products=products)
+
+
+def normalize(df: pd.DataFrame) -> pd.DataFrame:
+    """Compares tables regardless of row order."""
+    return df.sort_values(list(df.columns), key=lambda column: column.astype(str)).reset_index(drop=True)
+
+
+@pytest.mark.parametrize("granularity", ["row", "daily", "product"])
+@pytest.mark.parametrize("partition_by", ["ID_FILIAL", "month"])
+def test_partitioned_transform_matches_batch_transform(extract_contract, partition_by, granularity):
+    """
+    Test that the partitioned transform produces the same tables and types as the single-process transform,
+    including the aggregated sales velocity of products sold in several partitions.
+    """
+    expected = TransformData(velocity_granularity=granularity, backend="pandas").transform(extract_contract)
+
+    actual = PartitionedTransformData(partition_by, max_workers=2, velocity_granularity=granularity).transform(
+        extract_contract
+    )
+
+    for table in TABLES:
+        pd.testing.assert_frame_equal(
+            normalize(getattr(actual, table)),
+            normalize(getattr(expected, table)),
+            check_categorical=False,
+            obj=table,
+        )
+
+
+def test_partitioned_transform_with_available_stock_base(extract_contract):
+    """
+    Test that the available stock base is added to the merged stock before computing the sales velocity.
+    """
+    base = pd.DataFrame({"PRODUTO": ["A"], "COR_PRODUTO": ["Red"], "ESTOQUE_DISPONIVEL": [6]})
+    expected = TransformData(backend="pandas").transform(extract_contract, base)
+
+    actual = PartitionedTransformData("ID_FILIAL", max_workers=2).transform(extract_contract, base)
+
+    pd.testing.assert_frame_equal(
+        normalize(actual.sales_velocity), normalize(expected.sales_velocity), check_categorical=False
+    )
+
+
+def test_partitioned_transform_merges_products_sold_in_several_branches(extract_contract):
+    """
+    Test that a product sold in every branch gets a single sales velocity row, averaged over all of its sales
+    (the duplicate is dropped and the sale without quantity counts as zero).
+    """
+    sales = extract_contract.sales.assign(
+        PRODUTO=pd.Series(["A"] * 6, dtype="category"), COR_PRODUTO=pd.Series(["Red"] * 6, dtype="category")
+    )
+    contract = ExtractContract(
+        sales=sales, stock=extract_contract.stock, store=extract_contract.store, products=extract_contract.products
+    )
+
+    velocity = PartitionedTransformData("ID_FILIAL", max_workers=3, velocity_granularity="product").transform(contract)
+
+    assert velocity.sales_velocity[["PRODUTO", "QTD_VENDAS"]].astype(str).values.tolist() == [["A", "5"]]
+    assert velocity.sales_velocity["VELOCIDADE_VENDA"].iloc[0] == pytest.approx((3 + 5 + 2 + 0 + 4) / 5 / 14)
+
+
+@pytest.fixture
+def monthly_sources(tmp_path):
+    """Fixture with the synthetic sources, with sales and stock written to one directory per month."""
+    generate_sources(str(tmp_path), 5_000, days=90)
+    for source in ("sales", "stock"):
+        schema = SOURCE_SCHEMAS[source]
+        single_file = tmp_path / schema.file_name
+        rows = pd.read_csv(single_file, dtype=str, keep_default_na=False)
+        months = pd.to_datetime(rows[schema.watermark_column]).dt.strftime("%Y-%m")
+        for month, month_rows in rows.groupby(months):
+            (tmp_path / schema.directory / month).mkdir(parents=True)
+            month_rows.to_csv(tmp_path / schema.directory / month / "parte-1.csv", index=False)
+        single_file.unlink()
+    return DataLoader(base_path=str(tmp_path))
+
+
+@pytest.mark.parametrize("partition_by", ["ID_FILIAL", "month"])
+def test_transform_files_matches_batch_transform(monthly_sources, partition_by):
+    """
+    Test that transforming the source files, read by the workers when partitioned by month, produces the same
+    tables as the single-process transform of the extracted sources.
+    """
+    expected = TransformData(backend="pandas").transform(ExtractContract(**monthly_sources.extract_all()))
+
+    actual = PartitionedTransformData(partition_by, max_workers=2).transform_files(
+        monthly_sources.source_paths(), monthly_sources
+    )
+
+    for table in TABLES:
+        pd.testing.assert_frame_equal(
+            normalize(getattr(actual, table)),
+            normalize(getattr(expected, table)),
+            check_categorical=False,
+            obj=table,
+        )
+
+
+def test_group_files_balances_months_by_size(tmp_path):
+    """
+    Test that the files of each month land in one partition, with the largest months spread first, and that
+    sources with undated files are not grouped.
+    """
+    sizes = {"2024-05/parte-1.csv": 30, "2024-06/parte-1.csv": 10, "2024-06/parte-2.csv": 15, "2024-07.csv": 20}
+    for name, size in sizes.items():
+        (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / name).write_text("x" * size)
+    paths = sorted(tmp_path / name for name in sizes)
+
+    partitions = PartitionedTransformData("month", max_workers=2).group_files(paths, tmp_path)
+
+    assert [[str(path.relative_to(tmp_path)) for path in partition] for partition in partitions] == [
+        ["2024-05/parte-1.csv"],
+        ["2024-06/parte-1.csv", "2024-06/parte-2.csv", "2024-07.csv"],
+    ]
+    assert PartitionedTransformData("month").group_files([*paths, tmp_path / "extra.csv"], tmp_path) is None
+    assert PartitionedTransformData("ID_FILIAL").group_files(paths, tmp_path) is None
+
+
+def test_split_balances_keys_and_keeps_duplicates_together(extract_contract):
+    """
+    Test that keys are spread over the partitions by row count and that each key lands in one partition.
+    """
+    partitions = PartitionedTransformData("ID_FILIAL", max_workers=2).split(extract_contract.sales, "sales")
+
+    assert [len(partition) for partition in partitions] == [3, 3]
+    assert sorted(partitions[0]["ID_FILIAL"].unique()) == [1]
+    assert sorted(partitions[1]["ID_FILIAL"].unique()) == [2, 3]
+
+
+def test_split_requires_partition_column():
+    """
+    Test that a source without the partition column is rejected.
+    """
+    with pytest.raises(ValueError, match="não contém a coluna de partição DATA_VENDA"):
+        PartitionedTransformData("month").split(pd.DataFrame({"ID_FILIAL": [1]}), "sales")
+
+
+def test_invalid_partition_key():
+    """
+    Test that an unknown partition key is rejected.
+    """
+    with pytest.raises(ValueError, match="Chave de partição inválida"):
+        PartitionedTransformData("UF")
@@ -0,0 +1,138 @@
+import pandas as pd
+import pytest
+
+from src.driver.dataloader import DataLoader
+from src.stages.contracts.extract_contract import ExtractContract
+from src.stages.contracts.transform_contract import TransformContract
+from src.stages.transform.transform_data import TransformData
+
+SOURCE_FILES = {
+    "estoque_hering.csv": (
+        "DATA_FOTO,ID_FILIAL,PRODUTO,COR_PRODUTO,TAMANHO,TOTAL,TRANSITO\n"
+        "2024-06-09,10709,KFRB,1BSN,M,10,2\n"
+        "2024-06-09,10709,KFRB,1BSN,M,10,2\n"
+        "2024-06-10,10709,KFRB,1BSN,G,5,0\n"
+        "2024-06-10,10115,KFRA,2ASN,P,3,3\n"
+        "2024-06-10,10115,KFRC,1BSN,P,7,1\n"
+    ),
+    "lojas_hering.csv": (
+        "ID_FILIAL,LOJA,PONTO_VENDA_COD,PONTO_VENDA,PUBLICO_LOJA,CANAL,CIDADE,LOJA_M2,PAIS,UF,CLIMA,STATUS\n"
+        "10115,Loja Ipanema,214,214:Rua Visconde De Piraja,A,Lojas,RIO DE JANEIRO,129,BR,RJ,Quente,INACTIVE\n"
+        "10709,Loja Centro,,,,Lojas,JOINVILLE,44,BR,SC,Fria,ACTIVE\n"
+    ),
+    "produtos_hering.csv": (
+        "ARTIGO_COR,ARTIGO,DESC_PRODUTO,COR,COR_DESCRICAO,NEGOCIO,PARTE,GRUPO,GENERO,COD_COTA,COLECAO,PIRAMIDE\n"
+        "0995CTHKM,0995,PACOTE HK M,GER,PACOTE DZ M,HERING KIDS,,,,424,VERAO 2024,CORE\n"
+        "0995CTHKM,0995,PACOTE HK M,GER,PACOTE DZ M,HERING KIDS,,,,124,OUTONO 2024,CORE\n"
+    ),
+    "vendas_hering.csv": (
+        "DATA_VENDA,ID_FILIAL,PRODUTO,COR_PRODUTO,TAMANHO,VENDA_PECAS,VENDA_LIQUIDA,VENDA_BRUTA\n"
+        "2024-06-09,10709,KFRB,1BSN,M,1,32.86,35.99\n"
+        "2024-06-09,10709,KFRB,1BSN,M,1,32.86,35.99\n"
+        "2024-06-09,10709,KFRB,1BSN,G,2,65.72,71.98\n"
+        "2024-06-10,10115,KFRA,2ASN,P,4,80.00,90.00\n"
+        "2024-06-10,10115,KFRC,1BSN,P,,10.00,12.00\n"
+        "2024-06-11,10709,KFRB,1BSN,M,3,98.58,107.97\n"
+    ),
+}
+
+TABLES = ("sales", "stock", "store", "products", "available_stock", "sales_by_region", "sales_velocity")
+
+
+@pytest.fixture
+def source_files(tmp_path):
+    """Fixture that writes one small CSV file per registered source schema."""
+    for file_name, content in SOURCE_FILES.items():
+        (tmp_path / file_name).write_text(content)
+    return tmp_path
+
+
+@pytest.fixture(params=["duckdb", "polars"])
+def backend(request):
+    """Fixture that yields each out-of-core backend whose package is installed."""
+    pytest.importorskip(request.param)
+    return request.param
+
+
+def normalize(df: pd.DataFrame) -> pd.DataFrame:
+    """Compares tables by value: text columns as strings, rows sorted, integers widened."""
+    df = df.copy()
+    for column in df.columns:
+        if isinstance(df[column].dtype, pd.CategoricalDtype) or df[column].dtype == object:
+            df[column] = df[column].astype(str)
+    return df.sort_values(list(df.columns)).reset_index(drop=True)
+
+
+def assert_same_contract(expected, actual) -> None:
+    """Asserts that two transform contracts hold the same rows in every table."""
+    for table in TABLES:
+        expected_df, actual_df = getattr(expected, table), getattr(actual, table)
+        assert list(actual_df.columns) == list(expected_df.columns), table
+        pd.testing.assert_frame_equal(normalize(actual_df), normalize(expected_df), check_dtype=False, obj=table)
+
+
+def test_backend_transform_files_matches_pandas(source_files, backend):
+    """
+    Test that reading the source files directly produces the same tables as the pandas backend.
+    """
+    loader = DataLoader(base_path=str(source_files))
+    expected = TransformData(backend="pandas").transform(ExtractContract(**loader.extract_all()))
+
+    actual = TransformData(backend=backend).transform_files(loader.source_paths())
+
+    assert_same_contract(expected, actual)
+    assert actual.sales["DATA_VENDA"].dtype == "datetime64[ns]"
+    assert isinstance(actual.sales["PRODUTO"].dtype, pd.CategoricalDtype)
+
+
+@pytest.mark.parametrize("granularity", ["row", "product"])
+def test_backend_transform_matches_pandas_with_base_stock(source_files, backend, granularity):
+    """
+    Test that transforming an extract contract with an available stock base matches the pandas backend.
+    """
+    contract = ExtractContract(**DataLoader(base_path=str(source_files)).extract_all())
+    base = pd.DataFrame({"PRODUTO": ["KFRB", "KFRA"], "COR_PRODUTO": ["1BSN", "2ASN"], "ESTOQUE_DISPONIVEL": [5, 2]})
+
+    expected = TransformData(backend="pandas", velocity_granularity=granularity).transform(contract, base)
+    actual = TransformData(backend=backend, velocity_granularity=granularity).transform(contract, base)
+
+    assert_same_contract(expected, actual)
+
+
+@pytest.mark.parametrize("granularity", ["row", "product"])
+def test_backend_transform_files_stream_matches_transform_files(source_files, backend, granularity):
+    """
+    Test that streaming the results of the source files yields bounded chunks holding the same tables.
+    """
+    paths = DataLoader(base_path=str(source_files)).source_paths()
+    transform_data = TransformData(backend=backend, velocity_granularity=granularity)
+    expected = transform_data.transform_files(paths)
+
+    chunks = list(transform_data.transform_files_stream(paths, chunk_size=2))
+
+    assert all(0 < len(chunk) <= 2 for _, chunk in chunks)
+    assert [table for table, _ in chunks].count("sales") == 3
+    actual = TransformContract(
+        **{table: pd.concat([chunk for name, chunk in chunks if name == table]) for table in TABLES}
+    )
+    assert_same_contract(expected, actual)
+    assert all(chunk["DATA_VENDA"].dtype == "datetime64[ns]" for table, chunk in chunks if table == "sales")
+
+
+def test_invalid_transform_backend():
+    """
+    Test that an unknown backend is rejected.
+    """
+    with pytest.raises(ValueError, match="Backend de transformação inválido"):
+        TransformData(backend="spark")
+
+
+def test_pandas_backend_does_not_read_files(source_files):
+    """
+    Test that the pandas backend only transforms extracted DataFrames.
+    """
+    paths = DataLoader(base_path=str(source_files)).source_paths()
+    with pytest.raises(ValueError, match="O backend pandas não lê os arquivos de origem"):
+        TransformData(backend="pandas").transform_files(paths)
+    with pytest.raises(ValueError, match="O backend pandas não lê os arquivos de origem"):
+        TransformData(backend="pandas").transform_files_stream(paths, chunk_size=2)
@@ -1,9 +1,16 @@
+import dataclasses
+from unittest.mock import patch
+
 import pandas as pd
 import pytest
 
+from src.driver.dataloader import DataLoader
+from src.driver.schemas import SOURCE_SCHEMAS
 from src.stages.contracts.extract_contract import ExtractContract
+from src.stages.contracts.extract_stream_contract import ExtractStreamContract
 from src.stages.contracts.transform_contract import TransformContract
 from src.stages.transform.transform_data import TransformData
+from tests.benchmarks.synthetic_data import generate_sources
 
 
 @pytest.fixture
@@ -206,3 +213,305 @@ def test_calculate_sales_by_region():
     result = service._calculate_sales_by_region(sales_data, store_data)
 
     pd.testing.assert_frame_equal(result, expected_output)
+
+
+def _chunks(df: pd.DataFrame, size: int):
+    return (df.iloc[start : start + size] for start in range(0, len(df), size))
+
+
+def test_transform_stream_matches_batch_transform():
+    """
+    Test that transform_stream produces the same aggregates as transform, chunk by chunk.
+    """
+    sales_df = pd.DataFrame(
+        {
+            "PRODUTO": ["A", "B", "A", "C", "B"],
+            "COR_PRODUTO": ["Red", "Blue", "Red", "Green", "Blue"],
+            "VENDA_PECAS": [30, 50, 10, 5, 20],
+            "ID_FILIAL": [1, 2, 2, 1, 1],
+        }
+    )
+    stock_df = pd.DataFrame(
+        {
+            "PRODUTO": ["A", "B", "A", "C"],
+            "COR_PRODUTO": ["Red", "Blue", "Red", "Green"],
+            "TOTAL": [100, 200, 50, 0],
+            "TRANSITO": [10, 20, 5, 0],
+        }
+    )
+    store_df = pd.DataFrame({"ID_FILIAL": [1, 2], "UF": ["SP", "RJ"], "CIDADE": ["São Paulo", "Rio de Janeiro"]})
+    products_df = pd.DataFrame({"PRODUTO": ["A", "B", "C"], "DESCRICAO": ["Product A", "Product B", "Product C"]})
+
+    service = TransformData()
+    expected = service.transform(ExtractContract(sales=sales_df, stock=stock_df, store=store_df, products=products_df))
+    stream = service.transform_stream(
+        ExtractStreamContract(
+            sales=_chunks(sales_df, 2),
+            stock=_chunks(stock_df, 3),
+            store=_chunks(store_df, 1),
+            products=_chunks(products_df, 2),
+        )
+    )
+
+    tables = {}
+    for table_name, chunk in stream:
+        tables.setdefault(table_name, []).append(chunk)
+    result = {name: pd.concat(chunks, ignore_index=True) for name, chunks in tables.items()}
+
+    assert [len(chunks) for chunks in (tables["stock"], tables["sales"], tables["sales_velocity"])] == [2, 3, 3]
+    pd.testing.assert_frame_equal(result["available_stock"], expected.available_stock)
+    pd.testing.assert_frame_equal(result["sales_by_region"], expected.sales_by_region)
+    pd.testing.assert_frame_equal(result["sales"], expected.sales.reset_index(drop=True))
+    pd.testing.assert_frame_equal(result["store"], expected.store)
+    assert len(result["sales_velocity"]) == len(expected.sales_velocity)
+
+
+def test_transform_stream_accumulates_aggregated_velocity():
+    """
+    Test that, with an aggregated granularity, transform_stream yields a single sales_velocity table with one
+    row per product, equal to the batch transform, instead of one row per product and chunk.
+    """
+    sales_df = pd.DataFrame(
+        {
+            "DATA_VENDA": pd.to_datetime(["2024-06-09", "2024-06-09", "2024-06-10", "2024-06-11", "2024-06-11"]),
+            "PRODUTO": ["A", "B", "A", "C", "A"],
+            "COR_PRODUTO": ["Red", "Blue", "Red", "Green", "Red"],
+            "VENDA_PECAS": [30, 50, 10, 5, 20],
+            "ID_FILIAL": [1, 2, 2, 1, 1],
+        }
+    )
+    stock_df = pd.DataFrame(
+        {"PRODUTO": ["A", "B", "C"], "COR_PRODUTO": ["Red", "Blue", "Green"], "TOTAL": [100, 200, 50], "TRANSITO": 0}
+    )
+    store_df = pd.DataFrame({"ID_FILIAL": [1, 2], "UF": ["SP", "RJ"], "CIDADE": ["São Paulo", "Rio de Janeiro"]})
+    products_df = pd.DataFrame({"PRODUTO": ["A", "B", "C"]})
+
+    service = TransformData(velocity_granularity="product")
+    expected = service.transform(ExtractContract(sales=sales_df, stock=stock_df, store=store_df, products=products_df))
+    stream = service.transform_stream(
+        ExtractStreamContract(
+            sales=_chunks(sales_df, 2), stock=iter([stock_df]), store=iter([store_df]), products=iter([products_df])
+        )
+    )
+
+    velocity = [chunk for table_name, chunk in stream if table_name == "sales_velocity"]
+
+    assert len(velocity) == 1
+    pd.testing.assert_frame_equal(velocity[0].reset_index(drop=True), expected.sales_velocity.reset_index(drop=True))
+
+
+def test_clean_data_keeps_categorical_and_date_types():
+    """
+    Test that _clean_data fills missing categorical values without losing the column types.
+    """
+    service = TransformData()
+    input_data = pd.DataFrame(
+        {
+            "UF": pd.Series(["SP", None, "SP"], dtype="category"),
+            "DATA_VENDA": pd.to_datetime(["2024-06-09", None, "2024-06-09"]),
+        }
+    )
+
+    cleaned_data = service._clean_data(input_data)
+
+    assert cleaned_data["UF"].dtype == "category"
+    assert cleaned_data["UF"].tolist() == ["SP", 0]
+    assert pd.api.types.is_datetime64_any_dtype(cleaned_data["DATA_VENDA"])
+
+
+def test_transform_with_available_stock_base(mock_extract_contract):
+    """
+    Test that the incremental transform keeps the stock delta but computes velocity on the merged stock.
+    """
+    mock_extract_contract.sales["ID_FILIAL"] = [1, 2]
+    base = pd.DataFrame({"PRODUTO": ["A"], "COR_PRODUTO": ["Red"], "ESTOQUE_DISPONIVEL": [210]})
+
+    result = TransformData().transform(mock_extract_contract, available_stock_base=base)
+
+    assert result.available_stock.set_index("PRODUTO")["ESTOQUE_DISPONIVEL"].to_dict() == {"A": 90, "B": 180}
+    velocity = result.sales_velocity.set_index("PRODUTO")
+    assert velocity.loc["A", "ESTOQUE_DISPONIVEL"] == 300
+    assert velocity.loc["A", "VELOCIDADE_VENDA"] == pytest.approx(0.1)
+    assert velocity.loc["B", "ESTOQUE_DISPONIVEL"] == 180
+
+
+@pytest.fixture
+def engine_contract():
+    """Fixture that provides an extract contract with duplicates, missing values and a product without stock."""
+    sales_df = pd.DataFrame(
+        {
+            "DATA_VENDA": pd.to_datetime(["2024-06-09", "2024-06-09", "2024-06-10", "2024-06-10", "2024-06-11"]),
+            "ID_FILIAL": pd.array([1, 1, 2, 3, 2], dtype="int32"),
+            "PRODUTO": pd.Series(["A", "A", "B", "C", "A"], dtype="category"),
+            "COR_PRODUTO": pd.Series(["Red", "Red", "Blue", "Green", "Red"], dtype="category"),
+            "VENDA_PECAS": pd.array([30, 30, None, 5, 20], dtype="Int32"),
+            "VENDA_LIQUIDA": [10.5, 10.5, 3.0, float("nan"), 8.25],
+        }
+    )
+    stock_df = pd.DataFrame(
+        {
+            "PRODUTO": pd.Series(["A", "B", "A", "C", "C"], dtype="category"),
+            "COR_PRODUTO": pd.Series(["Red", "Blue", "Red", "Green", "Green"], dtype="category"),
+            "TOTAL": pd.array([100, 200, 50, 0, 0], dtype="int32"),
+            "TRANSITO": pd.array([10, 20, 5, 0, 0], dtype="int32"),
+        }
+    )
+    store_df = pd.DataFrame(
+        {
+            "ID_FILIAL": pd.array([1, 2, 3], dtype="int32"),
+            "UF": pd.Series(["SP", "RJ", "SP"], dtype="category"),
+            "CIDADE": pd.Series(["São Paulo", "Rio de Janeiro", None], dtype="category"),
+        }
+    )
+    products_df = pd.DataFrame({"PRODUTO": ["A", "B", "C"], "DESCRICAO": ["Product A", "Product B", "Product C"]})
+    return ExtractContract(sales=sales_df, stock=stock_df, store=store_df, products=products_df)
+
+
+@pytest.mark.parametrize("granularity", ["row", "daily", "product"])
+def test_vectorized_engine_matches_legacy_engine(engine_contract, granularity):
+    """
+    Test that the vectorized engine produces the same tables as the legacy engine, with a numeric velocity.
+    """
+    assert_engines_match(engine_contract, granularity)
+
+
+@pytest.fixture(scope="module")
+def synthetic_contract(tmp_path_factory):
+    """Fixture that provides the synthetic benchmark sources, at 10,000 sales rows, extracted once."""
+    source_dir = tmp_path_factory.mktemp("synthetic")
+    generate_sources(str(source_dir), 10_000)
+    return ExtractContract(**DataLoader(base_path=str(source_dir)).extract_all())
+
+
+@pytest.mark.parametrize("granularity", ["row", "daily", "product"])
+def test_vectorized_engine_matches_legacy_engine_on_synthetic_sources(synthetic_contract, granularity):
+    """
+    Test that the vectorized engine, the default one, produces the same tables as the legacy engine on the
+    synthetic benchmark sources, whose keys and popularity follow the project sample.
+    """
+    assert_engines_match(synthetic_contract, granularity)
+
+
+def assert_engines_match(extract_contract, granularity):
+    """Asserts that both engines produce the same tables, with a numeric velocity in the vectorized one."""
+    legacy = TransformData(engine="legacy", velocity_granularity=granularity).transform(extract_contract)
+    vectorized = TransformData(engine="vectorized", velocity_granularity=granularity).transform(extract_contract)
+
+    assert vectorized.sales_velocity["VELOCIDADE_VENDA"].dtype == "float64"
+    pd.testing.assert_frame_equal(
+        vectorized.sales_velocity, legacy.sales_velocity.astype({"VELOCIDADE_VENDA": "float64"})
+    )
+    for table in ("sales", "stock", "store", "products", "available_stock", "sales_by_region"):
+        pd.testing.assert_frame_equal(getattr(vectorized, table), getattr(legacy, table))
+
+
+@pytest.mark.parametrize("granularity", ["daily", "product"])
+def test_vectorized_engine_groups_sales_once(engine_contract, granularity):
+    """
+    Test that, with an aggregated velocity, the vectorized engine groups the sales once for both the velocity
+    and the sales by region.
+    """
+    transform_data = TransformData(engine="vectorized", velocity_granularity=granularity)
+
+    with patch.object(TransformData, "_group_sales", autospec=True, side_effect=TransformData._group_sales) as spy:
+        transform_data.transform(engine_contract)
+
+    spy.assert_called_once()
+    assert "ID_FILIAL" in spy.call_args.args[2]
+
+
+def test_drop_loaded_rows_keeps_late_rows_of_the_high_water_mark(engine_contract):
+    """
+    Test that re-extracted rows of the high water mark date that were already loaded are dropped, while the
+    rows that arrived later with the same date are kept.
+    """
+    transform_data = TransformData()
+    loaded = transform_data.transform(engine_contract)
+    mark_date = loaded.sales["DATA_VENDA"] == loaded.sales["DATA_VENDA"].max()
+    loaded_row_hashes = {"sales": SOURCE_SCHEMAS["sales"].row_hashes(loaded.sales[mark_date])}
+    mark_date_rows = engine_contract.sales[engine_contract.sales["DATA_VENDA"] == "2024-06-11"]
+    late_row = mark_date_rows.assign(VENDA_PECAS=pd.array([7], dtype="Int32"))
+    next_row = mark_date_rows.assign(DATA_VENDA=pd.to_datetime(["2024-06-12"]))
+    extracted = ExtractContract(
+        sales=pd.concat([mark_date_rows, late_row, next_row], ignore_index=True),
+        stock=engine_contract.stock.iloc[:0],
+        store=engine_contract.store,
+        products=engine_contract.products,
+    )
+
+    result = transform_data.drop_loaded_rows(extracted, loaded_row_hashes)
+
+    assert result.sales["VENDA_PECAS"].tolist() == [7, 20]
+    assert result.sales["DATA_VENDA"].tolist() == list(pd.to_datetime(["2024-06-11", "2024-06-12"]))
+    assert result.stock is extracted.stock
+
+
+def test_drop_loaded_rows_matches_rows_with_missing_values(engine_contract):
+    """
+    Test that rows loaded with missing values, filled by the cleaning, are recognized in the raw extraction.
+    """
+    transform_data = TransformData()
+    loaded = transform_data.transform(engine_contract)
+    mark_date = loaded.sales["DATA_VENDA"] == pd.Timestamp("2024-06-10")
+    loaded_row_hashes = {"sales": SOURCE_SCHEMAS["sales"].row_hashes(loaded.sales[mark_date])}
+    extracted = dataclasses.replace(
+        engine_contract, sales=engine_contract.sales[engine_contract.sales["DATA_VENDA"] >= "2024-06-10"]
+    )
+
+    result = transform_data.drop_loaded_rows(extracted, loaded_row_hashes)
+
+    assert result.sales["DATA_VENDA"].tolist() == [pd.Timestamp("2024-06-11")]
+
+
+def test_invalid_transform_engine():
+    """
+    Test that an unknown engine is rejected.
+    """
+    with pytest.raises(ValueError, match="Motor de transformação inválido"):
+        TransformData(engine="polars")
+
+
+@pytest.mark.parametrize("granularity", ["daily", "product"])
+def test_aggregated_velocity_matches_row_level_averages(granularity):
+    """
+    Test that the aggregated velocity, weighted by QTD_VENDAS, gives the same per-product averages as the
+    row-level velocity with fewer rows.
+    """
+    sales_df = pd.DataFrame(
+        {
+            "DATA_VENDA": pd.to_datetime(["2024-06-09", "2024-06-09", "2024-06-09", "2024-06-10", "2024-06-11"]),
+            "ID_FILIAL": pd.array([1, 1, 2, 3, 1], dtype="int32"),
+            "PRODUTO": pd.Series(["A", "A", "B", "C", "A"], dtype="category"),
+            "COR_PRODUTO": pd.Series(["Red", "Red", "Blue", "Green", "Red"], dtype="category"),
+            "VENDA_PECAS": pd.array([30, 10, None, 5, 20], dtype="Int32"),
+            "VENDA_LIQUIDA": [10.5, 3.5, 3.0, 1.0, 8.25],
+        }
+    )
+    stock_df = pd.DataFrame(
+        {
+            "PRODUTO": pd.Series(["A", "B", "C"], dtype="category"),
+            "COR_PRODUTO": pd.Series(["Red", "Blue", "Green"], dtype="category"),
+            "ESTOQUE_DISPONIVEL": pd.array([100, 50, 0], dtype="int64"),
+        }
+    )
+
+    rows = TransformData()._calculate_sales_velocity_vectorized(sales_df, stock_df)
+    aggregated = TransformData(velocity_granularity=granularity)._calculate_sales_velocity_aggregated(
+        sales_df, stock_df, TransformData.VELOCITY_GRANULARITIES[granularity]
+    )
+
+    weighted = (aggregated["VELOCIDADE_VENDA"] * aggregated["QTD_VENDAS"]).groupby(
+        aggregated["PRODUTO"], observed=True
+    ).sum() / aggregated.groupby("PRODUTO", observed=True)["QTD_VENDAS"].sum()
+    expected = rows.groupby("PRODUTO", observed=True)["VELOCIDADE_VENDA"].mean()
+    pd.testing.assert_series_equal(weighted, expected, check_names=False)
+    assert len(aggregated) < len(rows)
+    assert aggregated["QTD_VENDAS"].sum() == len(rows)
+
+
+def test_invalid_velocity_granularity():
+    """
+    Test that an unknown velocity granularity is rejected.
+    """
+    with pytest.raises(ValueError, match="Granularidade inválida"):
+        TransformData(velocity_granularity="weekly")